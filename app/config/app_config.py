@@ -12,3 +12,10 @@ V1_OPTIONS = {
     "title": APP_TITLE,
     "version": APP_VERSION,
 }
+
+# Multiple parameter values stored before the JSON format are pickled and
+# have no PRM.value_multiple. Turn off after
+# run_convert_multiple_parameter_values.py has converted all of them.
+MULTIPLE_VALUES_LEGACY_ROWS = os.environ.get(
+    "MULTIPLE_VALUES_LEGACY_ROWS", "True"
+).upper() in ("TRUE", "Y", "YES", "1")
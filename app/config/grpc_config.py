@@ -17,3 +17,53 @@ ZEEBE_PORT = os.environ.get("ZEEBE_PORT", "26500")
 
 # Uvicorn configuration
 UVICORN_WORKERS = os.environ.get("UVICORN_WORKERS", "")
+
+# Port of the inventory gRPC server
+GRPC_PORT = int(os.environ.get("GRPC_PORT", "50051"))
+# Port of the second server for bulk streams of objects and parameters, so
+# exports do not take calls of interactive lookups (0: not started)
+GRPC_BULK_PORT = int(os.environ.get("GRPC_BULK_PORT", "0"))
+# Calls handled by the server at once (0: no limit), further calls are
+# rejected with RESOURCE_EXHAUSTED
+GRPC_MAX_CONCURRENT_RPCS = int(os.environ.get("GRPC_MAX_CONCURRENT_RPCS", "0"))
+GRPC_BULK_MAX_CONCURRENT_RPCS = int(
+    os.environ.get("GRPC_BULK_MAX_CONCURRENT_RPCS", "0")
+)
+# Size limits of sent and received messages in bytes (-1: no limit)
+GRPC_MAX_SEND_MESSAGE_SIZE = int(
+    os.environ.get("GRPC_MAX_SEND_MESSAGE_SIZE", "-1")
+)
+GRPC_MAX_RECEIVE_MESSAGE_SIZE = int(
+    os.environ.get("GRPC_MAX_RECEIVE_MESSAGE_SIZE", "4194304")
+)
+# Compression of responses (none, gzip or deflate) for clients which accept
+# it: of all methods, of methods with streamed responses and of all methods
+# of the bulk server, and of single methods ("GetTMOTree=gzip,...")
+GRPC_COMPRESSION = os.environ.get("GRPC_COMPRESSION", "none")
+GRPC_BULK_COMPRESSION = os.environ.get("GRPC_BULK_COMPRESSION", "gzip")
+GRPC_METHOD_COMPRESSION = os.environ.get("GRPC_METHOD_COMPRESSION", "")
+
+# Worker threads of the inventory gRPC server for database calls
+GRPC_DB_WORKERS = int(os.environ.get("GRPC_DB_WORKERS", "16"))
+# Exports and object streams use own workers, one such method can run
+# at most GRPC_DB_HEAVY_METHOD_LIMIT times at once
+GRPC_DB_HEAVY_WORKERS = int(os.environ.get("GRPC_DB_HEAVY_WORKERS", "4"))
+GRPC_DB_HEAVY_METHOD_LIMIT = int(
+    os.environ.get("GRPC_DB_HEAVY_METHOD_LIMIT", "2")
+)
+# Streamed messages are packed up to this size in bytes
+GRPC_MESSAGE_MAX_SIZE = int(os.environ.get("GRPC_MESSAGE_MAX_SIZE", "4100000"))
+# Methods which send objects and request data as pickle hex strings, turn
+# off after clients have moved to the typed V2 methods
+GRPC_PICKLE_PAYLOADS = os.environ.get(
+    "GRPC_PICKLE_PAYLOADS", "True"
+).upper() in ("TRUE", "Y", "YES", "1")
+# GetTMOTree serves the TMO tree from memory while no changes are recorded
+# in the event history, at most for this number of seconds (0 turns off)
+GRPC_TMO_TREE_CACHE_TTL = float(
+    os.environ.get("GRPC_TMO_TREE_CACHE_TTL", "300")
+)
+# ReplayEvents stops at events stored this number of seconds ago. Ids of
+# events are taken on insert, so an event of a transaction which is not
+# committed yet can get a lower id than replayed events
+EVENT_REPLAY_LAG = float(os.environ.get("EVENT_REPLAY_LAG", "10"))
@@ -89,3 +89,15 @@ if KAFKA_SECURED:
 KAFKA_PRODUCER_PART_TOPIC_PARTITIONS = int(
     os.environ.get("KAFKA_PRODUCER_PARTITION_TOPIC_PARTITIONS", 10)
 )
+
+# Outbox relay (run_outbox_relay.py)
+KAFKA_OUTBOX_BATCH_SIZE = int(os.environ.get("KAFKA_OUTBOX_BATCH_SIZE", 500))
+KAFKA_OUTBOX_POLL_INTERVAL = float(
+    os.environ.get("KAFKA_OUTBOX_POLL_INTERVAL", 0.5)
+)
+KAFKA_OUTBOX_FLUSH_TIMEOUT = float(
+    os.environ.get("KAFKA_OUTBOX_FLUSH_TIMEOUT", 30)
+)
+KAFKA_OUTBOX_METRICS_INTERVAL = float(
+    os.environ.get("KAFKA_OUTBOX_METRICS_INTERVAL", 60)
+)
@@ -1,6 +1,13 @@
 import os
 
 SECURITY_TYPE = os.environ.get("SECURITY_TYPE", "DISABLE").upper()
+# seconds for which TMO ids available to roles are cached by a process
+PERMISSION_CACHE_TTL = int(os.environ.get("PERMISSION_CACHE_TTL", "30"))
+# reads of objects without own permissions are filtered by permissions of
+# their object types
+INHERIT_OBJECT_PERMISSIONS = os.environ.get(
+    "INHERIT_OBJECT_PERMISSIONS", "False"
+).upper() in ("TRUE", "Y", "YES", "1")
 
 KEYCLOAK_PROTOCOL = os.environ.get("KEYCLOAK_PROTOCOL", "http")
 KEYCLOAK_HOST = os.environ.get("KEYCLOAK_HOST", "keycloak")
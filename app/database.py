@@ -2,9 +2,15 @@ from typing import Union, Generator
 
 from fastapi import Depends
 from fastapi.requests import Request
+from sqlalchemy.ext.asyncio import create_async_engine
 from sqlmodel import create_engine, Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from config.database_config import DATABASE_URL, DB_SCHEMA
+from config.database_config import (
+    DATABASE_URL,
+    ASYNC_DATABASE_URL,
+    DB_SCHEMA,
+)
 from services.security_service.security_data_models import UserData
 from services.security_service.security_factory import security
 from services.security_service.session.add_security import add_security_data
@@ -19,6 +25,18 @@ engine = create_engine(
     pool_pre_ping=True,
 )
 
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    pool_size=20,
+    max_overflow=100,
+    connect_args={
+        "server_settings": {"search_path": DB_SCHEMA},
+        # prepared statements are not shared between pgbouncer backends
+        "statement_cache_size": 0,
+    },
+    pool_pre_ping=True,
+)
+
 
 def get_session(request: Request, user_data: UserData = Depends(security)):
     with Session(engine, expire_on_commit=False) as session:
@@ -31,6 +49,16 @@ def get_not_auth_session():
         yield session
 
 
+async def get_async_session(
+    request: Request, user_data: UserData = Depends(security)
+):
+    async with AsyncSession(async_engine, expire_on_commit=False) as session:
+        add_security_data(
+            session=session.sync_session, request=request, user_data=user_data
+        )
+        yield session
+
+
 def get_chunked_values_by_sqlalchemy_limit(
     values: Union[list, set, dict.keys],
 ) -> Generator:
@@ -1,6 +1,5 @@
 import copy
 import datetime
-import pickle
 from typing import List, Union, Tuple
 
 import sqlalchemy
@@ -20,6 +19,7 @@ from functions import functions_dicts
 from functions.db_functions import db_add, db_read
 from functions.functions_utils.utils import (
     calculate_by_formula_new,
+    encode_multiple_value,
     set_param_attrs,
 )
 from functions.validation_functions.validation_function import (
@@ -245,7 +245,7 @@ def create_param_types_with_error_list(
                 continue
 
             if param_type.multiple:
-                field_value = pickle.dumps(field_value).hex()
+                field_value = encode_multiple_value(field_value)
 
         db_param_type = TPRM(
             name=param_type.name,
@@ -353,7 +353,7 @@ def create_parameters_with_error_list(
             continue
 
         if db_param_type.multiple:
-            param.value = pickle.dumps(param.value).hex()
+            param.value = encode_multiple_value(param.value)
 
         if db_param_type.val_type == "formula":
             try:
@@ -1,10 +1,10 @@
 import json  # noqa
 import json  # noqa
-import pickle
-from typing import List
+from typing import Iterable, List
 
 from fastapi import HTTPException
 from sqlalchemy import or_, cast, String, and_
+from sqlalchemy import Select
 from sqlmodel import select, Session
 
 from common.common_utils import ValueTypeValidator
@@ -14,6 +14,23 @@ from models import TMO, TPRM, MO, PRM
 from routers.parameter_type_router.schemas import TPRMUpdate
 
 
+def _get_multiple_prms_containing_any(
+    session: Session, tprm_ids: Iterable[int] | Select, values: Iterable
+) -> list[PRM]:
+    """Returns PRMs of multiple link TPRMs which contain any of values.
+    Matching is done by value_multiple in SQL, so only affected PRMs
+    (and legacy pickled ones) are loaded and decoded"""
+    prms = {}
+    for chunk in get_chunked_values_by_sqlalchemy_limit(values):
+        stmt = select(PRM).where(
+            PRM.tprm_id.in_(tprm_ids),
+            utils.multiple_value_contains_any_condition(chunk),
+        )
+        for prm in session.execute(stmt).scalars():
+            prms[prm.id] = prm
+    return list(prms.values())
+
+
 def delete_mo_links_by_tmo_id(session: Session, object_type_id: int) -> None:
     session.info["disable_security"] = True
     already_deleted_param_ids = set()
@@ -49,7 +66,7 @@ def delete_mo_links_by_tmo_id(session: Session, object_type_id: int) -> None:
             session.delete(param)
 
     # delete link by TPRMs where multiple is True
-    object_ids_of_tmo = (
+    object_ids_of_tmo = set(
         session.execute(select(MO.id).where(MO.tmo_id == object_type_id))
         .scalars()
         .all()
@@ -60,24 +77,25 @@ def delete_mo_links_by_tmo_id(session: Session, object_type_id: int) -> None:
         TPRM.multiple.is_(True),
         or_(TPRM.constraint.is_(None), TPRM.constraint == str(object_type_id)),
     )
-    params_to_delete = (
-        session.execute(select(PRM).where(PRM.tprm_id.in_(subquery)))
-        .scalars()
-        .all()
+    stmt = select(PRM).where(
+        PRM.tprm_id.in_(subquery),
+        utils.multiple_value_contains_any_condition(
+            select(cast(MO.id, String)).where(MO.tmo_id == object_type_id)
+        ),
     )
+    params_to_delete = session.execute(stmt).scalars().all()
 
     for param in params_to_delete:
         param_value = utils.decode_multiple_value(param.value)
         if param_value:
-            param.value = [
+            param_value = [
                 mo_id for mo_id in param_value if mo_id not in object_ids_of_tmo
             ]
-            if param.value:
-                param.value = pickle.dumps(param.value).hex()
+            if param_value:
+                param.value = utils.encode_multiple_value(param_value)
                 session.add(param)
                 continue
 
-            param.value = pickle.dumps(param.value).hex()
             already_deleted_param_ids.add(str(param.id))
             tprms_of_linked_params.add(str(param.tprm_id))
             session.delete(param)
@@ -123,10 +141,10 @@ def delete_mo_links_by_tmo_id(session: Session, object_type_id: int) -> None:
             TPRM.constraint.in_(tprms_of_linked_params),
         ),
     )
-    prm_links_to_delete = (
-        session.execute(select(PRM).where(PRM.tprm_id.in_(subquery)))
-        .scalars()
-        .all()
+    prm_links_to_delete = _get_multiple_prms_containing_any(
+        session=session,
+        tprm_ids=subquery,
+        values=already_deleted_param_ids,
     )
     for prm_link in prm_links_to_delete:
         multiple_value = utils.decode_multiple_value(prm_link.value)
@@ -137,7 +155,7 @@ def delete_mo_links_by_tmo_id(session: Session, object_type_id: int) -> None:
                 if str(prm_link_id) not in already_deleted_param_ids
             ]
             if multiple_value:
-                prm_link.value = pickle.dumps(multiple_value).hex()
+                prm_link.value = utils.encode_multiple_value(multiple_value)
                 session.add(prm_link)
                 continue
 
@@ -217,7 +235,9 @@ def delete_mo_links_by_mo_id(session: Session, mo: MO) -> None:
         stmt = (
             select(PRM)
             .where(
-                PRM.tprm_id.in_(mo_link_tprms_multiple), PRM.value.isnot(None)
+                PRM.tprm_id.in_(mo_link_tprms_multiple),
+                PRM.value.isnot(None),
+                utils.multiple_value_contains_any_condition([mo.id]),
             )
             .execution_options(yield_per=limit)
         )
@@ -234,7 +254,9 @@ def delete_mo_links_by_mo_id(session: Session, mo: MO) -> None:
                         if linked_mo_id != mo.id
                     ]
                     if multiple_value:
-                        mo_link_param.value = pickle.dumps(multiple_value).hex()
+                        mo_link_param.value = utils.encode_multiple_value(
+                            multiple_value
+                        )
                         session.add(mo_link_param)
                         continue
 
@@ -292,10 +314,10 @@ def delete_mo_links_by_mo_id(session: Session, mo: MO) -> None:
             TPRM.constraint.in_(tprms_of_linked_params),
         ),
     ]
-    links_to_already_deleted_prms = (
-        session.execute(select(PRM).join(TPRM).where(*conditions))
-        .scalars()
-        .all()
+    links_to_already_deleted_prms = _get_multiple_prms_containing_any(
+        session=session,
+        tprm_ids=select(TPRM.id).where(*conditions),
+        values=already_deleted_param_ids,
     )
 
     for prm_link in links_to_already_deleted_prms:
@@ -304,10 +326,10 @@ def delete_mo_links_by_mo_id(session: Session, mo: MO) -> None:
             multiple_value = [
                 prm_link_id
                 for prm_link_id in multiple_value
-                if prm_link_id not in already_deleted_param_ids
+                if str(prm_link_id) not in already_deleted_param_ids
             ]
             if multiple_value:
-                prm_link.value = pickle.dumps(multiple_value).hex()
+                prm_link.value = utils.encode_multiple_value(multiple_value)
                 session.add(prm_link)
                 continue
 
@@ -358,10 +380,10 @@ def delete_mo_links_by_mo_id_list(
     # CHECK IF OBJECTS USES IN LINKS AND REMOVE LINKS
     # FOR MULTIPLE-LINK CASE
     for chunk in get_chunked_values_by_sqlalchemy_limit(mo_link_tprms_multiple):
-        stmt = select(PRM).where(PRM.tprm_id.in_(chunk), PRM.value.isnot(None))
-
         for partition in get_chunked_values_by_sqlalchemy_limit(
-            session.execute(stmt).scalars().all()
+            _get_multiple_prms_containing_any(
+                session=session, tprm_ids=chunk, values=mo_ids
+            )
         ):
             for mo_link_param in partition:
                 multiple_value = utils.decode_multiple_value(
@@ -374,7 +396,9 @@ def delete_mo_links_by_mo_id_list(
                         if linked_mo_id not in mo_ids
                     ]
                     if multiple_value:
-                        mo_link_param.value = pickle.dumps(multiple_value).hex()
+                        mo_link_param.value = utils.encode_multiple_value(
+                            multiple_value
+                        )
                         session.add(mo_link_param)
                         continue
 
@@ -426,10 +450,10 @@ def delete_mo_links_by_mo_id_list(
             TPRM.constraint.in_(tprms_of_linked_params),
         ),
     ]
-    links_to_already_deleted_prms = (
-        session.execute(select(PRM).join(TPRM).where(*conditions))
-        .scalars()
-        .all()
+    links_to_already_deleted_prms = _get_multiple_prms_containing_any(
+        session=session,
+        tprm_ids=select(TPRM.id).where(*conditions),
+        values=already_deleted_param_ids,
     )
 
     for prm_link in links_to_already_deleted_prms:
@@ -438,10 +462,10 @@ def delete_mo_links_by_mo_id_list(
             multiple_value = [
                 prm_link_id
                 for prm_link_id in multiple_value
-                if prm_link_id not in already_deleted_param_ids
+                if str(prm_link_id) not in already_deleted_param_ids
             ]
             if multiple_value:
-                prm_link.value = pickle.dumps(multiple_value).hex()
+                prm_link.value = utils.encode_multiple_value(multiple_value)
                 session.add(prm_link)
                 continue
 
@@ -468,7 +492,12 @@ def delete_prm_links_by_mo_id(session: Session, mo_id: int) -> None:
         if prm_link_tprm.multiple:
             stmt = (
                 select(PRM)
-                .where(PRM.tprm_id == prm_link_tprm.id)
+                .where(
+                    PRM.tprm_id == prm_link_tprm.id,
+                    utils.multiple_value_contains_any_condition(
+                        select(cast(PRM.id, String)).where(PRM.mo_id == mo_id)
+                    ),
+                )
                 .execution_options(yield_per=10000)
             )
             for partition in (
@@ -488,9 +517,9 @@ def delete_prm_links_by_mo_id(session: Session, mo_id: int) -> None:
                             if not new_mult_prm_value:
                                 session.delete(prm_link)
                             else:
-                                prm_link.value = pickle.dumps(
+                                prm_link.value = utils.encode_multiple_value(
                                     new_mult_prm_value
-                                ).hex()
+                                )
                                 session.add(prm_link)
 
         else:
@@ -527,8 +556,13 @@ def delete_prm_links_by_mo_id_list(
 
     for prm_link_tprm in prm_link_tprms:
         if prm_link_tprm.multiple:
-            stmt = select(PRM).where(PRM.tprm_id == prm_link_tprm.id)
-            for partition in session.execute(stmt).scalars().all():
+            for partition in get_chunked_values_by_sqlalchemy_limit(
+                _get_multiple_prms_containing_any(
+                    session=session,
+                    tprm_ids=[prm_link_tprm.id],
+                    values=object_prm_ids_as_strs,
+                )
+            ):
                 for prm_link in partition:
                     multiple_value = utils.decode_multiple_value(prm_link.value)
                     if multiple_value:
@@ -544,9 +578,9 @@ def delete_prm_links_by_mo_id_list(
                             if not new_mult_prm_value:
                                 session.delete(prm_link)
                             else:
-                                prm_link.value = pickle.dumps(
+                                prm_link.value = utils.encode_multiple_value(
                                     new_mult_prm_value
-                                ).hex()
+                                )
                                 session.add(prm_link)
 
         else:
@@ -654,7 +688,12 @@ def delete_prm_links_by_prm_id(
 
     stmt = (
         select(PRM)
-        .where(PRM.tprm_id.in_(multiple_tprm_ids))
+        .where(
+            PRM.tprm_id.in_(multiple_tprm_ids),
+            utils.multiple_value_contains_any_condition(
+                [parameter_instance.id]
+            ),
+        )
         .execution_options(yield_per=limit)
     )
     for links in session.execute(stmt).scalars().partitions(size=limit):
@@ -666,7 +705,7 @@ def delete_prm_links_by_prm_id(
                     continue
 
                 multiple_value.remove(parameter_instance.id)
-                link.value = pickle.dumps(multiple_value).hex()
+                link.value = utils.encode_multiple_value(multiple_value)
                 session.add(link)
 
         session.flush()
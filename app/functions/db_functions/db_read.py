@@ -6,6 +6,7 @@ from fastapi import HTTPException
 from sqlalchemy import or_, and_, desc, asc
 from sqlalchemy.orm import selectinload
 from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from common.common_schemas import OrderByRule
 from common.common_utils import unpack_dict_values
@@ -449,19 +450,16 @@ def get_parameters_for_object_by_object_query(
     return results
 
 
-def get_objects_with_parameters_by_mo_ids(
-    session: Session,
+def _get_objects_by_mo_ids_query(
     limit: int | None,
     offset: int | None,
     object_type_id: int = None,
     mos_ids: list = None,
     p_id: int = None,
-    returnable: bool = False,
     active: bool = True,
     order_by_rule: OrderByRule = None,
-    identifiers_instead_of_values: bool = False,
-    with_parent_name: bool = False,
-) -> list:
+    after_id: int | None = None,
+):
     if order_by_rule is not None:
         if order_by_rule == "desc":
             order_by_column = desc(MO.id)
@@ -476,13 +474,55 @@ def get_objects_with_parameters_by_mo_ids(
         MO.p_id == p_id if p_id is not None else True,
         MO.active == active,
     )
+    if after_id is not None:
+        mos_query = mos_query.where(
+            MO.id < after_id if order_by_rule == "desc" else MO.id > after_id
+        )
     if order_by_column is not None:
         mos_query = mos_query.order_by(order_by_column)
     if offset:
         mos_query = mos_query.offset(offset)
     if limit:
         mos_query = mos_query.limit(limit)
+    return mos_query
+
+
+def _get_parent_ids(result: list) -> set:
+    return {
+        item["p_id"] for item in result if item.get("p_id", None) is not None
+    }
 
+
+def _add_parent_names(result: list, p_id_and_name: dict) -> list:
+    for item in result:
+        item["parent_name"] = p_id_and_name.get(item["p_id"], None)
+    return result
+
+
+def get_objects_with_parameters_by_mo_ids(
+    session: Session,
+    limit: int | None,
+    offset: int | None,
+    object_type_id: int = None,
+    mos_ids: list = None,
+    p_id: int = None,
+    returnable: bool = False,
+    active: bool = True,
+    order_by_rule: OrderByRule = None,
+    identifiers_instead_of_values: bool = False,
+    with_parent_name: bool = False,
+    after_id: int | None = None,
+) -> list:
+    mos_query = _get_objects_by_mo_ids_query(
+        limit=limit,
+        offset=offset,
+        object_type_id=object_type_id,
+        mos_ids=mos_ids,
+        p_id=p_id,
+        active=active,
+        order_by_rule=order_by_rule,
+        after_id=after_id,
+    )
     db_mos = session.exec(mos_query).all()
     result = get_parameters_for_object_by_object_query(
         session=session,
@@ -492,31 +532,62 @@ def get_objects_with_parameters_by_mo_ids(
         returnable=returnable,
     )
     if with_parent_name:
-        result_object_index_with_p_ids = {}
-        for result_object_index in range(len(result)):
-            if result[result_object_index].get("p_id", None) is not None:
-                result_object_index_with_p_ids[result_object_index] = result[
-                    result_object_index
-                ].get("p_id")
-
-        real_p_id = [
-            p_id
-            for _, p_id in result_object_index_with_p_ids.items()
-            if p_id is not None
-        ]
-        mos_query = select(MO.id, MO.name).where(MO.id.in_(set(real_p_id)))
+        mos_query = select(MO.id, MO.name).where(
+            MO.id.in_(_get_parent_ids(result))
+        )
         db_mos = session.exec(mos_query).mappings().all()
-
         p_id_and_name = {mo["id"]: mo["name"] for mo in db_mos}
+        _add_parent_names(result=result, p_id_and_name=p_id_and_name)
+    return result
 
-        real_p_id = list(p_id_and_name.keys())
-        for result_object_index in range(len(result)):
-            if result[result_object_index]["p_id"] in real_p_id:
-                parent_name = p_id_and_name[result[result_object_index]["p_id"]]
-            else:
-                parent_name = None
 
-            result[result_object_index]["parent_name"] = parent_name
+async def get_objects_with_parameters_by_mo_ids_async(
+    session: AsyncSession,
+    limit: int | None,
+    offset: int | None,
+    object_type_id: int = None,
+    mos_ids: list = None,
+    p_id: int = None,
+    returnable: bool = False,
+    active: bool = True,
+    order_by_rule: OrderByRule = None,
+    identifiers_instead_of_values: bool = False,
+    with_parent_name: bool = False,
+    after_id: int | None = None,
+) -> list:
+    """Async version of get_objects_with_parameters_by_mo_ids.
+
+    Queries are executed by asyncpg, so the event loop is not blocked while
+    waiting for the database. Parameters are converted by the sync
+    implementation inside the session greenlet (run_sync).
+    """
+    mos_query = _get_objects_by_mo_ids_query(
+        limit=limit,
+        offset=offset,
+        object_type_id=object_type_id,
+        mos_ids=mos_ids,
+        p_id=p_id,
+        active=active,
+        order_by_rule=order_by_rule,
+        after_id=after_id,
+    )
+    db_mos = (await session.exec(mos_query)).all()
+    result = await session.run_sync(
+        lambda sync_session: get_parameters_for_object_by_object_query(
+            session=sync_session,
+            db_mos=db_mos,
+            mos_ids=mos_ids,
+            identifiers_instead_of_values=identifiers_instead_of_values,
+            returnable=returnable,
+        )
+    )
+    if with_parent_name:
+        mos_query = select(MO.id, MO.name).where(
+            MO.id.in_(_get_parent_ids(result))
+        )
+        db_mos = (await session.exec(mos_query)).mappings().all()
+        p_id_and_name = {mo["id"]: mo["name"] for mo in db_mos}
+        _add_parent_names(result=result, p_id_and_name=p_id_and_name)
     return result
 
 
@@ -0,0 +1,498 @@
+"""Formulas of `formula` TPRMs compiled into evaluation plans.
+
+The constraint is split into statements and parsed once per TPRM version,
+the plan evaluates it against whole columns of parameter values. The plan
+evaluates rows only when the result is the same as the row by row
+evaluation (calculate_by_formula_batch / calculate_by_formula_new) gives:
+rows with missing values, values of other types than the formula expects,
+division by zero or dates are left for the row by row evaluation, as well
+as all rows of formulas with calls, slices and names.
+"""
+
+import ast
+import operator
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Mapping
+
+import numpy as np
+import pandas as pd
+
+from functions.formula_parser import MAX_FORMULA_LENGTH
+from models import TPRM
+
+FORMULA_PLAN_CACHE_SIZE = 1024
+
+# statements are parsed by the same expressions as calculate_by_formula_new
+STATEMENT_REGEX = re.compile(r"(?:if|elif) (.*) then (.*)")
+CONDITION_TOKENS_REGEX = re.compile(
+    r"(.*?) (==|!=|>|>=|<=|<) (\w+)( or | and )?"
+)
+CONDITION_REGEX = re.compile(r"(.*) (==|!=|>|>=|<=|<) (.*)?")
+ELSE_REGEX = re.compile(r" else (.+)")
+# values which evaluate_formula reads as datetime
+DATETIME_REGEX = re.compile(r"\d+-\d+-\d+T")
+# values which break string comparison of conditions
+NOT_QUOTABLE_REGEX = re.compile(r"['\\]")
+# integers are exact in float64 up to 2 ** 53
+MAX_EXACT_INTEGER = 2**53
+
+FUNCTIONS = ("parameter", "INNER_MAX")
+BINARY_OPERATIONS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+}
+COMPARISONS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+}
+
+
+class NotVectorizable(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class FormulaExpression:
+    source: str
+    node: ast.Expression
+    # base of INNER_MAX when TPRM has no parameters, see formula_case
+    inner_max_start: Any = 0
+
+
+@dataclass(frozen=True)
+class FormulaComparison:
+    left: FormulaExpression
+    operator: str
+    right: FormulaExpression
+
+
+@dataclass(frozen=True)
+class FormulaCase:
+    # comparisons joined by "and" in groups joined by "or"
+    condition: tuple[tuple[FormulaComparison, ...], ...]
+    action: FormulaExpression
+
+
+@dataclass(frozen=True)
+class FormulaPlan:
+    constraint: str
+    cases: tuple[FormulaCase, ...] = ()
+    otherwise: FormulaExpression | None = None
+    parameter_names: frozenset[str] = frozenset()
+    inner_max_names: frozenset[str] = frozenset()
+    vectorizable: bool = False
+
+    def evaluate(
+        self,
+        columns: Mapping[str, pd.Series],
+        index: pd.Index,
+        inner_max: Callable[[str, Any], Any] | None = None,
+    ) -> tuple[pd.Series, pd.Series]:
+        """Returns values of rows of index and mask of evaluated rows.
+
+        columns are values of parameter['name'] by name, inner_max gives
+        INNER_MAX['name'] by name and start of the expression."""
+        values = pd.Series(None, index=index, dtype=object)
+        evaluated = pd.Series(False, index=index)
+        if not self.vectorizable or index.empty:
+            return values, evaluated
+
+        context = _Context(columns=columns, index=index, inner_max=inner_max)
+        try:
+            pending = pd.Series(True, index=index)
+            for case in self.cases:
+                matched, valid = context.condition(case.condition)
+                # rows with not evaluated condition are left for rows
+                pending &= valid
+                chosen = pending & matched
+                if chosen.any():
+                    context.assign(values, evaluated, chosen, case.action)
+                pending &= ~matched
+            # rows without matched case and else raise ValueError by rows
+            if self.otherwise is not None and pending.any():
+                context.assign(values, evaluated, pending, self.otherwise)
+        except NotVectorizable:
+            evaluated[:] = False
+        return values, evaluated
+
+
+def _compile_expression(source: str) -> FormulaExpression:
+    if not source or len(source) > MAX_FORMULA_LENGTH:
+        raise NotVectorizable(source)
+    try:
+        node = ast.parse(source, mode="eval")
+    except SyntaxError:
+        raise NotVectorizable(source)
+
+    functions_by_name = {}
+    function_nodes = set()
+    for nd in ast.walk(node.body):
+        if isinstance(nd, ast.Subscript):
+            if not (
+                isinstance(nd.value, ast.Name)
+                and nd.value.id in FUNCTIONS
+                and isinstance(nd.slice, ast.Constant)
+                and isinstance(nd.slice.value, str)
+            ):
+                raise NotVectorizable(source)
+            name = nd.slice.value
+            # evaluate_formula replaces only this spelling by the value and
+            # a name has one value in it for both functions
+            spelling = ast.get_source_segment(source, nd)
+            function = functions_by_name.setdefault(name, nd.value.id)
+            if (
+                spelling != f"{nd.value.id}['{name}']"
+                or function != nd.value.id
+            ):
+                raise NotVectorizable(source)
+            function_nodes.add(nd.value)
+        elif isinstance(nd, ast.Name):
+            if nd not in function_nodes:
+                raise NotVectorizable(source)
+        elif isinstance(nd, ast.Constant):
+            if not isinstance(nd.value, (int, float, str)):
+                raise NotVectorizable(source)
+        elif isinstance(nd, ast.BinOp):
+            if type(nd.op) not in BINARY_OPERATIONS:
+                raise NotVectorizable(source)
+        elif isinstance(nd, ast.UnaryOp):
+            if not isinstance(nd.op, ast.USub):
+                raise NotVectorizable(source)
+        elif not isinstance(nd, (ast.Load, ast.operator, ast.unaryop)):
+            raise NotVectorizable(source)
+
+    inner_max_start = 0
+    if (
+        "INNER_MAX" in functions_by_name.values()
+        and isinstance(node.body, ast.BinOp)
+        and isinstance(node.body.right, ast.Constant)
+    ):
+        inner_max_start = node.body.right.value
+    return FormulaExpression(
+        source=source, node=node, inner_max_start=inner_max_start
+    )
+
+
+def _compile_condition(
+    source: str,
+) -> tuple[tuple[FormulaComparison, ...], ...]:
+    tokens = CONDITION_TOKENS_REGEX.findall(source)
+    if not (tokens and tokens[0][3]):
+        tokens = CONDITION_REGEX.findall(source)[:1]
+        if not tokens:
+            raise NotVectorizable(source)
+        tokens = [(*tokens[0], "")]
+    # all comparisons but the last are followed by "and" / "or"
+    if tokens[-1][3] or not all(token[3] for token in tokens[:-1]):
+        raise NotVectorizable(source)
+
+    groups = [[]]
+    for left, clause, right, joiner in tokens:
+        groups[-1].append(
+            FormulaComparison(
+                left=_compile_expression(left),
+                operator=clause,
+                right=_compile_expression(right),
+            )
+        )
+        if joiner == " or ":
+            groups.append([])
+    return tuple(tuple(group) for group in groups)
+
+
+def compile_formula(constraint: str) -> FormulaPlan:
+    """Parses constraint of formula TPRM into plan. Plan of a constraint
+    which can't be evaluated by columns is not vectorizable."""
+    try:
+        if ";" not in constraint:
+            cases = ()
+            otherwise = _compile_expression(constraint)
+        else:
+            *statements, last_statement = constraint.split(";")
+            cases = []
+            for statement in statements:
+                expression = STATEMENT_REGEX.findall(statement)
+                if not expression or not expression[0][0]:
+                    raise NotVectorizable(statement)
+                current_condition, then_ = expression[0]
+                cases.append(
+                    FormulaCase(
+                        condition=_compile_condition(current_condition),
+                        action=_compile_expression(then_),
+                    )
+                )
+            otherwise = None
+            if last_statement:
+                expression = ELSE_REGEX.findall(last_statement)
+                if not expression:
+                    raise NotVectorizable(last_statement)
+                otherwise = _compile_expression(expression[0])
+    except NotVectorizable:
+        return FormulaPlan(constraint=constraint)
+
+    expressions = [otherwise] if otherwise else []
+    for case in cases:
+        expressions.append(case.action)
+        for group in case.condition:
+            for comparison in group:
+                expressions.extend((comparison.left, comparison.right))
+    names = {"parameter": set(), "INNER_MAX": set()}
+    for expression in expressions:
+        for nd in ast.walk(expression.node):
+            if isinstance(nd, ast.Subscript):
+                names[nd.value.id].add(nd.slice.value)
+    return FormulaPlan(
+        constraint=constraint,
+        cases=tuple(cases),
+        otherwise=otherwise,
+        parameter_names=frozenset(names["parameter"]),
+        inner_max_names=frozenset(names["INNER_MAX"]),
+        vectorizable=True,
+    )
+
+
+@lru_cache(maxsize=FORMULA_PLAN_CACHE_SIZE)
+def _get_formula_plan(
+    tprm_id: int | None, version: int | None, constraint: str
+) -> FormulaPlan:
+    return compile_formula(constraint)
+
+
+def get_formula_plan(tprm: TPRM) -> FormulaPlan:
+    """Plan of formula TPRM cached by id and version of the TPRM"""
+    return _get_formula_plan(tprm.id, tprm.version, tprm.constraint or "")
+
+
+@dataclass
+class _Values:
+    """Values of an expression: a column or a scalar"""
+
+    values: Any
+    is_str: bool
+    # integer values of numbers, evaluate_formula keeps them int
+    is_int: Any = False
+    valid: Any = True
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(
+        value, (bool, int, float, np.integer, np.floating, np.bool_)
+    ) and not pd.isna(value)
+
+
+def _number_values(values: Any, is_int: Any, valid: Any = True) -> _Values:
+    # integers of evaluate_formula are exact and have no negative zero
+    with np.errstate(all="ignore"):
+        if isinstance(is_int, pd.Series):
+            values = values.where(~is_int, values + 0.0)
+        elif is_int:
+            values = values + 0.0
+        valid = valid & ~(is_int & (np.abs(values) >= MAX_EXACT_INTEGER))
+    return _Values(values=values, is_str=False, is_int=is_int, valid=valid)
+
+
+def _float_column_values(column: pd.Series) -> _Values:
+    try:
+        numbers = column.astype(float)
+    except (TypeError, ValueError, OverflowError):
+        raise NotVectorizable()
+    return _number_values(
+        values=numbers,
+        is_int=numbers == np.floor(numbers),
+        valid=numbers.notna(),
+    )
+
+
+def _column_values(column: pd.Series) -> _Values:
+    if column.dtype.kind in "iufb":
+        return _float_column_values(column)
+
+    is_number = column.map(_is_number).astype(bool)
+    is_str = column.map(lambda value: isinstance(value, str)).astype(bool)
+    # column of one kind, values of other kind are left for rows
+    if is_number.sum() >= is_str.sum():
+        result = _float_column_values(column.where(is_number))
+        result.valid &= is_number
+        return result
+    strings = column.where(is_str, "")
+    return _Values(
+        values=strings,
+        is_str=True,
+        valid=is_str & ~strings.str.contains(DATETIME_REGEX, na=False),
+    )
+
+
+def _constant_values(value: Any) -> _Values:
+    if isinstance(value, str):
+        return _Values(values=value, is_str=True)
+    # eval_constant reads integral float as int
+    value = np.float64(value)
+    return _number_values(values=value, is_int=value.is_integer())
+
+
+class _Context:
+    def __init__(
+        self,
+        columns: Mapping[str, pd.Series],
+        index: pd.Index,
+        inner_max: Callable[[str, Any], Any] | None,
+    ):
+        self.columns = columns
+        self.index = index
+        self.inner_max = inner_max
+        self._column_values: dict[str, _Values] = {}
+        self._inner_max_values: dict[tuple[str, Any], _Values] = {}
+
+    def broadcast(self, value: Any, dtype=None) -> pd.Series:
+        if isinstance(value, pd.Series):
+            return value
+        return pd.Series(value, index=self.index, dtype=dtype)
+
+    def get_column(self, name: str) -> _Values:
+        if name not in self._column_values:
+            if name not in self.columns:
+                raise NotVectorizable(name)
+            column = self.columns[name]
+            if not column.index.equals(self.index):
+                column = column.reindex(self.index)
+            self._column_values[name] = _column_values(column)
+        return self._column_values[name]
+
+    def get_inner_max(self, name: str, start: Any) -> _Values:
+        key = (name, start)
+        if key not in self._inner_max_values:
+            if self.inner_max is None:
+                raise NotVectorizable(name)
+            try:
+                value = self.inner_max(name, start)
+            except ValueError:
+                raise NotVectorizable(name)
+            if not _is_number(value):
+                raise NotVectorizable(name)
+            self._inner_max_values[key] = _constant_values(value)
+        return self._inner_max_values[key]
+
+    def expression(self, expression: FormulaExpression) -> _Values:
+        return self._evaluate(expression.node.body, expression)
+
+    def _evaluate(self, node: ast.AST, expression: FormulaExpression):
+        if isinstance(node, ast.Constant):
+            return _constant_values(node.value)
+        if isinstance(node, ast.Subscript):
+            if node.value.id == "INNER_MAX":
+                return self.get_inner_max(
+                    node.slice.value, expression.inner_max_start
+                )
+            return self.get_column(node.slice.value)
+        if isinstance(node, ast.UnaryOp):
+            operand = self._evaluate(node.operand, expression)
+            if operand.is_str:
+                raise NotVectorizable(expression.source)
+            return _number_values(
+                values=-operand.values,
+                is_int=operand.is_int,
+                valid=operand.valid,
+            )
+        if isinstance(node, ast.BinOp):
+            return self._binary(
+                node.op,
+                self._evaluate(node.left, expression),
+                self._evaluate(node.right, expression),
+                expression,
+            )
+        raise NotVectorizable(expression.source)
+
+    def _binary(
+        self,
+        op: ast.operator,
+        left: _Values,
+        right: _Values,
+        expression: FormulaExpression,
+    ) -> _Values:
+        valid = left.valid & right.valid
+        # evaluate_formula adds strings only to strings by rows
+        if left.is_str or right.is_str:
+            if not (left.is_str and right.is_str and isinstance(op, ast.Add)):
+                raise NotVectorizable(expression.source)
+            return _Values(
+                values=left.values + right.values, is_str=True, valid=valid
+            )
+
+        with np.errstate(all="ignore"):
+            values = BINARY_OPERATIONS[type(op)](left.values, right.values)
+        if isinstance(op, ast.Div):
+            # division by zero is None by rows
+            valid = valid & (right.values != 0)
+            is_int = False
+        else:
+            is_int = left.is_int & right.is_int
+        return _number_values(values=values, is_int=is_int, valid=valid)
+
+    def comparison(self, comparison: FormulaComparison) -> tuple:
+        left = self.expression(comparison.left)
+        right = self.expression(comparison.right)
+        valid = left.valid & right.valid
+        if left.is_str != right.is_str:
+            raise NotVectorizable(comparison.left.source)
+        left_values, right_values = left.values, right.values
+        if left.is_str:
+            # _calc_condition compares values quoted in the statement
+            valid = valid & ~self.broadcast(left_values, object).str.contains(
+                NOT_QUOTABLE_REGEX, na=False
+            )
+            valid = valid & ~self.broadcast(right_values, object).str.contains(
+                NOT_QUOTABLE_REGEX, na=False
+            )
+            left_values = self.broadcast(left_values, object).where(valid, "")
+            right_values = self.broadcast(right_values, object).where(valid, "")
+        matched = COMPARISONS[comparison.operator](left_values, right_values)
+        return (
+            self.broadcast(matched, bool).astype(bool),
+            self.broadcast(valid, bool).astype(bool),
+        )
+
+    def condition(
+        self, condition: tuple[tuple[FormulaComparison, ...], ...]
+    ) -> tuple[pd.Series, pd.Series]:
+        matched = pd.Series(False, index=self.index)
+        valid = pd.Series(True, index=self.index)
+        for group in condition:
+            group_matched = pd.Series(True, index=self.index)
+            for comparison in group:
+                comparison_matched, comparison_valid = self.comparison(
+                    comparison
+                )
+                group_matched &= comparison_matched
+                valid &= comparison_valid
+            matched |= group_matched
+        return matched & valid, valid
+
+    def assign(
+        self,
+        values: pd.Series,
+        evaluated: pd.Series,
+        rows: pd.Series,
+        expression: FormulaExpression,
+    ) -> None:
+        result = self.expression(expression)
+        rows = rows & self.broadcast(result.valid, bool).astype(bool)
+        if not rows.any():
+            return
+        result_values = self.broadcast(result.values)[rows]
+        if result.is_str:
+            values[rows] = result_values
+        else:
+            is_int = self.broadcast(result.is_int, bool)[rows]
+            values[rows] = [
+                int(value) if value_is_int else float(value)
+                for value, value_is_int in zip(result_values, is_int)
+            ]
+        evaluated |= rows
@@ -1,30 +1,50 @@
 import ast
+import json
 import pickle
 import re
+from collections import defaultdict
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Any
+from typing import Any, Iterable
 
 import math
 import sqlalchemy
 from fastapi import HTTPException
-from pandas import Series
-from sqlalchemy import func
+from pandas import DataFrame, Index, Series
+from sqlalchemy import (
+    ColumnElement,
+    Select,
+    func,
+    literal,
+    or_,
+)
 from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from common.common_constant import NAME_DELIMITER
+from config import app_config
+from database import get_chunked_values_by_sqlalchemy_limit
+from functions.formula_compiler import get_formula_plan
 from functions.formula_parser import evaluate_formula
-from models import MO, TPRM, PRM, TMO, GeometryType
+from models import (
+    MO,
+    TPRM,
+    PRM,
+    TMO,
+    GeometryType,
+    PRM_MULTIPLE_VALUE_COLUMN,
+    PRM_TYPED_VALUE_COLUMNS,
+)
 from routers.parameter_type_router.schemas import TPRMUpdate
 
 
-def count_objects(
-    session: Session,
+def _count_objects_query(
     object_type_id: int = None,
     mos_ids: list = None,
     p_id: int = None,
     active: bool = True,
-) -> int:
-    count_query = (
+):
+    return (
         select(func.count())
         .select_from(MO)
         .where(
@@ -34,10 +54,36 @@ def count_objects(
             MO.active == active,
         )
     )
+
+
+def count_objects(
+    session: Session,
+    object_type_id: int = None,
+    mos_ids: list = None,
+    p_id: int = None,
+    active: bool = True,
+) -> int:
+    count_query = _count_objects_query(
+        object_type_id=object_type_id, mos_ids=mos_ids, p_id=p_id, active=active
+    )
     quantity = session.exec(count_query).first()
     return quantity
 
 
+async def count_objects_async(
+    session: AsyncSession,
+    object_type_id: int = None,
+    mos_ids: list = None,
+    p_id: int = None,
+    active: bool = True,
+) -> int:
+    count_query = _count_objects_query(
+        object_type_id=object_type_id, mos_ids=mos_ids, p_id=p_id, active=active
+    )
+    quantity = (await session.exec(count_query)).first()
+    return quantity
+
+
 def session_commit_create_or_exception(session: Session, message: str) -> None:
     try:
         session.commit()
@@ -360,7 +406,60 @@ def calculate_by_formula(
     return evaluate_formula(formula, values, parameter)
 
 
+def _multiple_value_json_default(item: Any):
+    # numpy scalars come from pandas based batch processing
+    if hasattr(item, "item"):
+        return item.item()
+    return str(item)
+
+
+def encode_multiple_value(value: Any) -> str:
+    """Serializes the list of a multiple parameter as a JSON array,
+    which postgres exposes as PRM.value_multiple jsonb column"""
+    return json.dumps(list(value), default=_multiple_value_json_default)
+
+
+def is_legacy_multiple_value(value: str) -> bool:
+    """Multiple values stored before the JSON format are pickled hex strings"""
+    return not value.startswith("[")
+
+
+def multiple_value_contains_any_condition(
+    values: Iterable[int | str] | Select,
+) -> ColumnElement:
+    """Returns condition for PRMs whose multiple link value contains at least
+    one of values (ids or a select of ids casted to string).
+    Until MULTIPLE_VALUES_LEGACY_ROWS is turned off, PRMs with legacy pickled
+    values are matched as well and have to be checked by the caller after
+    decoding"""
+    if not isinstance(values, Select):
+        values = [str(value) for value in values]
+
+    if isinstance(values, list) and len(values) == 1:
+        # served by the GIN index of value_multiple
+        condition = PRM_MULTIPLE_VALUE_COLUMN.contains([int(values[0])])
+    else:
+        elements = (
+            func.jsonb_array_elements_text(PRM_MULTIPLE_VALUE_COLUMN)
+            .table_valued("value")
+            .render_derived()
+        )
+        condition = (
+            select(literal(1))
+            .select_from(elements)
+            .where(elements.c.value.in_(values))
+            .exists()
+        )
+
+    if app_config.MULTIPLE_VALUES_LEGACY_ROWS:
+        # IS NULL arm does not allow to use the index
+        return or_(PRM_MULTIPLE_VALUE_COLUMN.is_(None), condition)
+    return condition
+
+
 def decode_multiple_value(value: Any):
+    if not is_legacy_multiple_value(value):
+        return json.loads(value)
     multiple_value_bytes = bytes.fromhex(value)
     multiple_value = pickle.loads(multiple_value_bytes)
     return multiple_value
@@ -513,6 +612,55 @@ def find_deep_parent(
         return None, None
 
 
+# values which int() reads, INNER_MAX reads only them
+INT_VALUE_PATTERN = r"^\s*[-+]?[0-9]+\s*$"
+
+
+@dataclass(frozen=True)
+class ParameterAggregate:
+    """Aggregates of integer values of parameters of a TPRM"""
+
+    count: int = 0
+    not_int_count: int = 0
+    max: int | None = None
+    min: int | None = None
+
+
+def get_parameter_aggregates(
+    session: Session, tprm_ids: Iterable[int]
+) -> dict[int, ParameterAggregate]:
+    """Aggregates of parameters by TPRM id in one query. Values are read from
+    value_numeric, which the prm_fill_typed_values trigger keeps current on
+    every insert and update of PRM"""
+    tprm_ids = list(tprm_ids)
+    if not tprm_ids:
+        return {}
+    is_int = PRM.value.regexp_match(INT_VALUE_PATTERN)
+    value_numeric = PRM_TYPED_VALUE_COLUMNS["numeric"]
+    stmt = (
+        select(
+            PRM.tprm_id,
+            func.count(),
+            func.count().filter(~is_int),
+            func.max(value_numeric).filter(is_int),
+            func.min(value_numeric).filter(is_int),
+        )
+        .where(PRM.tprm_id.in_(tprm_ids))
+        .group_by(PRM.tprm_id)
+    )
+    result = {tprm_id: ParameterAggregate() for tprm_id in tprm_ids}
+    for tprm_id, count, not_int_count, max_value, min_value in session.execute(
+        stmt
+    ):
+        result[tprm_id] = ParameterAggregate(
+            count=count,
+            not_int_count=not_int_count,
+            max=int(max_value) if max_value is not None else None,
+            min=int(min_value) if min_value is not None else None,
+        )
+    return result
+
+
 def evaluate_prm_value(
     session: Session, names: list, mo: MO, function_names: list, extra: dict
 ) -> (dict, dict):
@@ -561,9 +709,7 @@ def evaluate_prm_value(
                 value = str(param.value)
         elif name != "x" and function_names[i] == "INNER_MAX":
             tprm = session.exec(
-                select(TPRM)
-                .outerjoin(PRM)
-                .where(
+                select(TPRM).where(
                     TPRM.name == name,
                     TPRM.multiple != True,  # noqa
                     TPRM.tmo_id == mo.tmo_id,
@@ -572,13 +718,17 @@ def evaluate_prm_value(
             if tprm:
                 match tprm.val_type:
                     case "int" | "formula":
-                        value = int(
-                            max(
-                                [prm.value for prm in tprm.prms],
-                                default=extra.get("INNER_MAX_VALUE", 0) * -1,
-                                key=int,
+                        aggregate = get_parameter_aggregates(
+                            session=session, tprm_ids=[tprm.id]
+                        )[tprm.id]
+                        if aggregate.not_int_count:
+                            raise ValueError(
+                                f"Not integer values of tprm '{name}' for "
+                                f"function {function_names[i]}"
                             )
-                        )
+                        value = aggregate.max
+                        if value is None:
+                            value = int(extra.get("INNER_MAX_VALUE", 0) * -1)
                     case _:
                         raise ValueError(
                             f"Incorrect tprm '{name}' val type for function {function_names[i]}"
@@ -754,6 +904,104 @@ def calculate_by_formula_new(
     return _correct_formula_result_type(result)
 
 
+def get_formula_parameter_columns(
+    session: Session, names: Iterable[str], mo_ids: Iterable[int]
+) -> dict[str, Series]:
+    """Values of single parameters by TPRM names for objects, converted as
+    evaluate_prm_value converts them for one object"""
+    # evaluate_prm_value looks for TPRM name with spaces when there is no
+    # parameter with the name
+    names_by_tprm_name = defaultdict(list)
+    for name in names:
+        names_by_tprm_name[name].append(name)
+        if name.replace("_", " ") != name:
+            names_by_tprm_name[name.replace("_", " ")].append(name)
+    if not names_by_tprm_name:
+        return {}
+
+    values_by_name: dict[str, dict[int, Any]] = defaultdict(dict)
+    exact_names = set()
+    link_ids_by_name: dict[str, dict[int, int]] = defaultdict(dict)
+    for mo_ids_chunk in get_chunked_values_by_sqlalchemy_limit(mo_ids):
+        stmt = (
+            select(PRM.mo_id, PRM.value, TPRM.name, TPRM.val_type)
+            .join(TPRM)
+            .where(
+                PRM.mo_id.in_(mo_ids_chunk),
+                TPRM.name.in_(list(names_by_tprm_name)),
+                TPRM.multiple != True,  # noqa
+            )
+        )
+        for mo_id, value, tprm_name, val_type in session.execute(stmt):
+            for name in names_by_tprm_name[tprm_name]:
+                if (name, mo_id) in exact_names:
+                    continue
+                if name == tprm_name:
+                    exact_names.add((name, mo_id))
+                # not converted values are missing, the object is calculated
+                # by calculate_by_formula_new
+                try:
+                    if val_type in ["int", "float"]:
+                        value_by_type = float(value)
+                    elif val_type == "bool":
+                        value_by_type = value == "True"
+                    elif val_type == "mo_link":
+                        link_ids_by_name[name][mo_id] = int(value)
+                        continue
+                    else:
+                        value_by_type = str(value)
+                except ValueError:
+                    value_by_type = None
+                values_by_name[name][mo_id] = value_by_type
+                link_ids_by_name[name].pop(mo_id, None)
+
+    link_ids = {
+        link_id
+        for link_ids_by_mo in link_ids_by_name.values()
+        for link_id in link_ids_by_mo.values()
+    }
+    link_names = {}
+    for link_ids_chunk in get_chunked_values_by_sqlalchemy_limit(link_ids):
+        stmt = select(MO.id, MO.name).where(MO.id.in_(link_ids_chunk))
+        link_names.update(session.execute(stmt).all())
+    for name, link_ids_by_mo in link_ids_by_name.items():
+        for mo_id, link_id in link_ids_by_mo.items():
+            values_by_name[name][mo_id] = str(link_names.get(link_id))
+
+    return {
+        name: Series(values_by_mo, dtype=object)
+        for name, values_by_mo in values_by_name.items()
+    }
+
+
+def calculate_by_formula_for_objects(
+    session: Session, param_type: TPRM, objects: list[MO]
+) -> dict[int, Any]:
+    """Values of formula for objects by object id. Formula plan evaluates
+    objects by columns of parameter values, other objects are calculated by
+    calculate_by_formula_new"""
+    plan = get_formula_plan(param_type)
+    index = Index(list(dict.fromkeys(mo.id for mo in objects)))
+    values = evaluated = Series(dtype=object)
+    if plan.vectorizable:
+        columns = get_formula_parameter_columns(
+            session=session, names=plan.parameter_names, mo_ids=index.tolist()
+        )
+        values, evaluated = plan.evaluate(columns=columns, index=index)
+
+    result = {}
+    for mo in objects:
+        if mo.id in result:
+            continue
+        if evaluated.get(mo.id, False):
+            result[mo.id] = values[mo.id]
+        else:
+            result[mo.id] = calculate_by_formula_new(
+                session=session, param_type=param_type, object_instance=mo
+            )
+    return result
+
+
 def formula_case(
     session: Session, input_formula: str, mo: MO, extra: dict = {}
 ) -> Any:
@@ -808,6 +1056,7 @@ def calculate_by_formula_batch(
     formula_tprm: TPRM,
     prm_data: dict[str, Any] | Series,
     tprms_from_formula_by_name: dict[str, TPRM],
+    parameter_aggregates: dict[int, ParameterAggregate] | None = None,
 ) -> Any:
     """Calculate formula for batch without MO"""
     if not formula_tprm.constraint:
@@ -846,6 +1095,8 @@ def calculate_by_formula_batch(
                             clause_=clause_,
                             tmo_id=formula_tprm.tmo_id,
                             prm_data=prm_data,
+                            tprms_from_formula_by_name=tprms_from_formula_by_name,
+                            parameter_aggregates=parameter_aggregates,
                         )
                         if temp_cond_result is not None:
                             all_bool_result.append(temp_cond_result)
@@ -877,6 +1128,7 @@ def calculate_by_formula_batch(
                             tmo_id=formula_tprm.tmo_id,
                             prm_data=prm_data,
                             tprms_from_formula_by_name=tprms_from_formula_by_name,
+                            parameter_aggregates=parameter_aggregates,
                         )
                         if condition_result is None:
                             continue
@@ -889,6 +1141,7 @@ def calculate_by_formula_batch(
                         tmo_id=formula_tprm.tmo_id,
                         prm_data=prm_data,
                         tprms_from_formula_by_name=tprms_from_formula_by_name,
+                        parameter_aggregates=parameter_aggregates,
                     )
                 except ValueError:
                     if formula_tprm.required:
@@ -910,6 +1163,7 @@ def calculate_by_formula_batch(
                         tmo_id=formula_tprm.tmo_id,
                         prm_data=prm_data,
                         tprms_from_formula_by_name=tprms_from_formula_by_name,
+                        parameter_aggregates=parameter_aggregates,
                     )
                 except ValueError:
                     if formula_tprm.required:
@@ -930,6 +1184,7 @@ def calculate_by_formula_batch(
                 tmo_id=formula_tprm.tmo_id,
                 prm_data=prm_data,
                 tprms_from_formula_by_name=tprms_from_formula_by_name,
+                parameter_aggregates=parameter_aggregates,
             )
         except ValueError:
             if formula_tprm.required:
@@ -942,12 +1197,65 @@ def calculate_by_formula_batch(
     return _correct_formula_result_type(result)
 
 
+def calculate_by_formula_batch_frame(
+    session: Session,
+    formula_tprm: TPRM,
+    frame: DataFrame,
+    tprms_from_formula_by_name: dict[str, TPRM],
+    parameter_aggregates: dict[int, ParameterAggregate] | None = None,
+) -> tuple[Series, list]:
+    """Calculate formula for all rows of batch. Formula plan evaluates rows
+    by columns, other rows are calculated by calculate_by_formula_batch.
+    Aggregates of INNER_MAX TPRMs are read once and kept in
+    parameter_aggregates for other formulas of the batch.
+    Returns values by row index and indexes of rows with not valid values"""
+    if parameter_aggregates is None:
+        parameter_aggregates = {}
+    plan = get_formula_plan(formula_tprm)
+    columns = {
+        name: frame[str(tprm.id)]
+        for name, tprm in tprms_from_formula_by_name.items()
+        if name in plan.parameter_names and str(tprm.id) in frame.columns
+    }
+
+    def inner_max(name: str, start: Any) -> Any:
+        values, _ = evaluate_prm_value_batch(
+            session=session,
+            names=[name],
+            function_names=["INNER_MAX"],
+            prm_data={},
+            extra={"INNER_MAX_VALUE": start},
+            tprm_by_name=tprms_from_formula_by_name,
+            parameter_aggregates=parameter_aggregates,
+        )
+        return values[name]
+
+    values, evaluated = plan.evaluate(
+        columns=columns, index=frame.index, inner_max=inner_max
+    )
+    not_valid_indexes = []
+    for index, row in frame[~evaluated.values].iterrows():
+        row = {column_name: value for column_name, value in row.items()}
+        try:
+            values[index] = calculate_by_formula_batch(
+                session=session,
+                formula_tprm=formula_tprm,
+                prm_data=row,
+                tprms_from_formula_by_name=tprms_from_formula_by_name,
+                parameter_aggregates=parameter_aggregates,
+            )
+        except ValueError:
+            not_valid_indexes.append(index)
+    return values, not_valid_indexes
+
+
 def formula_case_solver_batch(
     session: Session,
     constraint: str,
     tmo_id: int,
     prm_data: dict,
     tprms_from_formula_by_name: dict[str, TPRM],
+    parameter_aggregates: dict[int, ParameterAggregate] | None = None,
 ) -> Any:
     values = {}
     parameter = {}
@@ -987,6 +1295,7 @@ def formula_case_solver_batch(
                 prm_data=prm_data,
                 extra=extra,
                 tprm_by_name=tprms_from_formula_by_name,
+                parameter_aggregates=parameter_aggregates,
             )
 
     except ValueError:
@@ -1006,9 +1315,14 @@ def evaluate_prm_value_batch(
     prm_data: dict[str, Any],
     extra: dict,
     tprm_by_name: dict[str, TPRM],
+    parameter_aggregates: dict[int, ParameterAggregate] | None = None,
 ) -> tuple[dict, dict]:
+    """Values of names of formula for a row of batch. parameter_aggregates are
+    aggregates of TPRMs read for previous rows of the batch"""
     if not names:
         return {}, {}
+    if parameter_aggregates is None:
+        parameter_aggregates = {}
     if len(names) != len(function_names):
         raise ValueError("names and function_names must be the same length")
 
@@ -1053,21 +1367,13 @@ def evaluate_prm_value_batch(
                 f"Incorrect tprm '{tprm.name}' val type for function INNER_MAX"
             )
         default_base = int(extra.get("INNER_MAX_VALUE", 0)) * -1
-        if not tprm.prms:
-            return int(default_base)
-        try:
-            return int(
-                max((int(p.value) for p in tprm.prms), default=default_base)
+        if tprm.id not in parameter_aggregates:
+            parameter_aggregates.update(
+                get_parameter_aggregates(session=session, tprm_ids=[tprm.id])
             )
-        except Exception:
-            vals = []
-            for p in tprm.prms:
-                try:
-                    vals.append(int(p.value))
-                except Exception as e:
-                    print(e)
-                    continue
-            return int(max(vals)) if vals else int(default_base)
+        # values which are not integers are skipped
+        max_value = parameter_aggregates[tprm.id].max
+        return max_value if max_value is not None else default_base
 
     values: dict[str, Any] = {}
     parameter: dict[str, Any] = {}
@@ -1131,6 +1437,7 @@ def _calc_condition_batch(
     tmo_id: int,
     prm_data: dict,
     tprms_from_formula_by_name: dict[str, TPRM],
+    parameter_aggregates: dict[int, ParameterAggregate] | None = None,
 ) -> bool | None:
     """Calc left and right conditions in the statement, then eval bool result for statement"""
     try:
@@ -1140,6 +1447,7 @@ def _calc_condition_batch(
             tmo_id=tmo_id,
             prm_data=prm_data,
             tprms_from_formula_by_name=tprms_from_formula_by_name,
+            parameter_aggregates=parameter_aggregates,
         )
         right_value = formula_case_solver_batch(
             session=session,
@@ -1147,6 +1455,7 @@ def _calc_condition_batch(
             tmo_id=tmo_id,
             prm_data=prm_data,
             tprms_from_formula_by_name=tprms_from_formula_by_name,
+            parameter_aggregates=parameter_aggregates,
         )
     except ValueError:
         return
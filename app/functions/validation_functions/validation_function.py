@@ -1,4 +1,3 @@
-import pickle
 import re
 from datetime import datetime
 from typing import Any
@@ -322,7 +321,7 @@ def params_validation_and_convertation_when_change_val_type(
                     db_param = db_read.get_db_param_or_exception(
                         session=session, prm_id=param.id
                     )
-                    new_value = pickle.dumps(multiple_value).hex()
+                    new_value = utils.encode_multiple_value(multiple_value)
                     db_param.value = new_value
                     session.add(db_param)
             else:
@@ -1,5 +1,3 @@
-import pickle
-
 from sqlmodel import Session, select
 
 from functions.db_functions import db_read
@@ -13,7 +11,7 @@ def update_parameter_multiple_value_for_str(
 ):
     session.info["disable_security"] = True
     db_param = db_read.get_db_param_or_exception(session=session, prm_id=prm_id)
-    new_value = pickle.dumps(multiple_value).hex()
+    new_value = utils.encode_multiple_value(multiple_value)
     db_param.value = new_value
     session.add(db_param)
 
@@ -40,12 +38,12 @@ def delete_parameter_by_prm_link_value(session: Session, param):
     for prm_link_tprm in prm_link_tprms:
         for prm_link in prm_link_tprm.prms:
             if prm_link_tprm.multiple:
-                prm_link_value = pickle.loads(bytes.fromhex(prm_link.value))
+                prm_link_value = utils.decode_multiple_value(prm_link.value)
                 prm_link_value = [
                     value for value in prm_link_value if value != param.id
                 ]
                 if prm_link_value:
-                    prm_link.value = pickle.dumps(prm_link_value).hex()
+                    prm_link.value = utils.encode_multiple_value(prm_link_value)
                     session.add(prm_link)
                 else:
                     session.delete(prm_link)
@@ -37,8 +37,14 @@ async def run_migrations_online():
             )
         )
 
-        async with connection.begin():
-            await connection.run_sync(lambda _: context.run_migrations())
+        # alembic manages the transaction, so migrations can use
+        # autocommit_block() (e.g. CREATE INDEX CONCURRENTLY)
+        await connection.run_sync(lambda _: run_migrations_in_transaction())
+
+
+def run_migrations_in_transaction():
+    with context.begin_transaction():
+        context.run_migrations()
 
 
 def run_migrations_offline():
@@ -0,0 +1,152 @@
+"""prm typed value columns
+
+Adds typed copies of prm.value (numeric, date, timestamp, bool) kept in sync
+by the prm_fill_typed_values trigger, and (tprm_id, typed value, mo_id)
+indexes for them.
+prm is not rewritten and stays available: nullable columns are added by one
+ALTER TABLE without a default, existing rows are filled in committed batches
+and indexes are built concurrently.
+
+Revision ID: 4f2b8c1d9e7a
+Revises: 29b83250b3e6
+Create Date: 2026-10-17 09:12:41.528113
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4f2b8c1d9e7a'
+down_revision = '29b83250b3e6'
+branch_labels = None
+depends_on = None
+
+
+TYPED_COLUMNS = [
+    ('value_numeric', sa.Numeric(), 'prm_value_to_numeric'),
+    ('value_date', sa.Date(), 'prm_value_to_date'),
+    ('value_datetime', sa.DateTime(), 'prm_value_to_timestamp'),
+    ('value_bool', sa.Boolean(), 'prm_value_to_bool'),
+]
+
+FUNCTIONS = [
+    r"""
+    CREATE OR REPLACE FUNCTION prm_value_to_numeric(value text) RETURNS numeric
+    LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+        SELECT CASE
+            WHEN value ~ '^\s*[-+]?([0-9]+\.?[0-9]*|\.[0-9]+)([eE][-+]?[0-9]{1,4})?\s*$'
+            THEN value::numeric
+        END
+    $$
+    """,
+    r"""
+    CREATE OR REPLACE FUNCTION prm_value_to_date(value text) RETURNS date
+    LANGUAGE plpgsql IMMUTABLE PARALLEL SAFE AS $$
+    BEGIN
+        IF value ~ '^\d{4}-\d{1,2}-\d{1,2}$' THEN
+            BEGIN
+                RETURN to_date(value, 'YYYY-MM-DD');
+            EXCEPTION WHEN others THEN
+                RETURN NULL;
+            END;
+        END IF;
+        RETURN NULL;
+    END;
+    $$
+    """,
+    r"""
+    CREATE OR REPLACE FUNCTION prm_value_to_timestamp(value text) RETURNS timestamp
+    LANGUAGE plpgsql IMMUTABLE PARALLEL SAFE AS $$
+    BEGIN
+        IF value ~ '^\d{4}-\d{1,2}-\d{1,2}([T ]\d{1,2}:\d{1,2}(:\d{1,2}(\.\d{1,6})?)?)?Z?$' THEN
+            BEGIN
+                RETURN rtrim(value, 'Z')::timestamp;
+            EXCEPTION WHEN others THEN
+                RETURN NULL;
+            END;
+        END IF;
+        RETURN NULL;
+    END;
+    $$
+    """,
+    r"""
+    CREATE OR REPLACE FUNCTION prm_value_to_bool(value text) RETURNS boolean
+    LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+        SELECT CASE lower(value) WHEN 'true' THEN true WHEN 'false' THEN false END
+    $$
+    """,
+]
+
+
+TRIGGER_FUNCTION = """
+    CREATE OR REPLACE FUNCTION prm_fill_typed_values() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        NEW.value_numeric := prm_value_to_numeric(NEW.value);
+        NEW.value_date := prm_value_to_date(NEW.value);
+        NEW.value_datetime := prm_value_to_timestamp(NEW.value);
+        NEW.value_bool := prm_value_to_bool(NEW.value);
+        RETURN NEW;
+    END;
+    $$
+    """
+
+TRIGGER = """
+    CREATE TRIGGER prm_fill_typed_values
+    BEFORE INSERT OR UPDATE OF value ON prm
+    FOR EACH ROW EXECUTE FUNCTION prm_fill_typed_values()
+    """
+
+BACKFILL_BATCH_SIZE = 50_000
+
+
+def upgrade():
+    for function_ddl in FUNCTIONS:
+        op.execute(function_ddl)
+    op.execute(
+        'ALTER TABLE prm '
+        + ', '.join(
+            f'ADD COLUMN {column_name} {column_type.compile(dialect=op.get_bind().dialect)}'
+            for column_name, column_type, _ in TYPED_COLUMNS
+        )
+    )
+    op.execute(TRIGGER_FUNCTION)
+    op.execute(TRIGGER)
+
+    # rows written from now on are filled by the trigger
+    with op.get_context().autocommit_block():
+        bind = op.get_bind()
+        min_id, max_id = bind.execute(
+            sa.text('SELECT min(id), max(id) FROM prm')
+        ).one()
+        set_values = ', '.join(
+            f'{column_name} = {function_name}(value)'
+            for column_name, _, function_name in TYPED_COLUMNS
+        )
+        for start_id in range(min_id or 0, (max_id or 0) + 1, BACKFILL_BATCH_SIZE):
+            bind.execute(
+                sa.text(
+                    f'UPDATE prm SET {set_values} '
+                    'WHERE id >= :start_id AND id < :end_id'
+                ),
+                {'start_id': start_id, 'end_id': start_id + BACKFILL_BATCH_SIZE},
+            )
+
+        for column_name, _, _ in TYPED_COLUMNS:
+            op.create_index(
+                f'ix_prm_tprm_id_{column_name}_mo_id',
+                'prm',
+                ['tprm_id', column_name, 'mo_id'],
+                unique=False,
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade():
+    op.execute('DROP TRIGGER IF EXISTS prm_fill_typed_values ON prm')
+    op.execute('DROP FUNCTION IF EXISTS prm_fill_typed_values()')
+    for column_name, _, function_name in reversed(TYPED_COLUMNS):
+        op.drop_index(f'ix_prm_tprm_id_{column_name}_mo_id', table_name='prm')
+        op.drop_column('prm', column_name)
+        op.execute(f'DROP FUNCTION IF EXISTS {function_name}(text)')
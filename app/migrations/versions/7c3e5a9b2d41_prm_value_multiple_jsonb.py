@@ -0,0 +1,110 @@
+"""prm value multiple jsonb
+
+Adds prm.value_multiple, a jsonb copy of multiple values filled by the
+prm_fill_typed_values trigger from the JSON array stored in prm.value, and a
+GIN index for containment queries. As for the typed value columns, prm is
+not rewritten: existing rows are filled in committed batches and the index
+is built concurrently. Rows which still hold pickled values stay NULL until
+they are converted with app/run_convert_multiple_parameter_values.py.
+
+Revision ID: 7c3e5a9b2d41
+Revises: 4f2b8c1d9e7a
+Create Date: 2026-10-17 11:03:27.904512
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '7c3e5a9b2d41'
+down_revision = '4f2b8c1d9e7a'
+branch_labels = None
+depends_on = None
+
+
+FUNCTION = r"""
+    CREATE OR REPLACE FUNCTION prm_value_to_jsonb_array(value text) RETURNS jsonb
+    LANGUAGE plpgsql IMMUTABLE PARALLEL SAFE AS $$
+    DECLARE
+        result jsonb;
+    BEGIN
+        IF value ~ '^\[.*\]$' THEN
+            BEGIN
+                result := value::jsonb;
+            EXCEPTION WHEN others THEN
+                RETURN NULL;
+            END;
+            IF jsonb_typeof(result) = 'array' THEN
+                RETURN result;
+            END IF;
+        END IF;
+        RETURN NULL;
+    END;
+    $$
+    """
+
+
+TRIGGER_FUNCTION = """
+    CREATE OR REPLACE FUNCTION prm_fill_typed_values() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        NEW.value_numeric := prm_value_to_numeric(NEW.value);
+        NEW.value_date := prm_value_to_date(NEW.value);
+        NEW.value_datetime := prm_value_to_timestamp(NEW.value);
+        NEW.value_bool := prm_value_to_bool(NEW.value);
+        {multiple_value}
+        RETURN NEW;
+    END;
+    $$
+    """
+
+BACKFILL_BATCH_SIZE = 50_000
+
+
+def upgrade():
+    op.execute(FUNCTION)
+    op.add_column(
+        'prm',
+        sa.Column('value_multiple', postgresql.JSONB(astext_type=sa.Text())),
+    )
+    op.execute(
+        TRIGGER_FUNCTION.format(
+            multiple_value=(
+                'NEW.value_multiple := prm_value_to_jsonb_array(NEW.value);'
+            )
+        )
+    )
+
+    with op.get_context().autocommit_block():
+        bind = op.get_bind()
+        min_id, max_id = bind.execute(
+            sa.text('SELECT min(id), max(id) FROM prm')
+        ).one()
+        for start_id in range(min_id or 0, (max_id or 0) + 1, BACKFILL_BATCH_SIZE):
+            bind.execute(
+                sa.text(
+                    'UPDATE prm '
+                    'SET value_multiple = prm_value_to_jsonb_array(value) '
+                    "WHERE id >= :start_id AND id < :end_id AND value LIKE '[%'"
+                ),
+                {'start_id': start_id, 'end_id': start_id + BACKFILL_BATCH_SIZE},
+            )
+
+        op.create_index(
+            'ix_prm_value_multiple',
+            'prm',
+            ['value_multiple'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={'value_multiple': 'jsonb_path_ops'},
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade():
+    op.execute(TRIGGER_FUNCTION.format(multiple_value=''))
+    op.drop_index('ix_prm_value_multiple', table_name='prm')
+    op.drop_column('prm', 'value_multiple')
+    op.execute('DROP FUNCTION IF EXISTS prm_value_to_jsonb_array(text)')
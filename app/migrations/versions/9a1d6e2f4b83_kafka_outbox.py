@@ -0,0 +1,52 @@
+"""kafka outbox
+
+Adds kafka_outbox table. Changes of TMO, TPRM, MO and PRM are stored there
+in the transaction of the change and are sent to Kafka by the outbox relay.
+kafka_outbox_relay_metrics keeps counters of the relay.
+
+Revision ID: 9a1d6e2f4b83
+Revises: 7c3e5a9b2d41
+Create Date: 2026-10-17 13:41:05.217634
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9a1d6e2f4b83'
+down_revision = '7c3e5a9b2d41'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'kafka_outbox',
+        sa.Column('id', sa.BigInteger(), nullable=False),
+        sa.Column('class_name', sa.String(), nullable=False),
+        sa.Column('event', sa.String(), nullable=False),
+        sa.Column('user_id', sa.String(), nullable=True),
+        sa.Column('session_id', sa.String(), nullable=True),
+        sa.Column('payload', sa.LargeBinary(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_table(
+        'kafka_outbox_relay_metrics',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('batches', sa.BigInteger(), nullable=False),
+        sa.Column('failed_batches', sa.BigInteger(), nullable=False),
+        sa.Column('sent_rows', sa.BigInteger(), nullable=False),
+        sa.Column('delivered_messages', sa.BigInteger(), nullable=False),
+        sa.Column('failed_messages', sa.BigInteger(), nullable=False),
+        sa.Column('lag_seconds', sa.Float(), nullable=True),
+        sa.Column('rows_per_second', sa.Float(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+    )
+
+
+def downgrade():
+    op.drop_table('kafka_outbox_relay_metrics')
+    op.drop_table('kafka_outbox')
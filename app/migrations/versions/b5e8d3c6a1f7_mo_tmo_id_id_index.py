@@ -0,0 +1,33 @@
+"""mo tmo_id id index
+
+Adds (tmo_id, id) index on mo for keyset pages of objects of one TMO
+(GraphInformer.GetMOsByTMOidPages). The index is built concurrently.
+
+Revision ID: b5e8d3c6a1f7
+Revises: 9a1d6e2f4b83
+Create Date: 2026-10-17 16:02:47.311925
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'b5e8d3c6a1f7'
+down_revision = '9a1d6e2f4b83'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_mo_tmo_id_id',
+            'mo',
+            ['tmo_id', 'id'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade():
+    op.drop_index('ix_mo_tmo_id_id', table_name='mo')
@@ -0,0 +1,34 @@
+"""events event_type id index
+
+Adds (event_type, id) index on events for replay of events of a type by id
+cursor (EventManagerInformer.ReplayEvents). The index is built
+concurrently.
+
+Revision ID: c7f2a9e4d8b1
+Revises: b5e8d3c6a1f7
+Create Date: 2026-10-17 18:24:09.530712
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'c7f2a9e4d8b1'
+down_revision = 'b5e8d3c6a1f7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_events_event_type_id',
+            'events',
+            ['event_type', 'id'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade():
+    op.drop_index('ix_events_event_type_id', table_name='events')
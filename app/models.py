@@ -4,7 +4,10 @@ from typing import Optional, List, Dict
 
 from google.protobuf import timestamp_pb2, struct_pb2
 from sqlalchemy import (
+    BigInteger,
+    Float,
     Column,
+    LargeBinary,
     String,
     Integer,
     DateTime,
@@ -14,6 +17,10 @@ from sqlalchemy import (
     false,
     ARRAY,
     Index,
+    Numeric,
+    Date,
+    DDL,
+    event,
 )
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.declarative import declarative_base
@@ -301,6 +308,10 @@ class MO(MOBase, table=True):
         return res
 
 
+# Pages of objects of one TMO are read in id order after the last read id
+Index("ix_mo_tmo_id_id", MO.__table__.c.tmo_id, MO.__table__.c.id)
+
+
 class TPRMBase(SQLModel):
     name: str = Field(index=True)
     description: Optional[str] = Field(default=None)
@@ -451,6 +462,137 @@ class PRM(PRMBase, table=True):
         return res
 
 
+# Typed copies of PRM.value. They are filled by the prm_fill_typed_values
+# trigger on every write (ORM, bulk inserts, COPY, raw UPDATE), so no write
+# path has to maintain them. Values which can not be converted are stored
+# as NULL. Plain columns with a trigger (instead of generated columns) can be
+# added to an existing table without rewriting it.
+# The columns are not mapped to the PRM model (responses are not changed);
+# use them through PRM_TYPED_VALUE_COLUMNS in filters and sorting.
+PRM_TYPED_VALUE_FUNCTIONS_DDL = (
+    r"""
+    CREATE OR REPLACE FUNCTION prm_value_to_numeric(value text) RETURNS numeric
+    LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+        SELECT CASE
+            WHEN value ~ '^\s*[-+]?([0-9]+\.?[0-9]*|\.[0-9]+)([eE][-+]?[0-9]{1,4})?\s*$'
+            THEN value::numeric
+        END
+    $$
+    """,
+    r"""
+    CREATE OR REPLACE FUNCTION prm_value_to_date(value text) RETURNS date
+    LANGUAGE plpgsql IMMUTABLE PARALLEL SAFE AS $$
+    BEGIN
+        IF value ~ '^\d{4}-\d{1,2}-\d{1,2}$' THEN
+            BEGIN
+                RETURN to_date(value, 'YYYY-MM-DD');
+            EXCEPTION WHEN others THEN
+                RETURN NULL;
+            END;
+        END IF;
+        RETURN NULL;
+    END;
+    $$
+    """,
+    r"""
+    CREATE OR REPLACE FUNCTION prm_value_to_timestamp(value text) RETURNS timestamp
+    LANGUAGE plpgsql IMMUTABLE PARALLEL SAFE AS $$
+    BEGIN
+        IF value ~ '^\d{4}-\d{1,2}-\d{1,2}([T ]\d{1,2}:\d{1,2}(:\d{1,2}(\.\d{1,6})?)?)?Z?$' THEN
+            BEGIN
+                RETURN rtrim(value, 'Z')::timestamp;
+            EXCEPTION WHEN others THEN
+                RETURN NULL;
+            END;
+        END IF;
+        RETURN NULL;
+    END;
+    $$
+    """,
+    r"""
+    CREATE OR REPLACE FUNCTION prm_value_to_bool(value text) RETURNS boolean
+    LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+        SELECT CASE lower(value) WHEN 'true' THEN true WHEN 'false' THEN false END
+    $$
+    """,
+    r"""
+    CREATE OR REPLACE FUNCTION prm_value_to_jsonb_array(value text) RETURNS jsonb
+    LANGUAGE plpgsql IMMUTABLE PARALLEL SAFE AS $$
+    DECLARE
+        result jsonb;
+    BEGIN
+        IF value ~ '^\[.*\]$' THEN
+            BEGIN
+                result := value::jsonb;
+            EXCEPTION WHEN others THEN
+                RETURN NULL;
+            END;
+            IF jsonb_typeof(result) = 'array' THEN
+                RETURN result;
+            END IF;
+        END IF;
+        RETURN NULL;
+    END;
+    $$
+    """,
+)
+
+PRM_TYPED_VALUE_TRIGGER_DDL = (
+    """
+    CREATE OR REPLACE FUNCTION prm_fill_typed_values() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        NEW.value_numeric := prm_value_to_numeric(NEW.value);
+        NEW.value_date := prm_value_to_date(NEW.value);
+        NEW.value_datetime := prm_value_to_timestamp(NEW.value);
+        NEW.value_bool := prm_value_to_bool(NEW.value);
+        NEW.value_multiple := prm_value_to_jsonb_array(NEW.value);
+        RETURN NEW;
+    END;
+    $$
+    """,
+    """
+    CREATE TRIGGER prm_fill_typed_values
+    BEFORE INSERT OR UPDATE OF value ON prm
+    FOR EACH ROW EXECUTE FUNCTION prm_fill_typed_values()
+    """,
+)
+
+for _function_ddl in PRM_TYPED_VALUE_FUNCTIONS_DDL:
+    event.listen(PRM.__table__, "before_create", DDL(_function_ddl))
+event.listen(
+    PRM.__table__, "before_create", DDL(PRM_TYPED_VALUE_TRIGGER_DDL[0])
+)
+event.listen(PRM.__table__, "after_create", DDL(PRM_TYPED_VALUE_TRIGGER_DDL[1]))
+
+PRM_TYPED_VALUE_COLUMNS = {
+    "numeric": Column("value_numeric", Numeric),
+    "date": Column("value_date", Date),
+    "datetime": Column("value_datetime", DateTime),
+    "bool": Column("value_bool", Boolean),
+}
+for _typed_column in PRM_TYPED_VALUE_COLUMNS.values():
+    PRM.__table__.append_column(_typed_column)
+    Index(
+        f"ix_prm_tprm_id_{_typed_column.name}_mo_id",
+        PRM.__table__.c.tprm_id,
+        _typed_column,
+        PRM.__table__.c.mo_id,
+    )
+
+# Multiple values are stored in PRM.value as a JSON array (legacy rows hold
+# a pickled hex string and are NULL here until they are converted).
+# The GIN index serves containment lookups like "value_multiple @> '[id]'".
+PRM_MULTIPLE_VALUE_COLUMN = Column("value_multiple", JSONB)
+PRM.__table__.append_column(PRM_MULTIPLE_VALUE_COLUMN)
+Index(
+    "ix_prm_value_multiple",
+    PRM_MULTIPLE_VALUE_COLUMN,
+    postgresql_using="gin",
+    postgresql_ops={"value_multiple": "jsonb_path_ops"},
+)
+
+
 class Event(Base):
     __tablename__ = "events"
 
@@ -463,9 +605,44 @@ class Event(Base):
 
     __table_args__ = (
         Index("ix_events_event_type_model_id", "event_type", "model_id"),
+        # replay of events of a type by id cursor
+        Index("ix_events_event_type_id", "event_type", "id"),
     )
 
 
+class KafkaOutbox(Base):
+    """Kafka messages stored in the transaction of the change.
+    payload is a serialized list message (ListMO, ListPRM, ...) of class_name;
+    rows are sent and deleted by the outbox relay (run_outbox_relay.py)."""
+
+    __tablename__ = "kafka_outbox"
+
+    id = Column(BigInteger, primary_key=True)
+    class_name = Column(String, nullable=False)
+    event = Column(String, nullable=False)
+    user_id = Column(String, nullable=True)
+    session_id = Column(String, nullable=True)
+    payload = Column(LargeBinary, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+
+class KafkaOutboxRelayMetrics(Base):
+    """Counters of the outbox relay (one row), updated after every batch."""
+
+    __tablename__ = "kafka_outbox_relay_metrics"
+
+    id = Column(Integer, primary_key=True)
+    batches = Column(BigInteger, nullable=False, default=0)
+    failed_batches = Column(BigInteger, nullable=False, default=0)
+    sent_rows = Column(BigInteger, nullable=False, default=0)
+    delivered_messages = Column(BigInteger, nullable=False, default=0)
+    failed_messages = Column(BigInteger, nullable=False, default=0)
+    # age of the oldest row and speed of the last sent batch
+    lag_seconds = Column(Float, nullable=True)
+    rows_per_second = Column(Float, nullable=True)
+    updated_at = Column(DateTime, nullable=True)
+
+
 class BackgroundTaskBase(SQLModel):
     task_id: str = Field(nullable=False, primary_key=True)
 
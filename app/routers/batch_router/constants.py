@@ -2,6 +2,13 @@ import enum
 
 RESULT_PREVIEW_FILE_NAME = "preview file.xlsx"
 RESULT_EXPORT_FILE_NAME = "export_data"
+# number of file rows validated and created at once by streaming import
+IMPORT_CHUNK_SIZE = 10_000
+# number of objects converted to file rows at once by export
+EXPORT_CHUNK_SIZE = 5000
+# xlsx export is kept in memory up to this size, then moved to a temp file
+EXPORT_SPOOL_MAX_SIZE = 32 * 1024 * 1024
+EXPORT_READ_BLOCK_SIZE = 1024 * 1024
 
 # ERRORS
 EMPTY_VALUE_IN_REQUIRED = "empty_values_in_required"
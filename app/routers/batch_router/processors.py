@@ -1,20 +1,25 @@
 import ast
 import copy
+import csv
 import io
 import json
-import pickle
 import re
+import shutil
+import tempfile
+import zlib
 from ast import literal_eval
 from collections import Counter
 from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from http import HTTPStatus
-from typing import Any, Literal, List, Optional, Union
+from itertools import groupby
+from typing import Any, BinaryIO, Iterator, Literal, List, Optional, Union
 
 import numpy as np
 import pandas as pd
 import xlsxwriter
+from openpyxl import load_workbook
 from fastapi import (
     HTTPException,
     BackgroundTasks,
@@ -29,7 +34,6 @@ from sqlalchemy import (
     String,
     and_,
 )
-from sqlalchemy.orm import aliased
 from sqlmodel import Session, select
 from xlsxwriter.worksheet import Worksheet
 
@@ -41,9 +45,10 @@ from database import (
 )
 from functions.functions_dicts import value_convertation_by_val_type
 from functions.functions_utils.utils import (
-    calculate_by_formula_batch,
+    calculate_by_formula_batch_frame,
     extract_location_data,
     decode_multiple_value,
+    encode_multiple_value,
 )
 from functions.validation_functions.validation_utils import (
     get_possible_prm_ids_for_internal_link,
@@ -51,6 +56,10 @@ from functions.validation_functions.validation_utils import (
 )
 from models import PRM, TMO, MO, MOBase, TPRM
 from routers.batch_router.constants import (
+    EXPORT_CHUNK_SIZE,
+    EXPORT_READ_BLOCK_SIZE,
+    EXPORT_SPOOL_MAX_SIZE,
+    IMPORT_CHUNK_SIZE,
     EMPTY_VALUE_IN_REQUIRED,
     NOT_MULTIPLE_VALUE,
     NOT_VALID_VALUE_BY_CONSTRAINT,
@@ -76,6 +85,7 @@ from routers.batch_router.constants import (
     XLSX_FORMAT,
 )
 from routers.batch_router.exceptions import (
+    BatchCustomException,
     RequestedTMOIsVirtual,
     NotAllowedFileType,
     FileReadingException,
@@ -102,12 +112,16 @@ from routers.batch_router.schemas import (
     BatchImportValidatorResponse,
     ValidatedRequiredColumn,
     ExportFileTypes,
+    ExportCompression,
     ConvertedToListValuesInColumn,
 )
 from routers.batch_router.utils import (
     BatchConstantVariables,
     BatchFileConstants,
     BatchErrorAndWarningsCollector,
+    copy_rows_to_table,
+    get_table_row,
+    reserve_table_ids,
 )
 from routers.object_router.utils import (
     TPRMFilterCleaner,
@@ -117,6 +131,7 @@ from routers.parameter_router.schemas import PRMUpdateByMO, PRMCreateByMO
 from routers.parameter_type_router.utils import (
     get_list_trpms_by_tmo_and_val_type,
 )
+from services.listener_service.processor import ListenerService
 from val_types.constants import (
     enum_val_type_name,
     two_way_mo_link_val_type_name,
@@ -805,17 +820,11 @@ class BatchImportValidator(
                 ):
                     function_names.append(nd.value.func.attr)
 
-        parameter_type_names = [
-            n
-            for n, f in zip(parameter_type_names, function_names)
-            if f == "parameter"
-        ]
-        inner_max_names = [
+        return {
             n
             for n, f in zip(parameter_type_names, function_names)
-            if f == "INNER_MAX"
-        ]
-        return set(list({*parameter_type_names, *inner_max_names}))
+            if f in ("parameter", "INNER_MAX")
+        }
 
     def _process_formula_data(self) -> DataFrame:
         """
@@ -849,56 +858,59 @@ class BatchImportValidator(
         tprms = self._session.exec(query).all()
         tprm_by_name: dict[str, TPRM] = {t.name: t for t in tprms}
 
-        if self._formula_tprm_ids:
-            for index, row in dataframe_without_prm_links.iterrows():
-                row = {column_name: value for column_name, value in row.items()}
-
-                for column in self._formula_tprm_ids:
-                    formula_tprm = self._tprm_instance_by_id[int(column)]
+        parameter_aggregates = {}
+        for column in self._formula_tprm_ids:
+            formula_tprm = self._tprm_instance_by_id[int(column)]
 
-                    try:
-                        value = calculate_by_formula_batch(
-                            session=self._session,
-                            formula_tprm=formula_tprm,
-                            prm_data=row,
-                            tprms_from_formula_by_name=tprm_by_name,
-                        )
-
-                        if column in self._primary_tprms and not value:
-                            self._error_row_with_reasons[column].append(
-                                BatchPreviewErrorInstance(
-                                    error_value=formula_tprm.constraint,
-                                    status=NOT_VALID_VALUE_TYPE,
-                                    index_of_error_value=index,
-                                )
-                            )
-
-                            not_valid_formula_indexes.append(index)
-
-                        # set new calculated values
-                        self._main_dataframe.at[index, column] = value
-
-                    except ValueError:
-                        self._error_row_with_reasons[column].append(
-                            BatchPreviewErrorInstance(
-                                error_value=formula_tprm.constraint,
-                                status=NOT_VALID_VALUE_TYPE,
-                                index_of_error_value=index,
-                            )
-                        )
+            values, not_valid_indexes = calculate_by_formula_batch_frame(
+                session=self._session,
+                formula_tprm=formula_tprm,
+                frame=dataframe_without_prm_links,
+                tprms_from_formula_by_name=tprm_by_name,
+                parameter_aggregates=parameter_aggregates,
+            )
+            for index in not_valid_indexes:
+                self._error_row_with_reasons[column].append(
+                    BatchPreviewErrorInstance(
+                        error_value=formula_tprm.constraint,
+                        status=NOT_VALID_VALUE_TYPE,
+                        index_of_error_value=index,
+                    )
+                )
+            values = values.drop(not_valid_indexes)
 
-                    if self._error_row_with_reasons[column]:
-                        statuses_by_index = {
-                            error.index_of_error_value: error.status
-                            for error in self._error_row_with_reasons[column]
-                        }
-                        column_name = self._new_column_name_mapping[column]
-                        raise ColumnValuesValidationError(
-                            status_code=HTTPStatus.UNPROCESSABLE_ENTITY.value,
-                            detail=f"There are error data in primary "
-                            f"column {column_name}. "
-                            f"Error statuses by index: {statuses_by_index}",
+            if column in self._primary_tprms:
+                for index, value in values.items():
+                    if value:
+                        continue
+                    self._error_row_with_reasons[column].append(
+                        BatchPreviewErrorInstance(
+                            error_value=formula_tprm.constraint,
+                            status=NOT_VALID_VALUE_TYPE,
+                            index_of_error_value=index,
                         )
+                    )
+                    not_valid_formula_indexes.append(index)
+
+            # set new calculated values, numeric column keeps its dtype as
+            # when values are set one by one
+            main_column = self._main_dataframe.get(column)
+            if main_column is None or main_column.dtype != object:
+                values = values.infer_objects()
+            self._main_dataframe.loc[values.index, column] = values
+
+            if self._error_row_with_reasons[column]:
+                statuses_by_index = {
+                    error.index_of_error_value: error.status
+                    for error in self._error_row_with_reasons[column]
+                }
+                column_name = self._new_column_name_mapping[column]
+                raise ColumnValuesValidationError(
+                    status_code=HTTPStatus.UNPROCESSABLE_ENTITY.value,
+                    detail=f"There are error data in primary "
+                    f"column {column_name}. "
+                    f"Error statuses by index: {statuses_by_index}",
+                )
 
         # delete wrong primary formula rows
         if not_valid_formula_indexes:
@@ -1555,7 +1567,7 @@ class BatchImportValidator(
             if tprm_instance.multiple:
                 db_result_parameter_by_id.update(
                     {
-                        mo_id: pickle.loads(bytes.fromhex(value))
+                        mo_id: decode_multiple_value(value)
                         for mo_id, value in exists_parameters
                     }
                 )
@@ -2342,8 +2354,11 @@ class BatchImportValidator(
         quantity_of_created_prms = 0
         for column in self._tprm_ids:
             values = created_parameter_values[column].values.tolist()
+            # v != [] is an empty array for numpy values, so it is not used
             without_non_values = [
-                v for v in values if v is not None and v != []
+                v
+                for v in values
+                if v is not None and not (isinstance(v, list) and not v)
             ]
             len_of_column = len(without_non_values)
             quantity_of_created_prms += len_of_column
@@ -3159,7 +3174,7 @@ class BatchImportPreview(BatchImportValidator):
 
             for prm_id, prm_value, val_type, multiple in query:
                 if multiple:
-                    prm_value = pickle.loads(bytes.fromhex(prm_value))
+                    prm_value = decode_multiple_value(prm_value)
 
                 if val_type == "mo_link":
                     mo_linked_prms[prm_id] = prm_value
@@ -7271,27 +7286,36 @@ class BatchImportCreator(BatchImportValidator):
         for start in range(0, len(df), size):
             yield df.iloc[start : start + size]
 
-    @staticmethod
-    def slice_iter_object(data, size: int):
-        for start in range(0, len(data), size):
-            yield data[start : start + size]
-
     def _create_object_and_parameters(self) -> None:
-        mo_id_mapping: List[dict[str, Any]] = []
+        """Objects and parameters are written by COPY. Object ids are taken
+        from the sequence before, so names of not primary objects and
+        parameters are written without reading objects back"""
+        object_columns = [column.name for column in MO.__table__.columns]
 
         for df_slice in self.slice_dataframe(
             df=self._create_object_parameters_and_attributes, size=20_000
         ):
-            batch_created = []
+            rows = df_slice.to_dict("records")
+            object_ids = reserve_table_ids(
+                session=self._session,
+                table_name=MO.__tablename__,
+                count=len(rows),
+            )
+            created_objects = []
+            processed_parameters = []
 
-            for _, row_with_values in df_slice.iterrows():
+            for object_id, row in zip(object_ids, rows):
                 row_dict: dict[str, Any] = {
                     column: value
-                    for column, value in row_with_values.to_dict().items()
+                    for column, value in row.items()
                     if value is not None
                 }
 
-                mo = MO(**row_dict, tmo_id=self._object_type_instance.id)
+                mo = MO(
+                    **row_dict,
+                    id=object_id,
+                    tmo_id=self._object_type_instance.id,
+                )
 
                 if "parent_name" in row_dict:
                     mo.p_id = int(row_dict["parent_name"])
@@ -7305,23 +7329,10 @@ class BatchImportCreator(BatchImportValidator):
 
                 if self._object_type_instance.primary:
                     mo.name = row_dict.get(COMBINED_NAMES_COLUMN)
+                else:
+                    mo.name = str(object_id)
 
-                self._session.add(mo)
-                mo_id_mapping.append({"mo": mo, "row_dict": row_dict})
-                batch_created.append(mo)
-
-            self._session.flush()
-            for object_instance in batch_created:
-                self._session.expunge(object_instance)
-
-        for instances in self.slice_iter_object(data=mo_id_mapping, size=1_000):
-            processed_parameters = []
-            for _, instance in enumerate(instances):
-                mo = instance["mo"]
-                row_dict = instance["row_dict"]
-                if not self._object_type_instance.primary:
-                    mo.name = str(mo.id)
-                    self._session.add(mo)
+                created_objects.append(mo)
 
                 new_tprm_parameters = {
                     column_name: value
@@ -7331,19 +7342,31 @@ class BatchImportCreator(BatchImportValidator):
                 for column_name, new_value in new_tprm_parameters.items():
                     current_tprm = self._tprm_instance_by_id[int(column_name)]
                     value = (
-                        pickle.dumps(new_value).hex()
+                        encode_multiple_value(new_value)
                         if current_tprm.multiple
                         else new_value
                     )
                     if pd.notna(value):
-                        prm_dict = {
-                            "tprm_id": current_tprm.id,
-                            "mo_id": mo.id,
-                            "value": str(value),
-                        }
-                        processed_parameters.append(prm_dict)
+                        processed_parameters.append(
+                            (current_tprm.id, object_id, str(value), 1)
+                        )
 
-            self._session.bulk_insert_mappings(PRM, processed_parameters)
+            copy_rows_to_table(
+                session=self._session,
+                table_name=MO.__tablename__,
+                columns=object_columns,
+                rows=(get_table_row(mo) for mo in created_objects),
+            )
+            copy_rows_to_table(
+                session=self._session,
+                table_name=PRM.__tablename__,
+                columns=["tprm_id", "mo_id", "value", "version"],
+                rows=processed_parameters,
+            )
+            # COPY is not seen by flush listeners
+            ListenerService.receive_bulk_created(
+                session=self._session, instances=created_objects
+            )
 
     def _update_object_attributes(self):
         object_ids_for_update = (
@@ -7410,7 +7433,7 @@ class BatchImportCreator(BatchImportValidator):
             parameter_instance.version += 1
 
             if isinstance(new_value, list):
-                new_value = pickle.dumps(new_value).hex()
+                new_value = encode_multiple_value(new_value)
 
             parameter_instance.value = str(new_value)
             self._session.add(parameter_instance)
@@ -7422,7 +7445,7 @@ class BatchImportCreator(BatchImportValidator):
         for _, row in self._created_mo_prms.iterrows():
             new_value = row["value"]
             if isinstance(new_value, list):
-                new_value = pickle.dumps(new_value).hex()
+                new_value = encode_multiple_value(new_value)
 
             new_prm = PRM(
                 version=1,
@@ -7625,6 +7648,220 @@ class BatchImportCreator(BatchImportValidator):
         }
 
 
+class BatchImportChunkCreator(BatchImportCreator):
+    """
+    Processes one chunk of file rows by the same validators and converters
+    as BatchImportCreator. Names of objects from previous chunks are shared
+    by object_names_in_file to find duplicated objects in whole file
+    """
+
+    def __init__(
+        self,
+        dataframe: DataFrame,
+        object_names_in_file: set[str],
+        **kwargs,
+    ):
+        super().__init__(file=b"", **kwargs)
+        self._chunk_dataframe = dataframe
+        self._object_names_in_file = object_names_in_file
+
+    def _get_dataframe_from_file_data(self) -> DataFrame:
+        # validators address rows by their position in dataframe
+        self._main_dataframe = self._chunk_dataframe.reset_index(drop=True)
+        self._main_dataframe = self._main_dataframe.where(
+            cond=pd.notna(self._main_dataframe), other=None
+        )
+        self._chunk_dataframe = None
+        return self._main_dataframe
+
+    def _validate_and_replace_mo_duplicates(self) -> None:
+        super()._validate_and_replace_mo_duplicates()
+
+        indexes_to_delete = []
+        for index, name in self._combined_object_names_from_dataframe.items():
+            if not name:
+                continue
+            if name not in self._object_names_in_file:
+                self._object_names_in_file.add(name)
+                continue
+
+            self._error_row_with_reasons["Object Name"].append(
+                BatchPreviewErrorInstance(
+                    error_value=name,
+                    index_of_error_value=index,
+                    status=get_reason_message(DUPLICATED_OBJECT_NAMES, [index]),
+                )
+            )
+            match self._raise_error_status:
+                case ErrorProcessor.RAISE.value:
+                    raise DuplicatedMONameInFile(
+                        status_code=HTTPStatus.UNPROCESSABLE_ENTITY.value,
+                        detail=f"There are duplicated object name in file: {name}",
+                    )
+            indexes_to_delete.append(index)
+
+        self._main_dataframe.drop(indexes_to_delete, inplace=True)
+        self._combined_object_names_from_dataframe.drop(
+            indexes_to_delete, inplace=True
+        )
+
+
+class StreamingBatchImportCreator:
+    """
+    Imports file by chunks of rows, file is not read into memory at once.
+    Every chunk is validated, converted and committed separately, only
+    names of objects from file are kept between chunks. If some chunk
+    is not valid, chunks before it stay committed
+    """
+
+    def __init__(
+        self,
+        file: BinaryIO,
+        session: Session,
+        object_type_id: int,
+        column_name_mapping: dict,
+        delimiter: str,
+        check: bool = False,
+        file_content_type: str = "text/csv",
+        force: bool = False,
+    ):
+        self._file = file
+        self._session = session
+        self._object_type_id = object_type_id
+        self._column_name_mapping = column_name_mapping
+        self._delimiter = delimiter
+        self._check_data = check
+        self._file_content_type = file_content_type
+        self._force = force
+        self._chunk_size = IMPORT_CHUNK_SIZE
+
+        self._file_empty_values = BatchConstantVariables()._FILE_EMPTY_VALUES
+        self._object_names_in_file: set[str] = set()
+
+    def _iter_csv_dataframes(self) -> Iterator[DataFrame]:
+        try:
+            reader = pd.read_csv(
+                self._file,
+                dtype=str,
+                delimiter=self._delimiter,
+                na_values=self._file_empty_values,
+                keep_default_na=False,
+                chunksize=self._chunk_size,
+            )
+            yield from reader
+        except (ValueError, UnicodeDecodeError, pd.errors.ParserError) as e:
+            raise FileReadingException(
+                status_code=HTTPStatus.UNPROCESSABLE_ENTITY.value,
+                detail=str(e),
+            )
+
+    @staticmethod
+    def _get_xlsx_cell_value(value):
+        if value is None or value == "":
+            return None
+        return str(value)
+
+    def _iter_xlsx_dataframes(self) -> Iterator[DataFrame]:
+        # xlsx is a zip archive, which is read by random access, so upload
+        # is copied to a file on disk instead of memory
+        with tempfile.TemporaryFile() as xlsx_file:
+            shutil.copyfileobj(self._file, xlsx_file)
+            xlsx_file.seek(0)
+            try:
+                workbook = load_workbook(
+                    xlsx_file, read_only=True, data_only=True
+                )
+            except Exception as e:
+                raise FileReadingException(
+                    status_code=HTTPStatus.UNPROCESSABLE_ENTITY.value,
+                    detail=str(e),
+                )
+
+            try:
+                yield from self._iter_worksheet_dataframes(
+                    rows=workbook.worksheets[0].iter_rows(values_only=True)
+                )
+            finally:
+                workbook.close()
+
+    def _iter_worksheet_dataframes(self, rows: Iterator) -> Iterator[DataFrame]:
+        header = [
+            str(column) if column is not None else f"Unnamed: {index}"
+            for index, column in enumerate(next(rows, ()))
+        ]
+        not_unique_columns = [
+            column for column, count in Counter(header).items() if count > 1
+        ]
+        if not_unique_columns:
+            raise NotUniqueColumnsInFile(
+                status_code=HTTPStatus.UNPROCESSABLE_ENTITY.value,
+                detail=f"Column names must be unique. Not unique columns: {not_unique_columns}.",
+            )
+
+        chunk = []
+        for row in rows:
+            values = [self._get_xlsx_cell_value(value) for value in row]
+            if all(value is None for value in values):
+                continue
+            chunk.append(values[: len(header)])
+            if len(chunk) == self._chunk_size:
+                yield DataFrame(chunk, columns=header, dtype=object)
+                chunk = []
+        if chunk:
+            yield DataFrame(chunk, columns=header, dtype=object)
+
+    def _iter_dataframes(self) -> Iterator[DataFrame]:
+        if self._file_content_type == XLSX_FORMAT:
+            return self._iter_xlsx_dataframes()
+        return self._iter_csv_dataframes()
+
+    def _get_chunk_creator(
+        self, dataframe: DataFrame
+    ) -> BatchImportChunkCreator:
+        return BatchImportChunkCreator(
+            dataframe=dataframe,
+            object_names_in_file=self._object_names_in_file,
+            session=self._session,
+            object_type_id=self._object_type_id,
+            column_name_mapping=self._column_name_mapping,
+            delimiter=self._delimiter,
+            check=self._check_data,
+            file_content_type=self._file_content_type,
+            force=self._force,
+        )
+
+    def execute(self):
+        statistic = Counter()
+        processed_rows = 0
+        for dataframe in self._iter_dataframes():
+            first_row, processed_rows = (
+                processed_rows,
+                processed_rows + len(dataframe),
+            )
+            chunk_creator = self._get_chunk_creator(dataframe=dataframe)
+            del dataframe
+            try:
+                response = chunk_creator.execute()
+            except BatchCustomException as e:
+                # indexes in errors are counted from the start of the chunk
+                e.detail = (
+                    f"Error in file rows from {first_row} "
+                    f"to {processed_rows - 1}: {e.detail}"
+                )
+                raise
+            if self._check_data:
+                statistic.update(response)
+            del chunk_creator
+
+        if self._check_data:
+            return dict(statistic)
+
+        return {
+            "status": "ok",
+            "detail": f"File is valid. {processed_rows} rows are processed",
+        }
+
+
 class BatchExportProcessor:
     def __init__(
         self,
@@ -7637,10 +7874,12 @@ class BatchExportProcessor:
         prm_type_ids: Union[List[int], None] = Query(default=None),
         replace_ids_by_names: bool = Query(default=False),
         with_full_attributes: bool = Query(default=False),
+        compression: Optional[str] = None,
     ):
         self._object_type_id = object_type_id
         self._request_data = request
         self._file_type = file_type
+        self._compression = compression
         self._session = session
         self._delimiter = delimiter
         self._obj_ids = obj_ids
@@ -7648,12 +7887,8 @@ class BatchExportProcessor:
         self._replace_ids_by_names = replace_ids_by_names
         self._with_full_attributes = with_full_attributes
 
-        self._output = io.BytesIO()
-        self._workbook = xlsxwriter.Workbook(self._output)
+        self._chunk_size = EXPORT_CHUNK_SIZE
 
-        self._cache_column_name_type = {}
-        self._main_df = pd.DataFrame()
-        self._groups_and_tprm_count = dict()
         self._mo_where_condition = [MO.active == True]  # noqa
 
     def check(self):
@@ -7703,411 +7938,267 @@ class BatchExportProcessor:
         if self._obj_ids:
             self._mo_where_condition.append(MO.id.in_(self._obj_ids))
 
-    def _count_tprm_by_groups(self, tprm_group_name):
-        if self._groups_and_tprm_count.get(tprm_group_name, None) is None:
-            self._groups_and_tprm_count[tprm_group_name] = 0
-
-    def _get_parameters_by_parameter_type_for_column(
-        self, parameter_type_id: int
-    ):
-        stmt = select(PRM.mo_id.label("mo_id"), PRM.value.label("value")).where(
-            PRM.tprm_id == parameter_type_id
-        )
-
-        aliased_table = aliased(stmt.subquery())
-
-        stmt = (
-            select(MO.id.label("mo_id"), aliased_table)
-            .outerjoin(aliased_table, MO.id == aliased_table.c.mo_id)
-            .where(MO.tmo_id == self._object_type_id, *self._mo_where_condition)
-            .order_by(MO.id)
-        )
-
-        prm_values = self._session.execute(stmt).all()
-        return prm_values
-
-    def _fill_column_data(self, param_type_instance: TPRM, prm_values):
-        column_data = []
-        convert_by_val_type = value_convertation_by_val_type[
-            param_type_instance.val_type
+    def _get_attribute_columns(self) -> list[str]:
+        if not self._with_full_attributes:
+            return []
+        return [
+            column.name
+            for column in MO.__table__.columns
+            if column.name not in ("p_id", "point_a_id", "point_b_id")
         ]
 
-        if param_type_instance.multiple:
-            for prm_data in prm_values:
-                if prm_data.value is not None:
-                    value = decode_multiple_value(prm_data.value)
-                    column_data.append(str(value))
-                else:
-                    column_data.append("")
-        else:
-            for prm_data in prm_values:
-                if prm_data.value is not None:
-                    column_data.append(convert_by_val_type(prm_data.value))
-                else:
-                    column_data.append("")
-
-        return column_data
-
-    def _convert_values_to_names(
-        self, parameter_type_instance: TPRM, column_data: list[str]
-    ):
-        # for TPRMs with val_type 'mo_link' we store ids in DB,
-        # so we need to update response from giving ids to names of linked objects
-        if (
-            self._replace_ids_by_names
-            and parameter_type_instance.val_type == "mo_link"
-        ):
-            chunk_limit_len = 5000
-            rows_chunks = copy.copy(column_data)
-
-            column_data = []
-
-            # we decouple all rows by chunk_limit, because after than it will be easier to decouple ids for DB queries
-            for row_index in range(0, len(rows_chunks), chunk_limit_len):
-                not_formatted_linked_mo_ids = rows_chunks[
-                    row_index : row_index + chunk_limit_len
-                ]
-
-                # ths way in chunk we store data like ['[1,2,3]', '[4,5,6]', '', '[7,8,9]']
-                # so we need to convert it to ordinary list and get mo_ids from this chunk
-                # in future we will get names by these objects and will replace ids by names
-                if parameter_type_instance.multiple:
-                    mo_ids = set()
-                    for linked_mo_id in not_formatted_linked_mo_ids:
-                        if linked_mo_id:
-                            formatted_mo_ids = json.loads(linked_mo_id)
-                            for mo_id in formatted_mo_ids:
-                                mo_ids.add(mo_id)
-
-                # this way in chunk we store data like [1,2,'',4,'',6]
-                else:
-                    mo_ids = {
-                        mo_id for mo_id in not_formatted_linked_mo_ids if mo_id
-                    }
-
-                mo_ids = list(mo_ids)
-                # to get mo_names by ids we need to write query with IN operator.
-                # IN operator has limit of list -- 32766 objects,
-                # so we get chunk of 32766 objects to get names for them
-                mo_ids_chunks = [
-                    mo_ids[index : index + SQLALCHEMY_LIMIT]
-                    for index in range(0, len(mo_ids), SQLALCHEMY_LIMIT)
-                ]
-
-                # here we store mo id, name and tmo_name pairs
-                mo_names_and_ids = {}
-                tmo_names_by_mo_id = {}
-                for mo_ids_chunk in mo_ids_chunks:
-                    stmt = select(MO.id, MO.name, MO.tmo_id).where(
-                        MO.id.in_(mo_ids_chunk)
-                    )
-                    data = self._session.exec(stmt).all()
-                    mo_names_and_ids.update(
-                        {mo_id: mo_name for mo_id, mo_name, tmo_id in data}
-                    )
-                    tmo_names_by_mo_id.update(
-                        {mo_id: tmo_id for mo_id, mo_name, tmo_id in data}
-                    )
-
-                tmo_ids = set(tmo_names_by_mo_id.values())
-                tmo_names_by_id = {}
-                if tmo_ids:
-                    for tmo_ids_chunk in [
-                        list(tmo_ids)[index : index + SQLALCHEMY_LIMIT]
-                        for index in range(0, len(tmo_ids), SQLALCHEMY_LIMIT)
-                    ]:
-                        stmt = select(TMO.id, TMO.name).where(
-                            TMO.id.in_(tmo_ids_chunk)
-                        )
-                        tmo_data = self._session.exec(stmt).all()
-                        tmo_names_by_id.update(
-                            {tmo_id: tmo_name for tmo_id, tmo_name in tmo_data}
-                        )
-
-                # and now we need to replace ids by names with TMO name prefix
-                # here we can store 3 types of data: '', '[1,2,3]' and 1
-                # if row is empty -- we need just add it
-                # if it multiply and stores in json format we need to convert it and replace ids by names
-                # if it just id of some object -- we can replace it by name
-                for linked_mo_id in not_formatted_linked_mo_ids:
-                    if linked_mo_id:
-                        if parameter_type_instance.multiple:
-                            formatted_mo_ids = json.loads(linked_mo_id)
-                            converted_names_from_ids = []
-                            for mo_id in formatted_mo_ids:
-                                mo_name = mo_names_and_ids[mo_id]
-                                tmo_id = tmo_names_by_mo_id[mo_id]
-                                tmo_name = tmo_names_by_id[tmo_id]
-                                converted_names_from_ids.append(
-                                    f"{mo_name}:{tmo_name}"
-                                )
-                            column_data.append(
-                                json.dumps(converted_names_from_ids)
-                            )
-                        else:
-                            mo_name = mo_names_and_ids[linked_mo_id]
-                            tmo_id = tmo_names_by_mo_id[linked_mo_id]
-                            tmo_name = tmo_names_by_id[tmo_id]
-                            column_data.append(f"{mo_name}:{tmo_name}")
-
-                    else:
-                        column_data.append(linked_mo_id)
-
-        return column_data
+    def _get_columns(self) -> list[str]:
+        return [
+            *[tprm.name for tprm in self._parameter_types_to_fill_data],
+            "parent_name",
+            "point_a_name",
+            "point_b_name",
+            *self._get_attribute_columns(),
+        ]
 
-    def _fill_parent_name_column(self):
-        aliased_table = aliased(select(MO).subquery())
-        stmt = (
-            select(
-                MO.id.label("mo_id"), aliased_table.c.name.label("parent_name")
-            )
-            .outerjoin(aliased_table, MO.p_id == aliased_table.c.id)
+    def _get_objects_with_parameters_stmt(self):
+        # one row per object parameter, objects without parameters
+        # are returned once with empty tprm_id and value
+        tprm_ids = [tprm.id for tprm in self._parameter_types_to_fill_data]
+        parameters = (
+            select(PRM.mo_id, PRM.tprm_id, PRM.value)
+            .where(PRM.tprm_id.in_(tprm_ids))
+            .subquery()
+        )
+        object_columns = [MO.id, MO.p_id, MO.point_a_id, MO.point_b_id]
+        object_columns.extend(
+            getattr(MO, column_name)
+            for column_name in self._get_attribute_columns()
+            if column_name != "id"
+        )
+        return (
+            select(*object_columns, parameters.c.tprm_id, parameters.c.value)
+            .outerjoin(parameters, MO.id == parameters.c.mo_id)
             .where(MO.tmo_id == self._object_type_id, *self._mo_where_condition)
             .order_by(MO.id)
-        )
-
-        res = self._session.execute(stmt).all()
-        temporary_df = pd.DataFrame(data=res, columns=["mo_id", "parent_name"])
-        self._main_df["parent_name"] = temporary_df["parent_name"]
-
-    def _fill_points_column(self):
-        aliased_table = aliased(select(MO).subquery())
-        stmt = (
-            select(
-                MO.id.label("mo_id"),
-                aliased_table.c.name.label("point_a_name"),
-                aliased_table.c.tmo_id.label("point_a_tmo_id"),
+            .execution_options(yield_per=self._chunk_size)
+        )
+
+    def _iter_object_chunks(self):
+        """Yields lists of objects, every object is a tuple of MO row
+        and dict of its parameter values by tprm_id"""
+        rows = self._session.execute(self._get_objects_with_parameters_stmt())
+        chunk = []
+        for _, object_rows in groupby(rows, key=lambda row: row.id):
+            object_rows = list(object_rows)
+            values = {
+                row.tprm_id: row.value
+                for row in object_rows
+                if row.tprm_id is not None
+            }
+            chunk.append((object_rows[0], values))
+            if len(chunk) == self._chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def _get_object_names(self, object_ids: set[int]) -> dict[int, tuple]:
+        """Returns object name and object type name by object id"""
+        object_names = {}
+        for chunk in get_chunked_values_by_sqlalchemy_limit(object_ids):
+            stmt = (
+                select(MO.id, MO.name, TMO.name)
+                .join(TMO, TMO.id == MO.tmo_id)
+                .where(MO.id.in_(chunk))
             )
-            .outerjoin(aliased_table, MO.point_a_id == aliased_table.c.id)
-            .where(MO.tmo_id == self._object_type_id, *self._mo_where_condition)
-            .order_by(MO.id)
-        )
+            for mo_id, mo_name, tmo_name in self._session.execute(stmt):
+                object_names[mo_id] = (mo_name, tmo_name)
+        return object_names
 
-        res = self._session.execute(stmt).all()
-        temporary_df = pd.DataFrame(
-            data=res, columns=["mo_id", "point_a_name", "point_a_tmo_id"]
+    def _get_parameter_value(self, parameter_type_instance: TPRM, value):
+        if value is None:
+            return ""
+        if parameter_type_instance.multiple:
+            return decode_multiple_value(value)
+        return value_convertation_by_val_type[parameter_type_instance.val_type](
+            value
         )
 
-        point_a_tmo_ids = temporary_df["point_a_tmo_id"].dropna().unique()
-        tmo_names_by_id = {}
-        if len(point_a_tmo_ids) > 0:
-            for chunk in get_chunked_values_by_sqlalchemy_limit(
-                point_a_tmo_ids
-            ):
-                stmt = select(TMO.id, TMO.name).where(TMO.id.in_(chunk))
-                tmo_data = self._session.exec(stmt).all()
-                tmo_names_by_id.update(
-                    {tmo_id: tmo_name for tmo_id, tmo_name in tmo_data}
+    def _get_linked_object_ids(self, objects: list) -> set[int]:
+        linked_object_ids = set()
+        for object_row, values in objects:
+            linked_object_ids.update(
+                mo_id
+                for mo_id in (
+                    object_row.p_id,
+                    object_row.point_a_id,
+                    object_row.point_b_id,
                 )
-
-        formatted_point_a_names = []
-        for _, row in temporary_df.iterrows():
-            if pd.notna(row["point_a_name"]) and pd.notna(
-                row["point_a_tmo_id"]
-            ):
-                point_a_name = row["point_a_name"]
-                tmo_id = row["point_a_tmo_id"]
-                tmo_name = tmo_names_by_id.get(tmo_id, "")
-                formatted_point_a_names.append(f"{point_a_name}:{tmo_name}")
-            else:
-                formatted_point_a_names.append(row["point_a_name"])
-
-        self._main_df["point_a_name"] = formatted_point_a_names
-
-        aliased_table = aliased(select(MO).subquery())
-        stmt = (
-            select(
-                MO.id.label("mo_id"),
-                aliased_table.c.name.label("point_b_name"),
-                aliased_table.c.tmo_id.label("point_b_tmo_id"),
+                if mo_id is not None
             )
-            .outerjoin(aliased_table, MO.point_b_id == aliased_table.c.id)
-            .where(MO.tmo_id == self._object_type_id, *self._mo_where_condition)
-            .order_by(MO.id)
-        )
-
-        res = self._session.execute(stmt).all()
-        temporary_df = pd.DataFrame(
-            data=res, columns=["mo_id", "point_b_name", "point_b_tmo_id"]
-        )
-
-        point_b_tmo_ids = temporary_df["point_b_tmo_id"].dropna().unique()
-        tmo_names_by_id = {}
-        if len(point_b_tmo_ids) > 0:
-            for chunk in get_chunked_values_by_sqlalchemy_limit(
-                point_b_tmo_ids
-            ):
-                stmt = select(TMO.id, TMO.name).where(TMO.id.in_(chunk))
-                tmo_data = self._session.exec(stmt).all()
-                tmo_names_by_id.update(
-                    {tmo_id: tmo_name for tmo_id, tmo_name in tmo_data}
+            if not self._replace_ids_by_names:
+                continue
+            for parameter_type_instance in self._mo_link_parameter_types:
+                value = values.get(parameter_type_instance.id)
+                if value is None:
+                    continue
+                value = self._get_parameter_value(
+                    parameter_type_instance, value
                 )
+                if parameter_type_instance.multiple:
+                    linked_object_ids.update(value)
+                else:
+                    linked_object_ids.add(value)
+        return linked_object_ids
 
-        formatted_point_b_names = []
-        for _, row in temporary_df.iterrows():
-            if pd.notna(row["point_b_name"]) and pd.notna(
-                row["point_b_tmo_id"]
-            ):
-                point_b_name = row["point_b_name"]
-                tmo_id = row["point_b_tmo_id"]
-                tmo_name = tmo_names_by_id.get(tmo_id, "")
-                formatted_point_b_names.append(f"{point_b_name}:{tmo_name}")
-            else:
-                formatted_point_b_names.append(row["point_b_name"])
-
-        self._main_df["point_b_name"] = formatted_point_b_names
-
-    def _fill_all_object_attributes_column(self):
-        if self._with_full_attributes:
-            stmt = (
-                select(MO)
-                .where(
-                    MO.tmo_id == self._object_type_id, *self._mo_where_condition
+    @staticmethod
+    def _get_full_object_name(object_names: dict, mo_id: int):
+        if mo_id not in object_names:
+            return mo_id
+        mo_name, tmo_name = object_names[mo_id]
+        return f"{mo_name}:{tmo_name}"
+
+    def _get_rows(self, objects: list) -> list[list]:
+        # for TPRMs with val_type 'mo_link' we store ids in DB, so names
+        # of linked objects and of parents and points are got by one query
+        object_names = self._get_object_names(
+            object_ids=self._get_linked_object_ids(objects=objects)
+        )
+        rows = []
+        for object_row, values in objects:
+            row = []
+            for parameter_type_instance in self._parameter_types_to_fill_data:
+                value = self._get_parameter_value(
+                    parameter_type_instance,
+                    values.get(parameter_type_instance.id),
                 )
-                .order_by(MO.id)
-            )
-
-            res = self._session.execute(stmt).all()
-
-            temporary_df = pd.DataFrame(
-                [
-                    {
-                        k: v
-                        for k, v in row[0].__dict__.items()
-                        if k
-                        not in [
-                            "_sa_instance_state",
-                            "p_id",
-                            "point_a_id",
-                            "point_b_id",
-                        ]
-                    }
-                    for row in res
-                ]
-            )
-
-            for col in temporary_df.columns:
-                self._main_df[col] = temporary_df[col]
-
-    def _save_csv_file(self):
-        if self._file_type == ExportFileTypes.csv.value:
-            self._main_df.to_csv(
-                path_or_buf=self._output, index=False, sep=self._delimiter
-            )
-            self._output.seek(0)
-
-    def _save_xlsx_file(self):
-        if self._file_type != ExportFileTypes.csv.value:
-            start_row_for_df = 0
-
-            cell_format = self._workbook.add_format(
-                {
-                    "bold": True,
-                    "font_color": "black",
-                    "align": "center",
-                    "valign": "center",
-                    "border": 1,
-                    "border_color": "black",
-                }
-            )
-            worksheet = self._workbook.add_worksheet("sheet1")
-
-            # Add group headers
-            if start_row_for_df == 1:
-                first_column = 0
-                for (
-                    group_name,
-                    column_count,
-                ) in self._groups_and_tprm_count.items():
-                    last_column = first_column + column_count - 1
-                    if column_count == 1:
-                        worksheet.write(0, last_column, group_name, cell_format)
-                    else:
-                        worksheet.merge_range(
-                            first_row=0,
-                            first_col=first_column,
-                            last_row=0,
-                            last_col=last_column,
-                            data=group_name,
-                            cell_format=cell_format,
+                if (
+                    value != ""
+                    and self._replace_ids_by_names
+                    and parameter_type_instance.val_type == "mo_link"
+                ):
+                    if parameter_type_instance.multiple:
+                        value = json.dumps(
+                            [
+                                self._get_full_object_name(object_names, mo_id)
+                                for mo_id in value
+                            ]
                         )
-                    first_column = last_column + 1
-            column_number = 0
-            row_number = start_row_for_df
-            for column in self._main_df:
-                worksheet.write(row_number, column_number, column, cell_format)
-                row_number += 1
-
-                cell_format = None
-                column_type = self._cache_column_name_type.get(column)
-                if column_type == "bool":
-                    cell_format = self._workbook.add_format(
-                        {"num_format": "BOOLEAN"}
-                    )
-                data_list = [
-                    str(val) if val is not None else ""
-                    for val in self._main_df[column].values
-                ]
-
-                worksheet.write_column(
+                    else:
+                        value = self._get_full_object_name(object_names, value)
+                elif parameter_type_instance.multiple and value != "":
+                    value = str(value)
+                row.append(value)
+
+            parent = object_names.get(object_row.p_id)
+            row.append(parent[0] if parent else None)
+            for point_id in (object_row.point_a_id, object_row.point_b_id):
+                row.append(
+                    self._get_full_object_name(object_names, point_id)
+                    if point_id in object_names
+                    else None
+                )
+            row.extend(
+                object_row._mapping[column_name]
+                for column_name in self._get_attribute_columns()
+            )
+            rows.append(row)
+        return rows
+
+    def _iter_rows_chunks(self):
+        for objects in self._iter_object_chunks():
+            yield self._get_rows(objects=objects)
+
+    def _iter_csv_chunks(self):
+        buffer = io.StringIO()
+        writer = csv.writer(
+            buffer, delimiter=self._delimiter, lineterminator="\n"
+        )
+        writer.writerow(self._get_columns())
+        # header is sent before the first query result is read
+        yield buffer.getvalue().encode("utf-8")
+        for rows in self._iter_rows_chunks():
+            buffer.seek(0)
+            buffer.truncate()
+            writer.writerows(rows)
+            yield buffer.getvalue().encode("utf-8")
+
+    def _save_xlsx_file(self, output):
+        # rows are written in order, so worksheet keeps only current row
+        workbook = xlsxwriter.Workbook(output, {"constant_memory": True})
+        worksheet = workbook.add_worksheet("sheet1")
+        cell_format = workbook.add_format(
+            {
+                "bold": True,
+                "font_color": "black",
+                "align": "center",
+                "valign": "center",
+                "border": 1,
+                "border_color": "black",
+            }
+        )
+        worksheet.write_row(0, 0, self._get_columns(), cell_format)
+        row_number = 1
+        for rows in self._iter_rows_chunks():
+            for row in rows:
+                worksheet.write_row(
                     row_number,
-                    column_number,
-                    data_list,
-                    cell_format,
-                )
-                column_number += 1
-                row_number = start_row_for_df
-
-            self._workbook.close()
-
-    def _fill_file_data(self):
-        for parameter_type_instance in self._parameter_types_to_fill_data:
-            tprm_group_name = (
-                parameter_type_instance.group
-                if parameter_type_instance.group
-                else ""
-            )
-
-            self._count_tprm_by_groups(tprm_group_name=tprm_group_name)
-
-            values_for_column = (
-                self._get_parameters_by_parameter_type_for_column(
-                    parameter_type_id=parameter_type_instance.id
-                )
-            )
-
-            column_data = self._fill_column_data(
-                param_type_instance=parameter_type_instance,
-                prm_values=values_for_column,
-            )
-
-            column_data = self._convert_values_to_names(
-                parameter_type_instance=parameter_type_instance,
-                column_data=column_data,
-            )
-
-            self._main_df = self._main_df.assign(
-                **{parameter_type_instance.name: column_data}
-            )
-
-            if not parameter_type_instance.multiple:
-                self._cache_column_name_type[parameter_type_instance.name] = (
-                    parameter_type_instance.val_type
+                    0,
+                    [str(val) if val is not None else "" for val in row],
                 )
+                row_number += 1
+        workbook.close()
+
+    def _iter_xlsx_chunks(self):
+        # xlsx is a zip archive, it can be sent only after it is closed
+        with tempfile.SpooledTemporaryFile(
+            max_size=EXPORT_SPOOL_MAX_SIZE
+        ) as output:
+            self._save_xlsx_file(output=output)
+            output.seek(0)
+            while block := output.read(EXPORT_READ_BLOCK_SIZE):
+                yield block
+
+    def _iter_file_chunks(self):
+        if self._file_type == ExportFileTypes.csv.value:
+            yield from self._iter_csv_chunks()
+        else:
+            yield from self._iter_xlsx_chunks()
 
-            self._groups_and_tprm_count[tprm_group_name] += 1
-
-        self._fill_parent_name_column()
-        self._fill_points_column()
-        self._fill_all_object_attributes_column()
+    @staticmethod
+    def _iter_gzip_chunks(chunks):
+        compressor = zlib.compressobj(wbits=31)
+        for chunk in chunks:
+            compressed_chunk = compressor.compress(chunk)
+            if compressed_chunk:
+                yield compressed_chunk
+        yield compressor.flush()
 
     def execute(self):
+        """Returns generator of file content chunks. Objects with their
+        parameters are read by one ordered query and converted to rows
+        by chunks, so whole object type is not kept in memory"""
         self._get_query_params()
         self._get_parameter_type_to_filter()
         self._get_object_id_to_filter()
-        self._fill_file_data()
-        self._save_csv_file()
-        self._save_xlsx_file()
-        self._output.seek(0)
-
-        return self._output
+        self._mo_link_parameter_types = [
+            parameter_type_instance
+            for parameter_type_instance in self._parameter_types_to_fill_data
+            if parameter_type_instance.val_type == "mo_link"
+        ]
+        chunks = self._iter_file_chunks()
+        if self._compression == ExportCompression.gzip.value:
+            chunks = self._iter_gzip_chunks(chunks)
+        return self._iter_in_own_session(chunks)
+
+    def _iter_in_own_session(self, chunks):
+        """Reads objects for chunks by a session of the generator. The
+        session of a request is closed before the response is streamed"""
+        request_session = self._session
+        session = Session(request_session.get_bind(), expire_on_commit=False)
+        # security filters are applied by user data of the request
+        for key in ("jwt", "action"):
+            if key in request_session.info:
+                session.info[key] = request_session.info[key]
+        self._session = session
+        try:
+            yield from chunks
+        finally:
+            self._session = request_session
+            session.close()
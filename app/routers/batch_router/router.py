@@ -27,8 +27,9 @@ from routers.batch_router.processors import (
     BatchExportProcessor,
     BatchImportPreview,
     BatchImportCreator,
+    StreamingBatchImportCreator,
 )
-from routers.batch_router.schemas import ExportFileTypes
+from routers.batch_router.schemas import ExportCompression, ExportFileTypes
 from routers.batch_router.utils import parse_column_name_mapping
 from services.background_task_service.run_celery import (
     background_batch_import_preview,
@@ -62,6 +63,10 @@ router = APIRouter(prefix="/batch", tags=["Batch operations"])
         correct data and will ignore errors.
                if force is False: there are will be raised errors because of not correct data
 
+        streaming: if streaming is True: file is read, validated and created by chunks of rows, every chunk
+        is committed separately, so chunks before not valid one stay created.
+                   if streaming is False: whole file is validated before objects are created
+
         session: Session
 
         background_tasks: BackgroundTasks
@@ -77,9 +82,23 @@ def batch_objects_import(
     delimiter: str = Form(default=",", max_length=1, min_length=1),
     check: bool = Form(default=False),
     force: bool = Form(default=False),
+    streaming: bool = Form(default=False),
     session: Session = Depends(get_session),
 ):
     try:
+        if streaming:
+            task = StreamingBatchImportCreator(
+                file=file.file,
+                session=session,
+                object_type_id=tmo_id,
+                column_name_mapping=column_name_mapping,
+                delimiter=delimiter,
+                check=check,
+                file_content_type=file.content_type,
+                force=force,
+            )
+            return task.execute()
+
         task = BatchImportCreator(
             file=file.file.read(),
             session=session,
@@ -272,6 +291,11 @@ def batch_objects_export(
     prm_type_ids: Union[List[int], None] = Query(default=None),
     replace_ids_by_names: bool = Query(default=False),
     with_full_attributes: bool = Query(default=False),
+    compression: Union[ExportCompression, None] = Query(
+        default=None,
+        description="Compresses file while it is sent, response is returned "
+        "with Content-Encoding header",
+    ),
 ):
     try:
         request_data = {
@@ -293,16 +317,19 @@ def batch_objects_export(
             prm_type_ids=prm_type_ids,
             replace_ids_by_names=replace_ids_by_names,
             with_full_attributes=with_full_attributes,
+            compression=compression.value if compression else None,
         )
         task.check()
-        output = task.execute()
+        # chunks are read by a session of their own, the request session
+        # is closed before the response is streamed
+        file_chunks = task.execute()
 
-        return StreamingResponse(
-            output,
-            headers={
-                "Content-Disposition": f'attachment; filename="{RESULT_EXPORT_FILE_NAME}.{file_type.value}"'
-            },
-        )
+        headers = {
+            "Content-Disposition": f'attachment; filename="{RESULT_EXPORT_FILE_NAME}.{file_type.value}"'
+        }
+        if compression:
+            headers["Content-Encoding"] = compression.value
+        return StreamingResponse(file_chunks, headers=headers)
 
     except BatchCustomException as e:
         raise HTTPException(status_code=e.status_code, detail=e.detail)
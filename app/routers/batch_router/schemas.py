@@ -14,6 +14,10 @@ class ExportFileTypes(Enum):
         return [member.value for member in ExportFileTypes]
 
 
+class ExportCompression(Enum):
+    gzip = "gzip"
+
+
 @dataclass
 class ResultDataframes:
     updated_mo_prms: DataFrame
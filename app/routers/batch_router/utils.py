@@ -1,12 +1,15 @@
+import io
 import json
 from collections import defaultdict
-from typing import List
+from typing import Iterable, List
 
 from fastapi import (
     Form,
 )
 from fastapi.exceptions import RequestValidationError
 from pandas import DataFrame
+from sqlalchemy import JSON, Integer, func, select
+from sqlmodel import Session, SQLModel
 
 from models import TPRM
 from routers.batch_router.constants import (
@@ -36,6 +39,65 @@ def parse_column_name_mapping(column_name_mapping: str = Form(default="{}")):
         )
 
 
+def copy_rows_to_table(
+    session: Session, table_name: str, columns: list[str], rows: Iterable
+) -> None:
+    """
+    Writes rows to the table by COPY in the transaction of the session.
+    Values are sent quoted in csv format, so only None is stored as NULL
+    """
+
+    def format_value(value) -> str:
+        if value is None:
+            return ""
+        return '"' + str(value).replace('"', '""') + '"'
+
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write(",".join(format_value(value) for value in row))
+        buffer.write("\n")
+    buffer.seek(0)
+
+    cursor = session.connection().connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY {table_name} ({', '.join(columns)}) FROM STDIN "
+            f"WITH (FORMAT csv)",
+            buffer,
+        )
+    finally:
+        cursor.close()
+
+
+def reserve_table_ids(session: Session, table_name: str, count: int) -> list:
+    """Takes next values of the id sequence of the table, so rows can be
+    written with known ids"""
+    if not count:
+        return []
+    stmt = select(
+        func.nextval(func.pg_get_serial_sequence(table_name, "id"))
+    ).select_from(func.generate_series(1, count))
+    return session.execute(stmt).scalars().all()
+
+
+def get_table_row(instance: SQLModel) -> tuple:
+    """Returns values of all table columns of not flushed instance
+    in the form expected by copy_rows_to_table"""
+    row = []
+    for column in instance.__table__.columns:
+        value = getattr(instance, column.key)
+        if value is None and column.default is not None:
+            if column.default.is_scalar:
+                value = column.default.arg
+        elif value is not None and isinstance(column.type, JSON):
+            value = json.dumps(value)
+        elif isinstance(value, float) and isinstance(column.type, Integer):
+            # ids are read from the file as float, COPY does not cast them
+            value = int(value)
+        row.append(value)
+    return tuple(row)
+
+
 class BatchFileConstants:
     def __init__(self):
         self._created_mo_prms: DataFrame = DataFrame(
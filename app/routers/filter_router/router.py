@@ -16,6 +16,7 @@ async def read_common_info():
     - tprm_id*number* : id of TPRM \n
     - contains, is_any_of: filter flags. Able filter flags depends of TPRM type
      [str, date, datetime, float, int, bool, mo_link, prm_link, user_link, formula] \n
+    - multiple TPRMs of any type are filtered with flags: contains, contains_any_of, is_empty, is_not_empty \n
     - value : search value \n
     - 1;2;3 : search values with separator ;  - use if flag able to search by several values \n
     - filter_logical_operator: logical operator can be one of: and, or. By default equals 'and' \n
@@ -1,10 +1,14 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
+from sqlmodel import Session
+
+from database import get_session
 
 from services.kafka_service.consumer.kafka_utils import (
     get_topic_info,
     get_consumer_groups,
     get_consumer_group_offset,
 )
+from services.outbox_service.processor import get_outbox_lag
 
 router = APIRouter(tags=["Kafka"])
 
@@ -25,3 +29,8 @@ async def get_list_consumer_groups():
 async def get_list_consumer_group_offset():
     result = await get_consumer_group_offset()
     return {"kafka consumer group offset": result}
+
+
+@router.get("/outbox_lag")
+async def get_kafka_outbox_lag(session: Session = Depends(get_session)):
+    return get_outbox_lag(session=session)
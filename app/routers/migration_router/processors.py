@@ -7,12 +7,18 @@ import pandas as pd
 import xlsxwriter
 from fastapi import UploadFile
 from pandas import DataFrame
+from sqlalchemy import bindparam, update
 from sqlalchemy.orm import Session
 from sqlmodel import select
 from xlsxwriter.exceptions import DuplicateWorksheetName
 from xlsxwriter.worksheet import Worksheet
 
-from models import TMO, TPRM
+from functions.functions_utils.utils import (
+    decode_multiple_value,
+    encode_multiple_value,
+    is_legacy_multiple_value,
+)
+from models import TMO, TPRM, PRM, PRM_MULTIPLE_VALUE_COLUMN
 from routers.batch_router.constants import XLSX_FORMAT
 from routers.migration_router.constants import (
     SEPARATOR_FOR_PRM_LINK,
@@ -23,6 +29,7 @@ from routers.migration_router.exceptions import (
     ObjectTypeAlreadyExists,
 )
 from routers.migration_router.schemas import (
+    ConvertMultipleParameterValuesResponse,
     MigrateObjectTypeAsExportRequest,
     ParsedRequestedFileAsDict,
 )
@@ -786,3 +793,102 @@ class MigrateObjectTypeAsImport(ProcessFileForMigrateImport):
         self._convert_dependent_object_type_data()
         self._convert_dependent_parameter_type_data()
         self._session.commit()
+
+
+class ConvertMultipleParameterValues:
+    """Rewrites pickled values of multiple parameters (and default values of
+    multiple parameter types) to JSON arrays.
+    Parameters are processed in batches ordered by id, every batch is
+    committed separately, so conversion can run on a working system and can be
+    continued after interruption. Values are changed by plain UPDATE
+    statements: the stored list is not changed, so versions are kept and no
+    events are sent. A value is only replaced if it was not changed since it
+    was read, values written concurrently by users are kept."""
+
+    def __init__(self, session: Session, batch_size: int = 10_000):
+        self._session = session
+        self._batch_size = batch_size
+
+    def _convert_parameter_types(self) -> int:
+        parameter_types = self._session.execute(
+            select(TPRM.id, TPRM.field_value).where(
+                TPRM.multiple.is_(True), TPRM.field_value.isnot(None)
+            )
+        ).all()
+        new_values = [
+            {
+                "tprm_id": tprm_id,
+                "old_value": field_value,
+                "new_value": encode_multiple_value(
+                    decode_multiple_value(field_value)
+                ),
+            }
+            for tprm_id, field_value in parameter_types
+            if field_value and is_legacy_multiple_value(field_value)
+        ]
+        if new_values:
+            self._session.connection().execute(
+                update(TPRM.__table__)
+                .where(
+                    TPRM.__table__.c.id == bindparam("tprm_id"),
+                    TPRM.__table__.c.field_value == bindparam("old_value"),
+                )
+                .values(field_value=bindparam("new_value")),
+                new_values,
+            )
+            self._session.commit()
+        return len(new_values)
+
+    def _convert_parameters(self) -> int:
+        converted = 0
+        last_prm_id = 0
+        multiple_tprm_ids = select(TPRM.id).where(TPRM.multiple.is_(True))
+        while True:
+            stmt = (
+                select(PRM.id, PRM.value)
+                .where(
+                    PRM.id > last_prm_id,
+                    PRM.tprm_id.in_(multiple_tprm_ids),
+                    PRM_MULTIPLE_VALUE_COLUMN.is_(None),
+                    PRM.value.isnot(None),
+                )
+                .order_by(PRM.id)
+                .limit(self._batch_size)
+            )
+            parameters = self._session.execute(stmt).all()
+            if not parameters:
+                return converted
+
+            last_prm_id = parameters[-1].id
+            new_values = [
+                {
+                    "prm_id": prm_id,
+                    "old_value": value,
+                    "new_value": encode_multiple_value(
+                        decode_multiple_value(value)
+                    ),
+                }
+                for prm_id, value in parameters
+                if is_legacy_multiple_value(value)
+            ]
+            if new_values:
+                self._session.connection().execute(
+                    update(PRM.__table__)
+                    .where(
+                        PRM.__table__.c.id == bindparam("prm_id"),
+                        PRM.__table__.c.value == bindparam("old_value"),
+                    )
+                    .values(value=bindparam("new_value")),
+                    new_values,
+                )
+            self._session.commit()
+            converted += len(new_values)
+
+    def execute(self) -> ConvertMultipleParameterValuesResponse:
+        self._session.info["disable_security"] = True
+        converted_parameter_types = self._convert_parameter_types()
+        converted_parameters = self._convert_parameters()
+        return ConvertMultipleParameterValuesResponse(
+            converted_parameters=converted_parameters,
+            converted_parameter_types=converted_parameter_types,
+        )
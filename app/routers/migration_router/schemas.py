@@ -10,3 +10,8 @@ class MigrateObjectTypeAsExportRequest(BaseModel):
 class ParsedRequestedFileAsDict(BaseModel):
     object_type_instances_by_name: dict[str, dict] = {}
     parameter_type_instances_by_object_type_name: dict[str, list[dict]] = {}
+
+
+class ConvertMultipleParameterValuesResponse(BaseModel):
+    converted_parameters: int
+    converted_parameter_types: int
@@ -1,7 +1,6 @@
 import copy
 import io
 import itertools
-import pickle
 from collections import defaultdict
 from datetime import datetime, timezone
 from pprint import pprint
@@ -32,6 +31,8 @@ from functions.functions_utils.utils import (
     calculate_by_formula_new,
     find_deep_parent,
     count_objects,
+    decode_multiple_value,
+    encode_multiple_value,
 )
 from functions.validation_functions.validation_function import (
     check_if_all_required_params_passed,
@@ -88,7 +89,6 @@ from routers.object_router.utils import (
     validate_object_parameters,
     proceed_parameter_attributes,
     get_grouped_params,
-    decode_pickle_data,
     check_mo_is_part_of_other_mo_name,
     proceed_object_list_delete,
     recursive_find_children_all_children_tmo,
@@ -1293,9 +1293,9 @@ class CreateObjectWithParameters(
             if parameter_type_instance.multiple and isinstance(
                 parameter_to_create.value, list
             ):
-                parameter_to_create.value = pickle.dumps(
+                parameter_to_create.value = encode_multiple_value(
                     parameter_to_create.value
-                ).hex()
+                )
 
             if parameter_type_instance.id in [
                 latitude_parameter_type_id,
@@ -1644,7 +1644,7 @@ class GetLinkedObjectsByParametersLink(
             parameter_instance,
         ) in parameter_instances_by_id.items():
             linked_parameters_ids.update(
-                set(decode_pickle_data(parameter_instance.value))
+                set(decode_multiple_value(parameter_instance.value))
             )
 
         return linked_parameters_ids
@@ -1729,7 +1729,7 @@ class GetLinkedObjectsByParametersLink(
         )
 
         for parameter_instance in parameter_instances:
-            linked_parameters_ids: list = decode_pickle_data(
+            linked_parameters_ids: list = decode_multiple_value(
                 parameter_instance.value
             )
 
@@ -1748,7 +1748,7 @@ class GetLinkedObjectsByParametersLink(
 
                     values = [parameter_instance.value]
                     if linked_parameter_data.parameter_type_instance.multiple:
-                        values: list = decode_pickle_data(
+                        values: list = decode_multiple_value(
                             parameter_instance.value
                         )
 
@@ -1795,7 +1795,7 @@ class GetLinkedObjectsByParametersLink(
 
                 values = [current_prm.value]
                 if parameter_type_instance.multiple:
-                    values: list = decode_pickle_data(current_prm.value)
+                    values: list = decode_multiple_value(current_prm.value)
 
                 if values:
                     object_instance = self._get_object_instance_by_id(
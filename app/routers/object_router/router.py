@@ -19,11 +19,12 @@ from sqlalchemy import (
     desc,
 )
 from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from starlette.datastructures import ImmutableMultiDict, QueryParams
 from starlette.responses import StreamingResponse
 
 from common.common_constant import NAME_DELIMITER
-from database import get_session
+from database import get_session, get_async_session
 from functions.db_functions.db_read import (
     get_object_with_parameters,
     get_exists_objects,
@@ -115,13 +116,17 @@ async def read_objects(
     offset: Optional[int] = Query(default=0, gt=-1),
     order_by_tprms_id: list[int] | None = Query(None),
     order_by_asc: list[bool] | None = Query(None),
-    session: Session = Depends(get_session),
+    after_id: int | None = Query(None),
+    session: AsyncSession = Depends(get_async_session),
     identifiers_instead_of_values: bool = Query(False, include_in_schema=False),
 ):
     """
     Able to use query params to obtain filtered results
+
+    Set after_id to the id of the last object of the previous page to get the next page
+    without scanning the skipped objects (keyset pagination).
     """
-    res = read_objects_with_params(
+    res = await read_objects_with_params(
         query_params=request.query_params,
         response=response,
         object_type_id=object_type_id,
@@ -134,6 +139,7 @@ async def read_objects(
         offset=offset,
         order_by_tprms_id=order_by_tprms_id,
         order_by_asc=order_by_asc,
+        after_id=after_id,
         session=session,
         search_rule="start_with",
         identifiers_instead_of_values=identifiers_instead_of_values,
@@ -266,7 +272,8 @@ async def read_objects_by_post_method(
     offset: Optional[int] = Body(default=0, gt=-1),
     order_by_tprms_id: list[int] | None = Body(None),
     order_by_asc: list[bool] | None = Body(None),
-    session: Session = Depends(get_session),
+    after_id: int | None = Body(None),
+    session: AsyncSession = Depends(get_async_session),
     identifiers_instead_of_values: bool = Body(False),
 ):
     """To obtain results for specific objects with filter conditions set filter_params.
@@ -285,7 +292,7 @@ async def read_objects_by_post_method(
     else:
         query_params = ImmutableMultiDict()
     query_params = QueryParams(query_params)
-    res = read_objects_with_params(
+    res = await read_objects_with_params(
         query_params=query_params,
         response=response,
         object_type_id=object_type_id,
@@ -298,6 +305,7 @@ async def read_objects_by_post_method(
         offset=offset,
         order_by_tprms_id=order_by_tprms_id,
         order_by_asc=order_by_asc,
+        after_id=after_id,
         session=session,
         identifiers_instead_of_values=identifiers_instead_of_values,
     )
@@ -2,7 +2,6 @@ import copy
 import csv
 import io
 import json
-import pickle
 import re
 from collections import namedtuple, defaultdict
 from datetime import datetime
@@ -20,20 +19,19 @@ from typing import (
 from fastapi import HTTPException, Response
 from geopy.distance import geodesic as GD
 from sqlalchemy import (
-    String,
     Integer,
-    Date,
-    DateTime,
+    String,
     and_,
     or_,
     select,
     cast,
-    Numeric,
     func,
     delete,
     false,
+    true,
     text,
     bindparam,
+    update,
 )
 from sqlalchemy.orm import aliased
 from sqlalchemy.orm.attributes import flag_modified
@@ -41,6 +39,7 @@ from sqlmodel import (
     Session,
     select as select_sqlmodel,
 )  # Import select from sqlmodel to return models instead of rows
+from sqlmodel.ext.asyncio.session import AsyncSession
 from starlette.datastructures import QueryParams
 
 from common.common_constant import NAME_DELIMITER
@@ -56,22 +55,32 @@ from functions.db_functions.db_delete import (
     delete_prm_links_by_mo_id_list,
 )
 from functions.functions_utils import utils
-from models import TPRM, PRM, MO, TMO
+from models import (
+    TPRM,
+    PRM,
+    MO,
+    TMO,
+    PRM_TYPED_VALUE_COLUMNS,
+    PRM_MULTIPLE_VALUE_COLUMN,
+)
 from routers.object_router.exceptions import DescendantsLimit, ObjectNotExists
 from routers.object_type_router.utils import ObjectTypeDBGetter
 from routers.parameter_router.schemas import GroupedParam, PRMReadMultiple
-
-dict_convert_tmo_type_db_colum_type = {
-    "str": String,
-    "date": Date,
-    "datetime": DateTime,
-    "float": Numeric,
-    "int": Numeric,
-    "bool": String,
-    "mo_link": Numeric,
-    "prm_link": String,
-    "user_link": String,
-    "formula": String,
+from services.listener_service.processor import ListenerService
+
+# Typed PRM value columns are generated by the database and indexed
+# with (tprm_id, typed value, mo_id), so filters and sorting by them use indexes
+dict_prm_value_column_by_val_type = {
+    "str": PRM.value,
+    "date": PRM_TYPED_VALUE_COLUMNS["date"],
+    "datetime": PRM_TYPED_VALUE_COLUMNS["datetime"],
+    "float": PRM_TYPED_VALUE_COLUMNS["numeric"],
+    "int": PRM_TYPED_VALUE_COLUMNS["numeric"],
+    "bool": PRM_TYPED_VALUE_COLUMNS["bool"],
+    "mo_link": PRM_TYPED_VALUE_COLUMNS["numeric"],
+    "prm_link": PRM.value,
+    "user_link": PRM.value,
+    "formula": PRM.value,
 }
 
 DATE_PATTERN = "%Y-%m-%d"
@@ -79,6 +88,8 @@ DATETIME_PATTERN = "%Y-%m-%dT%H:%M"
 
 dict_operators_for_filter_condition = {"AND": and_, "OR": or_}
 
+MOIdsPage = namedtuple("MOIdsPage", "mo_ids total")
+
 
 def str_contains_where_condition(db_column, value):
     """Returns 'where' condition where  values of 'db_column' contain 'value'."""
@@ -416,11 +427,11 @@ def bool_equals_where_condition(db_column, value):
     """Returns 'where' condition where values of 'db_column' equal 'value'."""
     match value:
         case "true":
-            return db_column == "True"
+            return db_column == true()
         case "false":
-            return db_column == "False"
+            return db_column == false()
         case _:
-            return or_(db_column == "False", db_column == "True")
+            return db_column.isnot(None)
 
 
 def bool_is_empty_where_condition(db_column, value):
@@ -438,13 +449,13 @@ def bool_is_not_empty_where_condition(db_column, value):
 def bool_is_true_where_condition(db_column, value):
     """Returns 'where' condition where values of 'db_column' equal to true."""
 
-    return db_column == "True"
+    return db_column == true()
 
 
 def bool_is_false_where_condition(db_column, value):
     """Returns 'where' condition where values of 'db_column' equal to false."""
 
-    return db_column == "False"
+    return db_column == false()
 
 
 bool_flags = {
@@ -473,6 +484,49 @@ prm_flag = {
     "is_not_empty": prm_is_not_empty_where_condition,
 }
 
+
+def multiple_contains_where_condition(db_column, value):
+    """Returns 'where' condition where lists of 'db_column' contain all values."""
+
+    return db_column.contains(value)
+
+
+def multiple_contains_any_of_where_condition(db_column, value):
+    """Returns 'where' condition where lists of 'db_column' contain any of values."""
+
+    return or_(*[db_column.contains([item]) for item in value])
+
+
+# Filter flags of multiple TPRMs. They are applied to PRM.value_multiple
+# (jsonb, GIN indexed), values of 'contains' flags are separated by ;
+multiple_flags = {
+    "contains": multiple_contains_where_condition,
+    "contains_any_of": multiple_contains_any_of_where_condition,
+    "is_empty": prm_is_empty_where_condition,
+    "is_not_empty": prm_is_not_empty_where_condition,
+}
+
+# Converts filter values to types of items stored in multiple values
+multiple_filter_value_converter_by_val_type = {
+    "int": int,
+    "float": float,
+    "mo_link": int,
+    "prm_link": int,
+}
+
+
+def convert_multiple_filter_value(val_type: str, filter_flag: str, value: str):
+    """Returns list of values of 'contains' flags converted to types of items
+    stored in multiple values."""
+    if filter_flag in prm_flag:
+        return value
+
+    convert_value = multiple_filter_value_converter_by_val_type.get(
+        val_type, str
+    )
+    return [convert_value(item) for item in value.split(";") if item]
+
+
 dict_of_filter_flags = {
     "str": str_flags,
     "date": date_flags,
@@ -672,7 +726,6 @@ class TPRMFilterCleaner:
 
         stmt = select(TPRM).where(
             TPRM.id.in_(tprm_ids),
-            TPRM.multiple == False,  # noqa
             *object_type_where_condition,
         )
         tprms = self.session.execute(stmt).all()
@@ -681,13 +734,24 @@ class TPRMFilterCleaner:
 
         for tprm in tprms:
             tprm = tprm[0]
-            unique_key = namedtuple("UniqueKey", "Id VatType")
-            unique_key = unique_key(tprm.id, tprm.val_type)
+            unique_key = namedtuple("UniqueKey", "Id VatType Multiple")
+            unique_key = unique_key(tprm.id, tprm.val_type, tprm.multiple)
 
             for combination in self.filter_dict[tprm.id]:
+                val_type = tprm.val_type
+                filter_flag = combination.Flag
+                if tprm.multiple:
+                    if filter_flag not in multiple_flags:
+                        continue
+                    if filter_flag not in prm_flag:
+                        # values are separated by ; as in is_any_of flag
+                        filter_flag = "is_any_of"
+                        if val_type == "prm_link":
+                            val_type = "int"
+
                 is_valid = self.__field_value_validation_by_val_type(
-                    val_type=tprm.val_type,
-                    filter_flag=combination.Flag,
+                    val_type=val_type,
+                    filter_flag=filter_flag,
                     value=combination.Value,
                 )
                 if is_valid:
@@ -700,13 +764,15 @@ class TPRMFilterCleaner:
 
         return cleaned_filter_dict
 
-    def get_mo_ids_which_match_clean_filter_conditions(
+    def _get_statement_which_match_clean_filter_conditions(
         self,
         obj_ids=None,
         p_id=None,
         order_by: dict | None = None,
         active: bool | None = None,
     ):
+        """Returns statement which selects objects matching clean filter conditions
+        and list of (order column, ascending, tprm_id, prm value column) to order it by."""
         stm = select(MO.id, MO.tmo_id, MO.p_id)
 
         mo_where_condition = []
@@ -733,15 +799,18 @@ class TPRMFilterCleaner:
                 set_of_combined_data,
             ) in self.clean_filter_dict.items():
                 param_label = f"param_{iter_for_label_name}"
-                cast_type = dict_convert_tmo_type_db_colum_type.get(
-                    combined_key.VatType, False
-                )
+                if combined_key.Multiple:
+                    value_column = PRM_MULTIPLE_VALUE_COLUMN
+                    flags_for_current_val_type = multiple_flags
+                else:
+                    value_column = dict_prm_value_column_by_val_type.get(
+                        combined_key.VatType, None
+                    )
+                    flags_for_current_val_type = dict_of_filter_flags.get(
+                        combined_key.VatType, False
+                    )
                 cache_to_check_param_exist = {}
 
-                flags_for_current_val_type = dict_of_filter_flags.get(
-                    combined_key.VatType, False
-                )
-
                 for combined_data in set_of_combined_data:
                     where_condition_for_flag = False
                     if flags_for_current_val_type:
@@ -751,13 +820,13 @@ class TPRMFilterCleaner:
                             )
                         )
 
-                    if all([cast_type, where_condition_for_flag]):
+                    if value_column is not None and where_condition_for_flag:
                         if param_label not in cache_to_check_param_exist:
                             column_name = f"filter_{combined_data.Id}"
 
                             select_statement = select(
                                 PRM.mo_id,
-                                cast(PRM.value, cast_type()).label(column_name),
+                                value_column.label(column_name),
                             ).where(PRM.tprm_id == combined_data.Id)
                             aliased_table = aliased(select_statement.subquery())
 
@@ -772,10 +841,27 @@ class TPRMFilterCleaner:
                                 param_label
                             ]
 
+                        filter_value = combined_data.Value
+                        if combined_key.Multiple:
+                            filter_value = convert_multiple_filter_value(
+                                val_type=combined_key.VatType,
+                                filter_flag=combined_data.Flag,
+                                value=filter_value,
+                            )
+
+                        filter_column = getattr(aliased_table.c, column_name)
+                        if (
+                            combined_key.Multiple
+                            and combined_data.Flag in prm_flag
+                        ):
+                            # legacy pickled values have no value_multiple,
+                            # emptiness is checked by existence of parameter
+                            filter_column = aliased_table.c.mo_id
+
                         where_condition.append(
                             where_condition_for_flag(
-                                getattr(aliased_table.c, column_name),
-                                combined_data.Value,
+                                filter_column,
+                                filter_value,
                             )
                         )
             for table in joins_tables:
@@ -785,41 +871,200 @@ class TPRMFilterCleaner:
                 self.filter_logical_operator(*where_condition)
             ).distinct()
 
+        order_columns = []
         if order_by:
             order_value = namedtuple("OrderValue", "type ascending")
 
             for order_tprm_id, order_tprm_value in order_by.items():
                 column_name = f"order_{order_tprm_id}"
                 order_tprm_value: order_value = order_tprm_value
-                cast_type = dict_convert_tmo_type_db_colum_type.get(
-                    order_tprm_value.type, False
+                value_column = dict_prm_value_column_by_val_type.get(
+                    order_tprm_value.type, None
                 )
-                if not cast_type:
+                if value_column is None:
                     continue
 
                 select_statement = select(
-                    PRM.mo_id, cast(PRM.value, cast_type()).label(column_name)
+                    PRM.mo_id, value_column.label(column_name)
                 ).where(PRM.tprm_id == order_tprm_id)
                 aliased_table = aliased(select_statement.subquery())
 
-                order_by_condition = getattr(aliased_table.c, column_name)
-                if not order_tprm_value.ascending:
-                    order_by_condition = order_by_condition.desc()
-
-                stm = (
-                    stm.outerjoin(aliased_table, MO.id == aliased_table.c.mo_id)
-                    .order_by(order_by_condition)
-                    .add_columns(order_by_condition)
+                order_column = getattr(aliased_table.c, column_name)
+                stm = stm.outerjoin(
+                    aliased_table, MO.id == aliased_table.c.mo_id
+                ).add_columns(order_column)
+                order_columns.append(
+                    (
+                        order_column,
+                        order_tprm_value.ascending,
+                        order_tprm_id,
+                        value_column,
+                    )
                 )
-        else:
-            stm = stm.order_by(MO.id)
 
         if active is not None:
             stm = stm.where(MO.active == active)
 
+        return stm, order_columns
+
+    def _get_ordered_statement_which_match_clean_filter_conditions(
+        self,
+        obj_ids=None,
+        p_id=None,
+        order_by: dict | None = None,
+        active: bool | None = None,
+    ):
+        stm, order_columns = (
+            self._get_statement_which_match_clean_filter_conditions(
+                obj_ids=obj_ids, p_id=p_id, order_by=order_by, active=active
+            )
+        )
+        if order_columns:
+            for order_column, ascending, _, _ in order_columns:
+                stm = stm.order_by(
+                    order_column if ascending else order_column.desc()
+                )
+        else:
+            stm = stm.order_by(MO.id)
+        return stm
+
+    def get_mo_ids_which_match_clean_filter_conditions(
+        self,
+        obj_ids=None,
+        p_id=None,
+        order_by: dict | None = None,
+        active: bool | None = None,
+    ):
+        stm = self._get_ordered_statement_which_match_clean_filter_conditions(
+            obj_ids=obj_ids, p_id=p_id, order_by=order_by, active=active
+        )
         res = self.session.execute(stm).scalars().all()
         return res
 
+    def iter_pages_of_mo_ids_which_match_clean_filter_conditions(
+        self,
+        page_size: int,
+        obj_ids=None,
+        p_id=None,
+        order_by: dict | None = None,
+        active: bool | None = None,
+    ) -> Iterator[list[int]]:
+        """Yields ordered ids of objects which match clean filter conditions
+        by pages of page_size. Ids are read by server-side cursor, only one
+        page of them is loaded at once."""
+        stm = self._get_ordered_statement_which_match_clean_filter_conditions(
+            obj_ids=obj_ids, p_id=p_id, order_by=order_by, active=active
+        ).execution_options(yield_per=page_size)
+        for page in (
+            self.session.execute(stm).scalars().partitions(size=page_size)
+        ):
+            yield list(page)
+
+    def get_page_of_mo_ids_which_match_clean_filter_conditions(
+        self,
+        limit: int | None,
+        offset: int | None = None,
+        after_id: int | None = None,
+        obj_ids=None,
+        p_id=None,
+        order_by: dict | None = None,
+        active: bool | None = None,
+    ) -> MOIdsPage:
+        """Returns one page of ordered ids of objects which match clean filter conditions
+        and total count of matched objects, both computed by the database in one query.
+
+        after_id is a keyset cursor: the page starts right after the object with this id
+        in the requested order (offset is applied after the cursor)."""
+        stm, order_columns = (
+            self._get_statement_which_match_clean_filter_conditions(
+                obj_ids=obj_ids, p_id=p_id, order_by=order_by, active=active
+            )
+        )
+        filtered = stm.add_columns(
+            func.count().over().label("total_count")
+        ).subquery()
+
+        sort_columns = []
+        cursor_values = []
+        for order_column, ascending, tprm_id, value_column in order_columns:
+            sort_columns.append((filtered.c[order_column.name], ascending))
+            cursor_values.append(
+                select(value_column)
+                .where(PRM.tprm_id == tprm_id, PRM.mo_id == after_id)
+                .scalar_subquery()
+            )
+
+        page_stm = select(filtered.c.id, filtered.c.total_count)
+        if after_id is not None:
+            page_stm = page_stm.where(
+                get_keyset_after_condition(
+                    sort_columns=sort_columns,
+                    cursor_values=cursor_values,
+                    id_column=filtered.c.id,
+                    after_id=after_id,
+                )
+            )
+        page_stm = page_stm.order_by(
+            *[
+                column.asc().nulls_last()
+                if ascending
+                else column.desc().nulls_first()
+                for column, ascending in sort_columns
+            ],
+            filtered.c.id,
+        )
+        if offset:
+            page_stm = page_stm.offset(offset)
+        if limit is not None:
+            page_stm = page_stm.limit(limit)
+
+        rows = self.session.execute(page_stm).all()
+        if rows:
+            return MOIdsPage(
+                mo_ids=[row.id for row in rows], total=rows[0].total_count
+            )
+
+        # window function has no rows to be computed on for an empty page
+        total = 0
+        if offset or after_id is not None:
+            count_stm = select(func.count()).select_from(stm.subquery())
+            total = self.session.execute(count_stm).scalar_one()
+        return MOIdsPage(mo_ids=[], total=total)
+
+
+def get_keyset_after_condition(
+    sort_columns: list,
+    cursor_values: list,
+    id_column,
+    after_id: int,
+):
+    """Returns 'where' condition which selects rows placed after the cursor row
+    when rows are ordered by sort_columns (ASC NULLS LAST / DESC NULLS FIRST)
+    and then by id_column.
+
+    sort_columns: list of (column, ascending)
+    cursor_values: values (or scalar subqueries) of sort_columns for the cursor row
+    """
+    condition = id_column > after_id
+    for (column, ascending), cursor_value in zip(
+        reversed(sort_columns), reversed(cursor_values)
+    ):
+        if ascending:
+            after_cursor = and_(
+                cursor_value.isnot(None),
+                or_(column > cursor_value, column.is_(None)),
+            )
+        else:
+            after_cursor = or_(
+                column < cursor_value,
+                and_(cursor_value.is_(None), column.isnot(None)),
+            )
+        condition = or_(
+            after_cursor,
+            and_(column.isnot_distinct_from(cursor_value), condition),
+        )
+    return condition
+
 
 def filter_flags_by_tprm(tprm: TPRM):
     """Returns dict with filter flags particular tprm_id"""
@@ -990,8 +1235,8 @@ def proceed_object_list_delete(
 
     delete_prm_links_by_mo_id_list(session=session, mo_ids=mo_ids)
 
+    collapse_sequences_if_exist_massive(session, object_instances)
     for mo in object_instances:
-        collapse_sequences_if_exist(session, mo)
         session.delete(mo)
 
 
@@ -1051,10 +1296,6 @@ def ilike(pattern: str, string_list: list) -> list:
     return any(pattern_lower in string.lower() for string in string_list)
 
 
-def decode_pickle_data(data: str):
-    return pickle.loads(bytes.fromhex(data))
-
-
 def get_conditions_for_coords(
     outer_box_longitude_min: Union[float, None],
     outer_box_longitude_max: Union[float, None],
@@ -1169,46 +1410,48 @@ def get_conditions_for_coords(
     return conditions
 
 
-def read_objects_with_params(
+def _get_mo_ids_by_name_query(
+    name: str,
+    obj_id: Union[List[int], None],
+    search_rule: Literal["start_with", "end_with", "contains"],
+):
+    filters = [MO.latitude.isnot(None), MO.longitude.isnot(None)]
+
+    if name != " ":
+        ilike_rule = "%" + name + "%"
+
+        if search_rule == "start_with":
+            ilike_rule = name + "%"
+        if search_rule == "end_with":
+            ilike_rule = "%" + name
+
+        filters = [
+            MO.latitude.isnot(None),
+            MO.longitude.isnot(None),
+            MO.name.ilike(ilike_rule),
+        ]
+
+    if obj_id:
+        filters.append(MO.id.in_(obj_id))
+
+    return select(MO.id).where(and_(*filters)).order_by(MO.name)
+
+
+def _get_page_of_mo_ids_matching_filter_and_order(
     session: Session,
     query_params: QueryParams,
-    response: Response,
+    limit: int | None,
+    offset: int | None,
+    after_id: int | None = None,
     object_type_id: int = None,
     p_id: int = None,
-    name: str = None,
     obj_id: Union[List[int], None] = None,
-    with_parameters: bool = False,
     active: bool = True,
-    limit: Optional[int] = 50,
-    offset: Optional[int] = 0,
     order_by_tprms_id: list[int] | None = None,
     order_by_asc: list[bool] | None = None,
-    identifiers_instead_of_values: bool = False,
-    search_rule: Literal["start_with", "end_with", "contains"] = "contains",
-):
-    if name:
-        filters = [MO.latitude.isnot(None), MO.longitude.isnot(None)]
-
-        if name != " ":
-            ilike_rule = "%" + name + "%"
-
-            if search_rule == "start_with":
-                ilike_rule = name + "%"
-            if search_rule == "end_with":
-                ilike_rule = "%" + name
-
-            filters = [
-                MO.latitude.isnot(None),
-                MO.longitude.isnot(None),
-                MO.name.ilike(ilike_rule),
-            ]
-
-        if obj_id:
-            filters.append(MO.id.in_(obj_id))
-
-        query = select(MO.id).where(and_(*filters)).order_by(MO.name)
-        obj_id = session.execute(query).scalars().all()
-
+) -> MOIdsPage | None:
+    """Returns page of ordered ids of objects which match tprm filters from query_params.
+    Returns None if there are neither filter nor order conditions."""
     if object_type_id is not None:
         db_read.get_db_object_type_or_exception(session, object_type_id)
 
@@ -1223,51 +1466,113 @@ def read_objects_with_params(
         order_by_tprms_id=order_by_tprms_id,
         order_by_asc=order_by_asc,
     )
-    start = offset
-    end = start + limit
 
     if tprm_cleaner.check_filter_data_in_query_params() or order_by:
-        mos_ids = tprm_cleaner.get_mo_ids_which_match_clean_filter_conditions(
-            obj_ids=obj_id, p_id=p_id, order_by=order_by, active=active
+        return (
+            tprm_cleaner.get_page_of_mo_ids_which_match_clean_filter_conditions(
+                limit=limit,
+                offset=offset,
+                after_id=after_id,
+                obj_ids=obj_id,
+                p_id=p_id,
+                order_by=order_by,
+                active=active,
+            )
         )
-        obj_ids = mos_ids[start:end]
-        objects_to_read = db_read.get_objects_with_parameters_by_mo_ids(
-            session=session,
-            limit=None,
-            offset=None,
-            mos_ids=obj_ids,
-            returnable=not with_parameters,
-            active=active,
-            identifiers_instead_of_values=identifiers_instead_of_values,
+    return None
+
+
+async def read_objects_with_params(
+    session: AsyncSession,
+    query_params: QueryParams,
+    response: Response,
+    object_type_id: int = None,
+    p_id: int = None,
+    name: str = None,
+    obj_id: Union[List[int], None] = None,
+    with_parameters: bool = False,
+    active: bool = True,
+    limit: Optional[int] = 50,
+    offset: Optional[int] = 0,
+    order_by_tprms_id: list[int] | None = None,
+    order_by_asc: list[bool] | None = None,
+    identifiers_instead_of_values: bool = False,
+    search_rule: Literal["start_with", "end_with", "contains"] = "contains",
+    after_id: int | None = None,
+):
+    """Queries are executed by asyncpg, so the event loop is not blocked
+    while the database executes them.
+
+    after_id is a keyset cursor: when it is set, the page starts right after the
+    object with this id (offset is applied after the cursor)."""
+    if name:
+        query = _get_mo_ids_by_name_query(
+            name=name, obj_id=obj_id, search_rule=search_rule
         )
-        results_length = utils.count_objects(
-            session=session,
+        obj_id = (await session.execute(query)).scalars().all()
+
+    mos_ids_page = await session.run_sync(
+        lambda sync_session: _get_page_of_mo_ids_matching_filter_and_order(
+            session=sync_session,
+            query_params=query_params,
+            limit=limit,
+            offset=offset,
+            after_id=after_id,
             object_type_id=object_type_id,
-            mos_ids=mos_ids,
             p_id=p_id,
+            obj_id=obj_id,
             active=active,
+            order_by_tprms_id=order_by_tprms_id,
+            order_by_asc=order_by_asc,
+        )
+    )
+
+    if mos_ids_page is not None:
+        objects_to_read = (
+            await db_read.get_objects_with_parameters_by_mo_ids_async(
+                session=session,
+                limit=None,
+                offset=None,
+                mos_ids=mos_ids_page.mo_ids,
+                returnable=not with_parameters,
+                active=active,
+                identifiers_instead_of_values=identifiers_instead_of_values,
+            )
         )
+        position_by_mo_id = {
+            mo_id: position
+            for position, mo_id in enumerate(mos_ids_page.mo_ids)
+        }
+        objects_to_read.sort(key=lambda mo: position_by_mo_id[mo["id"]])
+        results_length = mos_ids_page.total
     else:
         obj_ids = obj_id
         if isinstance(obj_id, list):
-            obj_ids = obj_id[start:end]
-            offset = None
+            if after_id is not None and after_id in obj_id:
+                obj_ids = obj_id[obj_id.index(after_id) + 1 :]
+            obj_ids = obj_ids[offset : offset + limit]
+            page_offset = None
+            page_after_id = None
         else:
-            offset = start
-        objects_to_read = db_read.get_objects_with_parameters_by_mo_ids(
-            session=session,
-            limit=limit,
-            offset=offset,
-            object_type_id=object_type_id,
-            mos_ids=obj_ids,
-            p_id=p_id,
-            returnable=not with_parameters,
-            active=active,
-            order_by_rule=OrderByRule(rule="asc"),
-            identifiers_instead_of_values=identifiers_instead_of_values,
-            with_parent_name=True,
+            page_offset = offset
+            page_after_id = after_id
+        objects_to_read = (
+            await db_read.get_objects_with_parameters_by_mo_ids_async(
+                session=session,
+                limit=limit,
+                offset=page_offset,
+                object_type_id=object_type_id,
+                mos_ids=obj_ids,
+                p_id=p_id,
+                returnable=not with_parameters,
+                active=active,
+                order_by_rule=OrderByRule(rule="asc"),
+                identifiers_instead_of_values=identifiers_instead_of_values,
+                with_parent_name=True,
+                after_id=page_after_id,
+            )
         )
-        results_length = utils.count_objects(
+        results_length = await utils.count_objects_async(
             session=session,
             object_type_id=object_type_id,
             mos_ids=obj_id,
@@ -1493,75 +1798,103 @@ def reconstruct_geometry(
     return output
 
 
-def collapse_sequence_for_tprm(session: Session, param_type: TPRM, mo_id: int):
-    query = select(PRM).where(PRM.tprm_id == param_type.id, PRM.mo_id == mo_id)
-
-    sequence_prm = session.execute(query)
-    sequence_prm = sequence_prm.scalar()
-    if not sequence_prm:
-        return
-
-    query = select(PRM).where(
-        PRM.tprm_id == sequence_prm.tprm_id,
-        cast(PRM.value, Integer) >= int(sequence_prm.value),
-    )
-    if param_type.constraint:
-        sequence_type_value_subquery = (
-            select(PRM.value)
-            .where(PRM.tprm_id == param_type.constraint, PRM.mo_id == mo_id)
-            .scalar_subquery()
-        )
-        sequence_type_tprm_subquery = (
-            select(PRM.tprm_id)
-            .where(PRM.tprm_id == param_type.constraint, PRM.mo_id == mo_id)
-            .scalar_subquery()
+def collapse_sequence_for_objects(
+    session: Session, param_type: TPRM, mo_ids: Iterable[int]
+):
+    """Removes sequence parameters of objects and shifts the rest of their
+    sequences (groups of objects with the same constraint value) by one
+    UPDATE per chunk of objects. Every position is shifted by the number of
+    removed positions which are not greater than it"""
+    for chunk in get_chunked_values_by_sqlalchemy_limit(list(mo_ids)):
+        removed = aliased(PRM, name="removed")
+        remaining = aliased(PRM, name="remaining")
+        shifts = (
+            select(remaining.id, func.count().label("shift"))
+            .join(
+                removed,
+                and_(
+                    removed.tprm_id == param_type.id,
+                    removed.mo_id.in_(chunk),
+                    cast(removed.value, Integer)
+                    <= cast(remaining.value, Integer),
+                ),
+            )
+            .where(
+                remaining.tprm_id == param_type.id,
+                remaining.mo_id.not_in(chunk),
+            )
+            .group_by(remaining.id)
         )
+        if param_type.constraint:
+            removed_type = aliased(PRM, name="removed_type")
+            remaining_type = aliased(PRM, name="remaining_type")
+            shifts = shifts.join(
+                removed_type,
+                and_(
+                    removed_type.tprm_id == int(param_type.constraint),
+                    removed_type.mo_id == removed.mo_id,
+                ),
+            ).join(
+                remaining_type,
+                and_(
+                    remaining_type.tprm_id == int(param_type.constraint),
+                    remaining_type.mo_id == remaining.mo_id,
+                    remaining_type.value == removed_type.value,
+                ),
+            )
+        shifts = shifts.subquery()
 
-        subquery = (
-            select(PRM.mo_id)
-            .where(
-                PRM.value == sequence_type_value_subquery,
-                PRM.tprm_id == sequence_type_tprm_subquery,
+        query = (
+            update(PRM)
+            .where(PRM.id == shifts.c.id)
+            .values(
+                value=cast(cast(PRM.value, Integer) - shifts.c.shift, String)
             )
-            .scalar_subquery()
+            .returning(PRM)
+            .execution_options(synchronize_session="fetch")
         )
-        query = query.where(PRM.mo_id.in_(subquery))
+        updated_params = session.execute(query).scalars().all()
+        # bulk UPDATE is not seen by flush listeners
+        if updated_params:
+            ListenerService.receive_bulk_updated(
+                session=session, instances=updated_params
+            )
 
-    query = query.execution_options(yield_per=100)
-    params_to_update = session.execute(query).scalars().partitions(100)
-    for chunk in params_to_update:
-        for param_to_update in chunk:
-            param_to_update.value = str(int(param_to_update.value) - 1)
-            session.add(param_to_update)
+        query = delete(PRM).where(
+            PRM.tprm_id == param_type.id, PRM.mo_id.in_(chunk)
+        )
+        session.execute(query)
 
-    query = delete(PRM).where(PRM.tprm_id == param_type.id, PRM.mo_id == mo_id)
-    session.execute(query)
+
+def collapse_sequence_for_tprm(session: Session, param_type: TPRM, mo_id: int):
+    collapse_sequence_for_objects(
+        session=session, param_type=param_type, mo_ids=[mo_id]
+    )
 
 
 def collapse_sequences_if_exist(session: Session, object_instance: MO):
-    query = select(TPRM).where(
-        TPRM.tmo_id == object_instance.tmo_id, TPRM.val_type == "sequence"
-    )
-    sequence_tprms = session.exec(query)
-    sequence_tprms = sequence_tprms.scalars().all()
-    if not sequence_tprms:
-        return
+    collapse_sequences_if_exist_massive(session, [object_instance])
 
-    for seq_tprm in sequence_tprms:
-        collapse_sequence_for_tprm(session, seq_tprm, object_instance.id)
 
+def collapse_sequences_if_exist_massive(
+    session: Session, mo: Iterable[MO] | set[MO]
+):
+    mo_ids_by_tmo_id = defaultdict(list)
+    for object_instance in mo:
+        mo_ids_by_tmo_id[object_instance.tmo_id].append(object_instance.id)
+    if not mo_ids_by_tmo_id:
+        return
 
-def collapse_sequences_if_exist_massive(session: Session, mo: List[MO]):
     query = select(TPRM).where(
-        TPRM.tmo_id == mo.tmo_id, TPRM.val_type == "sequence"
+        TPRM.tmo_id.in_(mo_ids_by_tmo_id), TPRM.val_type == "sequence"
     )
     sequence_tprms = session.exec(query)
     sequence_tprms = sequence_tprms.scalars().all()
-    if not sequence_tprms:
-        return
 
     for seq_tprm in sequence_tprms:
-        collapse_sequence_for_tprm(session, seq_tprm, mo.id)
+        collapse_sequence_for_objects(
+            session, seq_tprm, mo_ids_by_tmo_id[seq_tprm.tmo_id]
+        )
 
 
 def get_updated_object_names(
@@ -2143,7 +2476,7 @@ def delete_prm_links_which_linked_to_already_deleted_params(
                 if str(prm_link_id) not in already_deleted_param_ids
             ]
             if multiple_value:
-                prm_link.value = pickle.dumps(multiple_value).hex()
+                prm_link.value = utils.encode_multiple_value(multiple_value)
                 session.add(prm_link)
                 continue
             session.delete(prm_link)
@@ -2155,7 +2488,7 @@ def get_linked_mo_name_for_prm_link(session: Session, parameter: PRM):
             linked_mo_names = {}
 
             for chunk in get_chunked_values_by_sqlalchemy_limit(
-                decode_pickle_data(parameter.value)
+                utils.decode_multiple_value(parameter.value)
             ):
                 temp = session.exec(
                     select(MO.id, MO.name).where(MO.id.in_(chunk))
@@ -2166,7 +2499,7 @@ def get_linked_mo_name_for_prm_link(session: Session, parameter: PRM):
 
             new_value = [
                 linked_mo_names[mo_id]
-                for mo_id in decode_pickle_data(parameter.value)
+                for mo_id in utils.decode_multiple_value(parameter.value)
             ]
         else:
             new_value = session.get(MO, int(parameter.value)).name
@@ -6,13 +6,13 @@ from sqlmodel import Session, select
 
 from database import get_chunked_values_by_sqlalchemy_limit
 from functions.db_functions import db_read, db_create
+from functions.functions_utils.utils import decode_multiple_value
 from models import (
     PRM,
     TMO,
     MO,
     TPRM,
 )
-from routers.object_router.utils import decode_pickle_data
 from routers.parameter_router.schemas import (
     PRMCreateByMO,
     CreateObjectParametersResponse,
@@ -319,8 +319,8 @@ class GetParameterData:
 
             match parameter_type_instance.multiple:
                 case True:
-                    prm_values: list[str] = decode_pickle_data(
-                        data=parameter_instance.value
+                    prm_values: list[str] = decode_multiple_value(
+                        parameter_instance.value
                     )
                     match parameter_type_instance.val_type:
                         case "mo_link":
@@ -1,4 +1,3 @@
-import pickle
 import time
 from collections import defaultdict
 from datetime import datetime
@@ -6,15 +5,21 @@ from typing import List, Union, Optional
 
 from fastapi import APIRouter, HTTPException, Query, Depends
 from sqlalchemy import or_, cast, String
+from sqlalchemy.orm import selectinload
 from sqlalchemy.orm.attributes import flag_modified
 from sqlmodel import Session
 from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from starlette.background import BackgroundTasks
 
 from common.common_exceptions import ValidationError
 from common.common_schemas import ErrorResponseModel
 from common.common_utils import ValueTypeValidator
-from database import get_session, get_chunked_values_by_sqlalchemy_limit
+from database import (
+    get_session,
+    get_async_session,
+    get_chunked_values_by_sqlalchemy_limit,
+)
 from functions.db_functions.db_read import (
     get_db_object_or_exception,
     get_db_object_type_or_exception,
@@ -463,14 +468,16 @@ async def update_object_parameters(
 async def read_parameters(
     object_id: int,
     param_type_ids: List[int],
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
 ):
     param_type_ids = set(param_type_ids)
-    get_db_object_or_exception(session=session, object_id=object_id)
-    prms_query = select(PRM).where(
-        PRM.mo_id == object_id, PRM.tprm_id.in_(param_type_ids)
+    await session.run_sync(get_db_object_or_exception, object_id)
+    prms_query = (
+        select(PRM)
+        .where(PRM.mo_id == object_id, PRM.tprm_id.in_(param_type_ids))
+        .options(selectinload(PRM.tprm))
     )
-    prms = session.exec(prms_query).all()
+    prms = (await session.exec(prms_query)).all()
     result = []
     for db_param in prms:
         if db_param.tprm.multiple:
@@ -1099,9 +1106,7 @@ async def get_full_data_about_prm_link(
         linked_prm_ids = []
         for parameter in requested_parameters:
             if parameter.tprm.multiple:
-                formatted_linked_ids = pickle.loads(
-                    bytes.fromhex(parameter.value)
-                )
+                formatted_linked_ids = decode_multiple_value(parameter.value)
                 parameter.value = formatted_linked_ids
 
                 linked_prm_ids.extend(formatted_linked_ids)
@@ -1164,9 +1169,7 @@ async def get_full_data_about_mo_link(
 
         for parameter in requested_parameters:
             if parameter.tprm.multiple:
-                formatted_linked_ids = pickle.loads(
-                    bytes.fromhex(parameter.value)
-                )
+                formatted_linked_ids = decode_multiple_value(parameter.value)
                 parameter.value = formatted_linked_ids
                 linked_mo_ids.extend(formatted_linked_ids)
                 continue
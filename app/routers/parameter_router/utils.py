@@ -1,13 +1,12 @@
 import copy
 import dataclasses
-import pickle
 import time
 from collections import defaultdict
 from datetime import timezone, datetime
 from typing import Any, List, Dict, Tuple, TypeAlias, Literal, Union
 
 from fastapi import HTTPException
-from sqlalchemy import cast, Integer, update, or_, tuple_
+from sqlalchemy import cast, Integer, String, update, or_, tuple_
 from sqlalchemy.orm.attributes import flag_modified
 from sqlmodel import Session, select, and_
 
@@ -19,10 +18,12 @@ from functions import functions_dicts
 from functions.db_functions import db_create, db_read
 from functions.db_functions.db_delete import delete_prm_links_by_prm_id
 from functions.functions_utils.utils import (
+    calculate_by_formula_for_objects,
     calculate_by_formula_new,
     extract_location_data,
     set_location_attrs,
     decode_multiple_value,
+    encode_multiple_value,
 )
 from functions.functions_utils.utils import (
     update_mo_label_when_update_label_prm,
@@ -49,6 +50,7 @@ from routers.parameter_router.schemas import (
     CreateParameterByObject,
     NewParameterValue,
 )
+from services.listener_service.processor import ListenerService
 from val_types.constants import (
     two_way_mo_link_val_type_name,
     ErrorHandlingType,
@@ -207,33 +209,37 @@ def update_prm_for_formula(
             mos = _get_mo_for_formula(
                 session=session, db_param_type=db_param_type
             )
-        for cur_mo in mos:
-            start_time = time.perf_counter()
-            try:
-                value = calculate_by_formula_new(
-                    session=session,
-                    param_type=db_param_type,
-                    object_instance=cur_mo,
-                )
-            except ValueError as ex:
-                raise ValueError(ex.args)
-            end_time = time.perf_counter()
-            print(
-                f"Update PRM for formula calculate new PRM value: {end_time - start_time}"
+        start_time = time.perf_counter()
+        try:
+            values = calculate_by_formula_for_objects(
+                session=session, param_type=db_param_type, objects=mos
             )
-            start_time = time.perf_counter()
-            for prm in cur_mo.prms:
-                if prm.tprm_id == db_param_type.id:
-                    prm.value = value
-                    prm.version += 1
-                    session.add(prm)
-                    break
+        except ValueError as ex:
+            raise ValueError(ex.args)
+        end_time = time.perf_counter()
+        print(
+            f"Update PRM for formula calculate new PRM values: {end_time - start_time}"
+        )
+        prm_by_mo_id = {}
+        for mo_ids in get_chunked_values_by_sqlalchemy_limit(values):
+            stmt = select(PRM).where(
+                PRM.tprm_id == db_param_type.id, PRM.mo_id.in_(mo_ids)
+            )
+            for prm in session.exec(stmt):
+                prm_by_mo_id[prm.mo_id] = prm
+
+        for cur_mo in mos:
+            value = values[cur_mo.id]
+            prm = prm_by_mo_id.get(cur_mo.id)
+            if prm:
+                prm.value = value
+                prm.version += 1
+                session.add(prm)
             else:
-                db_param = PRM(
+                prm_by_mo_id[cur_mo.id] = PRM(
                     tprm_id=db_param_type.id, mo_id=cur_mo.id, value=value
                 )
-                session.add(db_param)
-                session.flush()
+                session.add(prm_by_mo_id[cur_mo.id])
             update_object_version_and_modification_date(
                 session=session, object_instance=cur_mo
             )
@@ -307,17 +313,18 @@ def update_sequence(
     # action to do with sequence: if value 'increased' -> collapse else -> shift
     increased = int(new_param.value) > int(old_param.value)
 
-    query = select(PRM).where(PRM.tprm_id == param_type.id)
+    position = cast(PRM.value, Integer)
+    query = update(PRM).where(PRM.tprm_id == param_type.id)
     if increased:
         query = query.where(
-            cast(PRM.value, Integer) <= int(new_param.value),
-            cast(PRM.value, Integer) > int(old_param.value),
-        )
+            position <= int(new_param.value),
+            position > int(old_param.value),
+        ).values(value=cast(position - 1, String))
     else:
         query = query.where(
-            cast(PRM.value, Integer) >= int(new_param.value),
-            cast(PRM.value, Integer) < int(old_param.value),
-        )
+            position >= int(new_param.value),
+            position < int(old_param.value),
+        ).values(value=cast(position + 1, String))
 
     # if sequence depends on another TPRM -> add filter by MO with same dependency
     if param_type.constraint:
@@ -339,23 +346,14 @@ def update_sequence(
         )
         query = query.where(PRM.mo_id.in_(mo_subquery))
 
-    query = query.execution_options(yield_per=1000)
-    # update values in selected parameters
-    params_to_update = session.execute(query)
-    params_to_update = params_to_update.scalars().partitions(1000)
-    for chunk in params_to_update:
-        for param_to_update in chunk:
-            if increased:
-                new_value = int(param_to_update.value) - 1
-            else:
-                new_value = int(param_to_update.value) + 1
-
-            query = (
-                update(PRM)
-                .values(value=str(new_value))
-                .where(PRM.id == param_to_update.id)
-            )
-            session.execute(query)
+    # update values in selected parameters by one statement
+    query = query.returning(PRM).execution_options(synchronize_session="fetch")
+    updated_params = session.execute(query).scalars().all()
+    # bulk UPDATE is not seen by flush listeners
+    if updated_params:
+        ListenerService.receive_bulk_updated(
+            session=session, instances=updated_params
+        )
 
 
 def collapse_sequence_after_update_constraint(
@@ -365,19 +363,22 @@ def collapse_sequence_after_update_constraint(
         PRM.value == sequence_type, PRM.tprm_id == int(tprm.constraint)
     )
     query = (
-        select(PRM)
+        update(PRM)
         .where(
             PRM.tprm_id == tprm.id,
             PRM.mo_id.in_(subquery),
             cast(PRM.value, Integer) >= int(position),
         )
-        .execution_options(yield_per=1000)
+        .values(value=cast(cast(PRM.value, Integer) - 1, String))
+        .returning(PRM)
+        .execution_options(synchronize_session="fetch")
     )
-    chunks = session.exec(query)
-    for chunk in chunks.partitions(1000):
-        for prm in chunk:
-            prm.value = str(int(prm.value) - 1)
-            session.add(prm)
+    updated_params = session.execute(query).scalars().all()
+    # bulk UPDATE is not seen by flush listeners
+    if updated_params:
+        ListenerService.receive_bulk_updated(
+            session=session, instances=updated_params
+        )
 
 
 def update_depending_sequences_after_update_constraint(
@@ -990,9 +991,9 @@ class MassiveUpdateParameters:
                 # if success validation, we can save new value
                 current_parameter.value = str(value.new_value)
                 if current_tprm.multiple:
-                    current_parameter.value = pickle.dumps(
+                    current_parameter.value = encode_multiple_value(
                         value.new_value
-                    ).hex()
+                    )
                 current_parameter.version = current_parameter.version + 1
                 self.session.add(current_parameter)
 
@@ -1415,7 +1416,7 @@ class MultipleCreateParameterService:
     ) -> None:
         new_value = value_to_create.new_value
         if isinstance(new_value, list):
-            new_value = pickle.dumps(new_value).hex()
+            new_value = encode_multiple_value(new_value)
 
         parameter_for_db = PRM(
             mo_id=object_instance.id,
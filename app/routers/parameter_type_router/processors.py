@@ -1,5 +1,3 @@
-import pickle
-
 from fastapi import BackgroundTasks
 from sqlalchemy.orm import Session
 
@@ -8,7 +6,10 @@ from functions.db_functions.db_add import (
     add_required_params_for_objects_when_create_param_type,
 )
 from functions.functions_dicts import param_type_constraint_validation
-from functions.functions_utils.utils import session_commit_create_or_exception
+from functions.functions_utils.utils import (
+    encode_multiple_value,
+    session_commit_create_or_exception,
+)
 from functions.validation_functions.validation_function import (
     val_type_validation_when_create_param_type,
 )
@@ -103,7 +104,7 @@ class CreateParameterType(ObjectTypeDBGetter):
                     )
 
                     if self._request.multiple:
-                        field_value = pickle.dumps(field_value).hex()
+                        field_value = encode_multiple_value(field_value)
 
             param_type = self._request.dict()
 
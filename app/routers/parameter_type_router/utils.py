@@ -1,7 +1,8 @@
-import pickle
 from typing import List
 
 from fastapi import HTTPException
+from sqlalchemy import String, and_, cast, func, insert, literal
+from sqlalchemy.orm import aliased
 from sqlmodel import Session, select
 
 from common.common_constant import (
@@ -28,6 +29,7 @@ from routers.parameter_type_router.schemas import (
     TPRMUpdateWithTMO,
     TPRMCreateByTMO,
 )
+from services.listener_service.processor import ListenerService
 
 
 def compare_old_and_new_tprm(
@@ -117,46 +119,38 @@ def delete_constraint_of_tprm(session: Session, linked_tprm_id: int):
 
 
 def build_sequence(session: Session, tprm: TPRM):
-    # get ids of MO
-    mo_ids = session.execute(
-        select(MO.id).where(MO.tmo_id == tprm.tmo_id).order_by(MO.id)
-    )
-    mo_ids = mo_ids.scalars().all()
-
-    if not tprm.constraint:
-        for value, mo_id in enumerate(mo_ids):
-            parameter = PRM(tprm_id=tprm.id, mo_id=mo_id, value=str(value + 1))
-            session.add(parameter)
-            session.flush()
-    else:
-        # get unique values of constraint TPRM (sequence type)
-        query = (
-            select(PRM.value)
-            .where(PRM.tprm_id == int(tprm.constraint))
-            .distinct()
+    """Creates sequence parameters for all objects of TMO by one INSERT.
+    Objects are numbered in order of id, if sequence has constraint -
+    separately for every value of constraint TPRM (sequence type)"""
+    query = select(MO.id).where(MO.tmo_id == tprm.tmo_id)
+    sequence_type = None
+    if tprm.constraint:
+        sequence_type_param = aliased(PRM)
+        query = query.join(
+            sequence_type_param,
+            and_(
+                sequence_type_param.mo_id == MO.id,
+                sequence_type_param.tprm_id == int(tprm.constraint),
+            ),
         )
-        values = session.execute(query)
-        values = dict.fromkeys(values.scalars().all(), 1)
+        sequence_type = sequence_type_param.value
+    position = func.row_number().over(
+        partition_by=sequence_type, order_by=MO.id
+    )
+    query = query.add_columns(
+        literal(tprm.id), cast(position, String), literal(1)
+    )
 
-        # get mo_id to sequence type mapper
-        query = select(PRM.mo_id, PRM.value).where(
-            PRM.tprm_id == int(tprm.constraint), PRM.mo_id.in_(mo_ids)
-        )
-        constraint_params = session.execute(query)
-        constraint_params = {
-            item[0]: item[1] for item in constraint_params.all()
-        }
-
-        # build sequence
-        for mo_id in mo_ids:
-            parameter = PRM(
-                tprm_id=tprm.id,
-                mo_id=mo_id,
-                value=str(values[constraint_params[mo_id]]),
-            )
-            session.add(parameter)
-            session.flush()
-            values[constraint_params[mo_id]] += 1
+    stmt = (
+        insert(PRM)
+        .from_select(["mo_id", "tprm_id", "value", "version"], query)
+        .returning(PRM)
+    )
+    created_params = session.execute(stmt).scalars().all()
+    # bulk INSERT is not seen by flush listeners
+    ListenerService.receive_bulk_created(
+        session=session, instances=created_params
+    )
 
     session.commit()
 
@@ -259,7 +253,7 @@ def validate_param_type_before_update(
                 detail=e.detail,
             )
         if db_param_type.multiple:
-            field_value = pickle.dumps(field_value).hex()
+            field_value = utils.encode_multiple_value(field_value)
 
         else:
             field_value = validation_function.field_value_to_str_or_exception(
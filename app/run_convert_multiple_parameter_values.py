@@ -0,0 +1,27 @@
+import argparse
+import logging
+
+from sqlmodel import Session
+
+from database import engine
+from routers.migration_router.processors import ConvertMultipleParameterValues
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(
+        description="Converts pickled values of multiple parameters to JSON "
+        "arrays. Can be run on a working system and repeated."
+    )
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    args = parser.parse_args()
+
+    with Session(engine, expire_on_commit=False) as session:
+        task = ConvertMultipleParameterValues(
+            session=session, batch_size=args.batch_size
+        )
+        result = task.execute()
+    logging.info(
+        "Converted %s parameters and %s parameter types",
+        result.converted_parameters,
+        result.converted_parameter_types,
+    )
@@ -0,0 +1,55 @@
+import logging
+
+from resistant_kafka_avataa import ProducerConfig
+from resistant_kafka_avataa.common_schemas import KafkaSecurityConfig
+from sqlmodel import Session
+
+from config.kafka_config import (
+    KAFKA_PRODUCER_PART_TOPIC_NAME,
+    KAFKA_PRODUCER_TOPIC,
+    KAFKA_SASL_MECHANISMS,
+    KAFKA_SECURED,
+    KAFKA_SECURITY_PROTOCOL,
+    KAFKA_TURN_ON,
+    KAFKA_URL,
+)
+from database import engine
+from services.kafka_service.kafka_connection_utils import (
+    get_token_for_kafka_by_keycloak,
+)
+from services.kafka_service.producer.batch_producer import (
+    BatchProducerInitializer,
+)
+from services.outbox_service.processor import OutboxRelay
+
+
+def get_producer(producer_name: str) -> BatchProducerInitializer:
+    security_config = None
+    if KAFKA_SECURED:
+        security_config = KafkaSecurityConfig(
+            oauth_cb=get_token_for_kafka_by_keycloak,
+            security_protocol=KAFKA_SECURITY_PROTOCOL,
+            sasl_mechanisms=KAFKA_SASL_MECHANISMS,
+        )
+    return BatchProducerInitializer(
+        config=ProducerConfig(
+            producer_name=producer_name,
+            bootstrap_servers=KAFKA_URL,
+            security_config=security_config,
+        )
+    )
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    if not KAFKA_TURN_ON:
+        logging.info("Kafka is turned off, outbox relay is not started")
+    else:
+        relay = OutboxRelay(
+            session_factory=lambda: Session(engine, expire_on_commit=False),
+            producer=get_producer(KAFKA_PRODUCER_TOPIC),
+            producer_with_partitions=get_producer(
+                KAFKA_PRODUCER_PART_TOPIC_NAME
+            ),
+        )
+        relay.run()
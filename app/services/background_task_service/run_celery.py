@@ -139,11 +139,11 @@ def background_batch_export_task(
                 replace_ids_by_names=replace_ids_by_names,
             )
             task.check()
-            output = task.execute()
+            output = b"".join(task.execute())
 
             return BackgroundResponse(
                 status_code=HTTPStatus.OK.value,
-                response_message=str(output.read()),
+                response_message=str(output),
             ).__dict__
 
     except BatchCustomException as e:
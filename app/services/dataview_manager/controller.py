@@ -1,19 +1,46 @@
+from collections import OrderedDict
 from itertools import groupby
-from typing import Generator
+from typing import Any, Generator, Iterable
 
 from sqlalchemy import select
 from sqlalchemy.orm import Session, aliased
 
+from functions.functions_utils.utils import decode_multiple_value
 from models import MO, PRM
 
+LINK_VALUES_CACHE_SIZE = 200_000
+
+
+class LinkValuesCache:
+    """LRU of resolved link values by linked id (as str)"""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._values: OrderedDict[str, Any] = OrderedDict()
+
+    def get_many(self, link_ids: Iterable[str]) -> dict[str, Any]:
+        values = {}
+        for link_id in link_ids:
+            if link_id in self._values:
+                self._values.move_to_end(link_id)
+                values[link_id] = self._values[link_id]
+        return values
+
+    def update(self, values: dict[str, Any]) -> None:
+        for link_id, value in values.items():
+            self._values[link_id] = value
+            self._values.move_to_end(link_id)
+        while len(self._values) > self.max_size:
+            self._values.popitem(last=False)
+
 
 class GrpcController:
     @staticmethod
     def get_objects(
         session: Session,
         tmo_id: int,
+        page_size: int = 30000,
     ) -> Generator:
-        QUERY_SIZE = 30000  # noqa
         select_statement = select(
             MO.id.label("id"), MO.name.label("parent_name")
         )
@@ -25,7 +52,7 @@ class GrpcController:
         stmt_point_b = select(MO.id.label("id"), MO.name.label("point_b_name"))
         al_table_point_b = aliased(stmt_point_b.subquery())
 
-        offset = 0
+        last_id = None
         while True:
             query = select(
                 MO.id,
@@ -47,6 +74,10 @@ class GrpcController:
                 MO.creation_date,
                 MO.modification_date,
             ).where(MO.tmo_id == tmo_id)
+            # keyset pagination by ix_mo_tmo_id_id, pages are read by index
+            # range instead of skipping rows of previous pages
+            if last_id is not None:
+                query = query.where(MO.id > last_id)
             query = (
                 query.outerjoin(aliased_table, MO.p_id == aliased_table.c.id)
                 .outerjoin(
@@ -62,14 +93,22 @@ class GrpcController:
                 )
             )
             query = query.order_by(MO.id)
-            query = query.limit(QUERY_SIZE).offset(offset)
+            query = query.limit(page_size)
             result = session.execute(query)
             result = {item[0]: item._asdict() for item in result.fetchall()}
             if len(result) == 0:
                 break
 
             yield result
-            offset += QUERY_SIZE
+            if len(result) < page_size:
+                break
+            last_id = next(reversed(result))
+
+    @staticmethod
+    def _get_link_ids(value: str, multiple: bool) -> list[str]:
+        if not multiple:
+            return [value]
+        return [str(item) for item in decode_multiple_value(value)]
 
     @staticmethod
     def replace_links(
@@ -77,50 +116,65 @@ class GrpcController:
         objects: Generator,
         mo_links: list,
         prm_links: list,
+        multiple_links: set | None = None,
+        cache_size: int = LINK_VALUES_CACHE_SIZE,
     ) -> Generator:
+        """Replaces ids in values of mo_link parameters by names of objects
+        and in values of prm_link parameters by values of parameters.
+        Links of a page are resolved by one query per link type, resolved
+        values are kept for next pages"""
+        multiple_links = multiple_links or set()
+        link_queries = (
+            (set(mo_links), MO.id, MO.name, LinkValuesCache(cache_size)),
+            (set(prm_links), PRM.id, PRM.value, LinkValuesCache(cache_size)),
+        )
         for mos in objects:
-            mo_link_values = dict()
-            prm_link_values = dict()
-
-            for mo_id, item in mos.items():
-                params = item.get("params", [])
-
-                # grab mo_links
-                mo_links_raw = [
-                    param["value"]
-                    for param in params
-                    if param["tprm_id"] in mo_links
-                    and param["value"] is not None
-                    and param["value"] not in mo_link_values.keys()
+            for tprm_ids, id_column, value_column, cache in link_queries:
+                if not tprm_ids:
+                    continue
+
+                link_params = [
+                    param
+                    for item in mos.values()
+                    for param in item.get("params", [])
+                    if param["tprm_id"] in tprm_ids and param["value"]
                 ]
-                query = select(MO.id, MO.name).where(MO.id.in_(mo_links_raw))
-                mo_links_raw = session.execute(query)
-                mo_links_raw = {str(lv[0]): lv[1] for lv in mo_links_raw}
-                mo_link_values.update(mo_links_raw)
-
-                # grab prm_links
-                prm_links_raw = [
-                    param["value"]
-                    for param in params
-                    if param["tprm_id"] in prm_links
-                    and param["value"] is not None
-                    and param["value"] not in prm_link_values.keys()
+                link_ids = {
+                    link_id
+                    for param in link_params
+                    for link_id in GrpcController._get_link_ids(
+                        param["value"], param["tprm_id"] in multiple_links
+                    )
+                }
+                page_values = cache.get_many(link_ids)
+                not_resolved_ids = [
+                    int(link_id)
+                    for link_id in link_ids
+                    if link_id not in page_values and link_id.isdigit()
                 ]
-                query = select(PRM.id, PRM.value).where(
-                    PRM.id.in_(prm_links_raw)
-                )
-                prm_links_raw = session.execute(query)
-                prm_links_raw = {str(lv[0]): lv[1] for lv in prm_links_raw}
-                prm_link_values.update(prm_links_raw)
-
-                # replace links
-                for param in params:
-                    if param["tprm_id"] in mo_links and param["value"]:
-                        param["value"] = mo_link_values[param["value"]]
-                    if param["tprm_id"] in prm_links and param["value"]:
-                        params["value"] = prm_link_values[param["value"]]
-
-                mos[mo_id]["params"] = params
+                if not_resolved_ids:
+                    query = select(id_column, value_column).where(
+                        id_column.in_(not_resolved_ids)
+                    )
+                    resolved_values = {
+                        str(link_id): value
+                        for link_id, value in session.execute(query)
+                    }
+                    cache.update(resolved_values)
+                    page_values.update(resolved_values)
+
+                for param in link_params:
+                    # ids of deleted objects and parameters are kept
+                    values = [
+                        page_values.get(link_id, link_id)
+                        for link_id in GrpcController._get_link_ids(
+                            param["value"], param["tprm_id"] in multiple_links
+                        )
+                    ]
+                    if param["tprm_id"] in multiple_links:
+                        param["value"] = values
+                    else:
+                        param["value"] = values[0]
 
             yield mos
 
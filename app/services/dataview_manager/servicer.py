@@ -1,5 +1,5 @@
-import math
 import pickle
+from typing import Iterator
 
 from grpc import ServicerContext
 from sqlalchemy import select
@@ -8,9 +8,13 @@ from sqlalchemy.orm import Session
 from services.dataview_manager.controller import GrpcController
 
 from database import engine
+from services.grpc_service.message_chunker import MessageChunker
+from services.grpc_service.typed_payloads import pickle_payload, to_mo_message
 from services.grpc_service.proto_files.dataview.files.dataview_to_inventory_pb2 import (
     GetMOByTMOIdForViewRequest,
     GetMOByTMOIdForViewResponse,
+    GetMOByTMOIdForViewResponseV2,
+    MO as MOForView,
 )
 
 from models import TPRM
@@ -20,27 +24,54 @@ from services.grpc_service.proto_files.dataview.files.dataview_to_inventory_pb2_
 
 
 class DataviewToInventoryManager(DataviewToInventoryServicer):
+    @pickle_payload(replacement="GetMOByTMOIdForViewV2")
     def GetMOByTMOIdForView(
         self,
         request: GetMOByTMOIdForViewRequest,
         context: ServicerContext,
     ) -> GetMOByTMOIdForViewResponse:
-        grpc_message_max_size = 100 * 1024 * 1024
-        with Session(engine) as session:
-            # get link tprms before loading objects
-            query = select(TPRM.id).where(
-                TPRM.tmo_id == request.tmo_id, TPRM.val_type == "mo_link"
-            )
-            mo_link_tprms = session.execute(query).scalars().all()
+        chunker = MessageChunker(
+            message_class=GetMOByTMOIdForViewResponse,
+            field_name="mos_with_params",
+        )
+        for chunk in self._get_objects_for_view(tmo_id=request.tmo_id):
+            chunk = [pickle.dumps(item).hex() for item in chunk.values()]
+            yield from chunker.iter_messages(chunk)
 
-            query = select(TPRM.id).where(
-                TPRM.tmo_id == request.tmo_id, TPRM.val_type == "prm_link"
+    def GetMOByTMOIdForViewV2(
+        self,
+        request: GetMOByTMOIdForViewRequest,
+        context: ServicerContext,
+    ) -> GetMOByTMOIdForViewResponseV2:
+        chunker = MessageChunker(
+            message_class=GetMOByTMOIdForViewResponseV2,
+            field_name="mos_with_params",
+        )
+        for chunk in self._get_objects_for_view(tmo_id=request.tmo_id):
+            yield from chunker.iter_messages(
+                to_mo_message(item, MOForView) for item in chunk.values()
             )
-            prm_link_tprms = session.execute(query).scalars().all()
 
-            objects = GrpcController.get_objects(
-                session=session, tmo_id=request.tmo_id
+    @staticmethod
+    def _get_objects_for_view(tmo_id: int) -> Iterator[dict[int, dict]]:
+        with Session(engine) as session:
+            # get link tprms before loading objects
+            query = select(TPRM.id, TPRM.val_type, TPRM.multiple).where(
+                TPRM.tmo_id == tmo_id,
+                TPRM.val_type.in_(("mo_link", "prm_link")),
             )
+            link_tprms = session.execute(query).all()
+            mo_link_tprms = [
+                tprm.id for tprm in link_tprms if tprm.val_type == "mo_link"
+            ]
+            prm_link_tprms = [
+                tprm.id for tprm in link_tprms if tprm.val_type == "prm_link"
+            ]
+            multiple_link_tprms = {
+                tprm.id for tprm in link_tprms if tprm.multiple
+            }
+
+            objects = GrpcController.get_objects(session=session, tmo_id=tmo_id)
             objects_with_params = GrpcController.get_parameters(
                 session=session, objects=objects
             )
@@ -49,17 +80,6 @@ class DataviewToInventoryManager(DataviewToInventoryServicer):
                 objects=objects_with_params,
                 mo_links=mo_link_tprms,
                 prm_links=prm_link_tprms,
+                multiple_links=multiple_link_tprms,
             )
-
-            for chunk in result:
-                chunk = [pickle.dumps(item).hex() for item in chunk.values()]
-                msg = GetMOByTMOIdForViewResponse(mos_with_params=chunk)
-                msg_size = msg.ByteSize()
-
-                # create stack
-                steps = math.ceil(msg_size / grpc_message_max_size)
-                per_step = int(len(chunk) / steps)
-                for step in range(steps):
-                    start = step * per_step
-                    msg_data = chunk[start : start + per_step]
-                    yield GetMOByTMOIdForViewResponse(mos_with_params=msg_data)
+            yield from result
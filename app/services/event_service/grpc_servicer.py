@@ -1,16 +1,25 @@
+import json
+from datetime import datetime, timedelta
+from typing import Iterator
+
 import grpc
-from google.protobuf.struct_pb2 import Struct
-from sqlalchemy import asc
+from google.protobuf.timestamp_pb2 import Timestamp
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from sqlmodel import select
 
+from config.grpc_config import EVENT_REPLAY_LAG
 from database import engine
 from models import Event
+from services.grpc_service.db_executor import db_executor
 from services.grpc_service.proto_files.event_manager_methods.files import (
     event_manager_pb2,
 )
 from services.grpc_service.proto_files.event_manager_methods.files.event_manager_pb2 import (
     NewEventRequest,
+    ReplayedEvent,
+    ReplayEventsRequest,
+    ReplayEventsResponse,
 )
 from services.grpc_service.proto_files.event_manager_methods.files.event_manager_pb2_grpc import (
     EventManagerInformerServicer,
@@ -29,6 +38,14 @@ EVENT_TYPES_BY_INSTANCE = {
     "PRM": ["PRMCreate", "PRMUpdate", "PRMDelete"],
 }
 
+INSTANCE_NAME_BY_EVENT_TYPE = {
+    event_type: instance_name
+    for instance_name, event_types in EVENT_TYPES_BY_INSTANCE.items()
+    for event_type in event_types
+}
+REPLAY_BATCH_SIZE = 1000
+REPLAY_MAX_BATCH_SIZE = 10_000
+
 
 def _get_event_key_by_event_type(event_type: str, instance_name: str):
     return EVENT_TYPE_MAPPING.get(
@@ -37,51 +54,155 @@ def _get_event_key_by_event_type(event_type: str, instance_name: str):
     )
 
 
+def _get_event_data(event: Event) -> str:
+    instance_name = INSTANCE_NAME_BY_EVENT_TYPE[event.event_type]
+    return json.dumps(event.event[instance_name])
+
+
+def _to_replayed_event(event: Event) -> ReplayedEvent:
+    instance_name = INSTANCE_NAME_BY_EVENT_TYPE[event.event_type]
+    event_time = None
+    if event.event_time:
+        event_time = Timestamp()
+        event_time.FromDatetime(event.event_time)
+    return ReplayedEvent(
+        id=event.id,
+        type=_get_event_key_by_event_type(
+            event_type=event.event_type, instance_name=instance_name
+        ),
+        instance_name=instance_name,
+        event_type=event.event_type,
+        model_id=event.model_id,
+        user=event.user or "",
+        event_time=event_time,
+        data=_get_event_data(event),
+    )
+
+
+def get_last_event_id(
+    session: Session, stored_before: datetime | None = None
+) -> int:
+    query = select(func.max(Event.id))
+    if stored_before is not None:
+        query = query.where(Event.event_time <= stored_before)
+    return session.execute(query).scalar() or 0
+
+
+def iter_event_pages(
+    session: Session,
+    event_types: list[str],
+    after_event_id: int,
+    last_event_id: int,
+    batch_size: int,
+) -> Iterator[list[Event]]:
+    """Yields events of event_types with ids in (after_event_id,
+    last_event_id] in order of id by keyset pages"""
+    while after_event_id < last_event_id:
+        query = (
+            select(Event)
+            .where(
+                Event.event_type.in_(event_types),
+                Event.id > after_event_id,
+                Event.id <= last_event_id,
+            )
+            .order_by(Event.id)
+            .limit(batch_size)
+        )
+        events = session.execute(query).scalars().all()
+        if not events:
+            return
+
+        yield events
+        if len(events) < batch_size:
+            return
+        after_event_id = events[-1].id
+
+
 class EventManagerManager(EventManagerInformerServicer):
+    @db_executor.stream(heavy=True)
     def NewEvent(
         self,
         request: NewEventRequest,
         context: grpc.ServicerContext,
     ):
         with Session(engine) as session:
+            last_event_id = get_last_event_id(session=session)
             for instance_name, event_types in EVENT_TYPES_BY_INSTANCE.items():
                 for event_type in event_types:
-                    limit = 1000
-                    last_id = 0
-
                     event_key = _get_event_key_by_event_type(
                         event_type=event_type,
                         instance_name=instance_name,
                     )
-
-                    while True:
-                        query = (
-                            select(Event)
-                            .where(
-                                Event.event_type == event_type,
-                                Event.model_id.is_not(None),
-                                Event.model_id > last_id,
-                            )
-                            .order_by(asc(Event.model_id))
-                            .limit(limit)
-                        )
-
-                        instances = session.execute(query).scalars().all()
-                        if not instances:
-                            break
-
-                        for instance in instances:
-                            last_id = instance.model_id
-
-                            event_data = instance.__dict__["event"][
-                                instance_name
-                            ]
-
-                            payload = Struct()
-                            payload.update(event_data)
+                    # pages by unique id, pages by model_id skipped events
+                    # of one model split between two pages
+                    for events in iter_event_pages(
+                        session=session,
+                        event_types=[event_type],
+                        after_event_id=0,
+                        last_event_id=last_event_id,
+                        batch_size=REPLAY_BATCH_SIZE,
+                    ):
+                        for event in events:
+                            if event.model_id is None:
+                                continue
 
                             yield event_manager_pb2.NewEventRequest(
                                 type=event_key,
                                 instance_name=instance_name,
-                                data=payload,
+                                data=_get_event_data(event),
                             )
+
+    @db_executor.stream(heavy=True)
+    def ReplayEvents(
+        self,
+        request: ReplayEventsRequest,
+        context: grpc.ServicerContext,
+    ) -> Iterator[ReplayEventsResponse]:
+        event_types = list(request.event_types) or list(
+            INSTANCE_NAME_BY_EVENT_TYPE
+        )
+        unknown_event_types = set(event_types).difference(
+            INSTANCE_NAME_BY_EVENT_TYPE
+        )
+        if unknown_event_types:
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details(
+                f"Unknown event types: {sorted(unknown_event_types)}"
+            )
+            return
+
+        batch_size = request.batch_size or REPLAY_BATCH_SIZE
+        if not 0 < batch_size <= REPLAY_MAX_BATCH_SIZE:
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details(
+                f"Batch size must be between 1 and {REPLAY_MAX_BATCH_SIZE}. "
+                f"Received {batch_size}"
+            )
+            return
+
+        with Session(engine) as session:
+            # events stored after the call started are left for the next
+            # replay, so the stream ends. Recent events are left as well:
+            # an event with a lower id can still be committed after them
+            last_event_id = get_last_event_id(
+                session=session,
+                stored_before=datetime.utcnow()
+                - timedelta(seconds=EVENT_REPLAY_LAG),
+            )
+            cursor = request.after_event_id
+            for events in iter_event_pages(
+                session=session,
+                event_types=event_types,
+                after_event_id=cursor,
+                last_event_id=last_event_id,
+                batch_size=batch_size,
+            ):
+                cursor = events[-1].id
+                yield ReplayEventsResponse(
+                    events=[_to_replayed_event(event) for event in events],
+                    last_event_id=cursor,
+                )
+            if cursor < last_event_id:
+                # events of other types up to last_event_id are skipped
+                # by the next replay as well
+                yield ReplayEventsResponse(last_event_id=last_event_id)
@@ -5,6 +5,7 @@ from typing import Any, List, Union
 from fastapi.encoders import jsonable_encoder
 from google.protobuf.internal.well_known_types import Timestamp
 from google.protobuf.json_format import MessageToDict
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from sqlalchemy.sql.elements import Null
 from sqlmodel import select
@@ -41,10 +42,7 @@ class EventProcessor:
     def _process_object_type_event(
         self,
         object_type_instance: dict,
-    ) -> None:
-        new_session = next(get_not_auth_session())
-        new_session.commit()
-
+    ) -> dict:
         object_type_instance["creation_date"] = (
             self._convert_datetime_from_timestamp(
                 timestamp=object_type_instance["creation_date"]
@@ -56,22 +54,15 @@ class EventProcessor:
             )
         )
 
-        event = Event(
+        return self._get_event_values(
             event={"TMO": jsonable_encoder(object_type_instance)},
-            event_type=self._event_type,
             model_id=object_type_instance["id"],
-            user=self._username,
         )
-        new_session.add(event)
-        new_session.commit()
 
     def _process_object_event(
         self,
         object_instance: dict,
-    ) -> None:
-        new_session = next(get_not_auth_session())
-        new_session.commit()
-
+    ) -> dict:
         object_instance["creation_date"] = (
             self._convert_datetime_from_timestamp(
                 timestamp=object_instance["creation_date"]
@@ -90,28 +81,20 @@ class EventProcessor:
         if object_instance.get("pov"):
             object_instance["pov"] = MessageToDict(object_instance["pov"])
 
-        event = Event(
+        return self._get_event_values(
             event={
                 "MO": jsonable_encoder(
                     object_instance,
                     custom_encoder={Null: lambda _: "null"},
                 )
             },
-            event_type=self._event_type,
             model_id=object_instance["id"],
-            user=self._username,
         )
 
-        new_session.add(event)
-        new_session.commit()
-
     def _process_parameter_type_event(
         self,
         param_type_instance: dict,
-    ) -> None:
-        new_session = next(get_not_auth_session())
-        new_session.commit()
-
+    ) -> dict:
         if self._event_type == "TPRMDelete":
             PARAMETER_TYPE_INSTANCES_CACHE[param_type_instance["id"]] = (
                 param_type_instance
@@ -127,30 +110,41 @@ class EventProcessor:
                 timestamp=param_type_instance["modification_date"]
             )
         )
-        event = Event(
+        return self._get_event_values(
             event={"TPRM": jsonable_encoder(param_type_instance)},
-            event_type=self._event_type,
             model_id=param_type_instance["id"],
-            user=self._username,
         )
-        new_session.add(event)
-        new_session.commit()
+
+    def _get_parameter_types(self, session: Session) -> dict[int, dict]:
+        """Returns parameter types of all parameters by one query.
+        Deleted parameter types are taken from the cache."""
+        parameter_types = dict()
+        tprm_ids_to_select = set()
+        for parameter_instance in self._data_to_send:
+            tprm_id = int(parameter_instance["tprm_id"])
+            param_type_instance = PARAMETER_TYPE_INSTANCES_CACHE.get(tprm_id)
+            if param_type_instance:
+                parameter_types[tprm_id] = param_type_instance
+            else:
+                tprm_ids_to_select.add(tprm_id)
+
+        if tprm_ids_to_select:
+            query = select(TPRM).where(TPRM.id.in_(tprm_ids_to_select))
+            for param_type_instance in session.execute(query).scalars():
+                parameter_types[param_type_instance.id] = dict(
+                    param_type_instance
+                )
+
+        return parameter_types
 
     def _process_parameter_event(
         self,
         parameter_instance: dict,
-    ) -> None:
-        new_session = next(get_not_auth_session())
-        new_session.commit()
-
-        param_type_instance = PARAMETER_TYPE_INSTANCES_CACHE.get(
-            parameter_instance["tprm_id"]
-        )
-
-        if not param_type_instance:
-            query = select(TPRM).where(TPRM.id == parameter_instance["tprm_id"])
-            param_type_instance = new_session.execute(query).scalar()
-            param_type_instance = dict(param_type_instance)
+        parameter_types: dict[int, dict],
+    ) -> dict:
+        param_type_instance = parameter_types[
+            int(parameter_instance["tprm_id"])
+        ]
 
         if param_type_instance["multiple"]:
             param_to_read = PRMReadMultiple(
@@ -172,15 +166,19 @@ class EventProcessor:
                 parameter_instance["version"],
             )
 
-        event = Event(
+        return self._get_event_values(
             event={"PRM": jsonable_encoder(param_to_read.dict())},
-            event_type=self._event_type,
             model_id=parameter_instance["id"],
-            user=self._username,
         )
 
-        new_session.add(event)
-        new_session.commit()
+    def _get_event_values(self, event: dict, model_id: int) -> dict:
+        return {
+            "event": event,
+            "event_type": self._event_type,
+            "model_id": model_id,
+            "user": self._username,
+            "event_time": datetime.utcnow(),
+        }
 
     def _determine_event_type(self):
         new_key_event = {
@@ -200,24 +198,78 @@ class EventProcessor:
         )
         return dt.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3]
 
-    def execute(self):
-        for new_object in self._data_to_send:
-            match self._key_class_name:
-                case "TMO":
-                    self._process_object_type_event(
-                        object_type_instance=new_object
+    def get_events(self, session: Session) -> list[dict]:
+        """Returns values of Event rows for all instances"""
+        events = []
+        match self._key_class_name:
+            case "TMO":
+                for new_object in self._data_to_send:
+                    events.append(
+                        self._process_object_type_event(
+                            object_type_instance=new_object
+                        )
                     )
 
-                case "MO":
-                    self._process_object_event(object_instance=new_object)
+            case "MO":
+                for new_object in self._data_to_send:
+                    events.append(
+                        self._process_object_event(object_instance=new_object)
+                    )
 
-                case "TPRM":
-                    self._process_parameter_type_event(
-                        param_type_instance=new_object
+            case "TPRM":
+                for new_object in self._data_to_send:
+                    events.append(
+                        self._process_parameter_type_event(
+                            param_type_instance=new_object
+                        )
                     )
 
-                case "PRM":
-                    self._process_parameter_event(parameter_instance=new_object)
+            case "PRM":
+                parameter_types = self._get_parameter_types(session=session)
+                for new_object in self._data_to_send:
+                    events.append(
+                        self._process_parameter_event(
+                            parameter_instance=new_object,
+                            parameter_types=parameter_types,
+                        )
+                    )
+
+        return events
+
+    def execute(self):
+        writer = EventHistoryWriter()
+        writer.add(self)
+        writer.write()
+
+
+class EventHistoryWriter:
+    """Collects events of all instances changed by one commit and stores
+    them into the history by one session and one multi-row INSERT."""
+
+    def __init__(self):
+        self._processors: list[EventProcessor] = []
+
+    def add(self, processor: EventProcessor) -> None:
+        self._processors.append(processor)
+
+    def write(self) -> None:
+        if not self._processors:
+            return
+
+        for new_session in get_not_auth_session():
+            try:
+                events = []
+                for processor in self._processors:
+                    events.extend(processor.get_events(session=new_session))
+
+                if events:
+                    new_session.execute(insert(Event.__table__), events)
+                new_session.commit()
+            except Exception:
+                new_session.rollback()
+                raise
+
+        self._processors = []
 
 
 class ConvertInstancesToProto:
@@ -1,9 +1,8 @@
 import json
-import pickle
 import sys
 import traceback
 from collections import defaultdict
-from typing import AsyncIterable, Iterator
+from typing import Iterator
 
 from google.protobuf.json_format import ParseDict
 from google.protobuf.timestamp_pb2 import Timestamp  # noqa
@@ -13,11 +12,19 @@ from grpc.aio import ServicerContext
 from services.grpc_service.proto_files.graph.files.graph_pb2_grpc import (
     GraphInformerServicer,
 )
-from sqlalchemy import null, select, true
-from sqlalchemy.engine import Engine
-from sqlalchemy.orm import Session, aliased, sessionmaker
+from sqlalchemy import select
+from sqlalchemy.engine import Engine, Row
+from sqlalchemy.orm import Session, sessionmaker
 
+from functions.functions_utils.utils import decode_multiple_value
 from models import TMO, MO, TPRM, PRM
+from config.grpc_config import GRPC_TMO_TREE_CACHE_TTL
+from services.graph_service.tmo_tree import (
+    TMOTreeCache,
+    TMOTreeSnapshot,
+    get_points_constraints_by_tmo,
+)
+from services.grpc_service.db_executor import db_executor
 from services.grpc_service.proto_files.graph.files.graph_pb2 import (
     TreeNode,
     OutTprms,
@@ -41,6 +48,28 @@ from services.grpc_service.proto_files.graph.files.graph_pb2 import (
 )
 
 
+MO_PROTO_COLUMNS = (
+    MO.id,
+    MO.tmo_id,
+    MO.p_id,
+    MO.name,
+    MO.label,
+    MO.latitude,
+    MO.longitude,
+    MO.pov,
+    MO.geometry,
+    MO.model,
+    MO.active,
+    MO.point_a_id,
+    MO.point_b_id,
+    MO.status,
+    MO.version,
+)
+# sent as JSON strings
+MO_PROTO_JSON_FIELDS = ("pov", "geometry")
+PRM_PROTO_COLUMNS = (PRM.id, PRM.tprm_id, PRM.mo_id, PRM.value, PRM.version)
+
+
 class GraphInformer(GraphInformerServicer):
     def __init__(self, engine: Engine):
         super().__init__()
@@ -51,38 +80,23 @@ class GraphInformer(GraphInformerServicer):
             expire_on_commit=False,
             class_=Session,
         )
+        self.tmo_tree_cache = TMOTreeCache(ttl=GRPC_TMO_TREE_CACHE_TTL)
 
     def _get_session(self) -> Iterator[Session]:
         with self.session_builder() as session:
             yield session
 
-    def _get_point_tmo_const(self, tmo_id: int, session: Session):
-        stmt_sub = (
-            select(MO.point_a_id)
-            .filter(
-                MO.active == true(),
-                MO.tmo_id == tmo_id,
-                MO.point_a_id != null(),
-            )
-            .union_all(
-                select(MO.point_b_id).filter(
-                    MO.active == true(),
-                    MO.tmo_id == tmo_id,
-                    MO.point_b_id != null(),
-                )
-            )
-        )
-        stmt = select(MO.tmo_id).filter(MO.id.in_(stmt_sub)).distinct()
-        results = session.execute(stmt).scalars().all()
-        return results
+    @staticmethod
+    def _get_point_tmo_const(tmo_id: int, session: Session) -> list[int]:
+        return get_points_constraints_by_tmo(
+            session=session, tmo_ids=[tmo_id]
+        ).get(tmo_id, [])
 
     def _tree_recursive(
         self,
-        data: dict[int | None, list[TMO]],
-        tmo_p_id: int | None,
-        session: Session,
+        snapshot: TMOTreeSnapshot,
+        parent_nodes: list[TMO] | None,
     ) -> list[TreeNode] | None:
-        parent_nodes = data.get(tmo_p_id, None)
         if not parent_nodes:
             return
 
@@ -102,15 +116,12 @@ class GraphInformer(GraphInformerServicer):
                 lifecycle_process_definition=parent_node.lifecycle_process_definition,
                 geometry_type=parent_node.geometry_type,
                 materialize=parent_node.materialize,
-                points_constraint_by_tmo=(
-                    parent_node.points_constraint_by_tmo
-                    if parent_node.points_constraint_by_tmo
-                    else self._get_point_tmo_const(
-                        tmo_id=parent_node.id, session=session
-                    )
+                points_constraint_by_tmo=snapshot.get_points_constraint(
+                    parent_node
                 ),
                 child=self._tree_recursive(
-                    data=data, tmo_p_id=parent_node.id, session=session
+                    snapshot=snapshot,
+                    parent_nodes=snapshot.children.get(parent_node.id),
                 ),
                 id=parent_node.id,
                 minimize=parent_node.minimize,
@@ -131,47 +142,33 @@ class GraphInformer(GraphInformerServicer):
         return results
 
     def create_tree(
-        self, data: list[TMO], tmo_id: int | None, session: Session
+        self, snapshot: TMOTreeSnapshot, tmo_id: int | None
     ) -> OutGetTMOTree:
-        data_dict: dict[int | None, list[TMO]] = defaultdict(list)
-        tmo_p_id = None
-        for d in data:
-            data_dict[d.p_id].append(d)
-            if tmo_id is not None and d.id == tmo_id:
-                tmo_p_id = d.p_id
+        if tmo_id:
+            tmo = snapshot.tmos.get(tmo_id)
+            root_nodes = [tmo] if tmo else None
+        else:
+            root_nodes = snapshot.children.get(None)
 
         tree_nodes = self._tree_recursive(
-            data=data_dict, tmo_p_id=tmo_p_id, session=session
+            snapshot=snapshot, parent_nodes=root_nodes
         )
         return OutGetTMOTree(nodes=tree_nodes)
 
-    async def GetTMOTree(
+    @db_executor.unary()
+    def GetTMOTree(
         self, request: InTmoId, context: ServicerContext
     ) -> OutGetTMOTree:
-        if request.tmo_id:
-            hierarchy = (
-                select(TMO)
-                .where(TMO.id == request.tmo_id)
-                .cte(name="hierarchy", recursive=True)
-            )
-        else:
-            hierarchy = (
-                select(TMO)
-                .where(TMO.p_id == null())
-                .cte(name="hierarchy", recursive=True)
-            )
-        parent = aliased(hierarchy, name="p")
-        children = aliased(TMO, name="c")
-        hierarchy = hierarchy.union_all(
-            select(children).filter(children.p_id == parent.c.id)
-        )
-
-        stmt = select(TMO).join(hierarchy, TMO.id == hierarchy.c.id)
         with self.session_builder() as session:
-            response = list(session.execute(stmt).scalars().all())
-            return self.create_tree(
-                data=response, tmo_id=request.tmo_id, session=session
+            snapshot = self.tmo_tree_cache.get(session=session)
+        # responses of one snapshot are built once and only read afterwards
+        response = snapshot.responses.get(request.tmo_id)
+        if response is None:
+            response = self.create_tree(
+                snapshot=snapshot, tmo_id=request.tmo_id
             )
+            snapshot.responses[request.tmo_id] = response
+        return response
 
     def _create_tprm_constraint(
         self, tprm_id: int, multiple: bool, session: Session
@@ -180,9 +177,7 @@ class GraphInformer(GraphInformerServicer):
         values = session.execute(stmt).scalars().all()
         if multiple:
             values_new = set()
-            value_map = map(
-                lambda value: pickle.loads(bytes.fromhex(value)), values
-            )
+            value_map = map(decode_multiple_value, values)
             [values_new.update(v) for v in value_map]
             values = list(values_new)
         else:
@@ -221,7 +216,8 @@ class GraphInformer(GraphInformerServicer):
             version=tprm.version,
         )
 
-    async def GetTPRMsByTMOid(
+    @db_executor.unary()
+    def GetTPRMsByTMOid(
         self, request: InTmoIds, context: ServicerContext
     ) -> OutTprms:
         try:
@@ -238,10 +234,55 @@ class GraphInformer(GraphInformerServicer):
             print(e)
             raise e
 
-    async def GetMOsByTMOid(
+    @staticmethod
+    def _to_mo_proto(mo_row: Row, params: list[PrmProto]) -> MoProto:
+        fields = {
+            name: value
+            for name, value in mo_row._asdict().items()
+            if value is not None
+        }
+        for name in MO_PROTO_JSON_FIELDS:
+            if name in fields:
+                fields[name] = json.dumps(fields[name])
+        return MoProto(params=params, **fields)
+
+    def _get_mo_protos(
+        self, session: Session, mo_rows: list[Row], request: InMOsByTMOid
+    ) -> list[MoProto]:
+        """Returns MoProto with parameters of rows of MO_PROTO_COLUMNS"""
+        stmt_prms = select(*PRM_PROTO_COLUMNS).filter(
+            PRM.mo_id.in_([mo_row.id for mo_row in mo_rows])
+        )
+        if request.prm_filter_by:
+            prm_filter_by = json.loads(request.prm_filter_by)
+            stmt_prms = stmt_prms.filter_by(**prm_filter_by)
+
+        chunk_prms: dict[int, list[PrmProto]] = defaultdict(list)
+        for prm_row in session.execute(stmt_prms):
+            chunk_prms[prm_row.mo_id].append(
+                PrmProto(
+                    **{
+                        name: value
+                        for name, value in prm_row._asdict().items()
+                        if value is not None
+                    }
+                )
+            )
+
+        prepared_partition = []
+        for mo_row in mo_rows:
+            if mo_row.id not in chunk_prms and not request.keep_mo_without_prm:
+                continue
+            prepared_partition.append(
+                self._to_mo_proto(mo_row, chunk_prms.get(mo_row.id, []))
+            )
+        return prepared_partition
+
+    @db_executor.stream(heavy=True)
+    def GetMOsByTMOid(
         self, request: InMOsByTMOid, context: ServicerContext
-    ) -> AsyncIterable[OutMOsStream]:
-        stmt = select(MO).filter(MO.tmo_id == request.tmo_id)
+    ) -> Iterator[OutMOsStream]:
+        stmt = select(*MO_PROTO_COLUMNS).filter(MO.tmo_id == request.tmo_id)
         if request.mo_filter_by:
             mo_filter_by = json.loads(request.mo_filter_by)
             stmt = stmt.filter_by(**mo_filter_by)
@@ -253,44 +294,23 @@ class GraphInformer(GraphInformerServicer):
                 .yield_per(chunk_size)
                 .partitions(chunk_size)
             ):
-                chunk: dict[int, dict] = dict()
-                for p in partition:
-                    p = p[0]
-                    chunk[p.id] = p.dict(exclude_none=True)
-                stmt_prms = select(PRM).filter(
-                    PRM.mo_id.in_(list(chunk.keys()))
-                )
-                if request.prm_filter_by:
-                    prm_filter_by = json.loads(request.prm_filter_by)
-                    stmt_prms = stmt_prms.filter_by(**prm_filter_by)
-
-                chunk_prms: dict[int, list[dict]] = defaultdict(list)
-                for prm in session.execute(stmt_prms).scalars():  # type: PRM
-                    prm_proto = prm.dict(exclude_none=True)
-                    chunk_prms[prm.mo_id].append(prm_proto)
-
-                prepared_partition = []
-                for mo_id, mo in chunk.items():
-                    if (
-                        mo_id not in chunk_prms
-                        and not request.keep_mo_without_prm
-                    ):
-                        continue
-                    mo["params"] = chunk_prms.get(mo_id, [])
-                    mo["geometry"] = (
-                        json.dumps(mo["geometry"]) if "geometry" in mo else None
+                yield OutMOsStream(
+                    mo=self._get_mo_protos(
+                        session=session, mo_rows=partition, request=request
                     )
-                    mo["pov"] = json.dumps(mo["pov"]) if "pov" in mo else None
-                    mo_proto = ParseDict(
-                        mo, MoProto(), ignore_unknown_fields=True
-                    )
-                    prepared_partition.append(mo_proto)
-                yield OutMOsStream(mo=prepared_partition)
+                )
 
-    async def GetMOsByTMOidPages(
+    @db_executor.unary(heavy=True)
+    def GetMOsByTMOidPages(
         self, request: InMOsByTMOid, context: ServicerContext
     ) -> OutMOsStream | ServicerContext:
-        stmt = select(MO).filter(MO.tmo_id == request.tmo_id).order_by(MO.id)
+        """Returns one page of MOs of TMO in id order. Next page is requested
+        with after_mo_id of the response, offset is kept for old clients"""
+        stmt = (
+            select(*MO_PROTO_COLUMNS)
+            .filter(MO.tmo_id == request.tmo_id)
+            .order_by(MO.id)
+        )
         if request.mo_filter_by:
             mo_filter_by = json.loads(request.mo_filter_by)
             stmt = stmt.filter_by(**mo_filter_by)
@@ -305,42 +325,33 @@ class GraphInformer(GraphInformerServicer):
             )
             return context
 
-        offset = request.offset or 0
-        if 0 > offset:
-            context.set_code(StatusCode.INVALID_ARGUMENT)
-            context.set_details("Offset must be more than 0")
-            return context
+        if request.HasField("after_mo_id"):
+            stmt = stmt.filter(MO.id > request.after_mo_id)
+        else:
+            offset = request.offset or 0
+            if 0 > offset:
+                context.set_code(StatusCode.INVALID_ARGUMENT)
+                context.set_details("Offset must be more than 0")
+                return context
+            stmt = stmt.offset(offset)
 
-        stmt = stmt.offset(offset).limit(chunk_size)
+        stmt = stmt.limit(chunk_size)
 
         with self.session_builder() as session:
-            chunk: dict[int, dict] = dict()
-            for p in session.execute(stmt).scalars():
-                chunk[p.id] = p.dict(exclude_none=True)
-            stmt_prms = select(PRM).filter(PRM.mo_id.in_(list(chunk.keys())))
-            if request.prm_filter_by:
-                prm_filter_by = json.loads(request.prm_filter_by)
-                stmt_prms = stmt_prms.filter_by(**prm_filter_by)
-
-            chunk_prms: dict[int, list[dict]] = defaultdict(list)
-            for prm in session.execute(stmt_prms).scalars():  # type: PRM
-                prm_proto = prm.dict(exclude_none=True)
-                chunk_prms[prm.mo_id].append(prm_proto)
-
-            prepared_partition = []
-            for mo_id, mo in chunk.items():
-                if mo_id not in chunk_prms and not request.keep_mo_without_prm:
-                    continue
-                mo["params"] = chunk_prms.get(mo_id, [])
-                mo["geometry"] = (
-                    json.dumps(mo["geometry"]) if "geometry" in mo else None
+            mo_rows = session.execute(stmt).all()
+            response = OutMOsStream(
+                mo=self._get_mo_protos(
+                    session=session, mo_rows=mo_rows, request=request
                 )
-                mo["pov"] = json.dumps(mo["pov"]) if "pov" in mo else None
-                mo_proto = ParseDict(mo, MoProto(), ignore_unknown_fields=True)
-                prepared_partition.append(mo_proto)
-            return OutMOsStream(mo=prepared_partition)
-
-    async def GetTmoByMoId(
+            )
+        # MOs without parameters may be skipped, so the cursor is the last
+        # read MO, not the last returned one
+        if len(mo_rows) == chunk_size:
+            response.after_mo_id = mo_rows[-1].id
+        return response
+
+    @db_executor.unary()
+    def GetTmoByMoId(
         self, request: InTmoByMoId, context: ServicerContext
     ) -> OutTmoId | ServicerContext:
         stmt = select(MO.tmo_id).filter(MO.id == request.mo_id)
@@ -353,7 +364,8 @@ class GraphInformer(GraphInformerServicer):
             result = OutTmoId(tmo_id=(response or -1))
             return result
 
-    async def GetMOsByMoIds(
+    @db_executor.unary()
+    def GetMOsByMoIds(
         self, request: InMOsByMoIds, context: ServicerContext
     ) -> OutMOsByMoIds | ServicerContext:
         stmt = select(MO).filter(MO.id.in_(request.mo_ids))
@@ -378,7 +390,8 @@ class GraphInformer(GraphInformerServicer):
             results = OutMOsByMoIds(mos=mos)
             return results
 
-    async def GetPRMsByPRMIds(
+    @db_executor.unary()
+    def GetPRMsByPRMIds(
         self, request: InPRMsByPRMIds, context: ServicerContext
     ) -> OutPRMsByPRMIds | ServicerContext:
         stmt = select(PRM).filter(PRM.id.in_(request.prm_ids))
@@ -399,7 +412,8 @@ class GraphInformer(GraphInformerServicer):
             results = OutPRMsByPRMIds(prms=prms)
             return results
 
-    async def GetPointTmoConst(
+    @db_executor.unary()
+    def GetPointTmoConst(
         self, request: InTmoId, context: ServicerContext
     ) -> OutTmoIds | ServicerContext:
         with self.session_builder() as session:
@@ -409,7 +423,8 @@ class GraphInformer(GraphInformerServicer):
             grpc_response = OutTmoIds(tmo_ids=response)
             return grpc_response
 
-    async def GetTprmConst(
+    @db_executor.unary()
+    def GetTprmConst(
         self, request: InTprmId, context: ServicerContext
     ) -> OutTmoIds | ServicerContext:
         stmt = select(TPRM).filter(TPRM.id == request.tprm_id)
@@ -433,7 +448,8 @@ class GraphInformer(GraphInformerServicer):
             grpc_response = OutTmoIds(tmo_ids=response)
             return grpc_response
 
-    async def GetTprmByTprmIds(
+    @db_executor.unary()
+    def GetTprmByTprmIds(
         self, request: InTprmIds, context: ServicerContext
     ) -> OutTprms:
         stmt = select(TPRM).filter(TPRM.id.in_(request.tprm_ids))
@@ -0,0 +1,120 @@
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Iterable
+
+from sqlalchemy import func, select, true
+from sqlalchemy.orm import Session, aliased
+
+from models import MO, TMO, Event
+
+
+def get_points_constraints_by_tmo(
+    session: Session, tmo_ids: Iterable[int] | None = None
+) -> dict[int, list[int]]:
+    """Returns ids of TMOs of point_a/point_b objects which active objects
+    of every TMO use, by one grouped query (for all TMOs if tmo_ids is None)"""
+    point = aliased(MO, name="point")
+    statements = []
+    for point_column in (MO.point_a_id, MO.point_b_id):
+        stmt = (
+            select(MO.tmo_id, point.tmo_id)
+            .join(point, point.id == point_column)
+            .where(MO.active == true())
+        )
+        if tmo_ids is not None:
+            stmt = stmt.where(MO.tmo_id.in_(tmo_ids))
+        statements.append(stmt)
+    # UNION removes duplicated pairs of both point columns
+    stmt = statements[0].union(statements[1])
+
+    results = defaultdict(list)
+    for tmo_id, point_tmo_id in session.execute(stmt):
+        results[tmo_id].append(point_tmo_id)
+    return dict(results)
+
+
+@dataclass
+class TMOTreeSnapshot:
+    """All TMOs with their point constraints at one version of the data"""
+
+    version: int | None
+    created_at: float
+    tmos: dict[int, TMO]
+    children: dict[int | None, list[TMO]]
+    points_constraints: dict[int, list[int]]
+    # built responses by requested tmo_id
+    responses: dict = field(default_factory=dict)
+
+    def get_points_constraint(self, tmo: TMO) -> list[int]:
+        if tmo.points_constraint_by_tmo:
+            return tmo.points_constraint_by_tmo
+        return self.points_constraints.get(tmo.id, [])
+
+
+class TMOTreeCache:
+    """Keeps the last TMOTreeSnapshot in memory.
+
+    Every change of TMO and MO is written into the event history after
+    commit, so the snapshot is rebuilt when the last event id differs from
+    the one it was built at. ttl (seconds) limits the age of the snapshot for
+    changes without events, ttl=0 turns the cache off."""
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._snapshot: TMOTreeSnapshot | None = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _get_version(session: Session) -> int | None:
+        return session.execute(select(func.max(Event.id))).scalar()
+
+    def _is_actual(
+        self, snapshot: TMOTreeSnapshot | None, version: int | None
+    ) -> bool:
+        return (
+            snapshot is not None
+            and snapshot.version == version
+            and time.monotonic() - snapshot.created_at < self.ttl
+        )
+
+    @staticmethod
+    def _build(session: Session, version: int | None) -> TMOTreeSnapshot:
+        tmos = session.execute(select(TMO).order_by(TMO.id)).scalars().all()
+        children = defaultdict(list)
+        for tmo in tmos:
+            children[tmo.p_id].append(tmo)
+        tmo_ids_without_constraint = [
+            tmo.id for tmo in tmos if not tmo.points_constraint_by_tmo
+        ]
+        return TMOTreeSnapshot(
+            version=version,
+            created_at=time.monotonic(),
+            tmos={tmo.id: tmo for tmo in tmos},
+            children=dict(children),
+            points_constraints=get_points_constraints_by_tmo(
+                session=session, tmo_ids=tmo_ids_without_constraint
+            ),
+        )
+
+    def get(self, session: Session) -> TMOTreeSnapshot:
+        if self.ttl <= 0:
+            return self._build(session=session, version=None)
+
+        # the version is read before TMOs, so the snapshot is never older
+        # than the version it is stored with
+        version = self._get_version(session=session)
+        snapshot = self._snapshot
+        if self._is_actual(snapshot=snapshot, version=version):
+            return snapshot
+
+        with self._lock:
+            snapshot = self._snapshot
+            if not self._is_actual(snapshot=snapshot, version=version):
+                snapshot = self._build(session=session, version=version)
+                self._snapshot = snapshot
+            return snapshot
+
+    def clear(self) -> None:
+        self._snapshot = None
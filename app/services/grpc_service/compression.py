@@ -0,0 +1,120 @@
+"""Per-method compression of responses of the inventory gRPC server"""
+
+import inspect
+from typing import Callable
+
+import grpc
+
+COMPRESSION_ALGORITHMS = {
+    "none": grpc.Compression.NoCompression,
+    "gzip": grpc.Compression.Gzip,
+    "deflate": grpc.Compression.Deflate,
+}
+
+
+def get_compression(name: str) -> grpc.Compression:
+    try:
+        return COMPRESSION_ALGORITHMS[name.strip().lower()]
+    except KeyError:
+        raise ValueError(
+            f"Unknown gRPC compression {name!r}, "
+            f"expected one of {list(COMPRESSION_ALGORITHMS)}"
+        ) from None
+
+
+def parse_method_compression(value: str) -> dict[str, grpc.Compression]:
+    """Parses "GetTMOTree=gzip,/Informer/GetMOsByIds=none" into compression
+    by method name or by full method path"""
+    result = {}
+    for item in value.split(","):
+        if not item.strip():
+            continue
+        method, separator, name = item.partition("=")
+        if not separator or not method.strip():
+            raise ValueError(
+                f"gRPC method compression {item!r} is not <method>=<algorithm>"
+            )
+        result[method.strip()] = get_compression(name)
+    return result
+
+
+def _with_compression(
+    behavior: Callable, compression: grpc.Compression
+) -> Callable:
+    # keeps kind of the behavior, grpc.aio runs synchronous behaviors in
+    # threads and awaits asynchronous ones
+    if inspect.isasyncgenfunction(behavior):
+
+        async def wrapper(request, context):
+            context.set_compression(compression)
+            async for response in behavior(request, context):
+                yield response
+
+    elif inspect.iscoroutinefunction(behavior):
+
+        async def wrapper(request, context):
+            context.set_compression(compression)
+            return await behavior(request, context)
+
+    else:
+
+        def wrapper(request, context):
+            context.set_compression(compression)
+            return behavior(request, context)
+
+    return wrapper
+
+
+class CompressionInterceptor(grpc.aio.ServerInterceptor):
+    """Compresses responses of methods in method_compression and of all
+    methods with streamed responses (bulk transfers of objects and
+    parameters) by streaming_compression. Responses are compressed only for
+    clients which accept the algorithm, others get them uncompressed."""
+
+    def __init__(
+        self,
+        streaming_compression: grpc.Compression | None,
+        method_compression: dict[str, grpc.Compression] | None = None,
+    ):
+        self.streaming_compression = streaming_compression
+        self.method_compression = method_compression or {}
+
+    def get_method_compression(
+        self, method: str, response_streaming: bool
+    ) -> grpc.Compression | None:
+        for key in (method, method.rsplit("/", 1)[-1]):
+            if key in self.method_compression:
+                return self.method_compression[key]
+        if response_streaming:
+            return self.streaming_compression
+        return None
+
+    async def intercept_service(self, continuation, handler_call_details):
+        handler = await continuation(handler_call_details)
+        if handler is None:
+            return None
+
+        compression = self.get_method_compression(
+            method=handler_call_details.method,
+            response_streaming=handler.response_streaming,
+        )
+        if compression is None:
+            return handler
+
+        if handler.request_streaming and handler.response_streaming:
+            factory = grpc.stream_stream_rpc_method_handler
+            behavior = handler.stream_stream
+        elif handler.request_streaming:
+            factory = grpc.stream_unary_rpc_method_handler
+            behavior = handler.stream_unary
+        elif handler.response_streaming:
+            factory = grpc.unary_stream_rpc_method_handler
+            behavior = handler.unary_stream
+        else:
+            factory = grpc.unary_unary_rpc_method_handler
+            behavior = handler.unary_unary
+        return factory(
+            _with_compression(behavior, compression),
+            request_deserializer=handler.request_deserializer,
+            response_serializer=handler.response_serializer,
+        )
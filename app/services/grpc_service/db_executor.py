@@ -0,0 +1,121 @@
+"""Execution of blocking servicer code outside of the grpc.aio event loop"""
+
+import asyncio
+import contextlib
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Iterator
+
+from config.grpc_config import (
+    GRPC_DB_HEAVY_METHOD_LIMIT,
+    GRPC_DB_HEAVY_WORKERS,
+    GRPC_DB_WORKERS,
+)
+
+_STOP = object()
+
+
+class GrpcDBExecutor:
+    """Runs servicer methods, which use synchronous sessions, in worker
+    threads, so the event loop keeps serving other calls while one of them
+    reads a large result set.
+
+    Heavy methods (exports and streams of objects) run in own pool and at
+    most heavy_method_limit calls of one heavy method run at once, so they
+    can not take all workers of short lookups."""
+
+    def __init__(
+        self, workers: int, heavy_workers: int, heavy_method_limit: int
+    ):
+        self._pool = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="grpc-db"
+        )
+        self._heavy_pool = ThreadPoolExecutor(
+            max_workers=heavy_workers, thread_name_prefix="grpc-db-heavy"
+        )
+        self._heavy_method_limit = heavy_method_limit
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+        self._semaphores_loop = None
+
+    def _get_limit(self, name: str, heavy: bool):
+        if not heavy:
+            return contextlib.nullcontext()
+
+        loop = asyncio.get_running_loop()
+        if loop is not self._semaphores_loop:
+            # semaphore is bound to the loop it was used in first
+            self._semaphores = {}
+            self._semaphores_loop = loop
+        if name not in self._semaphores:
+            self._semaphores[name] = asyncio.Semaphore(self._heavy_method_limit)
+        return self._semaphores[name]
+
+    async def run(
+        self, func: Callable, *args, heavy: bool = False, **kwargs
+    ) -> Any:
+        """Returns result of func called in worker thread"""
+        pool = self._heavy_pool if heavy else self._pool
+        call = functools.partial(func, *args, **kwargs)
+        async with self._get_limit(name=func.__qualname__, heavy=heavy):
+            return await asyncio.get_running_loop().run_in_executor(pool, call)
+
+    async def iterate(
+        self, func: Callable[..., Iterator], *args, heavy: bool = False
+    ) -> AsyncIterator:
+        """Yields items of generator func. Every item is produced in worker
+        thread, the generator is closed in worker thread as well"""
+        pool = self._heavy_pool if heavy else self._pool
+        loop = asyncio.get_running_loop()
+        async with self._get_limit(name=func.__qualname__, heavy=heavy):
+            iterator = await loop.run_in_executor(pool, func, *args)
+            try:
+                while True:
+                    item = await loop.run_in_executor(
+                        pool, next, iterator, _STOP
+                    )
+                    if item is _STOP:
+                        break
+                    yield item
+            finally:
+                await loop.run_in_executor(pool, iterator.close)
+
+    def unary(self, heavy: bool = False):
+        """Makes async servicer method of synchronous one"""
+
+        def decorator(method: Callable):
+            @functools.wraps(method)
+            async def wrapper(servicer, request, context):
+                return await self.run(
+                    method, servicer, request, context, heavy=heavy
+                )
+
+            return wrapper
+
+        return decorator
+
+    def stream(self, heavy: bool = False):
+        """Makes async generator servicer method of synchronous generator"""
+
+        def decorator(method: Callable[..., Iterator]):
+            @functools.wraps(method)
+            async def wrapper(servicer, request, context):
+                responses = self.iterate(
+                    method, servicer, request, context, heavy=heavy
+                )
+                try:
+                    async for response in responses:
+                        yield response
+                finally:
+                    # closes the generator if the call is cancelled
+                    await responses.aclose()
+
+            return wrapper
+
+        return decorator
+
+
+db_executor = GrpcDBExecutor(
+    workers=GRPC_DB_WORKERS,
+    heavy_workers=GRPC_DB_HEAVY_WORKERS,
+    heavy_method_limit=GRPC_DB_HEAVY_METHOD_LIMIT,
+)
@@ -4,7 +4,7 @@ import logging
 import pickle
 import traceback
 from sys import stderr
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Iterator
 
 import grpc
 import math
@@ -12,7 +12,19 @@ from google.protobuf import json_format, any_pb2
 from sqlalchemy import func
 from sqlalchemy.orm import aliased
 from sqlmodel import Session, select
-
+from starlette.datastructures import QueryParams
+
+from config.grpc_config import (
+    GRPC_BULK_COMPRESSION,
+    GRPC_BULK_MAX_CONCURRENT_RPCS,
+    GRPC_BULK_PORT,
+    GRPC_COMPRESSION,
+    GRPC_MAX_CONCURRENT_RPCS,
+    GRPC_MAX_RECEIVE_MESSAGE_SIZE,
+    GRPC_MAX_SEND_MESSAGE_SIZE,
+    GRPC_METHOD_COMPRESSION,
+    GRPC_PORT,
+)
 from database import engine
 from functions.db_functions.db_read import get_objects_with_parameters
 from functions.functions_dicts import value_convertation_by_val_type
@@ -23,6 +35,12 @@ from services.airflow_service.servicer import AirflowManager
 from services.dataview_manager.servicer import DataviewToInventoryManager
 from services.event_service.grpc_servicer import EventManagerManager
 from services.graph_service.graph import GraphInformer
+from services.grpc_service.compression import (
+    CompressionInterceptor,
+    get_compression,
+    parse_method_compression,
+)
+from services.grpc_service.db_executor import db_executor
 from services.grpc_service.grpc_utils import (
     check_tmo_has_sevrirty,
     get_smallest_severity_value,
@@ -30,6 +48,7 @@ from services.grpc_service.grpc_utils import (
     GetAllMOWithParamsByTMOId,
     GetAllMOAttrsByTMOIdWithSpecialParameters,
 )
+from services.grpc_service.message_chunker import MessageChunker
 from services.grpc_service.proto_files.airflow.files import (
     airflow_manager_pb2_grpc,
 )
@@ -60,6 +79,13 @@ from services.grpc_service.proto_files.transfer.files import transfer_pb2_grpc
 from services.grpc_service.proto_files.zeebe.files import (
     zeebe_to_inventory_pb2_grpc,
 )
+from services.grpc_service.typed_payloads import (
+    jwt_from_message,
+    order_by_from_message,
+    pickle_payload,
+    query_params_from_message,
+    to_mo_message,
+)
 from services.security_service.implementation.disabled import DisabledSecurity
 from services.security_service.security_data_models import UserData
 from services.security_service.security_factory import (
@@ -77,7 +103,8 @@ if not isinstance(security_instance, DisabledSecurity):
 class Informer(inventory_data_pb2_grpc.InformerServicer):
     max_chunk_size = 1_000_000
 
-    async def GetParamsValuesForMO(
+    @db_executor.unary()
+    def GetParamsValuesForMO(
         self,
         request: inventory_data_pb2.InfoRequest,
         context: grpc.aio.ServicerContext,
@@ -134,7 +161,8 @@ class Informer(inventory_data_pb2_grpc.InformerServicer):
 
         return inventory_data_pb2.InfoReply(mo_info=msg_data)
 
-    async def GetTMOidForMo(
+    @db_executor.unary()
+    def GetTMOidForMo(
         self,
         request: inventory_data_pb2.IntValue,
         context: grpc.aio.ServicerContext,
@@ -154,7 +182,8 @@ class Informer(inventory_data_pb2_grpc.InformerServicer):
 
         return inventory_data_pb2.MOInfo(**res)
 
-    async def GetObjWithParams(
+    @db_executor.stream(heavy=True)
+    def GetObjWithParams(
         self,
         request: inventory_data_pb2.RequestForObjInfoByTMO,
         context: grpc.aio.ServicerContext,
@@ -221,7 +250,8 @@ class Informer(inventory_data_pb2_grpc.InformerServicer):
                     **response_dict
                 )
 
-    async def GetMOQuantityBySeverity(
+    @db_executor.unary()
+    def GetMOQuantityBySeverity(
         self,
         request: inventory_data_pb2.RequestSeverityValues,
         context: grpc.aio.ServicerContext,
@@ -273,7 +303,8 @@ class Informer(inventory_data_pb2_grpc.InformerServicer):
             dict_mo_info=pickle_response
         )
 
-    async def GetMOSeverityMaxValue(
+    @db_executor.unary()
+    def GetMOSeverityMaxValue(
         self,
         request: inventory_data_pb2.RequestSeverityMoId,
         context: grpc.aio.ServicerContext,
@@ -297,6 +328,7 @@ class Informer(inventory_data_pb2_grpc.InformerServicer):
 
             return inventory_data_pb2.ResponseSeverityMoId(max_severity=0)
 
+    @pickle_payload(replacement="GetFilteredObjWithParamsV2")
     async def GetFilteredObjWithParams(
         self,
         request: inventory_data_pb2.RequestForFilteredObjInfoByTMO,
@@ -309,6 +341,7 @@ class Informer(inventory_data_pb2_grpc.InformerServicer):
             objects_with_parameters=resp_data
         )
 
+    @pickle_payload(replacement="GetFilteredObjWithParamsStreamV2")
     async def GetFilteredObjWithParamsStream(
         self,
         request: inventory_data_pb2.RequestForFilteredObjInfoByTMO,
@@ -326,28 +359,127 @@ class Informer(inventory_data_pb2_grpc.InformerServicer):
                 grpc.StatusCode.INTERNAL, f"Error in process: {str(ex)}"
             )
 
-    async def GetFilteredObjSpecial(
+    async def GetFilteredObjWithParamsV2(
+        self,
+        request: inventory_data_pb2.RequestForFilteredObjInfoByTMOV2,
+        context: grpc.aio.ServicerContext,
+    ) -> inventory_data_pb2.ResponseMOs:
+        """Returns ResponseMOs."""
+        handler = FilteredObjWithParamsHandler()
+        objects = await handler.process_v2(request=request)
+        return inventory_data_pb2.ResponseMOs(objects=objects)
+
+    async def GetFilteredObjWithParamsStreamV2(
+        self,
+        request: inventory_data_pb2.RequestForFilteredObjInfoByTMOV2,
+        context: grpc.aio.ServicerContext,
+    ) -> AsyncGenerator[inventory_data_pb2.ResponseMOs, None]:
+        """Returns stream of ResponseMOs."""
+        handler = FilteredObjWithParamsHandler()
+        try:
+            async for response in handler.get_stream_response_chunked_v2(
+                request=request
+            ):
+                yield response
+        except Exception as ex:
+            await context.abort(
+                grpc.StatusCode.INTERNAL, f"Error in process: {str(ex)}"
+            )
+
+    @pickle_payload(replacement="GetFilteredObjSpecialV2")
+    @db_executor.stream(heavy=True)
+    def GetFilteredObjSpecial(
         self,
         request: inventory_data_pb2.RequestForFilteredObjSpecial,
         context: grpc.aio.ServicerContext,
     ):
         """Returns ResponseMOdataOrMOIds."""
+        parts = self._get_filtered_obj_special_parts(
+            request=request,
+            query_params=(
+                pickle.loads(bytes.fromhex(request.query_params))
+                if request.query_params
+                else None
+            ),
+            order_by=(
+                pickle.loads(bytes.fromhex(request.order_by))
+                if request.order_by
+                else None
+            ),
+            decoded_jwt=(
+                pickle.loads(bytes.fromhex(request.decoded_jwt))
+                if request.decoded_jwt
+                else None
+            ),
+        )
+        for mo_ids, mo_dataset in parts:
+            response = inventory_data_pb2.ResponseMOdataSpecial(
+                mo_ids=mo_ids,
+                pickle_mo_dataset=[
+                    pickle.dumps(item).hex() for item in mo_dataset
+                ],
+            )
+            print(
+                f"filtered-object-special: message-size: {response.ByteSize()}"
+            )
+            yield response
+
+    @db_executor.stream(heavy=True)
+    def GetFilteredObjSpecialV2(
+        self,
+        request: inventory_data_pb2.RequestForFilteredObjSpecialV2,
+        context: grpc.aio.ServicerContext,
+    ):
+        """Returns stream of ResponseMOdataSpecialV2."""
+        parts = self._get_filtered_obj_special_parts(
+            request=request,
+            query_params=(
+                query_params_from_message(request.query_params)
+                if request.query_params
+                else None
+            ),
+            order_by=(
+                order_by_from_message(request.order_by)
+                if request.order_by
+                else None
+            ),
+            decoded_jwt=(
+                jwt_from_message(request.decoded_jwt)
+                if request.HasField("decoded_jwt")
+                else None
+            ),
+        )
+        for mo_ids, mo_dataset in parts:
+            yield inventory_data_pb2.ResponseMOdataSpecialV2(
+                mo_ids=mo_ids,
+                objects=[
+                    to_mo_message(item, inventory_data_pb2.MO)
+                    for item in mo_dataset
+                ],
+            )
+
+    @staticmethod
+    def _get_filtered_obj_special_parts(
+        request: inventory_data_pb2.RequestForFilteredObjSpecial
+        | inventory_data_pb2.RequestForFilteredObjSpecialV2,
+        query_params: QueryParams | None,
+        order_by: dict | None,
+        decoded_jwt: dict | None,
+    ) -> Iterator[tuple[list[int], list[dict]]]:
+        """Yields parts of ids of filtered objects with their data: values
+        of request.tprm_ids by int TPRM id and request.mo_attrs"""
         CHUNK_SIZE = 1000
 
         tprm_cleaner_data = dict()
         if request.object_type_id:
             tprm_cleaner_data["object_type_id"] = request.object_type_id
 
-        if request.query_params:
-            tprm_cleaner_data["query_params"] = pickle.loads(
-                bytes.fromhex(request.query_params)
-            )
+        if query_params:
+            tprm_cleaner_data["query_params"] = query_params
 
         additional_filter_data = {}
-        if request.order_by:
-            additional_filter_data["order_by"] = pickle.loads(
-                bytes.fromhex(request.order_by)
-            )
+        if order_by:
+            additional_filter_data["order_by"] = order_by
 
         if request.mo_ids:
             additional_filter_data["obj_ids"] = request.mo_ids
@@ -356,14 +488,12 @@ class Informer(inventory_data_pb2_grpc.InformerServicer):
             additional_filter_data["p_id"] = request.p_ids
 
         with Session(engine) as session:
-            if request.decoded_jwt:
-                session.info["jwt"] = UserData.from_jwt(
-                    pickle.loads(bytes.fromhex(request.decoded_jwt))
-                )
+            if decoded_jwt:
+                session.info["jwt"] = UserData.from_jwt(decoded_jwt)
                 session.info["action"] = "read"
 
             mos_ids = []
-            pickle_mo_dataset = []
+            mo_dataset = []
             tprm_cleaner = TPRMFilterCleaner(
                 session=session, **tprm_cleaner_data
             )
@@ -387,23 +517,14 @@ class Informer(inventory_data_pb2_grpc.InformerServicer):
                     mos_ids = session.execute(stmt).scalars().all()
 
             if not mos_ids:
-                yield inventory_data_pb2.ResponseMOdataSpecial(
-                    mo_ids=[], pickle_mo_dataset=[]
-                )
+                yield [], []
                 return
 
             if request.only_ids:
                 for part in range(math.ceil(len(mos_ids) / CHUNK_SIZE)):
                     inner_offset = part * CHUNK_SIZE
                     inner_limit = inner_offset + CHUNK_SIZE
-                    response = inventory_data_pb2.ResponseMOdataSpecial(
-                        mo_ids=mos_ids[inner_offset:inner_limit],
-                        pickle_mo_dataset=[],
-                    )
-                    print(
-                        f"filtered-object-special: message-size: {response.ByteSize()}"
-                    )
-                    yield response
+                    yield mos_ids[inner_offset:inner_limit], []
                 return
 
             mo_fields = {MO.id, MO.p_id}
@@ -475,45 +596,34 @@ class Informer(inventory_data_pb2_grpc.InformerServicer):
                             for column_name in mo_fields_names
                         }
                     )
-                    return pickle.dumps(res).hex()
+                    return res
 
-                pickle_mo_dataset = [combine_data(item) for item in all_mo_ids]
+                mo_dataset = [combine_data(item) for item in all_mo_ids]
 
             else:
                 stmt = select(MO).where(MO.id.in_(mos_ids))
                 mos = session.execute(stmt).scalars().all()
 
                 if mos:
-                    pickle_mo_dataset = [
-                        pickle.dumps(
-                            {
-                                column_name: attr_data
-                                for column_name in mo_fields_names
-                                if (
-                                    attr_data := getattr(
-                                        item, column_name, None
-                                    )
-                                )
-                            }
-                        ).hex()
+                    mo_dataset = [
+                        {
+                            column_name: attr_data
+                            for column_name in mo_fields_names
+                            if (attr_data := getattr(item, column_name, None))
+                        }
                         for item in mos
                     ]
 
             for part in range(math.ceil(len(mos_ids) / CHUNK_SIZE)):
                 inner_offset = part * CHUNK_SIZE
                 inner_limit = inner_offset + CHUNK_SIZE
-                response = inventory_data_pb2.ResponseMOdataSpecial(
-                    mo_ids=mos_ids[inner_offset:inner_limit],
-                    pickle_mo_dataset=pickle_mo_dataset[
-                        inner_offset:inner_limit
-                    ],
+                yield (
+                    mos_ids[inner_offset:inner_limit],
+                    mo_dataset[inner_offset:inner_limit],
                 )
-                print(
-                    f"filtered-object-special: message-size: {response.ByteSize()}"
-                )
-                yield response
 
-    async def GetTMOlifecycle(
+    @db_executor.unary()
+    def GetTMOlifecycle(
         self,
         request: inventory_data_pb2.RequestTMOlifecycleByTMOidList,
         context: grpc.aio.ServicerContext,
@@ -528,7 +638,8 @@ class Informer(inventory_data_pb2_grpc.InformerServicer):
                 tmo_ids_with_lifecycle=all_tmo_ids
             )
 
-    async def GetTPRMNames(
+    @db_executor.unary()
+    def GetTPRMNames(
         self,
         request: inventory_data_pb2.RequestTPRMIds,
         context: grpc.aio.ServicerContext,
@@ -552,7 +663,8 @@ class Informer(inventory_data_pb2_grpc.InformerServicer):
 
         return res
 
-    async def GetHierarchyLevelChildren(
+    @db_executor.unary()
+    def GetHierarchyLevelChildren(
         self,
         request: inventory_data_pb2.RequestListLevels,
         context: grpc.aio.ServicerContext,
@@ -617,6 +729,7 @@ class Informer(inventory_data_pb2_grpc.InformerServicer):
             ]
         )
 
+    @db_executor.unary()
     def GetMODetailsWithTPRMNames(
         self,
         request: inventory_data_pb2.RequestMODetailsWithTPRMNames,
@@ -635,7 +748,8 @@ class Informer(inventory_data_pb2_grpc.InformerServicer):
 
         return inventory_data_pb2.ResponseMODetailsWithTPRMNames(column=result)
 
-    async def GetColumnsForMaterializedView(
+    @db_executor.unary()
+    def GetColumnsForMaterializedView(
         self,
         request: inventory_data_pb2.RequestTMOAttrsAndTypes,
         context: grpc.aio.ServicerContext,
@@ -676,7 +790,8 @@ class Informer(inventory_data_pb2_grpc.InformerServicer):
 
         return inventory_data_pb2.ResponseTMOAttrsAndTypes(attrs=res)
 
-    async def GetTMOInfoByTMOId(
+    @db_executor.unary()
+    def GetTMOInfoByTMOId(
         self,
         request: inventory_data_pb2.TMOInfoRequest,
         context: grpc.aio.ServicerContext,
@@ -695,7 +810,8 @@ class Informer(inventory_data_pb2_grpc.InformerServicer):
         except Exception:
             print(traceback.format_exc(), file=stderr)
 
-    async def GetAllTMO(
+    @db_executor.unary()
+    def GetAllTMO(
         self,
         request: inventory_data_pb2.GetAllTMORequest,
         context: grpc.aio.ServicerContext,
@@ -708,6 +824,7 @@ class Informer(inventory_data_pb2_grpc.InformerServicer):
             ]
             return inventory_data_pb2.GetAllTMOResponse(tmo_info=result)
 
+    @db_executor.unary()
     def GetTPRMNameToTypeMapper(
         self,
         request: inventory_data_pb2.RequestTPRMNameToType,
@@ -723,7 +840,8 @@ class Informer(inventory_data_pb2_grpc.InformerServicer):
             mapper = {res[0]: res[1] for res in response.fetchall()}
             return inventory_data_pb2.ResponseTPRMNameToType(mapper=mapper)
 
-    async def GetTMOInfoByMOId(
+    @db_executor.unary()
+    def GetTMOInfoByMOId(
         self,
         request: inventory_data_pb2.MOInfoRequest,
         context: grpc.aio.ServicerContext,
@@ -735,6 +853,7 @@ class Informer(inventory_data_pb2_grpc.InformerServicer):
 
         return inventory_data_pb2.ResponseListInt(values=result)
 
+    @db_executor.stream(heavy=True)
     def GetObjWithParamsLimited(
         self,
         request: inventory_data_pb2.RequestObjWithParamsLimited,
@@ -781,7 +900,8 @@ class Informer(inventory_data_pb2_grpc.InformerServicer):
                     data=pickle.dumps(res).hex()
                 )
 
-    async def GetTPRMData(
+    @db_executor.unary()
+    def GetTPRMData(
         self,
         request: inventory_data_pb2.RequestTPRMData,
         context: grpc.aio.ServicerContext,
@@ -800,7 +920,8 @@ class Informer(inventory_data_pb2_grpc.InformerServicer):
 
         return inventory_data_pb2.ResponseTPRMData(tprms_data=result)
 
-    async def DeleteMOsByIds(
+    @db_executor.unary()
+    def DeleteMOsByIds(
         self,
         request: inventory_data_pb2.DeleteMOIdsRequest,
         context: grpc.aio.ServicerContext,
@@ -819,13 +940,14 @@ class Informer(inventory_data_pb2_grpc.InformerServicer):
 
         return inventory_data_pb2.DeleteMOIdsResponse(deleted_quantity=count)
 
-    async def GetAllMOWithParamsByTMOId(
+    @pickle_payload(replacement="GetAllMOWithParamsByTMOIdV2")
+    @db_executor.stream(heavy=True)
+    def GetAllMOWithParamsByTMOId(
         self,
         request: inventory_data_pb2.GetAllMOWithParamsByTMOIdRequest,
         context: grpc.aio.ServicerContext,
     ) -> inventory_data_pb2.GetAllMOWithParamsByTMOIdResponse:
         """Returns GetAllMOWithParamsByTMOIdResponse."""
-        grpc_message_max_size = 4100000
         if not request.tmo_id:
             msg = inventory_data_pb2.GetAllMOWithParamsByTMOIdResponse(
                 mos_with_params=[]
@@ -833,50 +955,54 @@ class Informer(inventory_data_pb2_grpc.InformerServicer):
             yield msg
             return
 
+        chunker = MessageChunker(
+            message_class=inventory_data_pb2.GetAllMOWithParamsByTMOIdResponse,
+            field_name="mos_with_params",
+        )
         with Session(engine) as session:
             process_of_getting_data = GetAllMOWithParamsByTMOId(
                 session=session, tmo_id=request.tmo_id
             )
-            for data in process_of_getting_data.get_result_generator(
+            for data in process_of_getting_data.iter_results(
                 replace_links=request.replace_links
             ):
-                msg = inventory_data_pb2.GetAllMOWithParamsByTMOIdResponse(
-                    mos_with_params=data
+                yield from chunker.iter_messages(
+                    pickle.dumps(item).hex() for item in data
                 )
-                msg_size = msg.ByteSize()
-
-                # create stack
-                steps = math.ceil(msg_size / grpc_message_max_size)
-                len_of_objects = len(data)
-                per_step = int(len_of_objects / steps)
-                stack = [
-                    data[start : start + per_step]
-                    for start in range(0, len_of_objects, per_step)
-                ]
 
-                while True:
-                    try:
-                        msg_items = stack.pop()
-                    except IndexError:
-                        break
-                    msg = inventory_data_pb2.GetAllMOWithParamsByTMOIdResponse(
-                        mos_with_params=msg_items
-                    )
-                    msg_size = msg.ByteSize()
-                    if msg_size > grpc_message_max_size:
-                        half = len(msg_items) // 2
-                        stack.extend([msg_items[:half], msg_items[half:]])
-                        continue
-                    else:
-                        yield msg
+    @db_executor.stream(heavy=True)
+    def GetAllMOWithParamsByTMOIdV2(
+        self,
+        request: inventory_data_pb2.GetAllMOWithParamsByTMOIdRequest,
+        context: grpc.aio.ServicerContext,
+    ) -> inventory_data_pb2.ResponseMOs:
+        """Returns stream of ResponseMOs."""
+        if not request.tmo_id:
+            yield inventory_data_pb2.ResponseMOs(objects=[])
+            return
 
-    async def GetMODataByIds(
+        chunker = MessageChunker(
+            message_class=inventory_data_pb2.ResponseMOs,
+            field_name="objects",
+        )
+        with Session(engine) as session:
+            process_of_getting_data = GetAllMOWithParamsByTMOId(
+                session=session, tmo_id=request.tmo_id
+            )
+            for data in process_of_getting_data.iter_results(
+                replace_links=request.replace_links
+            ):
+                yield from chunker.iter_messages(
+                    to_mo_message(item, inventory_data_pb2.MO) for item in data
+                )
+
+    @db_executor.stream(heavy=True)
+    def GetMODataByIds(
         self,
         request: inventory_data_pb2.GetMODataByIdsRequest,
         context: grpc.aio.ServicerContext,
     ) -> inventory_data_pb2.GetMODataByIdsResponse:
         """Returns GetMONamesByIdsResponse."""
-        grpc_message_max_size = 4100000
         query_max_params = 30000
         if not request.mo_ids:
             msg = inventory_data_pb2.GetMODataByIdsResponse()
@@ -909,38 +1035,19 @@ class Informer(inventory_data_pb2_grpc.InformerServicer):
                 for mo_data in list_of_mo_names_and_ids
             ]
 
-            msg = inventory_data_pb2.GetMODataByIdsResponse(
-                list_of_mo=inner_msg
+            chunker = MessageChunker(
+                message_class=inventory_data_pb2.GetMODataByIdsResponse,
+                field_name="list_of_mo",
             )
+            yield from chunker.iter_messages(inner_msg, send_empty=True)
 
-            msg_size = msg.ByteSize()
-            if msg_size > grpc_message_max_size:
-                msg_order = list()
-                one_msg = inventory_data_pb2.GetMODataByIdsResponse()
-                for item in inner_msg:
-                    one_msg.list_of_mo.append(item)
-
-                    if one_msg.ByteSize() > grpc_message_max_size:
-                        last_one = one_msg.list_of_mo.pop()
-                        msg_order.append(one_msg)
-                        one_msg = inventory_data_pb2.GetMODataByIdsResponse()
-                        one_msg.list_of_mo.append(last_one)
-
-                if len(one_msg.list_of_mo) > 0:
-                    msg_order.append(one_msg)
-
-                for msg in msg_order:
-                    yield msg
-            else:
-                yield msg
-
-    async def GetPRMsByPRMIds(
+    @db_executor.stream(heavy=True)
+    def GetPRMsByPRMIds(
         self,
         request: inventory_data_pb2.GetPRMsByPRMIdsRequest,
         context: grpc.aio.ServicerContext,
     ) -> inventory_data_pb2.GetPRMsByPRMIdsResponse:
         """Returns GetPRMsByPRMIdsResponse."""
-        grpc_message_max_size = 4100000
         query_max_params = 30000
         if not request.prm_ids:
             msg = inventory_data_pb2.GetPRMsByPRMIdsResponse()
@@ -973,40 +1080,25 @@ class Informer(inventory_data_pb2_grpc.InformerServicer):
                 for prm_data in list_of_prms_data
             ]
 
-            msg = inventory_data_pb2.GetPRMsByPRMIdsResponse(
-                list_of_prm=inner_msg
+            chunker = MessageChunker(
+                message_class=inventory_data_pb2.GetPRMsByPRMIdsResponse,
+                field_name="list_of_prm",
             )
+            yield from chunker.iter_messages(inner_msg, send_empty=True)
 
-            msg_size = msg.ByteSize()
-            if msg_size > grpc_message_max_size:
-                msg_order = list()
-                one_msg = inventory_data_pb2.GetPRMsByPRMIdsResponse()
-                for item in inner_msg:
-                    one_msg.list_of_prm.append(item)
-
-                    if one_msg.ByteSize() > grpc_message_max_size:
-                        last_one = one_msg.list_of_prm.pop()
-                        msg_order.append(one_msg)
-                        one_msg = inventory_data_pb2.GetPRMsByPRMIdsResponse()
-                        one_msg.list_of_prm.append(last_one)
-
-                if len(one_msg.list_of_prm) > 0:
-                    msg_order.append(one_msg)
-
-                for msg in msg_order:
-                    yield msg
-            else:
-                yield msg
-
-    async def GetTPRMAllData(
+    @db_executor.stream()
+    def GetTPRMAllData(
         self,
         request: inventory_data_pb2.RequestGetTPRMAlldata,
         context: grpc.aio.ServicerContext,
     ) -> inventory_data_pb2.ResponseGetTPRMAlldata:
         """Returns TPRM data by list of tprm_ids, if list is empty - returns data for all TPRMs"""
         yield_per = 10000
-        grpc_message_max_size = 4100000
 
+        chunker = MessageChunker(
+            message_class=inventory_data_pb2.ResponseGetTPRMAlldata,
+            field_name="tprms_data",
+        )
         with Session(engine) as session:
             if request.tprm_ids:
                 stmt = (
@@ -1023,42 +1115,21 @@ class Informer(inventory_data_pb2_grpc.InformerServicer):
                 tprms_data = [
                     pickle.dumps(data.dict()).hex() for data in partition
                 ]
-                msg = inventory_data_pb2.ResponseGetTPRMAlldata(
-                    tprms_data=tprms_data
-                )
-
-                msg_size = msg.ByteSize()
-                if msg_size > grpc_message_max_size:
-                    msg_order = list()
-                    one_msg = inventory_data_pb2.ResponseGetTPRMAlldata()
-                    for item in tprms_data:
-                        one_msg.tprms_data.append(item)
-
-                        if one_msg.ByteSize() > grpc_message_max_size:
-                            last_one = one_msg.tprms_data.pop()
-                            msg_order.append(one_msg)
-                            one_msg = (
-                                inventory_data_pb2.ResponseGetTPRMAlldata()
-                            )
-                            one_msg.tprms_data.append(last_one)
-
-                    if len(one_msg.tprms_data) > 0:
-                        msg_order.append(one_msg)
+                yield from chunker.iter_messages(tprms_data)
 
-                    for msg in msg_order:
-                        yield msg
-                else:
-                    yield msg
-
-    async def GetAllTPRMSByTMOId(
+    @db_executor.stream()
+    def GetAllTPRMSByTMOId(
         self,
         request: inventory_data_pb2.RequestGetAllTPRMSByTMOId,
         context: grpc.aio.ServicerContext,
     ) -> inventory_data_pb2.ResponseGetAllTPRMSByTMOId:
         """Returns TPRM data by tmo_id"""
         yield_per = 10000
-        grpc_message_max_size = 4100000
 
+        chunker = MessageChunker(
+            message_class=inventory_data_pb2.ResponseGetAllTPRMSByTMOId,
+            field_name="tprms_data",
+        )
         with Session(engine) as session:
             stmt = (
                 select(TPRM)
@@ -1072,34 +1143,10 @@ class Informer(inventory_data_pb2_grpc.InformerServicer):
                 tprms_data = [
                     pickle.dumps(data.dict()).hex() for data in partition
                 ]
-                msg = inventory_data_pb2.ResponseGetAllTPRMSByTMOId(
-                    tprms_data=tprms_data
-                )
-
-                msg_size = msg.ByteSize()
-                if msg_size > grpc_message_max_size:
-                    msg_order = list()
-                    one_msg = inventory_data_pb2.ResponseGetAllTPRMSByTMOId()
-                    for item in tprms_data:
-                        one_msg.tprms_data.append(item)
-
-                        if one_msg.ByteSize() > grpc_message_max_size:
-                            last_one = one_msg.tprms_data.pop()
-                            msg_order.append(one_msg)
-                            one_msg = (
-                                inventory_data_pb2.ResponseGetAllTPRMSByTMOId()
-                            )
-                            one_msg.tprms_data.append(last_one)
+                yield from chunker.iter_messages(tprms_data)
 
-                    if len(one_msg.tprms_data) > 0:
-                        msg_order.append(one_msg)
-
-                    for msg in msg_order:
-                        yield msg
-                else:
-                    yield msg
-
-    async def GetAllRawPRMDataByTPRMId(
+    @db_executor.stream(heavy=True)
+    def GetAllRawPRMDataByTPRMId(
         self,
         request: inventory_data_pb2.RequestGetAllRawPRMDataByTPRMId,
         context: grpc.aio.ServicerContext,
@@ -1110,7 +1157,10 @@ class Informer(inventory_data_pb2_grpc.InformerServicer):
             return
 
         prm_yield_per = 40000
-        grpc_message_max_size = 4100000
+        chunker = MessageChunker(
+            message_class=inventory_data_pb2.ResponseGetAllRawPRMDataByTPRMId,
+            field_name="prms",
+        )
         with Session(engine) as session:
             # get tmo tprms
             stmt = (
@@ -1133,31 +1183,9 @@ class Informer(inventory_data_pb2_grpc.InformerServicer):
                     for prm_data in prm_partition
                 ]
 
-                msg = inventory_data_pb2.ResponseGetAllRawPRMDataByTPRMId(
-                    prms=msg_data
-                )
-                msg_size = msg.ByteSize()
-                if msg_size > grpc_message_max_size:
-                    msg_order = list()
-                    one_msg = (
-                        inventory_data_pb2.ResponseGetAllRawPRMDataByTPRMId()
-                    )
-                    for item in msg_data:
-                        one_msg.prms.append(item)
-                        if one_msg.ByteSize() > grpc_message_max_size:
-                            last_one = one_msg.prms.pop()
-                            msg_order.append(one_msg)
-                            one_msg = inventory_data_pb2.ResponseGetAllRawPRMDataByTPRMId()
-                            one_msg.prms.append(last_one)
-
-                    if len(one_msg.prms) > 0:
-                        msg_order.append(one_msg)
-
-                    for msg in msg_order:
-                        yield msg
-                else:
-                    yield msg
+                yield from chunker.iter_messages(msg_data)
 
+    @db_executor.stream(heavy=True)
     def GetFilteredObjSpecialExperimental(self, request, context):
         """Returns ResponseMOdataOrMOIds."""
         CHUNK_SIZE = 100
@@ -1386,13 +1414,13 @@ class Informer(inventory_data_pb2_grpc.InformerServicer):
                 )
                 yield response
 
-    async def GetAllMOByTMOIdWithSpecialParameters(
+    @db_executor.stream(heavy=True)
+    def GetAllMOByTMOIdWithSpecialParameters(
         self,
         request: inventory_data_pb2.MOWithSpecialParametersRequest,
         context: grpc.aio.ServicerContext,
     ) -> inventory_data_pb2.MOWithSpecialParametersResponse:
         """Returns MOWithSpecialParametersResponse."""
-        grpc_message_max_size = 4100000
         if not request.tmo_id:
             msg = inventory_data_pb2.MOWithSpecialParametersResponse(
                 mos_with_params=[]
@@ -1400,6 +1428,10 @@ class Informer(inventory_data_pb2_grpc.InformerServicer):
             yield msg
             return
 
+        chunker = MessageChunker(
+            message_class=inventory_data_pb2.MOWithSpecialParametersResponse,
+            field_name="mos_with_params",
+        )
         with Session(engine) as session:
             init_data = {"session": session, "tmo_id": request.tmo_id}
             if request.tprm_ids:
@@ -1408,31 +1440,9 @@ class Informer(inventory_data_pb2_grpc.InformerServicer):
                 **init_data
             )
             for data in process_of_getting_data.get_result_generator():
-                msg = inventory_data_pb2.MOWithSpecialParametersResponse(
-                    mos_with_params=data
-                )
-                msg_size = msg.ByteSize()
-                if msg_size > grpc_message_max_size:
-                    msg_order = list()
-                    one_msg = (
-                        inventory_data_pb2.MOWithSpecialParametersResponse()
-                    )
-                    for item in data:
-                        one_msg.mos_with_params.append(item)
-
-                        if one_msg.ByteSize() > grpc_message_max_size:
-                            last_one = one_msg.mos_with_params.pop()
-                            msg_order.append(one_msg)
-                            one_msg = inventory_data_pb2.MOWithSpecialParametersResponse()
-                            one_msg.mos_with_params.append(last_one)
-
-                    if len(one_msg.mos_with_params) > 0:
-                        msg_order.append(one_msg)
-                    for msg in msg_order:
-                        yield msg
-                else:
-                    yield msg
+                yield from chunker.iter_messages(data)
 
+    @db_executor.unary()
     def GetMOsNamesByIds(
         self,
         request: inventory_data_pb2.RequestGetMOsNamesByIds,
@@ -1446,7 +1456,15 @@ class Informer(inventory_data_pb2_grpc.InformerServicer):
         return inventory_data_pb2.ResponseGetMOsNamesByIds(mo_names=result)
 
 
-async def start_grpc_serve() -> None:
+def add_servicers(server: grpc.aio.Server, servicers: list[tuple]) -> None:
+    for add_servicer_to_server, servicer in servicers:
+        add_servicer_to_server(servicer, server)
+
+
+def create_server(
+    compression: grpc.Compression,
+    maximum_concurrent_rpcs: int,
+) -> grpc.aio.Server:
     # Keepalive options for server https://github.com/grpc/grpc/blob/master/examples/python/keep_alive/greeter_server.py
     server_options = [
         ("grpc.keepalive_time_ms", 20_000),
@@ -1457,41 +1475,86 @@ async def start_grpc_serve() -> None:
         ("grpc.max_connection_age_grace_ms", 5_000),
         ("grpc.http2.max_pings_without_data", 0),
         ("grpc.keepalive_permit_without_calls", 1),
+        ("grpc.max_send_message_length", GRPC_MAX_SEND_MESSAGE_SIZE),
+        ("grpc.max_receive_message_length", GRPC_MAX_RECEIVE_MESSAGE_SIZE),
     ]
-    port = 50051
-    listen_addr = "[::]:" + str(port)
-
-    server = grpc.aio.server(options=server_options)
-    transfer_pb2_grpc.add_TransferServicer_to_server(
-        transfer_inventory.Transfer(), server
-    )
-    inventory_data_pb2_grpc.add_InformerServicer_to_server(Informer(), server)
-    airflow_manager_pb2_grpc.add_AirflowManagerServicer_to_server(
-        AirflowManager(), server
-    )
-    dataview_to_inventory_pb2_grpc.add_DataviewToInventoryServicer_to_server(
-        DataviewToInventoryManager(), server
-    )
-    zeebe_to_inventory_pb2_grpc.add_ZeebeInformerServicer_to_server(
-        ZeebeInformer(engine=engine), server
-    )
-    graph_pb2_grpc.add_GraphInformerServicer_to_server(
-        GraphInformer(engine=engine), server
-    )
-    security_manager_pb2_grpc.add_SecurityManagerInformerServicer_to_server(
-        SecurityManagerInformer(engine=engine), server
+    interceptor = CompressionInterceptor(
+        streaming_compression=get_compression(GRPC_BULK_COMPRESSION),
+        method_compression=parse_method_compression(GRPC_METHOD_COMPRESSION),
     )
-    tasks_inventory_pb2_grpc.add_TasksInventoryServicer_to_server(
-        TasksInventoryManager(), server
-    )
-    event_manager_pb2_grpc.add_EventManagerInformerServicer_to_server(
-        EventManagerManager(), server
+    return grpc.aio.server(
+        options=server_options,
+        compression=compression,
+        interceptors=[interceptor],
+        maximum_concurrent_rpcs=maximum_concurrent_rpcs or None,
     )
 
+
+async def start_grpc_serve() -> None:
+    servicers = [
+        (
+            transfer_pb2_grpc.add_TransferServicer_to_server,
+            transfer_inventory.Transfer(),
+        ),
+        (inventory_data_pb2_grpc.add_InformerServicer_to_server, Informer()),
+        (
+            airflow_manager_pb2_grpc.add_AirflowManagerServicer_to_server,
+            AirflowManager(),
+        ),
+        (
+            dataview_to_inventory_pb2_grpc.add_DataviewToInventoryServicer_to_server,
+            DataviewToInventoryManager(),
+        ),
+        (
+            zeebe_to_inventory_pb2_grpc.add_ZeebeInformerServicer_to_server,
+            ZeebeInformer(engine=engine),
+        ),
+        (
+            graph_pb2_grpc.add_GraphInformerServicer_to_server,
+            GraphInformer(engine=engine),
+        ),
+        (
+            security_manager_pb2_grpc.add_SecurityManagerInformerServicer_to_server,
+            SecurityManagerInformer(engine=engine),
+        ),
+        (
+            tasks_inventory_pb2_grpc.add_TasksInventoryServicer_to_server,
+            TasksInventoryManager(),
+        ),
+        (
+            event_manager_pb2_grpc.add_EventManagerInformerServicer_to_server,
+            EventManagerManager(),
+        ),
+    ]
+
+    server = create_server(
+        compression=get_compression(GRPC_COMPRESSION),
+        maximum_concurrent_rpcs=GRPC_MAX_CONCURRENT_RPCS,
+    )
+    add_servicers(server=server, servicers=servicers)
+    listen_addr = "[::]:" + str(GRPC_PORT)
     server.add_insecure_port(listen_addr)
+    servers = [server]
+
+    if GRPC_BULK_PORT:
+        # the same servicers, all responses are compressed and calls are
+        # limited separately from interactive lookups
+        bulk_server = create_server(
+            compression=get_compression(GRPC_BULK_COMPRESSION),
+            maximum_concurrent_rpcs=GRPC_BULK_MAX_CONCURRENT_RPCS,
+        )
+        add_servicers(server=bulk_server, servicers=servicers)
+        bulk_server.add_insecure_port("[::]:" + str(GRPC_BULK_PORT))
+        servers.append(bulk_server)
+
     logging.info("Starting server on %s", listen_addr)
-    await server.start()
-    await server.wait_for_termination()
+    if GRPC_BULK_PORT:
+        logging.info("Starting bulk server on port %s", GRPC_BULK_PORT)
+    for grpc_server in servers:
+        await grpc_server.start()
+    await asyncio.gather(
+        *(grpc_server.wait_for_termination() for grpc_server in servers)
+    )
 
 
 if __name__ == "__main__":
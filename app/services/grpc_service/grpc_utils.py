@@ -2,7 +2,7 @@ import base64
 import io
 import math
 import pickle
-from typing import Generator
+from typing import Generator, Iterator
 from typing import List, Iterable
 
 import pandas as pd
@@ -300,15 +300,12 @@ def batch_export(session: Session, tmo_id: int, file_type: str):
 
 
 class GetAllMOWithParamsByTMOId:
-    MAX_COUNT_OF_TPRMS_IN_STEP = 300
     MO_COUNT_PER_QUERY = 15_000  # 30_000
 
     def __init__(self, session: Session, tmo_id: int):
         self.session = session
         self.tmo_id = tmo_id
         self._tprm_cache = None
-        self._list_of_tprms_per_step = None
-        self._list_of_statements = None
 
     @property
     def tmo_id(self):
@@ -318,15 +315,6 @@ class GetAllMOWithParamsByTMOId:
     def tmo_id(self, value: int):
         self._tmo_id = value
 
-    def __load_necessary_data(self):
-        # get tprm cache
-        self._tprm_cache = self.get_all_tprms_cache()
-
-        # find list of tprms per step
-        self._list_of_tprms_per_step = self.get_list_of_tprms_per_step()
-        # get list of statements
-        self._list_of_statements = self.get_list_of_statements()
-
     def get_all_tprms_cache(self):
         """Return dict with str(tprm.id) as key and tprm data as value"""
         stmt = select(TPRM).where(TPRM.tmo_id == self.tmo_id)
@@ -341,86 +329,6 @@ class GetAllMOWithParamsByTMOId:
         }
         return tprms_cache
 
-    def get_list_of_tprms_per_step(self) -> List[List[str]]:
-        """Returns list of lists with tprms ids as str type."""
-        count_of_steps = math.ceil(
-            len(self._tprm_cache.keys()) / self.MAX_COUNT_OF_TPRMS_IN_STEP
-        )
-
-        tprm_ids_as_str = list(self._tprm_cache.keys())
-        list_of_tprms_per_step = []
-        for step_number in range(count_of_steps):
-            start = step_number * self.MAX_COUNT_OF_TPRMS_IN_STEP
-            end = start + self.MAX_COUNT_OF_TPRMS_IN_STEP
-            step = tprm_ids_as_str[start:end]
-            if step:
-                list_of_tprms_per_step.append(tprm_ids_as_str[start:end])
-        return list_of_tprms_per_step
-
-    def get_list_of_statements(self):
-        """Returns lists of query statements"""
-        list_of_statements = []
-        if not self._tprm_cache:
-            stmt = select(MO).where(MO.tmo_id == self.tmo_id)
-            list_of_statements.append(stmt)
-        else:
-            for tprms_in_one_step in self._list_of_tprms_per_step:
-                if tprms_in_one_step:
-                    stmt = select(MO).where(MO.tmo_id == self.tmo_id)
-                    for tprm_id_as_str in tprms_in_one_step:
-                        label_name = tprm_id_as_str
-                        data = self._tprm_cache[tprm_id_as_str]
-                        select_stmt = select(
-                            PRM.mo_id, PRM.value.label(label_name)
-                        ).where(PRM.tprm_id == data["tprm_id"])
-                        aliased_table = aliased(select_stmt.subquery())
-                        stmt = stmt.join(
-                            aliased_table,
-                            MO.id == aliased_table.c.mo_id,
-                            isouter=True,
-                        ).add_columns(
-                            getattr(aliased_table.c, label_name, None)
-                        )
-                    list_of_statements.append(stmt)
-
-        return list_of_statements
-
-    @staticmethod
-    def get_set_of_item_params(item: RowMapping) -> set[str]:
-        """Returns set of params ids as set of str"""
-        tprms_keys = set(item.keys())
-        tprms_keys.remove("MO")
-        return tprms_keys
-
-    def get_params_as_dict_from_row_item(
-        self, item: RowMapping, params_ids_as_str: Iterable[str]
-    ) -> List[dict]:
-        """Returns dict of params ids as keys and their converter by type values for particular item"""
-        params = []
-        for tprm_key in params_ids_as_str:
-            # tprm_value = getattr(item, tprm_key, None)
-            tprm_value = item.get(tprm_key, None)
-
-            if tprm_value is None:
-                continue
-
-            # check on empty string
-            tprm_data = self._tprm_cache.get(tprm_key)
-            if not tprm_data:
-                continue
-            if not tprm_value and tprm_data["val_type"] != "str":
-                continue
-            params.append(
-                {
-                    "tprm_id": tprm_key,
-                    "value": self.get_tprm_value(
-                        tprm_value, tprm_data["val_type"], tprm_data["multiple"]
-                    ),
-                }
-            )
-
-        return params
-
     @staticmethod
     def get_tprm_value(tprm_value: str, tprm_val_type: str, tprm_multiple):
         if tprm_multiple:
@@ -432,155 +340,131 @@ class GetAllMOWithParamsByTMOId:
             else:
                 return tprm_value
 
-    def get_result_generator(self, replace_links: bool = False) -> Generator:
-        self.__load_necessary_data()
-
-        # get_all_mo_ids
-        stmt = select(MO.id).where(MO.tmo_id == self.tmo_id)
-        all_mo_ids = self.session.execute(stmt).scalars().all()
-        print(f"all_mo_len: {len(all_mo_ids)}")
-        count_of_steps = math.ceil(len(all_mo_ids) / self.MO_COUNT_PER_QUERY)
-
-        for step in range(count_of_steps):
-            start = step * self.MO_COUNT_PER_QUERY
-            end = start + self.MO_COUNT_PER_QUERY
-            mo_ids_for_step = all_mo_ids[start:end]
-
-            step_data = []
+    def _get_names_by_mo_ids(self, mo_ids: set[int]) -> dict[int, str]:
+        if not mo_ids:
+            return {}
+        stmt = select(MO.id, MO.name).where(MO.id.in_(mo_ids))
+        return dict(self.session.execute(stmt).all())
+
+    def _get_values_by_prm_ids(self, prm_ids: set[int]) -> dict[int, str]:
+        if not prm_ids:
+            return {}
+        stmt = select(PRM.id, PRM.value).where(PRM.id.in_(prm_ids))
+        return dict(self.session.execute(stmt).all())
+
+    def _replace_links_in_chunk(self, objects: list[dict]) -> None:
+        """Replaces ids in values of mo_link parameters by names of objects
+        and in values of prm_link parameters by values of parameters, one
+        query per link type for the chunk"""
+        links = {"mo_link": [], "prm_link": []}
+        for item in objects:
+            for param in item["params"]:
+                val_type = self._tprm_cache[param["tprm_id"]]["val_type"]
+                if val_type in links:
+                    links[val_type].append(param)
+
+        get_values_by_val_type = {
+            "mo_link": self._get_names_by_mo_ids,
+            "prm_link": self._get_values_by_prm_ids,
+        }
+        for val_type, params in links.items():
+            link_ids = set()
+            for param in params:
+                values = param["value"]
+                if not isinstance(values, list):
+                    values = [values]
+                link_ids.update(v for v in values if isinstance(v, int))
+            link_values = get_values_by_val_type[val_type](link_ids)
+            for param in params:
+                # ids of deleted objects and parameters are kept
+                if isinstance(param["value"], list):
+                    param["value"] = [
+                        link_values.get(value, value)
+                        for value in param["value"]
+                    ]
+                else:
+                    param["value"] = link_values.get(
+                        param["value"], param["value"]
+                    )
 
-            select_statement = select(
-                MO.id.label("id"), MO.name.label("parent_name")
-            )
-            aliased_table = aliased(select_statement.subquery())
+    def _get_param(self, tprm_id: int, value: str) -> dict | None:
+        tprm_key = str(tprm_id)
+        tprm_data = self._tprm_cache.get(tprm_key)
+        # check on empty string
+        if not tprm_data or (not value and tprm_data["val_type"] != "str"):
+            return None
+        return {
+            "tprm_id": tprm_key,
+            "value": self.get_tprm_value(
+                value, tprm_data["val_type"], tprm_data["multiple"]
+            ),
+        }
 
-            stmt_point_a = select(
-                MO.id.label("id"), MO.name.label("point_a_name")
-            )
-            al_table_point_a = aliased(stmt_point_a.subquery())
+    def iter_results(self, replace_links: bool = False) -> Iterator[list]:
+        """Yields lists of objects with parameters in order of id.
 
-            stmt_point_b = select(
-                MO.id.label("id"), MO.name.label("point_b_name")
-            )
-            al_table_point_b = aliased(stmt_point_b.subquery())
+        Objects and their parameters are read by two server-side cursors
+        ordered by object id and merged by mo_id, so each object is read
+        once whatever the number of TPRMs. Names of parents and points (and
+        link values) are read by one query per chunk of objects."""
+        self._tprm_cache = self.get_all_tprms_cache()
+        chunk_size = self.MO_COUNT_PER_QUERY
 
-            for stmt in self._list_of_statements:
-                exec_stmt = (
-                    stmt.where(MO.id.in_(mo_ids_for_step))
-                    .outerjoin(aliased_table, MO.p_id == aliased_table.c.id)
-                    .outerjoin(
-                        al_table_point_a, MO.point_a_id == al_table_point_a.c.id
-                    )
-                    .outerjoin(
-                        al_table_point_b, MO.point_b_id == al_table_point_b.c.id
-                    )
-                    .add_columns(
-                        aliased_table.c.parent_name,
-                        al_table_point_a.c.point_a_name,
-                        al_table_point_b.c.point_b_name,
+        mo_stmt = (
+            select(*MO.__table__.columns)
+            .where(MO.tmo_id == self.tmo_id)
+            .order_by(MO.id)
+            .execution_options(yield_per=chunk_size)
+        )
+        prm_stmt = (
+            select(PRM.mo_id, PRM.tprm_id, PRM.value)
+            .join(MO, MO.id == PRM.mo_id)
+            .where(MO.tmo_id == self.tmo_id)
+            .order_by(MO.id, PRM.tprm_id)
+            .execution_options(yield_per=chunk_size)
+        )
+        mo_chunks = self.session.execute(mo_stmt).partitions(chunk_size)
+        prm_rows = iter(
+            self.session.execute(prm_stmt) if self._tprm_cache else ()
+        )
+        prm_row = next(prm_rows, None)
+
+        for mo_rows in mo_chunks:
+            objects = {}
+            related_mo_ids = set()
+            for mo_row in mo_rows:
+                item = mo_row._asdict()
+                item["params"] = []
+                objects[item["id"]] = item
+                related_mo_ids.update(
+                    mo_id
+                    for mo_id in (
+                        item["p_id"],
+                        item["point_a_id"],
+                        item["point_b_id"],
                     )
+                    if mo_id is not None
                 )
-                res = [
-                    item._asdict()
-                    for item in self.session.execute(exec_stmt).fetchall()
-                ]
-
-                if res:
-                    step_data.append(res)
-
-            if len(step_data) > 0:
-                base_objects_tprms = self.get_set_of_item_params(
-                    step_data[0][0]
-                )
-                base_objects_data = dict()
-
-                for mo_data_row in step_data[0]:
-                    mo_as_dict = mo_data_row["MO"].dict()
-                    mo_as_dict["parent_name"] = mo_data_row.get("parent_name")
-                    mo_as_dict["point_a_name"] = mo_data_row.get("point_a_name")
-                    mo_as_dict["point_b_name"] = mo_data_row.get("point_b_name")
-                    if replace_links:
-                        mo_data_row = self.replace_mo_links_in_data_row(
-                            base_objects_tprms, mo_data_row
-                        )
-                        mo_data_row = self.replace_prm_links_in_data_row(
-                            base_objects_tprms, mo_data_row
-                        )
-                    mo_as_dict["params"] = (
-                        self.get_params_as_dict_from_row_item(
-                            item=mo_data_row,
-                            params_ids_as_str=base_objects_tprms,
-                        )
-                    )
-
-                    base_objects_data[mo_data_row["MO"].id] = mo_as_dict
 
-                for mo_data_rows in step_data[1:]:
-                    objects_tprms = self.get_set_of_item_params(mo_data_rows[0])
-
-                    for mo_data_row in mo_data_rows:
-                        mo_from_base = base_objects_data.get(
-                            mo_data_row["MO"].id
-                        )
-                        if mo_from_base:
-                            if replace_links:
-                                mo_data_row = self.replace_mo_links_in_data_row(
-                                    base_objects_tprms, mo_data_row
-                                )
-                                # mo_data_row = self.replace_prm_links_in_data_row(base_objects_tprms, mo_data_row)
-                            params = self.get_params_as_dict_from_row_item(
-                                item=mo_data_row,
-                                params_ids_as_str=objects_tprms,
-                            )
-                            mo_from_base["params"].extend(params)
-
-                base_objects_data = [
-                    pickle.dumps(item).hex()
-                    for item in base_objects_data.values()
-                ]
-                print(f"yielding {len(base_objects_data)} objects")
-                yield base_objects_data
-
-    def replace_mo_links_in_data_row(
-        self, tprms: list | set, mo_data_row: dict
-    ):
-        links = []
-        for tprm in tprms:
-            if self._tprm_cache.get(tprm):
-                if self._tprm_cache.get(tprm).get("val_type") == "mo_link":
-                    links.append(tprm)
-        link_values = [
-            int(mo_data_row[link])
-            for link in links
-            if mo_data_row.get(link) is not None
-        ]
-        query = select(MO.id, MO.name).where(MO.id.in_(link_values))
-        link_values = self.session.execute(query)
-        link_values = {str(lv[0]): lv[1] for lv in link_values}
-        for k in mo_data_row.keys():
-            if k in links and mo_data_row[k]:
-                mo_data_row[k] = link_values[mo_data_row[k]]
-        return mo_data_row
-
-    def replace_prm_links_in_data_row(
-        self, tprms: list | set, mo_data_row: dict
-    ):
-        links = []
-        for tprm in tprms:
-            if self._tprm_cache.get(tprm):
-                if self._tprm_cache.get(tprm).get("val_type") == "prm_link":
-                    links.append(tprm)
-        link_values = [
-            mo_data_row[link]
-            for link in links
-            if mo_data_row.get(link) is not None
-        ]
-        query = select(PRM.id, PRM.value).where(PRM.id.in_(link_values))
-        link_values = self.session.execute(query)
-        link_values = {str(lv[0]): lv[1] for lv in link_values}
-        for k in mo_data_row.keys():
-            if k in links and mo_data_row[k]:
-                mo_data_row[k] = link_values[mo_data_row[k]]
-        return mo_data_row
+            last_mo_id = mo_rows[-1].id
+            while prm_row is not None and prm_row.mo_id <= last_mo_id:
+                item = objects.get(prm_row.mo_id)
+                if item is not None and prm_row.value is not None:
+                    param = self._get_param(prm_row.tprm_id, prm_row.value)
+                    if param is not None:
+                        item["params"].append(param)
+                prm_row = next(prm_rows, None)
+
+            names = self._get_names_by_mo_ids(related_mo_ids)
+            for item in objects.values():
+                item["parent_name"] = names.get(item["p_id"])
+                item["point_a_name"] = names.get(item["point_a_id"])
+                item["point_b_name"] = names.get(item["point_b_id"])
+
+            result = list(objects.values())
+            if replace_links:
+                self._replace_links_in_chunk(result)
+            yield result
 
 
 class GetAllMOAttrsByTMOIdWithSpecialParameters:
@@ -0,0 +1,71 @@
+"""Packing of streamed elements into messages of limited size"""
+
+from typing import Iterable, Iterator
+
+from google.protobuf.descriptor import FieldDescriptor
+from google.protobuf.message import Message
+
+from config.grpc_config import GRPC_MESSAGE_MAX_SIZE
+
+
+def _varint_size(value: int) -> int:
+    return max(1, (value.bit_length() + 6) // 7)
+
+
+class MessageChunker:
+    """Packs elements of one repeated field into messages of at most
+    max_size bytes in one pass. Serialized size of every element is
+    computed once, element bigger than max_size is sent in own message."""
+
+    def __init__(
+        self,
+        message_class: type[Message],
+        field_name: str,
+        max_size: int = GRPC_MESSAGE_MAX_SIZE,
+    ):
+        field = message_class.DESCRIPTOR.fields_by_name[field_name]
+        if field.type not in (
+            FieldDescriptor.TYPE_MESSAGE,
+            FieldDescriptor.TYPE_STRING,
+            FieldDescriptor.TYPE_BYTES,
+        ):
+            raise ValueError(
+                f"Field {field_name} of {message_class.__name__} "
+                f"is not a repeated message, string or bytes field"
+            )
+        self._message_class = message_class
+        self._field_name = field_name
+        self._is_message = field.type == FieldDescriptor.TYPE_MESSAGE
+        self._tag_size = _varint_size(field.number << 3)
+        self.max_size = max_size
+
+    def element_size(self, element: Message | str | bytes) -> int:
+        """Returns number of bytes the element takes in the message"""
+        if self._is_message:
+            size = element.ByteSize()
+        elif isinstance(element, str) and not element.isascii():
+            size = len(element.encode("utf-8"))
+        else:
+            size = len(element)
+        return self._tag_size + _varint_size(size) + size
+
+    def iter_messages(
+        self, elements: Iterable, send_empty: bool = False
+    ) -> Iterator[Message]:
+        """Yields messages with elements in the same order. If send_empty
+        is True, one empty message is yielded for no elements"""
+        chunk = []
+        chunk_size = 0
+        is_sent = False
+        for element in elements:
+            size = self.element_size(element)
+            if chunk and chunk_size + size > self.max_size:
+                yield self._message_class(**{self._field_name: chunk})
+                is_sent = True
+                chunk = []
+                chunk_size = 0
+            chunk.append(element)
+            chunk_size += size
+
+        if chunk or (send_empty and not is_sent):
+            yield self._message_class(**{self._field_name: chunk})
@@ -11,19 +11,27 @@ from google.protobuf import symbol_database as _symbol_database
 _sym_db = _symbol_database.Default()
 
 
+from google.protobuf import struct_pb2 as google_dot_protobuf_dot_struct__pb2
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1b\x64\x61taview_to_inventory.proto\x12\x15\x64\x61taview_to_inventory\"Z\n\x1aGetMOByTMOIdForViewRequest\x12\x0e\n\x06tmo_id\x18\x01 \x01(\x05\x12\x1a\n\rreplace_links\x18\x02 \x01(\x08H\x00\x88\x01\x01\x42\x10\n\x0e_replace_links\"6\n\x1bGetMOByTMOIdForViewResponse\x12\x17\n\x0fmos_with_params\x18\x01 \x03(\t2\x98\x01\n\x13\x44\x61taviewToInventory\x12\x80\x01\n\x13GetMOByTMOIdForView\x12\x31.dataview_to_inventory.GetMOByTMOIdForViewRequest\x1a\x32.dataview_to_inventory.GetMOByTMOIdForViewResponse\"\x00\x30\x01\x62\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1b\x64\x61taview_to_inventory.proto\x12\x15\x64\x61taview_to_inventory\x1a\x1cgoogle/protobuf/struct.proto\x1a\x1fgoogle/protobuf/timestamp.proto\"Z\n\x1aGetMOByTMOIdForViewRequest\x12\x0e\n\x06tmo_id\x18\x01 \x01(\x05\x12\x1a\n\rreplace_links\x18\x02 \x01(\x08H\x00\x88\x01\x01\x42\x10\n\x0e_replace_links\"6\n\x1bGetMOByTMOIdForViewResponse\x12\x17\n\x0fmos_with_params\x18\x01 \x03(\t\"i\n\x03PRM\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0f\n\x07tprm_id\x18\x02 \x01(\x05\x12\r\n\x05mo_id\x18\x03 \x01(\x05\x12\x0f\n\x07version\x18\x04 \x01(\x05\x12%\n\x05value\x18\x05 \x01(\x0b\x32\x16.google.protobuf.Value\"\xd3\x06\n\x02MO\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x11\n\x04name\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x12\n\x05label\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x0e\n\x06tmo_id\x18\x04 \x01(\x05\x12\x11\n\x04p_id\x18\x05 \x01(\x05H\x02\x88\x01\x01\x12\x17\n\npoint_a_id\x18\x06 \x01(\x05H\x03\x88\x01\x01\x12\x17\n\npoint_b_id\x18\x07 \x01(\x05H\x04\x88\x01\x01\x12\x12\n\x05model\x18\x08 \x01(\tH\x05\x88\x01\x01\x12\x18\n\x0b\x64\x65scription\x18\t \x01(\tH\x06\x88\x01\x01\x12\x13\n\x06\x61\x63tive\x18\n \x01(\x08H\x07\x88\x01\x01\x12\x15\n\x08latitude\x18\x0b \x01(\x01H\x08\x88\x01\x01\x12\x16\n\tlongitude\x18\x0c \x01(\x01H\t\x88\x01\x01\x12\x13\n\x06status\x18\r \x01(\tH\n\x88\x01\x01\x12\x14\n\x07version\x18\x0e \x01(\x05H\x0b\x88\x01\x01\x12\x1b\n\x0e\x64ocument_count\x18\x0f \x01(\x05H\x0c\x88\x01\x01\x12$\n\x03pov\x18\x10 \x01(\x0b\x32\x17.google.protobuf.Struct\x12)\n\x08geometry\x18\x11 \x01(\x0b\x32\x17.google.protobuf.Struct\x12\x31\n\rcreation_date\x18\x12 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x35\n\x11modification_date\x18\x13 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x18\n\x0bparent_name\x18\x14 \x01(\tH\r\x88\x01\x01\x12\x19\n\x0cpoint_a_name\x18\x15 \x01(\tH\x0e\x88\x01\x01\x12\x19\n\x0cpoint_b_name\x18\x16 \x01(\tH\x0f\x88\x01\x01\x12*\n\x06params\x18\x17 \x03(\x0b\x32\x1a.dataview_to_inventory.PRMB\x07\n\x05_nameB\x08\n\x06_labelB\x07\n\x05_p_idB\r\n\x0b_point_a_idB\r\n\x0b_point_b_idB\x08\n\x06_modelB\x0e\n\x0c_descriptionB\t\n\x07_activeB\x0b\n\t_latitudeB\x0c\n\n_longitudeB\t\n\x07_statusB\n\n\x08_versionB\x11\n\x0f_document_countB\x0e\n\x0c_parent_nameB\x0f\n\r_point_a_nameB\x0f\n\r_point_b_name\"S\n\x1dGetMOByTMOIdForViewResponseV2\x12\x32\n\x0fmos_with_params\x18\x01 \x03(\x0b\x32\x19.dataview_to_inventory.MO2\x9f\x02\n\x13\x44\x61taviewToInventory\x12\x80\x01\n\x13GetMOByTMOIdForView\x12\x31.dataview_to_inventory.GetMOByTMOIdForViewRequest\x1a\x32.dataview_to_inventory.GetMOByTMOIdForViewResponse\"\x00\x30\x01\x12\x84\x01\n\x15GetMOByTMOIdForViewV2\x12\x31.dataview_to_inventory.GetMOByTMOIdForViewRequest\x1a\x34.dataview_to_inventory.GetMOByTMOIdForViewResponseV2\"\x00\x30\x01\x62\x06proto3')
 
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'dataview_to_inventory_pb2', globals())
 if _descriptor._USE_C_DESCRIPTORS == False:
 
   DESCRIPTOR._options = None
-  _GETMOBYTMOIDFORVIEWREQUEST._serialized_start=54
-  _GETMOBYTMOIDFORVIEWREQUEST._serialized_end=144
-  _GETMOBYTMOIDFORVIEWRESPONSE._serialized_start=146
-  _GETMOBYTMOIDFORVIEWRESPONSE._serialized_end=200
-  _DATAVIEWTOINVENTORY._serialized_start=203
-  _DATAVIEWTOINVENTORY._serialized_end=355
+  _GETMOBYTMOIDFORVIEWREQUEST._serialized_start=117
+  _GETMOBYTMOIDFORVIEWREQUEST._serialized_end=207
+  _GETMOBYTMOIDFORVIEWRESPONSE._serialized_start=209
+  _GETMOBYTMOIDFORVIEWRESPONSE._serialized_end=263
+  _PRM._serialized_start=265
+  _PRM._serialized_end=370
+  _MO._serialized_start=373
+  _MO._serialized_end=1224
+  _GETMOBYTMOIDFORVIEWRESPONSEV2._serialized_start=1226
+  _GETMOBYTMOIDFORVIEWRESPONSEV2._serialized_end=1309
+  _DATAVIEWTOINVENTORY._serialized_start=1312
+  _DATAVIEWTOINVENTORY._serialized_end=1599
 # @@protoc_insertion_point(module_scope)
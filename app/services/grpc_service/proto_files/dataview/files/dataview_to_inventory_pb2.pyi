@@ -1,7 +1,9 @@
+from google.protobuf import struct_pb2 as _struct_pb2
+from google.protobuf import timestamp_pb2 as _timestamp_pb2
 from google.protobuf.internal import containers as _containers
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import message as _message
-from typing import ClassVar as _ClassVar, Iterable as _Iterable, Optional as _Optional
+from typing import ClassVar as _ClassVar, Iterable as _Iterable, Mapping as _Mapping, Optional as _Optional, Union as _Union
 
 DESCRIPTOR: _descriptor.FileDescriptor
 
@@ -18,3 +20,73 @@ class GetMOByTMOIdForViewResponse(_message.Message):
     MOS_WITH_PARAMS_FIELD_NUMBER: _ClassVar[int]
     mos_with_params: _containers.RepeatedScalarFieldContainer[str]
     def __init__(self, mos_with_params: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class GetMOByTMOIdForViewResponseV2(_message.Message):
+    __slots__ = ["mos_with_params"]
+    MOS_WITH_PARAMS_FIELD_NUMBER: _ClassVar[int]
+    mos_with_params: _containers.RepeatedCompositeFieldContainer[MO]
+    def __init__(self, mos_with_params: _Optional[_Iterable[_Union[MO, _Mapping]]] = ...) -> None: ...
+
+class MO(_message.Message):
+    __slots__ = ["active", "creation_date", "description", "document_count", "geometry", "id", "label", "latitude", "longitude", "model", "modification_date", "name", "p_id", "params", "parent_name", "point_a_id", "point_a_name", "point_b_id", "point_b_name", "pov", "status", "tmo_id", "version"]
+    ACTIVE_FIELD_NUMBER: _ClassVar[int]
+    CREATION_DATE_FIELD_NUMBER: _ClassVar[int]
+    DESCRIPTION_FIELD_NUMBER: _ClassVar[int]
+    DOCUMENT_COUNT_FIELD_NUMBER: _ClassVar[int]
+    GEOMETRY_FIELD_NUMBER: _ClassVar[int]
+    ID_FIELD_NUMBER: _ClassVar[int]
+    LABEL_FIELD_NUMBER: _ClassVar[int]
+    LATITUDE_FIELD_NUMBER: _ClassVar[int]
+    LONGITUDE_FIELD_NUMBER: _ClassVar[int]
+    MODEL_FIELD_NUMBER: _ClassVar[int]
+    MODIFICATION_DATE_FIELD_NUMBER: _ClassVar[int]
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    PARAMS_FIELD_NUMBER: _ClassVar[int]
+    PARENT_NAME_FIELD_NUMBER: _ClassVar[int]
+    POINT_A_ID_FIELD_NUMBER: _ClassVar[int]
+    POINT_A_NAME_FIELD_NUMBER: _ClassVar[int]
+    POINT_B_ID_FIELD_NUMBER: _ClassVar[int]
+    POINT_B_NAME_FIELD_NUMBER: _ClassVar[int]
+    POV_FIELD_NUMBER: _ClassVar[int]
+    P_ID_FIELD_NUMBER: _ClassVar[int]
+    STATUS_FIELD_NUMBER: _ClassVar[int]
+    TMO_ID_FIELD_NUMBER: _ClassVar[int]
+    VERSION_FIELD_NUMBER: _ClassVar[int]
+    active: bool
+    creation_date: _timestamp_pb2.Timestamp
+    description: str
+    document_count: int
+    geometry: _struct_pb2.Struct
+    id: int
+    label: str
+    latitude: float
+    longitude: float
+    model: str
+    modification_date: _timestamp_pb2.Timestamp
+    name: str
+    p_id: int
+    params: _containers.RepeatedCompositeFieldContainer[PRM]
+    parent_name: str
+    point_a_id: int
+    point_a_name: str
+    point_b_id: int
+    point_b_name: str
+    pov: _struct_pb2.Struct
+    status: str
+    tmo_id: int
+    version: int
+    def __init__(self, id: _Optional[int] = ..., name: _Optional[str] = ..., label: _Optional[str] = ..., tmo_id: _Optional[int] = ..., p_id: _Optional[int] = ..., point_a_id: _Optional[int] = ..., point_b_id: _Optional[int] = ..., model: _Optional[str] = ..., description: _Optional[str] = ..., active: bool = ..., latitude: _Optional[float] = ..., longitude: _Optional[float] = ..., status: _Optional[str] = ..., version: _Optional[int] = ..., document_count: _Optional[int] = ..., pov: _Optional[_Union[_struct_pb2.Struct, _Mapping]] = ..., geometry: _Optional[_Union[_struct_pb2.Struct, _Mapping]] = ..., creation_date: _Optional[_Union[_timestamp_pb2.Timestamp, _Mapping]] = ..., modification_date: _Optional[_Union[_timestamp_pb2.Timestamp, _Mapping]] = ..., parent_name: _Optional[str] = ..., point_a_name: _Optional[str] = ..., point_b_name: _Optional[str] = ..., params: _Optional[_Iterable[_Union[PRM, _Mapping]]] = ...) -> None: ...
+
+class PRM(_message.Message):
+    __slots__ = ["id", "mo_id", "tprm_id", "value", "version"]
+    ID_FIELD_NUMBER: _ClassVar[int]
+    MO_ID_FIELD_NUMBER: _ClassVar[int]
+    TPRM_ID_FIELD_NUMBER: _ClassVar[int]
+    VALUE_FIELD_NUMBER: _ClassVar[int]
+    VERSION_FIELD_NUMBER: _ClassVar[int]
+    id: int
+    mo_id: int
+    tprm_id: int
+    value: _struct_pb2.Value
+    version: int
+    def __init__(self, id: _Optional[int] = ..., tprm_id: _Optional[int] = ..., mo_id: _Optional[int] = ..., version: _Optional[int] = ..., value: _Optional[_Union[_struct_pb2.Value, _Mapping]] = ...) -> None: ...
@@ -19,6 +19,11 @@ class DataviewToInventoryStub(object):
                 request_serializer=dataview__to__inventory__pb2.GetMOByTMOIdForViewRequest.SerializeToString,
                 response_deserializer=dataview__to__inventory__pb2.GetMOByTMOIdForViewResponse.FromString,
                 )
+        self.GetMOByTMOIdForViewV2 = channel.unary_stream(
+                '/dataview_to_inventory.DataviewToInventory/GetMOByTMOIdForViewV2',
+                request_serializer=dataview__to__inventory__pb2.GetMOByTMOIdForViewRequest.SerializeToString,
+                response_deserializer=dataview__to__inventory__pb2.GetMOByTMOIdForViewResponseV2.FromString,
+                )
 
 
 class DataviewToInventoryServicer(object):
@@ -30,6 +35,13 @@ class DataviewToInventoryServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GetMOByTMOIdForViewV2(self, request, context):
+        """/ Typed variant of GetMOByTMOIdForView
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_DataviewToInventoryServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -38,6 +50,11 @@ def add_DataviewToInventoryServicer_to_server(servicer, server):
                     request_deserializer=dataview__to__inventory__pb2.GetMOByTMOIdForViewRequest.FromString,
                     response_serializer=dataview__to__inventory__pb2.GetMOByTMOIdForViewResponse.SerializeToString,
             ),
+            'GetMOByTMOIdForViewV2': grpc.unary_stream_rpc_method_handler(
+                    servicer.GetMOByTMOIdForViewV2,
+                    request_deserializer=dataview__to__inventory__pb2.GetMOByTMOIdForViewRequest.FromString,
+                    response_serializer=dataview__to__inventory__pb2.GetMOByTMOIdForViewResponseV2.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'dataview_to_inventory.DataviewToInventory', rpc_method_handlers)
@@ -64,3 +81,20 @@ class DataviewToInventory(object):
             dataview__to__inventory__pb2.GetMOByTMOIdForViewResponse.FromString,
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def GetMOByTMOIdForViewV2(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/dataview_to_inventory.DataviewToInventory/GetMOByTMOIdForViewV2',
+            dataview__to__inventory__pb2.GetMOByTMOIdForViewRequest.SerializeToString,
+            dataview__to__inventory__pb2.GetMOByTMOIdForViewResponseV2.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
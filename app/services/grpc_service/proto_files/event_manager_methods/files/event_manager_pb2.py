@@ -2,25 +2,37 @@
 # Generated by the protocol buffer compiler.  DO NOT EDIT!
 # source: event_manager.proto
 """Generated protocol buffer code."""
+from google.protobuf.internal import builder as _builder
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import descriptor_pool as _descriptor_pool
 from google.protobuf import symbol_database as _symbol_database
-from google.protobuf.internal import builder as _builder
 # @@protoc_insertion_point(imports)
 
 _sym_db = _symbol_database.Default()
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x13\x65vent_manager.proto\x1a\x19google/protobuf/any.proto\x1a\x1cgoogle/protobuf/struct.proto\x1a\x1fgoogle/protobuf/timestamp.proto\"D\n\x0fNewEventRequest\x12\x0c\n\x04type\x18\x01 \x01(\t\x12\x15\n\rinstance_name\x18\x02 \x01(\t\x12\x0c\n\x04\x64\x61ta\x18\x03 \x01(\t\"7\n\x10NewEventResponse\x12\x12\n\nis_success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t2M\n\x14\x45ventManagerInformer\x12\x35\n\x08NewEvent\x12\x10.NewEventRequest\x1a\x11.NewEventResponse\"\x00(\x01\x30\x01\x62\x06proto3')
 
-_globals = globals()
-_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
-_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'event_manager_pb2', _globals)
+from google.protobuf import any_pb2 as google_dot_protobuf_dot_any__pb2
+from google.protobuf import struct_pb2 as google_dot_protobuf_dot_struct__pb2
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x13\x65vent_manager.proto\x1a\x19google/protobuf/any.proto\x1a\x1cgoogle/protobuf/struct.proto\x1a\x1fgoogle/protobuf/timestamp.proto\"D\n\x0fNewEventRequest\x12\x0c\n\x04type\x18\x01 \x01(\t\x12\x15\n\rinstance_name\x18\x02 \x01(\t\x12\x0c\n\x04\x64\x61ta\x18\x03 \x01(\t\"7\n\x10NewEventResponse\x12\x12\n\nis_success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\"V\n\x13ReplayEventsRequest\x12\x16\n\x0e\x61\x66ter_event_id\x18\x01 \x01(\x03\x12\x13\n\x0b\x65vent_types\x18\x02 \x03(\t\x12\x12\n\nbatch_size\x18\x03 \x01(\x05\"\xc4\x01\n\rReplayedEvent\x12\n\n\x02id\x18\x01 \x01(\x03\x12\x0c\n\x04type\x18\x02 \x01(\t\x12\x15\n\rinstance_name\x18\x03 \x01(\t\x12\x12\n\nevent_type\x18\x04 \x01(\t\x12\x15\n\x08model_id\x18\x05 \x01(\x03H\x00\x88\x01\x01\x12\x0c\n\x04user\x18\x06 \x01(\t\x12.\n\nevent_time\x18\x07 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x0c\n\x04\x64\x61ta\x18\x08 \x01(\tB\x0b\n\t_model_id\"M\n\x14ReplayEventsResponse\x12\x1e\n\x06\x65vents\x18\x01 \x03(\x0b\x32\x0e.ReplayedEvent\x12\x15\n\rlast_event_id\x18\x02 \x01(\x03\x32\x8e\x01\n\x14\x45ventManagerInformer\x12\x35\n\x08NewEvent\x12\x10.NewEventRequest\x1a\x11.NewEventResponse\"\x00(\x01\x30\x01\x12?\n\x0cReplayEvents\x12\x14.ReplayEventsRequest\x1a\x15.ReplayEventsResponse\"\x00\x30\x01\x62\x06proto3')
+
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'event_manager_pb2', globals())
 if _descriptor._USE_C_DESCRIPTORS == False:
+
   DESCRIPTOR._options = None
-  _globals['_NEWEVENTREQUEST']._serialized_start=113
-  _globals['_NEWEVENTREQUEST']._serialized_end=181
-  _globals['_NEWEVENTRESPONSE']._serialized_start=183
-  _globals['_NEWEVENTRESPONSE']._serialized_end=238
-  _globals['_EVENTMANAGERINFORMER']._serialized_start=240
-  _globals['_EVENTMANAGERINFORMER']._serialized_end=317
+  _NEWEVENTREQUEST._serialized_start=113
+  _NEWEVENTREQUEST._serialized_end=181
+  _NEWEVENTRESPONSE._serialized_start=183
+  _NEWEVENTRESPONSE._serialized_end=238
+  _REPLAYEVENTSREQUEST._serialized_start=240
+  _REPLAYEVENTSREQUEST._serialized_end=326
+  _REPLAYEDEVENT._serialized_start=329
+  _REPLAYEDEVENT._serialized_end=525
+  _REPLAYEVENTSRESPONSE._serialized_start=527
+  _REPLAYEVENTSRESPONSE._serialized_end=604
+  _EVENTMANAGERINFORMER._serialized_start=607
+  _EVENTMANAGERINFORMER._serialized_end=749
 # @@protoc_insertion_point(module_scope)
@@ -1,18 +1,21 @@
-from typing import ClassVar as _ClassVar, Optional as _Optional
-
+from google.protobuf import any_pb2 as _any_pb2
+from google.protobuf import struct_pb2 as _struct_pb2
+from google.protobuf import timestamp_pb2 as _timestamp_pb2
+from google.protobuf.internal import containers as _containers
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import message as _message
+from typing import ClassVar as _ClassVar, Iterable as _Iterable, Mapping as _Mapping, Optional as _Optional, Union as _Union
 
 DESCRIPTOR: _descriptor.FileDescriptor
 
 class NewEventRequest(_message.Message):
-    __slots__ = ["type", "instance_name", "data"]
-    TYPE_FIELD_NUMBER: _ClassVar[int]
-    INSTANCE_NAME_FIELD_NUMBER: _ClassVar[int]
+    __slots__ = ["data", "instance_name", "type"]
     DATA_FIELD_NUMBER: _ClassVar[int]
-    type: str
-    instance_name: str
+    INSTANCE_NAME_FIELD_NUMBER: _ClassVar[int]
+    TYPE_FIELD_NUMBER: _ClassVar[int]
     data: str
+    instance_name: str
+    type: str
     def __init__(self, type: _Optional[str] = ..., instance_name: _Optional[str] = ..., data: _Optional[str] = ...) -> None: ...
 
 class NewEventResponse(_message.Message):
@@ -22,3 +25,41 @@ class NewEventResponse(_message.Message):
     is_success: bool
     message: str
     def __init__(self, is_success: bool = ..., message: _Optional[str] = ...) -> None: ...
+
+class ReplayEventsRequest(_message.Message):
+    __slots__ = ["after_event_id", "batch_size", "event_types"]
+    AFTER_EVENT_ID_FIELD_NUMBER: _ClassVar[int]
+    BATCH_SIZE_FIELD_NUMBER: _ClassVar[int]
+    EVENT_TYPES_FIELD_NUMBER: _ClassVar[int]
+    after_event_id: int
+    batch_size: int
+    event_types: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, after_event_id: _Optional[int] = ..., event_types: _Optional[_Iterable[str]] = ..., batch_size: _Optional[int] = ...) -> None: ...
+
+class ReplayEventsResponse(_message.Message):
+    __slots__ = ["events", "last_event_id"]
+    EVENTS_FIELD_NUMBER: _ClassVar[int]
+    LAST_EVENT_ID_FIELD_NUMBER: _ClassVar[int]
+    events: _containers.RepeatedCompositeFieldContainer[ReplayedEvent]
+    last_event_id: int
+    def __init__(self, events: _Optional[_Iterable[_Union[ReplayedEvent, _Mapping]]] = ..., last_event_id: _Optional[int] = ...) -> None: ...
+
+class ReplayedEvent(_message.Message):
+    __slots__ = ["data", "event_time", "event_type", "id", "instance_name", "model_id", "type", "user"]
+    DATA_FIELD_NUMBER: _ClassVar[int]
+    EVENT_TIME_FIELD_NUMBER: _ClassVar[int]
+    EVENT_TYPE_FIELD_NUMBER: _ClassVar[int]
+    ID_FIELD_NUMBER: _ClassVar[int]
+    INSTANCE_NAME_FIELD_NUMBER: _ClassVar[int]
+    MODEL_ID_FIELD_NUMBER: _ClassVar[int]
+    TYPE_FIELD_NUMBER: _ClassVar[int]
+    USER_FIELD_NUMBER: _ClassVar[int]
+    data: str
+    event_time: _timestamp_pb2.Timestamp
+    event_type: str
+    id: int
+    instance_name: str
+    model_id: int
+    type: str
+    user: str
+    def __init__(self, id: _Optional[int] = ..., type: _Optional[str] = ..., instance_name: _Optional[str] = ..., event_type: _Optional[str] = ..., model_id: _Optional[int] = ..., user: _Optional[str] = ..., event_time: _Optional[_Union[_timestamp_pb2.Timestamp, _Mapping]] = ..., data: _Optional[str] = ...) -> None: ...
@@ -19,6 +19,11 @@ class EventManagerInformerStub(object):
                 request_serializer=event__manager__pb2.NewEventRequest.SerializeToString,
                 response_deserializer=event__manager__pb2.NewEventResponse.FromString,
                 )
+        self.ReplayEvents = channel.unary_stream(
+                '/EventManagerInformer/ReplayEvents',
+                request_serializer=event__manager__pb2.ReplayEventsRequest.SerializeToString,
+                response_deserializer=event__manager__pb2.ReplayEventsResponse.FromString,
+                )
 
 
 class EventManagerInformerServicer(object):
@@ -30,6 +35,14 @@ class EventManagerInformerServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def ReplayEvents(self, request, context):
+        """Events of the history in order of id, starting after after_event_id.
+        Every response has last_event_id to resume the replay from
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_EventManagerInformerServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -38,6 +51,11 @@ def add_EventManagerInformerServicer_to_server(servicer, server):
                     request_deserializer=event__manager__pb2.NewEventRequest.FromString,
                     response_serializer=event__manager__pb2.NewEventResponse.SerializeToString,
             ),
+            'ReplayEvents': grpc.unary_stream_rpc_method_handler(
+                    servicer.ReplayEvents,
+                    request_deserializer=event__manager__pb2.ReplayEventsRequest.FromString,
+                    response_serializer=event__manager__pb2.ReplayEventsResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'EventManagerInformer', rpc_method_handlers)
@@ -64,3 +82,20 @@ class EventManagerInformer(object):
             event__manager__pb2.NewEventResponse.FromString,
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def ReplayEvents(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/EventManagerInformer/ReplayEvents',
+            event__manager__pb2.ReplayEventsRequest.SerializeToString,
+            event__manager__pb2.ReplayEventsResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
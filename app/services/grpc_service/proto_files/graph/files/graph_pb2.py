@@ -14,7 +14,7 @@ _sym_db = _symbol_database.Default()
 from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0bgraph.proto\x12\x05graph\x1a\x1fgoogle/protobuf/timestamp.proto\")\n\x07InTmoId\x12\x13\n\x06tmo_id\x18\x01 \x01(\x03H\x00\x88\x01\x01\x42\t\n\x07_tmo_id\",\n\x08InTprmId\x12\x14\n\x07tprm_id\x18\x01 \x01(\x03H\x00\x88\x01\x01\x42\n\n\x08_tprm_id\"\x1d\n\tInTprmIds\x12\x10\n\x08tprm_ids\x18\x01 \x03(\x03\"\xff\x06\n\x08TreeNode\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x11\n\x04p_id\x18\x02 \x01(\x03H\x00\x88\x01\x01\x12\x11\n\x04icon\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x18\n\x0b\x64\x65scription\x18\x04 \x01(\tH\x02\x88\x01\x01\x12\x0f\n\x07virtual\x18\x05 \x01(\x08\x12\x19\n\x11global_uniqueness\x18\x06 \x01(\x08\x12)\n\x1clifecycle_process_definition\x18\x07 \x01(\tH\x03\x88\x01\x01\x12\x1a\n\rgeometry_type\x18\x08 \x01(\tH\x04\x88\x01\x01\x12\x13\n\x0bmaterialize\x18\t \x01(\x08\x12 \n\x18points_constraint_by_tmo\x18\n \x03(\x03\x12\x1e\n\x05\x63hild\x18\x0b \x03(\x0b\x32\x0f.graph.TreeNode\x12\n\n\x02id\x18\x0c \x01(\x03\x12\x10\n\x08minimize\x18\r \x01(\x08\x12\x17\n\ncreated_by\x18\x0e \x01(\tH\x05\x88\x01\x01\x12\x18\n\x0bmodified_by\x18\x0f \x01(\tH\x06\x88\x01\x01\x12\x15\n\x08latitude\x18\x10 \x01(\x03H\x07\x88\x01\x01\x12\x16\n\tlongitude\x18\x11 \x01(\x03H\x08\x88\x01\x01\x12\x36\n\rcreation_date\x18\x12 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\t\x88\x01\x01\x12:\n\x11modification_date\x18\x13 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\n\x88\x01\x01\x12\x0f\n\x07primary\x18\x14 \x03(\x03\x12\x18\n\x0bseverity_id\x18\x15 \x01(\x03H\x0b\x88\x01\x01\x12\x13\n\x06status\x18\x16 \x01(\x03H\x0c\x88\x01\x01\x12\x14\n\x07version\x18\x17 \x01(\x05H\r\x88\x01\x01\x12\x16\n\tline_type\x18\x18 \x01(\tH\x0e\x88\x01\x01\x12\r\n\x05label\x18\x19 \x03(\x03\x42\x07\n\x05_p_idB\x07\n\x05_iconB\x0e\n\x0c_descriptionB\x1f\n\x1d_lifecycle_process_definitionB\x10\n\x0e_geometry_typeB\r\n\x0b_created_byB\x0e\n\x0c_modified_byB\x0b\n\t_latitudeB\x0c\n\n_longitudeB\x10\n\x0e_creation_dateB\x14\n\x12_modification_dateB\x0e\n\x0c_severity_idB\t\n\x07_statusB\n\n\x08_versionB\x0c\n\n_line_type\"/\n\rOutGetTMOTree\x12\x1e\n\x05nodes\x18\x01 \x03(\x0b\x32\x0f.graph.TreeNode\"\x1a\n\x08InTmoIds\x12\x0e\n\x06tmo_id\x18\x01 \x03(\x03\"\xc1\x04\n\x04TPRM\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x18\n\x0b\x64\x65scription\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x10\n\x08val_type\x18\x03 \x01(\t\x12\x10\n\x08multiple\x18\x04 \x01(\x08\x12\x10\n\x08required\x18\x05 \x01(\x08\x12\x12\n\nreturnable\x18\x06 \x01(\x08\x12\x17\n\nconstraint\x18\x07 \x01(\tH\x01\x88\x01\x01\x12\x1c\n\x0fprm_link_filter\x18\x08 \x01(\tH\x02\x88\x01\x01\x12\x12\n\x05group\x18\t \x01(\tH\x03\x88\x01\x01\x12\x0e\n\x06tmo_id\x18\n \x01(\x03\x12\n\n\x02id\x18\x0b \x01(\x03\x12\x13\n\x0b\x66ield_value\x18\x0c \x01(\t\x12\x17\n\ncreated_by\x18\r \x01(\tH\x04\x88\x01\x01\x12\x18\n\x0bmodified_by\x18\x0e \x01(\tH\x05\x88\x01\x01\x12\x36\n\rcreation_date\x18\x0f \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x06\x88\x01\x01\x12:\n\x11modification_date\x18\x10 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x07\x88\x01\x01\x12\x14\n\x07version\x18\x11 \x01(\x05H\x08\x88\x01\x01\x42\x0e\n\x0c_descriptionB\r\n\x0b_constraintB\x12\n\x10_prm_link_filterB\x08\n\x06_groupB\r\n\x0b_created_byB\x0e\n\x0c_modified_byB\x10\n\x0e_creation_dateB\x14\n\x12_modification_dateB\n\n\x08_version\"&\n\x08OutTprms\x12\x1a\n\x05tprms\x18\x01 \x03(\x0b\x32\x0b.graph.TPRM\"\x8c\x01\n\x0cInMOsByTMOid\x12\x0e\n\x06tmo_id\x18\x01 \x01(\x03\x12\x14\n\x0cmo_filter_by\x18\x02 \x01(\t\x12\x15\n\rprm_filter_by\x18\x03 \x01(\t\x12\x1b\n\x13keep_mo_without_prm\x18\x04 \x01(\x08\x12\x12\n\nchunk_size\x18\x05 \x01(\x05\x12\x0e\n\x06offset\x18\x06 \x01(\x05\"Q\n\x03PRM\x12\x0f\n\x07tprm_id\x18\x01 \x01(\x03\x12\r\n\x05mo_id\x18\x02 \x01(\x03\x12\r\n\x05value\x18\x03 \x01(\t\x12\n\n\x02id\x18\x04 \x01(\x03\x12\x0f\n\x07version\x18\x05 \x01(\x05\"\xb0\x02\n\x02MO\x12\x0e\n\x06tmo_id\x18\x01 \x01(\x03\x12\x11\n\x04p_id\x18\x02 \x01(\x03H\x00\x88\x01\x01\x12\n\n\x02id\x18\x03 \x01(\x03\x12\x0c\n\x04name\x18\x04 \x01(\t\x12\x10\n\x08latitude\x18\x05 \x01(\x02\x12\x11\n\tlongitude\x18\x06 \x01(\x02\x12\x0b\n\x03pov\x18\x07 \x01(\t\x12\x10\n\x08geometry\x18\x08 \x01(\t\x12\r\n\x05model\x18\t \x01(\t\x12\x0e\n\x06\x61\x63tive\x18\n \x01(\x08\x12\x12\n\npoint_a_id\x18\x0b \x01(\x03\x12\x12\n\npoint_b_id\x18\x0c \x01(\x03\x12\x0e\n\x06status\x18\r \x01(\t\x12\x0f\n\x07version\x18\x0e \x01(\x03\x12\x1a\n\x06params\x18\x0f \x03(\x0b\x32\n.graph.PRM\x12\x12\n\x05label\x18\x10 \x01(\tH\x01\x88\x01\x01\x42\x07\n\x05_p_idB\x08\n\x06_label\"%\n\x0cOutMOsStream\x12\x15\n\x02mo\x18\x01 \x03(\x0b\x32\t.graph.MO\"\x1c\n\x0bInTmoByMoId\x12\r\n\x05mo_id\x18\x01 \x01(\x03\"\x1a\n\x08OutTmoId\x12\x0e\n\x06tmo_id\x18\x01 \x01(\x03\"\x1e\n\x0cInMOsByMoIds\x12\x0e\n\x06mo_ids\x18\x01 \x03(\x03\"\'\n\rOutMOsByMoIds\x12\x16\n\x03mos\x18\x01 \x03(\x0b\x32\t.graph.MO\"!\n\x0eInPRMsByPRMIds\x12\x0f\n\x07prm_ids\x18\x01 \x03(\x03\"+\n\x0fOutPRMsByPRMIds\x12\x18\n\x04prms\x18\x01 \x03(\x0b\x32\n.graph.PRM\"\x1c\n\tOutTmoIds\x12\x0f\n\x07tmo_ids\x18\x01 \x03(\x03\x32\xdc\x04\n\rGraphInformer\x12\x34\n\nGetTMOTree\x12\x0e.graph.InTmoId\x1a\x14.graph.OutGetTMOTree\"\x00\x12\x35\n\x0fGetTPRMsByTMOid\x12\x0f.graph.InTmoIds\x1a\x0f.graph.OutTprms\"\x00\x12=\n\rGetMOsByTMOid\x12\x13.graph.InMOsByTMOid\x1a\x13.graph.OutMOsStream\"\x00\x30\x01\x12@\n\x12GetMOsByTMOidPages\x12\x13.graph.InMOsByTMOid\x1a\x13.graph.OutMOsStream\"\x00\x12\x35\n\x0cGetTmoByMoId\x12\x12.graph.InTmoByMoId\x1a\x0f.graph.OutTmoId\"\x00\x12<\n\rGetMOsByMoIds\x12\x13.graph.InMOsByMoIds\x1a\x14.graph.OutMOsByMoIds\"\x00\x12\x42\n\x0fGetPRMsByPRMIds\x12\x15.graph.InPRMsByPRMIds\x1a\x16.graph.OutPRMsByPRMIds\"\x00\x12\x36\n\x10GetPointTmoConst\x12\x0e.graph.InTmoId\x1a\x10.graph.OutTmoIds\"\x00\x12\x33\n\x0cGetTprmConst\x12\x0f.graph.InTprmId\x1a\x10.graph.OutTmoIds\"\x00\x12\x37\n\x10GetTprmByTprmIds\x12\x10.graph.InTprmIds\x1a\x0f.graph.OutTprms\"\x00\x62\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0bgraph.proto\x12\x05graph\x1a\x1fgoogle/protobuf/timestamp.proto\")\n\x07InTmoId\x12\x13\n\x06tmo_id\x18\x01 \x01(\x03H\x00\x88\x01\x01\x42\t\n\x07_tmo_id\",\n\x08InTprmId\x12\x14\n\x07tprm_id\x18\x01 \x01(\x03H\x00\x88\x01\x01\x42\n\n\x08_tprm_id\"\x1d\n\tInTprmIds\x12\x10\n\x08tprm_ids\x18\x01 \x03(\x03\"\xff\x06\n\x08TreeNode\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x11\n\x04p_id\x18\x02 \x01(\x03H\x00\x88\x01\x01\x12\x11\n\x04icon\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x18\n\x0b\x64\x65scription\x18\x04 \x01(\tH\x02\x88\x01\x01\x12\x0f\n\x07virtual\x18\x05 \x01(\x08\x12\x19\n\x11global_uniqueness\x18\x06 \x01(\x08\x12)\n\x1clifecycle_process_definition\x18\x07 \x01(\tH\x03\x88\x01\x01\x12\x1a\n\rgeometry_type\x18\x08 \x01(\tH\x04\x88\x01\x01\x12\x13\n\x0bmaterialize\x18\t \x01(\x08\x12 \n\x18points_constraint_by_tmo\x18\n \x03(\x03\x12\x1e\n\x05\x63hild\x18\x0b \x03(\x0b\x32\x0f.graph.TreeNode\x12\n\n\x02id\x18\x0c \x01(\x03\x12\x10\n\x08minimize\x18\r \x01(\x08\x12\x17\n\ncreated_by\x18\x0e \x01(\tH\x05\x88\x01\x01\x12\x18\n\x0bmodified_by\x18\x0f \x01(\tH\x06\x88\x01\x01\x12\x15\n\x08latitude\x18\x10 \x01(\x03H\x07\x88\x01\x01\x12\x16\n\tlongitude\x18\x11 \x01(\x03H\x08\x88\x01\x01\x12\x36\n\rcreation_date\x18\x12 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\t\x88\x01\x01\x12:\n\x11modification_date\x18\x13 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\n\x88\x01\x01\x12\x0f\n\x07primary\x18\x14 \x03(\x03\x12\x18\n\x0bseverity_id\x18\x15 \x01(\x03H\x0b\x88\x01\x01\x12\x13\n\x06status\x18\x16 \x01(\x03H\x0c\x88\x01\x01\x12\x14\n\x07version\x18\x17 \x01(\x05H\r\x88\x01\x01\x12\x16\n\tline_type\x18\x18 \x01(\tH\x0e\x88\x01\x01\x12\r\n\x05label\x18\x19 \x03(\x03\x42\x07\n\x05_p_idB\x07\n\x05_iconB\x0e\n\x0c_descriptionB\x1f\n\x1d_lifecycle_process_definitionB\x10\n\x0e_geometry_typeB\r\n\x0b_created_byB\x0e\n\x0c_modified_byB\x0b\n\t_latitudeB\x0c\n\n_longitudeB\x10\n\x0e_creation_dateB\x14\n\x12_modification_dateB\x0e\n\x0c_severity_idB\t\n\x07_statusB\n\n\x08_versionB\x0c\n\n_line_type\"/\n\rOutGetTMOTree\x12\x1e\n\x05nodes\x18\x01 \x03(\x0b\x32\x0f.graph.TreeNode\"\x1a\n\x08InTmoIds\x12\x0e\n\x06tmo_id\x18\x01 \x03(\x03\"\xc1\x04\n\x04TPRM\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x18\n\x0b\x64\x65scription\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x10\n\x08val_type\x18\x03 \x01(\t\x12\x10\n\x08multiple\x18\x04 \x01(\x08\x12\x10\n\x08required\x18\x05 \x01(\x08\x12\x12\n\nreturnable\x18\x06 \x01(\x08\x12\x17\n\nconstraint\x18\x07 \x01(\tH\x01\x88\x01\x01\x12\x1c\n\x0fprm_link_filter\x18\x08 \x01(\tH\x02\x88\x01\x01\x12\x12\n\x05group\x18\t \x01(\tH\x03\x88\x01\x01\x12\x0e\n\x06tmo_id\x18\n \x01(\x03\x12\n\n\x02id\x18\x0b \x01(\x03\x12\x13\n\x0b\x66ield_value\x18\x0c \x01(\t\x12\x17\n\ncreated_by\x18\r \x01(\tH\x04\x88\x01\x01\x12\x18\n\x0bmodified_by\x18\x0e \x01(\tH\x05\x88\x01\x01\x12\x36\n\rcreation_date\x18\x0f \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x06\x88\x01\x01\x12:\n\x11modification_date\x18\x10 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x07\x88\x01\x01\x12\x14\n\x07version\x18\x11 \x01(\x05H\x08\x88\x01\x01\x42\x0e\n\x0c_descriptionB\r\n\x0b_constraintB\x12\n\x10_prm_link_filterB\x08\n\x06_groupB\r\n\x0b_created_byB\x0e\n\x0c_modified_byB\x10\n\x0e_creation_dateB\x14\n\x12_modification_dateB\n\n\x08_version\"&\n\x08OutTprms\x12\x1a\n\x05tprms\x18\x01 \x03(\x0b\x32\x0b.graph.TPRM\"\xb6\x01\n\x0cInMOsByTMOid\x12\x0e\n\x06tmo_id\x18\x01 \x01(\x03\x12\x14\n\x0cmo_filter_by\x18\x02 \x01(\t\x12\x15\n\rprm_filter_by\x18\x03 \x01(\t\x12\x1b\n\x13keep_mo_without_prm\x18\x04 \x01(\x08\x12\x12\n\nchunk_size\x18\x05 \x01(\x05\x12\x0e\n\x06offset\x18\x06 \x01(\x05\x12\x18\n\x0b\x61\x66ter_mo_id\x18\x07 \x01(\x03H\x00\x88\x01\x01\x42\x0e\n\x0c_after_mo_id\"Q\n\x03PRM\x12\x0f\n\x07tprm_id\x18\x01 \x01(\x03\x12\r\n\x05mo_id\x18\x02 \x01(\x03\x12\r\n\x05value\x18\x03 \x01(\t\x12\n\n\x02id\x18\x04 \x01(\x03\x12\x0f\n\x07version\x18\x05 \x01(\x05\"\xb0\x02\n\x02MO\x12\x0e\n\x06tmo_id\x18\x01 \x01(\x03\x12\x11\n\x04p_id\x18\x02 \x01(\x03H\x00\x88\x01\x01\x12\n\n\x02id\x18\x03 \x01(\x03\x12\x0c\n\x04name\x18\x04 \x01(\t\x12\x10\n\x08latitude\x18\x05 \x01(\x02\x12\x11\n\tlongitude\x18\x06 \x01(\x02\x12\x0b\n\x03pov\x18\x07 \x01(\t\x12\x10\n\x08geometry\x18\x08 \x01(\t\x12\r\n\x05model\x18\t \x01(\t\x12\x0e\n\x06\x61\x63tive\x18\n \x01(\x08\x12\x12\n\npoint_a_id\x18\x0b \x01(\x03\x12\x12\n\npoint_b_id\x18\x0c \x01(\x03\x12\x0e\n\x06status\x18\r \x01(\t\x12\x0f\n\x07version\x18\x0e \x01(\x03\x12\x1a\n\x06params\x18\x0f \x03(\x0b\x32\n.graph.PRM\x12\x12\n\x05label\x18\x10 \x01(\tH\x01\x88\x01\x01\x42\x07\n\x05_p_idB\x08\n\x06_label\"O\n\x0cOutMOsStream\x12\x15\n\x02mo\x18\x01 \x03(\x0b\x32\t.graph.MO\x12\x18\n\x0b\x61\x66ter_mo_id\x18\x02 \x01(\x03H\x00\x88\x01\x01\x42\x0e\n\x0c_after_mo_id\"\x1c\n\x0bInTmoByMoId\x12\r\n\x05mo_id\x18\x01 \x01(\x03\"\x1a\n\x08OutTmoId\x12\x0e\n\x06tmo_id\x18\x01 \x01(\x03\"\x1e\n\x0cInMOsByMoIds\x12\x0e\n\x06mo_ids\x18\x01 \x03(\x03\"\'\n\rOutMOsByMoIds\x12\x16\n\x03mos\x18\x01 \x03(\x0b\x32\t.graph.MO\"!\n\x0eInPRMsByPRMIds\x12\x0f\n\x07prm_ids\x18\x01 \x03(\x03\"+\n\x0fOutPRMsByPRMIds\x12\x18\n\x04prms\x18\x01 \x03(\x0b\x32\n.graph.PRM\"\x1c\n\tOutTmoIds\x12\x0f\n\x07tmo_ids\x18\x01 \x03(\x03\x32\xdc\x04\n\rGraphInformer\x12\x34\n\nGetTMOTree\x12\x0e.graph.InTmoId\x1a\x14.graph.OutGetTMOTree\"\x00\x12\x35\n\x0fGetTPRMsByTMOid\x12\x0f.graph.InTmoIds\x1a\x0f.graph.OutTprms\"\x00\x12=\n\rGetMOsByTMOid\x12\x13.graph.InMOsByTMOid\x1a\x13.graph.OutMOsStream\"\x00\x30\x01\x12@\n\x12GetMOsByTMOidPages\x12\x13.graph.InMOsByTMOid\x1a\x13.graph.OutMOsStream\"\x00\x12\x35\n\x0cGetTmoByMoId\x12\x12.graph.InTmoByMoId\x1a\x0f.graph.OutTmoId\"\x00\x12<\n\rGetMOsByMoIds\x12\x13.graph.InMOsByMoIds\x1a\x14.graph.OutMOsByMoIds\"\x00\x12\x42\n\x0fGetPRMsByPRMIds\x12\x15.graph.InPRMsByPRMIds\x1a\x16.graph.OutPRMsByPRMIds\"\x00\x12\x36\n\x10GetPointTmoConst\x12\x0e.graph.InTmoId\x1a\x10.graph.OutTmoIds\"\x00\x12\x33\n\x0cGetTprmConst\x12\x0f.graph.InTprmId\x1a\x10.graph.OutTmoIds\"\x00\x12\x37\n\x10GetTprmByTprmIds\x12\x10.graph.InTprmIds\x1a\x0f.graph.OutTprms\"\x00\x62\x06proto3')
 
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'graph_pb2', globals())
@@ -38,27 +38,27 @@ if _descriptor._USE_C_DESCRIPTORS == False:
   _OUTTPRMS._serialized_start=1730
   _OUTTPRMS._serialized_end=1768
   _INMOSBYTMOID._serialized_start=1771
-  _INMOSBYTMOID._serialized_end=1911
-  _PRM._serialized_start=1913
-  _PRM._serialized_end=1994
-  _MO._serialized_start=1997
-  _MO._serialized_end=2301
-  _OUTMOSSTREAM._serialized_start=2303
-  _OUTMOSSTREAM._serialized_end=2340
-  _INTMOBYMOID._serialized_start=2342
-  _INTMOBYMOID._serialized_end=2370
-  _OUTTMOID._serialized_start=2372
-  _OUTTMOID._serialized_end=2398
-  _INMOSBYMOIDS._serialized_start=2400
-  _INMOSBYMOIDS._serialized_end=2430
-  _OUTMOSBYMOIDS._serialized_start=2432
-  _OUTMOSBYMOIDS._serialized_end=2471
-  _INPRMSBYPRMIDS._serialized_start=2473
-  _INPRMSBYPRMIDS._serialized_end=2506
-  _OUTPRMSBYPRMIDS._serialized_start=2508
-  _OUTPRMSBYPRMIDS._serialized_end=2551
-  _OUTTMOIDS._serialized_start=2553
-  _OUTTMOIDS._serialized_end=2581
-  _GRAPHINFORMER._serialized_start=2584
-  _GRAPHINFORMER._serialized_end=3188
+  _INMOSBYTMOID._serialized_end=1953
+  _PRM._serialized_start=1955
+  _PRM._serialized_end=2036
+  _MO._serialized_start=2039
+  _MO._serialized_end=2343
+  _OUTMOSSTREAM._serialized_start=2345
+  _OUTMOSSTREAM._serialized_end=2424
+  _INTMOBYMOID._serialized_start=2426
+  _INTMOBYMOID._serialized_end=2454
+  _OUTTMOID._serialized_start=2456
+  _OUTTMOID._serialized_end=2482
+  _INMOSBYMOIDS._serialized_start=2484
+  _INMOSBYMOIDS._serialized_end=2514
+  _OUTMOSBYMOIDS._serialized_start=2516
+  _OUTMOSBYMOIDS._serialized_end=2555
+  _INPRMSBYPRMIDS._serialized_start=2557
+  _INPRMSBYPRMIDS._serialized_end=2590
+  _OUTPRMSBYPRMIDS._serialized_start=2592
+  _OUTPRMSBYPRMIDS._serialized_end=2635
+  _OUTTMOIDS._serialized_start=2637
+  _OUTTMOIDS._serialized_end=2665
+  _GRAPHINFORMER._serialized_start=2668
+  _GRAPHINFORMER._serialized_end=3272
 # @@protoc_insertion_point(module_scope)
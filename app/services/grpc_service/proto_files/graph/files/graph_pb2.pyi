@@ -13,20 +13,22 @@ class InMOsByMoIds(_message.Message):
     def __init__(self, mo_ids: _Optional[_Iterable[int]] = ...) -> None: ...
 
 class InMOsByTMOid(_message.Message):
-    __slots__ = ["chunk_size", "keep_mo_without_prm", "mo_filter_by", "offset", "prm_filter_by", "tmo_id"]
+    __slots__ = ["after_mo_id", "chunk_size", "keep_mo_without_prm", "mo_filter_by", "offset", "prm_filter_by", "tmo_id"]
+    AFTER_MO_ID_FIELD_NUMBER: _ClassVar[int]
     CHUNK_SIZE_FIELD_NUMBER: _ClassVar[int]
     KEEP_MO_WITHOUT_PRM_FIELD_NUMBER: _ClassVar[int]
     MO_FILTER_BY_FIELD_NUMBER: _ClassVar[int]
     OFFSET_FIELD_NUMBER: _ClassVar[int]
     PRM_FILTER_BY_FIELD_NUMBER: _ClassVar[int]
     TMO_ID_FIELD_NUMBER: _ClassVar[int]
+    after_mo_id: int
     chunk_size: int
     keep_mo_without_prm: bool
     mo_filter_by: str
     offset: int
     prm_filter_by: str
     tmo_id: int
-    def __init__(self, tmo_id: _Optional[int] = ..., mo_filter_by: _Optional[str] = ..., prm_filter_by: _Optional[str] = ..., keep_mo_without_prm: bool = ..., chunk_size: _Optional[int] = ..., offset: _Optional[int] = ...) -> None: ...
+    def __init__(self, tmo_id: _Optional[int] = ..., mo_filter_by: _Optional[str] = ..., prm_filter_by: _Optional[str] = ..., keep_mo_without_prm: bool = ..., chunk_size: _Optional[int] = ..., offset: _Optional[int] = ..., after_mo_id: _Optional[int] = ...) -> None: ...
 
 class InPRMsByPRMIds(_message.Message):
     __slots__ = ["prm_ids"]
@@ -113,10 +115,12 @@ class OutMOsByMoIds(_message.Message):
     def __init__(self, mos: _Optional[_Iterable[_Union[MO, _Mapping]]] = ...) -> None: ...
 
 class OutMOsStream(_message.Message):
-    __slots__ = ["mo"]
+    __slots__ = ["after_mo_id", "mo"]
+    AFTER_MO_ID_FIELD_NUMBER: _ClassVar[int]
     MO_FIELD_NUMBER: _ClassVar[int]
+    after_mo_id: int
     mo: _containers.RepeatedCompositeFieldContainer[MO]
-    def __init__(self, mo: _Optional[_Iterable[_Union[MO, _Mapping]]] = ...) -> None: ...
+    def __init__(self, mo: _Optional[_Iterable[_Union[MO, _Mapping]]] = ..., after_mo_id: _Optional[int] = ...) -> None: ...
 
 class OutPRMsByPRMIds(_message.Message):
     __slots__ = ["prms"]
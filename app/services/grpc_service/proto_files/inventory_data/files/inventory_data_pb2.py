@@ -12,9 +12,11 @@ _sym_db = _symbol_database.Default()
 
 
 from google.protobuf import any_pb2 as google_dot_protobuf_dot_any__pb2
+from google.protobuf import struct_pb2 as google_dot_protobuf_dot_struct__pb2
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x14inventory_data.proto\x12\x07mo_info\x1a\x19google/protobuf/any.proto\"#\n\x12\x44\x65leteMOIdsRequest\x12\r\n\x05mo_id\x18\x01 \x03(\x05\"/\n\x13\x44\x65leteMOIdsResponse\x12\x18\n\x10\x64\x65leted_quantity\x18\x01 \x01(\x05\" \n\x0eTMOInfoRequest\x12\x0e\n\x06tmo_id\x18\x01 \x03(\x05\"\x1f\n\rMOInfoRequest\x12\x0e\n\x06mo_ids\x18\x01 \x03(\x05\"#\n\x0fTMOInfoResponse\x12\x10\n\x08tmo_info\x18\x01 \x01(\t\"2\n\x0bInfoRequest\x12\r\n\x05mo_id\x18\x01 \x01(\x05\x12\x14\n\x08tprm_ids\x18\x02 \x03(\x05\x42\x02\x10\x01\"9\n\x13RequestSeverityMoId\x12\x0e\n\x06tmo_id\x18\x01 \x01(\x05\x12\x12\n\x06mo_ids\x18\x02 \x03(\x05\x42\x02\x10\x01\",\n\x14ResponseSeverityMoId\x12\x14\n\x0cmax_severity\x18\x01 \x01(\x05\"N\n\x15RequestSeverityValues\x12\x17\n\x0f\x64ict_severities\x18\x01 \x01(\t\x12\x1c\n\x14\x64ict_tmo_with_mo_ids\x18\x02 \x01(\t\"4\n\x1cResponseMOQuantityBySeverity\x12\x14\n\x0c\x64ict_mo_info\x18\x01 \x01(\t\":\n\x0bValueOfDict\x12+\n\rmo_tprm_value\x18\x01 \x03(\x0b\x32\x14.google.protobuf.Any\"\x81\x01\n\tInfoReply\x12/\n\x07mo_info\x18\x01 \x03(\x0b\x32\x1e.mo_info.InfoReply.MoInfoEntry\x1a\x43\n\x0bMoInfoEntry\x12\x0b\n\x03key\x18\x01 \x01(\x05\x12#\n\x05value\x18\x02 \x01(\x0b\x32\x14.mo_info.ValueOfDict:\x02\x38\x01\"&\n\x06MOInfo\x12\x0e\n\x06tmo_id\x18\x01 \x01(\x05\x12\x0c\n\x04p_id\x18\x02 \x01(\x05\"\x1c\n\x0bStringValue\x12\r\n\x05value\x18\x01 \x01(\t\"\x19\n\x08IntValue\x12\r\n\x05value\x18\x01 \x01(\x05\"\x1b\n\nFloatValue\x12\r\n\x05value\x18\x01 \x01(\x02\"\x1a\n\tBoolValue\x12\r\n\x05value\x18\x01 \x01(\x08\"W\n\x16RequestForObjInfoByTMO\x12\x16\n\x0eobject_type_id\x18\x01 \x01(\x05\x12\x14\n\x08tprm_ids\x18\x02 \x03(\x05\x42\x02\x10\x01\x12\x0f\n\x07mo_p_id\x18\x03 \x01(\x05\"!\n\x0fResponseListInt\x12\x0e\n\x06values\x18\x01 \x03(\x05\"\xb2\x01\n\x18ResponseWithObjInfoByTMO\x12\r\n\x05mo_id\x18\x01 \x01(\x05\x12\x46\n\x0btprm_values\x18\x02 \x03(\x0b\x32\x31.mo_info.ResponseWithObjInfoByTMO.TprmValuesEntry\x12\x0c\n\x04p_id\x18\x03 \x01(\x05\x1a\x31\n\x0fTprmValuesEntry\x12\x0b\n\x03key\x18\x01 \x01(\x05\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"5\n\x1eRequestTMOlifecycleByTMOidList\x12\x13\n\x07tmo_ids\x18\x01 \x03(\x05\x42\x02\x10\x01\"E\n\x1fResponseTMOlifecycleByTMOidList\x12\"\n\x16tmo_ids_with_lifecycle\x18\x01 \x03(\x05\x42\x02\x10\x01\"\x89\x01\n\x1eRequestForFilteredObjInfoByTMO\x12\x16\n\x0eobject_type_id\x18\x01 \x01(\x05\x12\x14\n\x0cquery_params\x18\x02 \x01(\t\x12\x10\n\x08order_by\x18\x03 \x01(\t\x12\x13\n\x0b\x64\x65\x63oded_jwt\x18\x04 \x01(\t\x12\x12\n\x06mo_ids\x18\x05 \x03(\x05\x42\x02\x10\x01\"1\n\x0eResponseMOdata\x12\x1f\n\x17objects_with_parameters\x18\x01 \x03(\t\"&\n\x0eRequestTPRMIds\x12\x14\n\x08tprm_ids\x18\x01 \x03(\x05\x42\x02\x10\x01\"6\n\x10ResponseTPRMName\x12\x0f\n\x07tprm_id\x18\x01 \x01(\x05\x12\x11\n\ttprm_name\x18\x02 \x01(\t\"=\n\x11ResponseTPRMNames\x12(\n\x05items\x18\x01 \x03(\x0b\x32\x19.mo_info.ResponseTPRMName\"\xd0\x01\n\x1cRequestForFilteredObjSpecial\x12\x16\n\x0eobject_type_id\x18\x01 \x01(\x05\x12\x14\n\x0cquery_params\x18\x02 \x01(\t\x12\x10\n\x08order_by\x18\x03 \x01(\t\x12\x13\n\x0b\x64\x65\x63oded_jwt\x18\x04 \x01(\t\x12\x12\n\x06mo_ids\x18\x05 \x03(\x05\x42\x02\x10\x01\x12\r\n\x05p_ids\x18\x06 \x03(\x05\x12\x10\n\x08only_ids\x18\x07 \x01(\x08\x12\x14\n\x08tprm_ids\x18\x08 \x03(\x05\x42\x02\x10\x01\x12\x10\n\x08mo_attrs\x18\t \x03(\t\"F\n\x15ResponseMOdataSpecial\x12\x12\n\x06mo_ids\x18\x01 \x03(\x05\x42\x02\x10\x01\x12\x19\n\x11pickle_mo_dataset\x18\x02 \x03(\t\"2\n\x0bRequestNode\x12\x0f\n\x07node_id\x18\x01 \x01(\t\x12\x12\n\x06mo_ids\x18\x02 \x03(\x05\x42\x02\x10\x01\"\x94\x01\n\x0cRequestLevel\x12(\n\nlevel_data\x18\x01 \x03(\x0b\x32\x14.mo_info.RequestNode\x12\x14\n\x0clevel_tmo_id\x18\x02 \x01(\x05\x12!\n\x15path_of_children_tmos\x18\x03 \x03(\x05\x42\x02\x10\x01\x12!\n\x15\x63ollect_data_for_tmos\x18\x04 \x03(\x05\x42\x02\x10\x01\"9\n\x11RequestListLevels\x12$\n\x05items\x18\x01 \x03(\x0b\x32\x15.mo_info.RequestLevel\"<\n\x0cResponseNode\x12\x0f\n\x07node_id\x18\x01 \x01(\t\x12\x1b\n\x0f\x63hildren_mo_ids\x18\x02 \x03(\x05\x42\x02\x10\x01\"9\n\x11ResponseListNodes\x12$\n\x05items\x18\x01 \x03(\x0b\x32\x15.mo_info.ResponseNode\"/\n\x1dRequestMODetailsWithTPRMNames\x12\x0e\n\x06tmo_id\x18\x01 \x01(\x05\"0\n\x1eResponseMODetailsWithTPRMNames\x12\x0e\n\x06\x63olumn\x18\x01 \x03(\t\")\n\x17RequestTMOAttrsAndTypes\x12\x0e\n\x06tmo_id\x18\x01 \x01(\x05\">\n\x0eTMOAttrAndType\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04type\x18\x02 \x01(\t\x12\x10\n\x08multiply\x18\x03 \x01(\x08\"B\n\x18ResponseTMOAttrsAndTypes\x12&\n\x05\x61ttrs\x18\x01 \x03(\x0b\x32\x17.mo_info.TMOAttrAndType\"p\n\x1bRequestObjWithParamsLimited\x12\x0e\n\x06tmo_id\x18\x01 \x01(\x05\x12\x12\n\ntprm_names\x18\x02 \x03(\t\x12\r\n\x05limit\x18\x03 \x01(\x05\x12\x13\n\x06offset\x18\x04 \x01(\x05H\x00\x88\x01\x01\x42\t\n\x07_offset\",\n\x1cResponseObjWithParamsLimited\x12\x0c\n\x04\x64\x61ta\x18\x01 \x01(\t\"\'\n\x0fRequestTPRMData\x12\x14\n\x08tprm_ids\x18\x01 \x03(\x05\x42\x02\x10\x01\"&\n\x10ResponseTPRMData\x12\x12\n\ntprms_data\x18\x01 \x03(\t\"8\n\x15RequestTPRMNameToType\x12\x0e\n\x06tmo_id\x18\x01 \x01(\x05\x12\x0f\n\x07\x63olumns\x18\x02 \x03(\t\"\x84\x01\n\x16ResponseTPRMNameToType\x12;\n\x06mapper\x18\x01 \x03(\x0b\x32+.mo_info.ResponseTPRMNameToType.MapperEntry\x1a-\n\x0bMapperEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\x12\n\x10GetAllTMORequest\"%\n\x11GetAllTMOResponse\x12\x10\n\x08tmo_info\x18\x01 \x03(\t\"`\n GetAllMOWithParamsByTMOIdRequest\x12\x0e\n\x06tmo_id\x18\x01 \x01(\x05\x12\x1a\n\rreplace_links\x18\x02 \x01(\x08H\x00\x88\x01\x01\x42\x10\n\x0e_replace_links\"<\n!GetAllMOWithParamsByTMOIdResponse\x12\x17\n\x0fmos_with_params\x18\x01 \x03(\t\"+\n\x15GetMODataByIdsRequest\x12\x12\n\x06mo_ids\x18\x01 \x03(\x05\x42\x02\x10\x01\"2\n\x06MOData\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0e\n\x06tmo_id\x18\x03 \x01(\x05\"=\n\x16GetMODataByIdsResponse\x12#\n\nlist_of_mo\x18\x01 \x03(\x0b\x32\x0f.mo_info.MOData\"-\n\x16GetPRMsByPRMIdsRequest\x12\x13\n\x07prm_ids\x18\x01 \x03(\x05\x42\x02\x10\x01\"R\n\x13PRMMsgValueAsString\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0f\n\x07tprm_id\x18\x02 \x01(\x05\x12\x0f\n\x07version\x18\x03 \x01(\x05\x12\r\n\x05value\x18\x04 \x01(\t\"L\n\x17GetPRMsByPRMIdsResponse\x12\x31\n\x0blist_of_prm\x18\x01 \x03(\x0b\x32\x1c.mo_info.PRMMsgValueAsString\"-\n\x15RequestGetTPRMAlldata\x12\x14\n\x08tprm_ids\x18\x01 \x03(\x05\x42\x02\x10\x01\",\n\x16ResponseGetTPRMAlldata\x12\x12\n\ntprms_data\x18\x01 \x03(\t\"+\n\x19RequestGetAllTPRMSByTMOId\x12\x0e\n\x06tmo_id\x18\x01 \x01(\x05\"0\n\x1aResponseGetAllTPRMSByTMOId\x12\x12\n\ntprms_data\x18\x01 \x03(\t\"2\n\x1fRequestGetAllRawPRMDataByTPRMId\x12\x0f\n\x07tprm_id\x18\x01 \x01(\x05\"v\n(ResponseGetAllRawPRMDataByTPRMIdInnerMsg\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0f\n\x07version\x18\x02 \x01(\x05\x12\x0f\n\x07tprm_id\x18\x03 \x01(\x05\x12\r\n\x05mo_id\x18\x04 \x01(\x05\x12\r\n\x05value\x18\x05 \x01(\t\"c\n ResponseGetAllRawPRMDataByTPRMId\x12?\n\x04prms\x18\x01 \x03(\x0b\x32\x31.mo_info.ResponseGetAllRawPRMDataByTPRMIdInnerMsg\"B\n\x1eMOWithSpecialParametersRequest\x12\x0e\n\x06tmo_id\x18\x01 \x01(\x05\x12\x10\n\x08tprm_ids\x18\x02 \x03(\x05\":\n\x1fMOWithSpecialParametersResponse\x12\x17\n\x0fmos_with_params\x18\x01 \x03(\t\")\n\x17RequestGetMOsNamesByIds\x12\x0e\n\x06mo_ids\x18\x01 \x03(\x03\"\x8c\x01\n\x18ResponseGetMOsNamesByIds\x12@\n\x08mo_names\x18\x01 \x03(\x0b\x32..mo_info.ResponseGetMOsNamesByIds.MoNamesEntry\x1a.\n\x0cMoNamesEntry\x12\x0b\n\x03key\x18\x01 \x01(\x03\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x32\xfd\x14\n\x08Informer\x12\x42\n\x14GetParamsValuesForMO\x12\x14.mo_info.InfoRequest\x1a\x12.mo_info.InfoReply\"\x00\x12\x35\n\rGetTMOidForMo\x12\x11.mo_info.IntValue\x1a\x0f.mo_info.MOInfo\"\x00\x12Z\n\x10GetObjWithParams\x12\x1f.mo_info.RequestForObjInfoByTMO\x1a!.mo_info.ResponseWithObjInfoByTMO\"\x00\x30\x01\x12^\n\x18GetFilteredObjWithParams\x12\'.mo_info.RequestForFilteredObjInfoByTMO\x1a\x17.mo_info.ResponseMOdata\"\x00\x12\x66\n\x1eGetFilteredObjWithParamsStream\x12\'.mo_info.RequestForFilteredObjInfoByTMO\x1a\x17.mo_info.ResponseMOdata\"\x00\x30\x01\x12\x66\n\x0fGetTMOlifecycle\x12\'.mo_info.RequestTMOlifecycleByTMOidList\x1a(.mo_info.ResponseTMOlifecycleByTMOidList\"\x00\x12V\n\x15GetMOSeverityMaxValue\x12\x1c.mo_info.RequestSeverityMoId\x1a\x1d.mo_info.ResponseSeverityMoId\"\x00\x12\x62\n\x17GetMOQuantityBySeverity\x12\x1e.mo_info.RequestSeverityValues\x1a%.mo_info.ResponseMOQuantityBySeverity\"\x00\x12\x45\n\x0cGetTPRMNames\x12\x17.mo_info.RequestTPRMIds\x1a\x1a.mo_info.ResponseTPRMNames\"\x00\x12\x62\n\x15GetFilteredObjSpecial\x12%.mo_info.RequestForFilteredObjSpecial\x1a\x1e.mo_info.ResponseMOdataSpecial\"\x00\x30\x01\x12U\n\x19GetHierarchyLevelChildren\x12\x1a.mo_info.RequestListLevels\x1a\x1a.mo_info.ResponseListNodes\"\x00\x12n\n\x19GetMODetailsWithTPRMNames\x12&.mo_info.RequestMODetailsWithTPRMNames\x1a\'.mo_info.ResponseMODetailsWithTPRMNames\"\x00\x12\x66\n\x1dGetColumnsForMaterializedView\x12 .mo_info.RequestTMOAttrsAndTypes\x1a!.mo_info.ResponseTMOAttrsAndTypes\"\x00\x12H\n\x11GetTMOInfoByTMOId\x12\x17.mo_info.TMOInfoRequest\x1a\x18.mo_info.TMOInfoResponse\"\x00\x12\x46\n\x10GetTMOInfoByMOId\x12\x16.mo_info.MOInfoRequest\x1a\x18.mo_info.ResponseListInt\"\x00\x12j\n\x17GetObjWithParamsLimited\x12$.mo_info.RequestObjWithParamsLimited\x1a%.mo_info.ResponseObjWithParamsLimited\"\x00\x30\x01\x12\x44\n\x0bGetTPRMData\x12\x18.mo_info.RequestTPRMData\x1a\x19.mo_info.ResponseTPRMData\"\x00\x12Y\n\x17GetTPRMNameToTypeMapper\x12\x1e.mo_info.RequestTPRMNameToType\x1a\x1c.mo_info.DeleteMOIdsResponse\"\x00\x12M\n\x0e\x44\x65leteMOsByIds\x12\x1b.mo_info.DeleteMOIdsRequest\x1a\x1c.mo_info.DeleteMOIdsResponse\"\x00\x12\x44\n\tGetAllTMO\x12\x19.mo_info.GetAllTMORequest\x1a\x1a.mo_info.GetAllTMOResponse\"\x00\x12v\n\x19GetAllMOWithParamsByTMOId\x12).mo_info.GetAllMOWithParamsByTMOIdRequest\x1a*.mo_info.GetAllMOWithParamsByTMOIdResponse\"\x00\x30\x01\x12U\n\x0eGetMODataByIds\x12\x1e.mo_info.GetMODataByIdsRequest\x1a\x1f.mo_info.GetMODataByIdsResponse\"\x00\x30\x01\x12X\n\x0fGetPRMsByPRMIds\x12\x1f.mo_info.GetPRMsByPRMIdsRequest\x1a .mo_info.GetPRMsByPRMIdsResponse\"\x00\x30\x01\x12U\n\x0eGetTPRMAllData\x12\x1e.mo_info.RequestGetTPRMAlldata\x1a\x1f.mo_info.ResponseGetTPRMAlldata\"\x00\x30\x01\x12\x61\n\x12GetAllTPRMSByTMOId\x12\".mo_info.RequestGetAllTPRMSByTMOId\x1a#.mo_info.ResponseGetAllTPRMSByTMOId\"\x00\x30\x01\x12s\n\x18GetAllRawPRMDataByTPRMId\x12(.mo_info.RequestGetAllRawPRMDataByTPRMId\x1a).mo_info.ResponseGetAllRawPRMDataByTPRMId\"\x00\x30\x01\x12n\n!GetFilteredObjSpecialExperimental\x12%.mo_info.RequestForFilteredObjSpecial\x1a\x1e.mo_info.ResponseMOdataSpecial\"\x00\x30\x01\x12}\n$GetAllMOByTMOIdWithSpecialParameters\x12\'.mo_info.MOWithSpecialParametersRequest\x1a(.mo_info.MOWithSpecialParametersResponse\"\x00\x30\x01\x12Y\n\x10GetMOsNamesByIds\x12 .mo_info.RequestGetMOsNamesByIds\x1a!.mo_info.ResponseGetMOsNamesByIds\"\x00\x62\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x14inventory_data.proto\x12\x07mo_info\x1a\x19google/protobuf/any.proto\x1a\x1cgoogle/protobuf/struct.proto\x1a\x1fgoogle/protobuf/timestamp.proto\"#\n\x12\x44\x65leteMOIdsRequest\x12\r\n\x05mo_id\x18\x01 \x03(\x05\"/\n\x13\x44\x65leteMOIdsResponse\x12\x18\n\x10\x64\x65leted_quantity\x18\x01 \x01(\x05\" \n\x0eTMOInfoRequest\x12\x0e\n\x06tmo_id\x18\x01 \x03(\x05\"\x1f\n\rMOInfoRequest\x12\x0e\n\x06mo_ids\x18\x01 \x03(\x05\"#\n\x0fTMOInfoResponse\x12\x10\n\x08tmo_info\x18\x01 \x01(\t\"2\n\x0bInfoRequest\x12\r\n\x05mo_id\x18\x01 \x01(\x05\x12\x14\n\x08tprm_ids\x18\x02 \x03(\x05\x42\x02\x10\x01\"9\n\x13RequestSeverityMoId\x12\x0e\n\x06tmo_id\x18\x01 \x01(\x05\x12\x12\n\x06mo_ids\x18\x02 \x03(\x05\x42\x02\x10\x01\",\n\x14ResponseSeverityMoId\x12\x14\n\x0cmax_severity\x18\x01 \x01(\x05\"N\n\x15RequestSeverityValues\x12\x17\n\x0f\x64ict_severities\x18\x01 \x01(\t\x12\x1c\n\x14\x64ict_tmo_with_mo_ids\x18\x02 \x01(\t\"4\n\x1cResponseMOQuantityBySeverity\x12\x14\n\x0c\x64ict_mo_info\x18\x01 \x01(\t\":\n\x0bValueOfDict\x12+\n\rmo_tprm_value\x18\x01 \x03(\x0b\x32\x14.google.protobuf.Any\"\x81\x01\n\tInfoReply\x12/\n\x07mo_info\x18\x01 \x03(\x0b\x32\x1e.mo_info.InfoReply.MoInfoEntry\x1a\x43\n\x0bMoInfoEntry\x12\x0b\n\x03key\x18\x01 \x01(\x05\x12#\n\x05value\x18\x02 \x01(\x0b\x32\x14.mo_info.ValueOfDict:\x02\x38\x01\"&\n\x06MOInfo\x12\x0e\n\x06tmo_id\x18\x01 \x01(\x05\x12\x0c\n\x04p_id\x18\x02 \x01(\x05\"\x1c\n\x0bStringValue\x12\r\n\x05value\x18\x01 \x01(\t\"\x19\n\x08IntValue\x12\r\n\x05value\x18\x01 \x01(\x05\"\x1b\n\nFloatValue\x12\r\n\x05value\x18\x01 \x01(\x02\"\x1a\n\tBoolValue\x12\r\n\x05value\x18\x01 \x01(\x08\"W\n\x16RequestForObjInfoByTMO\x12\x16\n\x0eobject_type_id\x18\x01 \x01(\x05\x12\x14\n\x08tprm_ids\x18\x02 \x03(\x05\x42\x02\x10\x01\x12\x0f\n\x07mo_p_id\x18\x03 \x01(\x05\"!\n\x0fResponseListInt\x12\x0e\n\x06values\x18\x01 \x03(\x05\"\xb2\x01\n\x18ResponseWithObjInfoByTMO\x12\r\n\x05mo_id\x18\x01 \x01(\x05\x12\x46\n\x0btprm_values\x18\x02 \x03(\x0b\x32\x31.mo_info.ResponseWithObjInfoByTMO.TprmValuesEntry\x12\x0c\n\x04p_id\x18\x03 \x01(\x05\x1a\x31\n\x0fTprmValuesEntry\x12\x0b\n\x03key\x18\x01 \x01(\x05\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"5\n\x1eRequestTMOlifecycleByTMOidList\x12\x13\n\x07tmo_ids\x18\x01 \x03(\x05\x42\x02\x10\x01\"E\n\x1fResponseTMOlifecycleByTMOidList\x12\"\n\x16tmo_ids_with_lifecycle\x18\x01 \x03(\x05\x42\x02\x10\x01\"\x89\x01\n\x1eRequestForFilteredObjInfoByTMO\x12\x16\n\x0eobject_type_id\x18\x01 \x01(\x05\x12\x14\n\x0cquery_params\x18\x02 \x01(\t\x12\x10\n\x08order_by\x18\x03 \x01(\t\x12\x13\n\x0b\x64\x65\x63oded_jwt\x18\x04 \x01(\t\x12\x12\n\x06mo_ids\x18\x05 \x03(\x05\x42\x02\x10\x01\"1\n\x0eResponseMOdata\x12\x1f\n\x17objects_with_parameters\x18\x01 \x03(\t\"&\n\x0eRequestTPRMIds\x12\x14\n\x08tprm_ids\x18\x01 \x03(\x05\x42\x02\x10\x01\"6\n\x10ResponseTPRMName\x12\x0f\n\x07tprm_id\x18\x01 \x01(\x05\x12\x11\n\ttprm_name\x18\x02 \x01(\t\"=\n\x11ResponseTPRMNames\x12(\n\x05items\x18\x01 \x03(\x0b\x32\x19.mo_info.ResponseTPRMName\"\xd0\x01\n\x1cRequestForFilteredObjSpecial\x12\x16\n\x0eobject_type_id\x18\x01 \x01(\x05\x12\x14\n\x0cquery_params\x18\x02 \x01(\t\x12\x10\n\x08order_by\x18\x03 \x01(\t\x12\x13\n\x0b\x64\x65\x63oded_jwt\x18\x04 \x01(\t\x12\x12\n\x06mo_ids\x18\x05 \x03(\x05\x42\x02\x10\x01\x12\r\n\x05p_ids\x18\x06 \x03(\x05\x12\x10\n\x08only_ids\x18\x07 \x01(\x08\x12\x14\n\x08tprm_ids\x18\x08 \x03(\x05\x42\x02\x10\x01\x12\x10\n\x08mo_attrs\x18\t \x03(\t\"F\n\x15ResponseMOdataSpecial\x12\x12\n\x06mo_ids\x18\x01 \x03(\x05\x42\x02\x10\x01\x12\x19\n\x11pickle_mo_dataset\x18\x02 \x03(\t\"2\n\x0bRequestNode\x12\x0f\n\x07node_id\x18\x01 \x01(\t\x12\x12\n\x06mo_ids\x18\x02 \x03(\x05\x42\x02\x10\x01\"\x94\x01\n\x0cRequestLevel\x12(\n\nlevel_data\x18\x01 \x03(\x0b\x32\x14.mo_info.RequestNode\x12\x14\n\x0clevel_tmo_id\x18\x02 \x01(\x05\x12!\n\x15path_of_children_tmos\x18\x03 \x03(\x05\x42\x02\x10\x01\x12!\n\x15\x63ollect_data_for_tmos\x18\x04 \x03(\x05\x42\x02\x10\x01\"9\n\x11RequestListLevels\x12$\n\x05items\x18\x01 \x03(\x0b\x32\x15.mo_info.RequestLevel\"<\n\x0cResponseNode\x12\x0f\n\x07node_id\x18\x01 \x01(\t\x12\x1b\n\x0f\x63hildren_mo_ids\x18\x02 \x03(\x05\x42\x02\x10\x01\"9\n\x11ResponseListNodes\x12$\n\x05items\x18\x01 \x03(\x0b\x32\x15.mo_info.ResponseNode\"/\n\x1dRequestMODetailsWithTPRMNames\x12\x0e\n\x06tmo_id\x18\x01 \x01(\x05\"0\n\x1eResponseMODetailsWithTPRMNames\x12\x0e\n\x06\x63olumn\x18\x01 \x03(\t\")\n\x17RequestTMOAttrsAndTypes\x12\x0e\n\x06tmo_id\x18\x01 \x01(\x05\">\n\x0eTMOAttrAndType\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04type\x18\x02 \x01(\t\x12\x10\n\x08multiply\x18\x03 \x01(\x08\"B\n\x18ResponseTMOAttrsAndTypes\x12&\n\x05\x61ttrs\x18\x01 \x03(\x0b\x32\x17.mo_info.TMOAttrAndType\"p\n\x1bRequestObjWithParamsLimited\x12\x0e\n\x06tmo_id\x18\x01 \x01(\x05\x12\x12\n\ntprm_names\x18\x02 \x03(\t\x12\r\n\x05limit\x18\x03 \x01(\x05\x12\x13\n\x06offset\x18\x04 \x01(\x05H\x00\x88\x01\x01\x42\t\n\x07_offset\",\n\x1cResponseObjWithParamsLimited\x12\x0c\n\x04\x64\x61ta\x18\x01 \x01(\t\"\'\n\x0fRequestTPRMData\x12\x14\n\x08tprm_ids\x18\x01 \x03(\x05\x42\x02\x10\x01\"&\n\x10ResponseTPRMData\x12\x12\n\ntprms_data\x18\x01 \x03(\t\"8\n\x15RequestTPRMNameToType\x12\x0e\n\x06tmo_id\x18\x01 \x01(\x05\x12\x0f\n\x07\x63olumns\x18\x02 \x03(\t\"\x84\x01\n\x16ResponseTPRMNameToType\x12;\n\x06mapper\x18\x01 \x03(\x0b\x32+.mo_info.ResponseTPRMNameToType.MapperEntry\x1a-\n\x0bMapperEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\x12\n\x10GetAllTMORequest\"%\n\x11GetAllTMOResponse\x12\x10\n\x08tmo_info\x18\x01 \x03(\t\"`\n GetAllMOWithParamsByTMOIdRequest\x12\x0e\n\x06tmo_id\x18\x01 \x01(\x05\x12\x1a\n\rreplace_links\x18\x02 \x01(\x08H\x00\x88\x01\x01\x42\x10\n\x0e_replace_links\"<\n!GetAllMOWithParamsByTMOIdResponse\x12\x17\n\x0fmos_with_params\x18\x01 \x03(\t\"+\n\x15GetMODataByIdsRequest\x12\x12\n\x06mo_ids\x18\x01 \x03(\x05\x42\x02\x10\x01\"2\n\x06MOData\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0e\n\x06tmo_id\x18\x03 \x01(\x05\"=\n\x16GetMODataByIdsResponse\x12#\n\nlist_of_mo\x18\x01 \x03(\x0b\x32\x0f.mo_info.MOData\"-\n\x16GetPRMsByPRMIdsRequest\x12\x13\n\x07prm_ids\x18\x01 \x03(\x05\x42\x02\x10\x01\"R\n\x13PRMMsgValueAsString\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0f\n\x07tprm_id\x18\x02 \x01(\x05\x12\x0f\n\x07version\x18\x03 \x01(\x05\x12\r\n\x05value\x18\x04 \x01(\t\"L\n\x17GetPRMsByPRMIdsResponse\x12\x31\n\x0blist_of_prm\x18\x01 \x03(\x0b\x32\x1c.mo_info.PRMMsgValueAsString\"-\n\x15RequestGetTPRMAlldata\x12\x14\n\x08tprm_ids\x18\x01 \x03(\x05\x42\x02\x10\x01\",\n\x16ResponseGetTPRMAlldata\x12\x12\n\ntprms_data\x18\x01 \x03(\t\"+\n\x19RequestGetAllTPRMSByTMOId\x12\x0e\n\x06tmo_id\x18\x01 \x01(\x05\"0\n\x1aResponseGetAllTPRMSByTMOId\x12\x12\n\ntprms_data\x18\x01 \x03(\t\"2\n\x1fRequestGetAllRawPRMDataByTPRMId\x12\x0f\n\x07tprm_id\x18\x01 \x01(\x05\"v\n(ResponseGetAllRawPRMDataByTPRMIdInnerMsg\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0f\n\x07version\x18\x02 \x01(\x05\x12\x0f\n\x07tprm_id\x18\x03 \x01(\x05\x12\r\n\x05mo_id\x18\x04 \x01(\x05\x12\r\n\x05value\x18\x05 \x01(\t\"c\n ResponseGetAllRawPRMDataByTPRMId\x12?\n\x04prms\x18\x01 \x03(\x0b\x32\x31.mo_info.ResponseGetAllRawPRMDataByTPRMIdInnerMsg\"B\n\x1eMOWithSpecialParametersRequest\x12\x0e\n\x06tmo_id\x18\x01 \x01(\x05\x12\x10\n\x08tprm_ids\x18\x02 \x03(\x05\":\n\x1fMOWithSpecialParametersResponse\x12\x17\n\x0fmos_with_params\x18\x01 \x03(\t\")\n\x17RequestGetMOsNamesByIds\x12\x0e\n\x06mo_ids\x18\x01 \x03(\x03\"\x8c\x01\n\x18ResponseGetMOsNamesByIds\x12@\n\x08mo_names\x18\x01 \x03(\x0b\x32..mo_info.ResponseGetMOsNamesByIds.MoNamesEntry\x1a.\n\x0cMoNamesEntry\x12\x0b\n\x03key\x18\x01 \x01(\x03\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"(\n\nQueryParam\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t\"C\n\x0bOrderByTPRM\x12\x0f\n\x07tprm_id\x18\x01 \x01(\x05\x12\x10\n\x08val_type\x18\x02 \x01(\t\x12\x11\n\tascending\x18\x03 \x01(\x08\"\xcf\x01\n RequestForFilteredObjInfoByTMOV2\x12\x16\n\x0eobject_type_id\x18\x01 \x01(\x05\x12)\n\x0cquery_params\x18\x02 \x03(\x0b\x32\x13.mo_info.QueryParam\x12&\n\x08order_by\x18\x03 \x03(\x0b\x32\x14.mo_info.OrderByTPRM\x12,\n\x0b\x64\x65\x63oded_jwt\x18\x04 \x01(\x0b\x32\x17.google.protobuf.Struct\x12\x12\n\x06mo_ids\x18\x05 \x03(\x05\x42\x02\x10\x01\"\x96\x02\n\x1eRequestForFilteredObjSpecialV2\x12\x16\n\x0eobject_type_id\x18\x01 \x01(\x05\x12)\n\x0cquery_params\x18\x02 \x03(\x0b\x32\x13.mo_info.QueryParam\x12&\n\x08order_by\x18\x03 \x03(\x0b\x32\x14.mo_info.OrderByTPRM\x12,\n\x0b\x64\x65\x63oded_jwt\x18\x04 \x01(\x0b\x32\x17.google.protobuf.Struct\x12\x12\n\x06mo_ids\x18\x05 \x03(\x05\x42\x02\x10\x01\x12\r\n\x05p_ids\x18\x06 \x03(\x05\x12\x10\n\x08only_ids\x18\x07 \x01(\x08\x12\x14\n\x08tprm_ids\x18\x08 \x03(\x05\x42\x02\x10\x01\x12\x10\n\x08mo_attrs\x18\t \x03(\t\"i\n\x03PRM\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0f\n\x07tprm_id\x18\x02 \x01(\x05\x12\r\n\x05mo_id\x18\x03 \x01(\x05\x12\x0f\n\x07version\x18\x04 \x01(\x05\x12%\n\x05value\x18\x05 \x01(\x0b\x32\x16.google.protobuf.Value\"\xc5\x06\n\x02MO\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x11\n\x04name\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x12\n\x05label\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x0e\n\x06tmo_id\x18\x04 \x01(\x05\x12\x11\n\x04p_id\x18\x05 \x01(\x05H\x02\x88\x01\x01\x12\x17\n\npoint_a_id\x18\x06 \x01(\x05H\x03\x88\x01\x01\x12\x17\n\npoint_b_id\x18\x07 \x01(\x05H\x04\x88\x01\x01\x12\x12\n\x05model\x18\x08 \x01(\tH\x05\x88\x01\x01\x12\x18\n\x0b\x64\x65scription\x18\t \x01(\tH\x06\x88\x01\x01\x12\x13\n\x06\x61\x63tive\x18\n \x01(\x08H\x07\x88\x01\x01\x12\x15\n\x08latitude\x18\x0b \x01(\x01H\x08\x88\x01\x01\x12\x16\n\tlongitude\x18\x0c \x01(\x01H\t\x88\x01\x01\x12\x13\n\x06status\x18\r \x01(\tH\n\x88\x01\x01\x12\x14\n\x07version\x18\x0e \x01(\x05H\x0b\x88\x01\x01\x12\x1b\n\x0e\x64ocument_count\x18\x0f \x01(\x05H\x0c\x88\x01\x01\x12$\n\x03pov\x18\x10 \x01(\x0b\x32\x17.google.protobuf.Struct\x12)\n\x08geometry\x18\x11 \x01(\x0b\x32\x17.google.protobuf.Struct\x12\x31\n\rcreation_date\x18\x12 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x35\n\x11modification_date\x18\x13 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x18\n\x0bparent_name\x18\x14 \x01(\tH\r\x88\x01\x01\x12\x19\n\x0cpoint_a_name\x18\x15 \x01(\tH\x0e\x88\x01\x01\x12\x19\n\x0cpoint_b_name\x18\x16 \x01(\tH\x0f\x88\x01\x01\x12\x1c\n\x06params\x18\x17 \x03(\x0b\x32\x0c.mo_info.PRMB\x07\n\x05_nameB\x08\n\x06_labelB\x07\n\x05_p_idB\r\n\x0b_point_a_idB\r\n\x0b_point_b_idB\x08\n\x06_modelB\x0e\n\x0c_descriptionB\t\n\x07_activeB\x0b\n\t_latitudeB\x0c\n\n_longitudeB\t\n\x07_statusB\n\n\x08_versionB\x11\n\x0f_document_countB\x0e\n\x0c_parent_nameB\x0f\n\r_point_a_nameB\x0f\n\r_point_b_name\"+\n\x0bResponseMOs\x12\x1c\n\x07objects\x18\x01 \x03(\x0b\x32\x0b.mo_info.MO\"K\n\x17ResponseMOdataSpecialV2\x12\x12\n\x06mo_ids\x18\x01 \x03(\x05\x42\x02\x10\x01\x12\x1c\n\x07objects\x18\x02 \x03(\x0b\x32\x0b.mo_info.MO2\x95\x18\n\x08Informer\x12\x42\n\x14GetParamsValuesForMO\x12\x14.mo_info.InfoRequest\x1a\x12.mo_info.InfoReply\"\x00\x12\x35\n\rGetTMOidForMo\x12\x11.mo_info.IntValue\x1a\x0f.mo_info.MOInfo\"\x00\x12Z\n\x10GetObjWithParams\x12\x1f.mo_info.RequestForObjInfoByTMO\x1a!.mo_info.ResponseWithObjInfoByTMO\"\x00\x30\x01\x12^\n\x18GetFilteredObjWithParams\x12\'.mo_info.RequestForFilteredObjInfoByTMO\x1a\x17.mo_info.ResponseMOdata\"\x00\x12\x66\n\x1eGetFilteredObjWithParamsStream\x12\'.mo_info.RequestForFilteredObjInfoByTMO\x1a\x17.mo_info.ResponseMOdata\"\x00\x30\x01\x12\x66\n\x0fGetTMOlifecycle\x12\'.mo_info.RequestTMOlifecycleByTMOidList\x1a(.mo_info.ResponseTMOlifecycleByTMOidList\"\x00\x12V\n\x15GetMOSeverityMaxValue\x12\x1c.mo_info.RequestSeverityMoId\x1a\x1d.mo_info.ResponseSeverityMoId\"\x00\x12\x62\n\x17GetMOQuantityBySeverity\x12\x1e.mo_info.RequestSeverityValues\x1a%.mo_info.ResponseMOQuantityBySeverity\"\x00\x12\x45\n\x0cGetTPRMNames\x12\x17.mo_info.RequestTPRMIds\x1a\x1a.mo_info.ResponseTPRMNames\"\x00\x12\x62\n\x15GetFilteredObjSpecial\x12%.mo_info.RequestForFilteredObjSpecial\x1a\x1e.mo_info.ResponseMOdataSpecial\"\x00\x30\x01\x12U\n\x19GetHierarchyLevelChildren\x12\x1a.mo_info.RequestListLevels\x1a\x1a.mo_info.ResponseListNodes\"\x00\x12n\n\x19GetMODetailsWithTPRMNames\x12&.mo_info.RequestMODetailsWithTPRMNames\x1a\'.mo_info.ResponseMODetailsWithTPRMNames\"\x00\x12\x66\n\x1dGetColumnsForMaterializedView\x12 .mo_info.RequestTMOAttrsAndTypes\x1a!.mo_info.ResponseTMOAttrsAndTypes\"\x00\x12H\n\x11GetTMOInfoByTMOId\x12\x17.mo_info.TMOInfoRequest\x1a\x18.mo_info.TMOInfoResponse\"\x00\x12\x46\n\x10GetTMOInfoByMOId\x12\x16.mo_info.MOInfoRequest\x1a\x18.mo_info.ResponseListInt\"\x00\x12j\n\x17GetObjWithParamsLimited\x12$.mo_info.RequestObjWithParamsLimited\x1a%.mo_info.ResponseObjWithParamsLimited\"\x00\x30\x01\x12\x44\n\x0bGetTPRMData\x12\x18.mo_info.RequestTPRMData\x1a\x19.mo_info.ResponseTPRMData\"\x00\x12Y\n\x17GetTPRMNameToTypeMapper\x12\x1e.mo_info.RequestTPRMNameToType\x1a\x1c.mo_info.DeleteMOIdsResponse\"\x00\x12M\n\x0e\x44\x65leteMOsByIds\x12\x1b.mo_info.DeleteMOIdsRequest\x1a\x1c.mo_info.DeleteMOIdsResponse\"\x00\x12\x44\n\tGetAllTMO\x12\x19.mo_info.GetAllTMORequest\x1a\x1a.mo_info.GetAllTMOResponse\"\x00\x12v\n\x19GetAllMOWithParamsByTMOId\x12).mo_info.GetAllMOWithParamsByTMOIdRequest\x1a*.mo_info.GetAllMOWithParamsByTMOIdResponse\"\x00\x30\x01\x12U\n\x0eGetMODataByIds\x12\x1e.mo_info.GetMODataByIdsRequest\x1a\x1f.mo_info.GetMODataByIdsResponse\"\x00\x30\x01\x12X\n\x0fGetPRMsByPRMIds\x12\x1f.mo_info.GetPRMsByPRMIdsRequest\x1a .mo_info.GetPRMsByPRMIdsResponse\"\x00\x30\x01\x12U\n\x0eGetTPRMAllData\x12\x1e.mo_info.RequestGetTPRMAlldata\x1a\x1f.mo_info.ResponseGetTPRMAlldata\"\x00\x30\x01\x12\x61\n\x12GetAllTPRMSByTMOId\x12\".mo_info.RequestGetAllTPRMSByTMOId\x1a#.mo_info.ResponseGetAllTPRMSByTMOId\"\x00\x30\x01\x12s\n\x18GetAllRawPRMDataByTPRMId\x12(.mo_info.RequestGetAllRawPRMDataByTPRMId\x1a).mo_info.ResponseGetAllRawPRMDataByTPRMId\"\x00\x30\x01\x12n\n!GetFilteredObjSpecialExperimental\x12%.mo_info.RequestForFilteredObjSpecial\x1a\x1e.mo_info.ResponseMOdataSpecial\"\x00\x30\x01\x12}\n$GetAllMOByTMOIdWithSpecialParameters\x12\'.mo_info.MOWithSpecialParametersRequest\x1a(.mo_info.MOWithSpecialParametersResponse\"\x00\x30\x01\x12Y\n\x10GetMOsNamesByIds\x12 .mo_info.RequestGetMOsNamesByIds\x1a!.mo_info.ResponseGetMOsNamesByIds\"\x00\x12_\n\x1aGetFilteredObjWithParamsV2\x12).mo_info.RequestForFilteredObjInfoByTMOV2\x1a\x14.mo_info.ResponseMOs\"\x00\x12g\n GetFilteredObjWithParamsStreamV2\x12).mo_info.RequestForFilteredObjInfoByTMOV2\x1a\x14.mo_info.ResponseMOs\"\x00\x30\x01\x12h\n\x17GetFilteredObjSpecialV2\x12\'.mo_info.RequestForFilteredObjSpecialV2\x1a .mo_info.ResponseMOdataSpecialV2\"\x00\x30\x01\x12\x62\n\x1bGetAllMOWithParamsByTMOIdV2\x12).mo_info.GetAllMOWithParamsByTMOIdRequest\x1a\x14.mo_info.ResponseMOs\"\x00\x30\x01\x62\x06proto3')
 
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'inventory_data_pb2', globals())
@@ -65,146 +67,170 @@ if _descriptor._USE_C_DESCRIPTORS == False:
   _REQUESTGETTPRMALLDATA.fields_by_name['tprm_ids']._serialized_options = b'\020\001'
   _RESPONSEGETMOSNAMESBYIDS_MONAMESENTRY._options = None
   _RESPONSEGETMOSNAMESBYIDS_MONAMESENTRY._serialized_options = b'8\001'
-  _DELETEMOIDSREQUEST._serialized_start=60
-  _DELETEMOIDSREQUEST._serialized_end=95
-  _DELETEMOIDSRESPONSE._serialized_start=97
-  _DELETEMOIDSRESPONSE._serialized_end=144
-  _TMOINFOREQUEST._serialized_start=146
-  _TMOINFOREQUEST._serialized_end=178
-  _MOINFOREQUEST._serialized_start=180
-  _MOINFOREQUEST._serialized_end=211
-  _TMOINFORESPONSE._serialized_start=213
-  _TMOINFORESPONSE._serialized_end=248
-  _INFOREQUEST._serialized_start=250
-  _INFOREQUEST._serialized_end=300
-  _REQUESTSEVERITYMOID._serialized_start=302
-  _REQUESTSEVERITYMOID._serialized_end=359
-  _RESPONSESEVERITYMOID._serialized_start=361
-  _RESPONSESEVERITYMOID._serialized_end=405
-  _REQUESTSEVERITYVALUES._serialized_start=407
-  _REQUESTSEVERITYVALUES._serialized_end=485
-  _RESPONSEMOQUANTITYBYSEVERITY._serialized_start=487
-  _RESPONSEMOQUANTITYBYSEVERITY._serialized_end=539
-  _VALUEOFDICT._serialized_start=541
-  _VALUEOFDICT._serialized_end=599
-  _INFOREPLY._serialized_start=602
-  _INFOREPLY._serialized_end=731
-  _INFOREPLY_MOINFOENTRY._serialized_start=664
-  _INFOREPLY_MOINFOENTRY._serialized_end=731
-  _MOINFO._serialized_start=733
-  _MOINFO._serialized_end=771
-  _STRINGVALUE._serialized_start=773
-  _STRINGVALUE._serialized_end=801
-  _INTVALUE._serialized_start=803
-  _INTVALUE._serialized_end=828
-  _FLOATVALUE._serialized_start=830
-  _FLOATVALUE._serialized_end=857
-  _BOOLVALUE._serialized_start=859
-  _BOOLVALUE._serialized_end=885
-  _REQUESTFOROBJINFOBYTMO._serialized_start=887
-  _REQUESTFOROBJINFOBYTMO._serialized_end=974
-  _RESPONSELISTINT._serialized_start=976
-  _RESPONSELISTINT._serialized_end=1009
-  _RESPONSEWITHOBJINFOBYTMO._serialized_start=1012
-  _RESPONSEWITHOBJINFOBYTMO._serialized_end=1190
-  _RESPONSEWITHOBJINFOBYTMO_TPRMVALUESENTRY._serialized_start=1141
-  _RESPONSEWITHOBJINFOBYTMO_TPRMVALUESENTRY._serialized_end=1190
-  _REQUESTTMOLIFECYCLEBYTMOIDLIST._serialized_start=1192
-  _REQUESTTMOLIFECYCLEBYTMOIDLIST._serialized_end=1245
-  _RESPONSETMOLIFECYCLEBYTMOIDLIST._serialized_start=1247
-  _RESPONSETMOLIFECYCLEBYTMOIDLIST._serialized_end=1316
-  _REQUESTFORFILTEREDOBJINFOBYTMO._serialized_start=1319
-  _REQUESTFORFILTEREDOBJINFOBYTMO._serialized_end=1456
-  _RESPONSEMODATA._serialized_start=1458
-  _RESPONSEMODATA._serialized_end=1507
-  _REQUESTTPRMIDS._serialized_start=1509
-  _REQUESTTPRMIDS._serialized_end=1547
-  _RESPONSETPRMNAME._serialized_start=1549
-  _RESPONSETPRMNAME._serialized_end=1603
-  _RESPONSETPRMNAMES._serialized_start=1605
-  _RESPONSETPRMNAMES._serialized_end=1666
-  _REQUESTFORFILTEREDOBJSPECIAL._serialized_start=1669
-  _REQUESTFORFILTEREDOBJSPECIAL._serialized_end=1877
-  _RESPONSEMODATASPECIAL._serialized_start=1879
-  _RESPONSEMODATASPECIAL._serialized_end=1949
-  _REQUESTNODE._serialized_start=1951
-  _REQUESTNODE._serialized_end=2001
-  _REQUESTLEVEL._serialized_start=2004
-  _REQUESTLEVEL._serialized_end=2152
-  _REQUESTLISTLEVELS._serialized_start=2154
-  _REQUESTLISTLEVELS._serialized_end=2211
-  _RESPONSENODE._serialized_start=2213
-  _RESPONSENODE._serialized_end=2273
-  _RESPONSELISTNODES._serialized_start=2275
-  _RESPONSELISTNODES._serialized_end=2332
-  _REQUESTMODETAILSWITHTPRMNAMES._serialized_start=2334
-  _REQUESTMODETAILSWITHTPRMNAMES._serialized_end=2381
-  _RESPONSEMODETAILSWITHTPRMNAMES._serialized_start=2383
-  _RESPONSEMODETAILSWITHTPRMNAMES._serialized_end=2431
-  _REQUESTTMOATTRSANDTYPES._serialized_start=2433
-  _REQUESTTMOATTRSANDTYPES._serialized_end=2474
-  _TMOATTRANDTYPE._serialized_start=2476
-  _TMOATTRANDTYPE._serialized_end=2538
-  _RESPONSETMOATTRSANDTYPES._serialized_start=2540
-  _RESPONSETMOATTRSANDTYPES._serialized_end=2606
-  _REQUESTOBJWITHPARAMSLIMITED._serialized_start=2608
-  _REQUESTOBJWITHPARAMSLIMITED._serialized_end=2720
-  _RESPONSEOBJWITHPARAMSLIMITED._serialized_start=2722
-  _RESPONSEOBJWITHPARAMSLIMITED._serialized_end=2766
-  _REQUESTTPRMDATA._serialized_start=2768
-  _REQUESTTPRMDATA._serialized_end=2807
-  _RESPONSETPRMDATA._serialized_start=2809
-  _RESPONSETPRMDATA._serialized_end=2847
-  _REQUESTTPRMNAMETOTYPE._serialized_start=2849
-  _REQUESTTPRMNAMETOTYPE._serialized_end=2905
-  _RESPONSETPRMNAMETOTYPE._serialized_start=2908
-  _RESPONSETPRMNAMETOTYPE._serialized_end=3040
-  _RESPONSETPRMNAMETOTYPE_MAPPERENTRY._serialized_start=2995
-  _RESPONSETPRMNAMETOTYPE_MAPPERENTRY._serialized_end=3040
-  _GETALLTMOREQUEST._serialized_start=3042
-  _GETALLTMOREQUEST._serialized_end=3060
-  _GETALLTMORESPONSE._serialized_start=3062
-  _GETALLTMORESPONSE._serialized_end=3099
-  _GETALLMOWITHPARAMSBYTMOIDREQUEST._serialized_start=3101
-  _GETALLMOWITHPARAMSBYTMOIDREQUEST._serialized_end=3197
-  _GETALLMOWITHPARAMSBYTMOIDRESPONSE._serialized_start=3199
-  _GETALLMOWITHPARAMSBYTMOIDRESPONSE._serialized_end=3259
-  _GETMODATABYIDSREQUEST._serialized_start=3261
-  _GETMODATABYIDSREQUEST._serialized_end=3304
-  _MODATA._serialized_start=3306
-  _MODATA._serialized_end=3356
-  _GETMODATABYIDSRESPONSE._serialized_start=3358
-  _GETMODATABYIDSRESPONSE._serialized_end=3419
-  _GETPRMSBYPRMIDSREQUEST._serialized_start=3421
-  _GETPRMSBYPRMIDSREQUEST._serialized_end=3466
-  _PRMMSGVALUEASSTRING._serialized_start=3468
-  _PRMMSGVALUEASSTRING._serialized_end=3550
-  _GETPRMSBYPRMIDSRESPONSE._serialized_start=3552
-  _GETPRMSBYPRMIDSRESPONSE._serialized_end=3628
-  _REQUESTGETTPRMALLDATA._serialized_start=3630
-  _REQUESTGETTPRMALLDATA._serialized_end=3675
-  _RESPONSEGETTPRMALLDATA._serialized_start=3677
-  _RESPONSEGETTPRMALLDATA._serialized_end=3721
-  _REQUESTGETALLTPRMSBYTMOID._serialized_start=3723
-  _REQUESTGETALLTPRMSBYTMOID._serialized_end=3766
-  _RESPONSEGETALLTPRMSBYTMOID._serialized_start=3768
-  _RESPONSEGETALLTPRMSBYTMOID._serialized_end=3816
-  _REQUESTGETALLRAWPRMDATABYTPRMID._serialized_start=3818
-  _REQUESTGETALLRAWPRMDATABYTPRMID._serialized_end=3868
-  _RESPONSEGETALLRAWPRMDATABYTPRMIDINNERMSG._serialized_start=3870
-  _RESPONSEGETALLRAWPRMDATABYTPRMIDINNERMSG._serialized_end=3988
-  _RESPONSEGETALLRAWPRMDATABYTPRMID._serialized_start=3990
-  _RESPONSEGETALLRAWPRMDATABYTPRMID._serialized_end=4089
-  _MOWITHSPECIALPARAMETERSREQUEST._serialized_start=4091
-  _MOWITHSPECIALPARAMETERSREQUEST._serialized_end=4157
-  _MOWITHSPECIALPARAMETERSRESPONSE._serialized_start=4159
-  _MOWITHSPECIALPARAMETERSRESPONSE._serialized_end=4217
-  _REQUESTGETMOSNAMESBYIDS._serialized_start=4219
-  _REQUESTGETMOSNAMESBYIDS._serialized_end=4260
-  _RESPONSEGETMOSNAMESBYIDS._serialized_start=4263
-  _RESPONSEGETMOSNAMESBYIDS._serialized_end=4403
-  _RESPONSEGETMOSNAMESBYIDS_MONAMESENTRY._serialized_start=4357
-  _RESPONSEGETMOSNAMESBYIDS_MONAMESENTRY._serialized_end=4403
-  _INFORMER._serialized_start=4406
-  _INFORMER._serialized_end=7091
+  _REQUESTFORFILTEREDOBJINFOBYTMOV2.fields_by_name['mo_ids']._options = None
+  _REQUESTFORFILTEREDOBJINFOBYTMOV2.fields_by_name['mo_ids']._serialized_options = b'\020\001'
+  _REQUESTFORFILTEREDOBJSPECIALV2.fields_by_name['mo_ids']._options = None
+  _REQUESTFORFILTEREDOBJSPECIALV2.fields_by_name['mo_ids']._serialized_options = b'\020\001'
+  _REQUESTFORFILTEREDOBJSPECIALV2.fields_by_name['tprm_ids']._options = None
+  _REQUESTFORFILTEREDOBJSPECIALV2.fields_by_name['tprm_ids']._serialized_options = b'\020\001'
+  _RESPONSEMODATASPECIALV2.fields_by_name['mo_ids']._options = None
+  _RESPONSEMODATASPECIALV2.fields_by_name['mo_ids']._serialized_options = b'\020\001'
+  _DELETEMOIDSREQUEST._serialized_start=123
+  _DELETEMOIDSREQUEST._serialized_end=158
+  _DELETEMOIDSRESPONSE._serialized_start=160
+  _DELETEMOIDSRESPONSE._serialized_end=207
+  _TMOINFOREQUEST._serialized_start=209
+  _TMOINFOREQUEST._serialized_end=241
+  _MOINFOREQUEST._serialized_start=243
+  _MOINFOREQUEST._serialized_end=274
+  _TMOINFORESPONSE._serialized_start=276
+  _TMOINFORESPONSE._serialized_end=311
+  _INFOREQUEST._serialized_start=313
+  _INFOREQUEST._serialized_end=363
+  _REQUESTSEVERITYMOID._serialized_start=365
+  _REQUESTSEVERITYMOID._serialized_end=422
+  _RESPONSESEVERITYMOID._serialized_start=424
+  _RESPONSESEVERITYMOID._serialized_end=468
+  _REQUESTSEVERITYVALUES._serialized_start=470
+  _REQUESTSEVERITYVALUES._serialized_end=548
+  _RESPONSEMOQUANTITYBYSEVERITY._serialized_start=550
+  _RESPONSEMOQUANTITYBYSEVERITY._serialized_end=602
+  _VALUEOFDICT._serialized_start=604
+  _VALUEOFDICT._serialized_end=662
+  _INFOREPLY._serialized_start=665
+  _INFOREPLY._serialized_end=794
+  _INFOREPLY_MOINFOENTRY._serialized_start=727
+  _INFOREPLY_MOINFOENTRY._serialized_end=794
+  _MOINFO._serialized_start=796
+  _MOINFO._serialized_end=834
+  _STRINGVALUE._serialized_start=836
+  _STRINGVALUE._serialized_end=864
+  _INTVALUE._serialized_start=866
+  _INTVALUE._serialized_end=891
+  _FLOATVALUE._serialized_start=893
+  _FLOATVALUE._serialized_end=920
+  _BOOLVALUE._serialized_start=922
+  _BOOLVALUE._serialized_end=948
+  _REQUESTFOROBJINFOBYTMO._serialized_start=950
+  _REQUESTFOROBJINFOBYTMO._serialized_end=1037
+  _RESPONSELISTINT._serialized_start=1039
+  _RESPONSELISTINT._serialized_end=1072
+  _RESPONSEWITHOBJINFOBYTMO._serialized_start=1075
+  _RESPONSEWITHOBJINFOBYTMO._serialized_end=1253
+  _RESPONSEWITHOBJINFOBYTMO_TPRMVALUESENTRY._serialized_start=1204
+  _RESPONSEWITHOBJINFOBYTMO_TPRMVALUESENTRY._serialized_end=1253
+  _REQUESTTMOLIFECYCLEBYTMOIDLIST._serialized_start=1255
+  _REQUESTTMOLIFECYCLEBYTMOIDLIST._serialized_end=1308
+  _RESPONSETMOLIFECYCLEBYTMOIDLIST._serialized_start=1310
+  _RESPONSETMOLIFECYCLEBYTMOIDLIST._serialized_end=1379
+  _REQUESTFORFILTEREDOBJINFOBYTMO._serialized_start=1382
+  _REQUESTFORFILTEREDOBJINFOBYTMO._serialized_end=1519
+  _RESPONSEMODATA._serialized_start=1521
+  _RESPONSEMODATA._serialized_end=1570
+  _REQUESTTPRMIDS._serialized_start=1572
+  _REQUESTTPRMIDS._serialized_end=1610
+  _RESPONSETPRMNAME._serialized_start=1612
+  _RESPONSETPRMNAME._serialized_end=1666
+  _RESPONSETPRMNAMES._serialized_start=1668
+  _RESPONSETPRMNAMES._serialized_end=1729
+  _REQUESTFORFILTEREDOBJSPECIAL._serialized_start=1732
+  _REQUESTFORFILTEREDOBJSPECIAL._serialized_end=1940
+  _RESPONSEMODATASPECIAL._serialized_start=1942
+  _RESPONSEMODATASPECIAL._serialized_end=2012
+  _REQUESTNODE._serialized_start=2014
+  _REQUESTNODE._serialized_end=2064
+  _REQUESTLEVEL._serialized_start=2067
+  _REQUESTLEVEL._serialized_end=2215
+  _REQUESTLISTLEVELS._serialized_start=2217
+  _REQUESTLISTLEVELS._serialized_end=2274
+  _RESPONSENODE._serialized_start=2276
+  _RESPONSENODE._serialized_end=2336
+  _RESPONSELISTNODES._serialized_start=2338
+  _RESPONSELISTNODES._serialized_end=2395
+  _REQUESTMODETAILSWITHTPRMNAMES._serialized_start=2397
+  _REQUESTMODETAILSWITHTPRMNAMES._serialized_end=2444
+  _RESPONSEMODETAILSWITHTPRMNAMES._serialized_start=2446
+  _RESPONSEMODETAILSWITHTPRMNAMES._serialized_end=2494
+  _REQUESTTMOATTRSANDTYPES._serialized_start=2496
+  _REQUESTTMOATTRSANDTYPES._serialized_end=2537
+  _TMOATTRANDTYPE._serialized_start=2539
+  _TMOATTRANDTYPE._serialized_end=2601
+  _RESPONSETMOATTRSANDTYPES._serialized_start=2603
+  _RESPONSETMOATTRSANDTYPES._serialized_end=2669
+  _REQUESTOBJWITHPARAMSLIMITED._serialized_start=2671
+  _REQUESTOBJWITHPARAMSLIMITED._serialized_end=2783
+  _RESPONSEOBJWITHPARAMSLIMITED._serialized_start=2785
+  _RESPONSEOBJWITHPARAMSLIMITED._serialized_end=2829
+  _REQUESTTPRMDATA._serialized_start=2831
+  _REQUESTTPRMDATA._serialized_end=2870
+  _RESPONSETPRMDATA._serialized_start=2872
+  _RESPONSETPRMDATA._serialized_end=2910
+  _REQUESTTPRMNAMETOTYPE._serialized_start=2912
+  _REQUESTTPRMNAMETOTYPE._serialized_end=2968
+  _RESPONSETPRMNAMETOTYPE._serialized_start=2971
+  _RESPONSETPRMNAMETOTYPE._serialized_end=3103
+  _RESPONSETPRMNAMETOTYPE_MAPPERENTRY._serialized_start=3058
+  _RESPONSETPRMNAMETOTYPE_MAPPERENTRY._serialized_end=3103
+  _GETALLTMOREQUEST._serialized_start=3105
+  _GETALLTMOREQUEST._serialized_end=3123
+  _GETALLTMORESPONSE._serialized_start=3125
+  _GETALLTMORESPONSE._serialized_end=3162
+  _GETALLMOWITHPARAMSBYTMOIDREQUEST._serialized_start=3164
+  _GETALLMOWITHPARAMSBYTMOIDREQUEST._serialized_end=3260
+  _GETALLMOWITHPARAMSBYTMOIDRESPONSE._serialized_start=3262
+  _GETALLMOWITHPARAMSBYTMOIDRESPONSE._serialized_end=3322
+  _GETMODATABYIDSREQUEST._serialized_start=3324
+  _GETMODATABYIDSREQUEST._serialized_end=3367
+  _MODATA._serialized_start=3369
+  _MODATA._serialized_end=3419
+  _GETMODATABYIDSRESPONSE._serialized_start=3421
+  _GETMODATABYIDSRESPONSE._serialized_end=3482
+  _GETPRMSBYPRMIDSREQUEST._serialized_start=3484
+  _GETPRMSBYPRMIDSREQUEST._serialized_end=3529
+  _PRMMSGVALUEASSTRING._serialized_start=3531
+  _PRMMSGVALUEASSTRING._serialized_end=3613
+  _GETPRMSBYPRMIDSRESPONSE._serialized_start=3615
+  _GETPRMSBYPRMIDSRESPONSE._serialized_end=3691
+  _REQUESTGETTPRMALLDATA._serialized_start=3693
+  _REQUESTGETTPRMALLDATA._serialized_end=3738
+  _RESPONSEGETTPRMALLDATA._serialized_start=3740
+  _RESPONSEGETTPRMALLDATA._serialized_end=3784
+  _REQUESTGETALLTPRMSBYTMOID._serialized_start=3786
+  _REQUESTGETALLTPRMSBYTMOID._serialized_end=3829
+  _RESPONSEGETALLTPRMSBYTMOID._serialized_start=3831
+  _RESPONSEGETALLTPRMSBYTMOID._serialized_end=3879
+  _REQUESTGETALLRAWPRMDATABYTPRMID._serialized_start=3881
+  _REQUESTGETALLRAWPRMDATABYTPRMID._serialized_end=3931
+  _RESPONSEGETALLRAWPRMDATABYTPRMIDINNERMSG._serialized_start=3933
+  _RESPONSEGETALLRAWPRMDATABYTPRMIDINNERMSG._serialized_end=4051
+  _RESPONSEGETALLRAWPRMDATABYTPRMID._serialized_start=4053
+  _RESPONSEGETALLRAWPRMDATABYTPRMID._serialized_end=4152
+  _MOWITHSPECIALPARAMETERSREQUEST._serialized_start=4154
+  _MOWITHSPECIALPARAMETERSREQUEST._serialized_end=4220
+  _MOWITHSPECIALPARAMETERSRESPONSE._serialized_start=4222
+  _MOWITHSPECIALPARAMETERSRESPONSE._serialized_end=4280
+  _REQUESTGETMOSNAMESBYIDS._serialized_start=4282
+  _REQUESTGETMOSNAMESBYIDS._serialized_end=4323
+  _RESPONSEGETMOSNAMESBYIDS._serialized_start=4326
+  _RESPONSEGETMOSNAMESBYIDS._serialized_end=4466
+  _RESPONSEGETMOSNAMESBYIDS_MONAMESENTRY._serialized_start=4420
+  _RESPONSEGETMOSNAMESBYIDS_MONAMESENTRY._serialized_end=4466
+  _QUERYPARAM._serialized_start=4468
+  _QUERYPARAM._serialized_end=4508
+  _ORDERBYTPRM._serialized_start=4510
+  _ORDERBYTPRM._serialized_end=4577
+  _REQUESTFORFILTEREDOBJINFOBYTMOV2._serialized_start=4580
+  _REQUESTFORFILTEREDOBJINFOBYTMOV2._serialized_end=4787
+  _REQUESTFORFILTEREDOBJSPECIALV2._serialized_start=4790
+  _REQUESTFORFILTEREDOBJSPECIALV2._serialized_end=5068
+  _PRM._serialized_start=5070
+  _PRM._serialized_end=5175
+  _MO._serialized_start=5178
+  _MO._serialized_end=6015
+  _RESPONSEMOS._serialized_start=6017
+  _RESPONSEMOS._serialized_end=6060
+  _RESPONSEMODATASPECIALV2._serialized_start=6062
+  _RESPONSEMODATASPECIALV2._serialized_end=6137
+  _INFORMER._serialized_start=6140
+  _INFORMER._serialized_end=9233
 # @@protoc_insertion_point(module_scope)
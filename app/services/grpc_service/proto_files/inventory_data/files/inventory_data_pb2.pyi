@@ -1,4 +1,6 @@
 from google.protobuf import any_pb2 as _any_pb2
+from google.protobuf import struct_pb2 as _struct_pb2
+from google.protobuf import timestamp_pb2 as _timestamp_pb2
 from google.protobuf.internal import containers as _containers
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import message as _message
@@ -105,6 +107,56 @@ class IntValue(_message.Message):
     value: int
     def __init__(self, value: _Optional[int] = ...) -> None: ...
 
+class MO(_message.Message):
+    __slots__ = ["active", "creation_date", "description", "document_count", "geometry", "id", "label", "latitude", "longitude", "model", "modification_date", "name", "p_id", "params", "parent_name", "point_a_id", "point_a_name", "point_b_id", "point_b_name", "pov", "status", "tmo_id", "version"]
+    ACTIVE_FIELD_NUMBER: _ClassVar[int]
+    CREATION_DATE_FIELD_NUMBER: _ClassVar[int]
+    DESCRIPTION_FIELD_NUMBER: _ClassVar[int]
+    DOCUMENT_COUNT_FIELD_NUMBER: _ClassVar[int]
+    GEOMETRY_FIELD_NUMBER: _ClassVar[int]
+    ID_FIELD_NUMBER: _ClassVar[int]
+    LABEL_FIELD_NUMBER: _ClassVar[int]
+    LATITUDE_FIELD_NUMBER: _ClassVar[int]
+    LONGITUDE_FIELD_NUMBER: _ClassVar[int]
+    MODEL_FIELD_NUMBER: _ClassVar[int]
+    MODIFICATION_DATE_FIELD_NUMBER: _ClassVar[int]
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    PARAMS_FIELD_NUMBER: _ClassVar[int]
+    PARENT_NAME_FIELD_NUMBER: _ClassVar[int]
+    POINT_A_ID_FIELD_NUMBER: _ClassVar[int]
+    POINT_A_NAME_FIELD_NUMBER: _ClassVar[int]
+    POINT_B_ID_FIELD_NUMBER: _ClassVar[int]
+    POINT_B_NAME_FIELD_NUMBER: _ClassVar[int]
+    POV_FIELD_NUMBER: _ClassVar[int]
+    P_ID_FIELD_NUMBER: _ClassVar[int]
+    STATUS_FIELD_NUMBER: _ClassVar[int]
+    TMO_ID_FIELD_NUMBER: _ClassVar[int]
+    VERSION_FIELD_NUMBER: _ClassVar[int]
+    active: bool
+    creation_date: _timestamp_pb2.Timestamp
+    description: str
+    document_count: int
+    geometry: _struct_pb2.Struct
+    id: int
+    label: str
+    latitude: float
+    longitude: float
+    model: str
+    modification_date: _timestamp_pb2.Timestamp
+    name: str
+    p_id: int
+    params: _containers.RepeatedCompositeFieldContainer[PRM]
+    parent_name: str
+    point_a_id: int
+    point_a_name: str
+    point_b_id: int
+    point_b_name: str
+    pov: _struct_pb2.Struct
+    status: str
+    tmo_id: int
+    version: int
+    def __init__(self, id: _Optional[int] = ..., name: _Optional[str] = ..., label: _Optional[str] = ..., tmo_id: _Optional[int] = ..., p_id: _Optional[int] = ..., point_a_id: _Optional[int] = ..., point_b_id: _Optional[int] = ..., model: _Optional[str] = ..., description: _Optional[str] = ..., active: bool = ..., latitude: _Optional[float] = ..., longitude: _Optional[float] = ..., status: _Optional[str] = ..., version: _Optional[int] = ..., document_count: _Optional[int] = ..., pov: _Optional[_Union[_struct_pb2.Struct, _Mapping]] = ..., geometry: _Optional[_Union[_struct_pb2.Struct, _Mapping]] = ..., creation_date: _Optional[_Union[_timestamp_pb2.Timestamp, _Mapping]] = ..., modification_date: _Optional[_Union[_timestamp_pb2.Timestamp, _Mapping]] = ..., parent_name: _Optional[str] = ..., point_a_name: _Optional[str] = ..., point_b_name: _Optional[str] = ..., params: _Optional[_Iterable[_Union[PRM, _Mapping]]] = ...) -> None: ...
+
 class MOData(_message.Message):
     __slots__ = ["id", "name", "tmo_id"]
     ID_FIELD_NUMBER: _ClassVar[int]
@@ -143,6 +195,30 @@ class MOWithSpecialParametersResponse(_message.Message):
     mos_with_params: _containers.RepeatedScalarFieldContainer[str]
     def __init__(self, mos_with_params: _Optional[_Iterable[str]] = ...) -> None: ...
 
+class OrderByTPRM(_message.Message):
+    __slots__ = ["ascending", "tprm_id", "val_type"]
+    ASCENDING_FIELD_NUMBER: _ClassVar[int]
+    TPRM_ID_FIELD_NUMBER: _ClassVar[int]
+    VAL_TYPE_FIELD_NUMBER: _ClassVar[int]
+    ascending: bool
+    tprm_id: int
+    val_type: str
+    def __init__(self, tprm_id: _Optional[int] = ..., val_type: _Optional[str] = ..., ascending: bool = ...) -> None: ...
+
+class PRM(_message.Message):
+    __slots__ = ["id", "mo_id", "tprm_id", "value", "version"]
+    ID_FIELD_NUMBER: _ClassVar[int]
+    MO_ID_FIELD_NUMBER: _ClassVar[int]
+    TPRM_ID_FIELD_NUMBER: _ClassVar[int]
+    VALUE_FIELD_NUMBER: _ClassVar[int]
+    VERSION_FIELD_NUMBER: _ClassVar[int]
+    id: int
+    mo_id: int
+    tprm_id: int
+    value: _struct_pb2.Value
+    version: int
+    def __init__(self, id: _Optional[int] = ..., tprm_id: _Optional[int] = ..., mo_id: _Optional[int] = ..., version: _Optional[int] = ..., value: _Optional[_Union[_struct_pb2.Value, _Mapping]] = ...) -> None: ...
+
 class PRMMsgValueAsString(_message.Message):
     __slots__ = ["id", "tprm_id", "value", "version"]
     ID_FIELD_NUMBER: _ClassVar[int]
@@ -155,6 +231,14 @@ class PRMMsgValueAsString(_message.Message):
     version: int
     def __init__(self, id: _Optional[int] = ..., tprm_id: _Optional[int] = ..., version: _Optional[int] = ..., value: _Optional[str] = ...) -> None: ...
 
+class QueryParam(_message.Message):
+    __slots__ = ["key", "value"]
+    KEY_FIELD_NUMBER: _ClassVar[int]
+    VALUE_FIELD_NUMBER: _ClassVar[int]
+    key: str
+    value: str
+    def __init__(self, key: _Optional[str] = ..., value: _Optional[str] = ...) -> None: ...
+
 class RequestForFilteredObjInfoByTMO(_message.Message):
     __slots__ = ["decoded_jwt", "mo_ids", "object_type_id", "order_by", "query_params"]
     DECODED_JWT_FIELD_NUMBER: _ClassVar[int]
@@ -169,6 +253,20 @@ class RequestForFilteredObjInfoByTMO(_message.Message):
     query_params: str
     def __init__(self, object_type_id: _Optional[int] = ..., query_params: _Optional[str] = ..., order_by: _Optional[str] = ..., decoded_jwt: _Optional[str] = ..., mo_ids: _Optional[_Iterable[int]] = ...) -> None: ...
 
+class RequestForFilteredObjInfoByTMOV2(_message.Message):
+    __slots__ = ["decoded_jwt", "mo_ids", "object_type_id", "order_by", "query_params"]
+    DECODED_JWT_FIELD_NUMBER: _ClassVar[int]
+    MO_IDS_FIELD_NUMBER: _ClassVar[int]
+    OBJECT_TYPE_ID_FIELD_NUMBER: _ClassVar[int]
+    ORDER_BY_FIELD_NUMBER: _ClassVar[int]
+    QUERY_PARAMS_FIELD_NUMBER: _ClassVar[int]
+    decoded_jwt: _struct_pb2.Struct
+    mo_ids: _containers.RepeatedScalarFieldContainer[int]
+    object_type_id: int
+    order_by: _containers.RepeatedCompositeFieldContainer[OrderByTPRM]
+    query_params: _containers.RepeatedCompositeFieldContainer[QueryParam]
+    def __init__(self, object_type_id: _Optional[int] = ..., query_params: _Optional[_Iterable[_Union[QueryParam, _Mapping]]] = ..., order_by: _Optional[_Iterable[_Union[OrderByTPRM, _Mapping]]] = ..., decoded_jwt: _Optional[_Union[_struct_pb2.Struct, _Mapping]] = ..., mo_ids: _Optional[_Iterable[int]] = ...) -> None: ...
+
 class RequestForFilteredObjSpecial(_message.Message):
     __slots__ = ["decoded_jwt", "mo_attrs", "mo_ids", "object_type_id", "only_ids", "order_by", "p_ids", "query_params", "tprm_ids"]
     DECODED_JWT_FIELD_NUMBER: _ClassVar[int]
@@ -191,6 +289,28 @@ class RequestForFilteredObjSpecial(_message.Message):
     tprm_ids: _containers.RepeatedScalarFieldContainer[int]
     def __init__(self, object_type_id: _Optional[int] = ..., query_params: _Optional[str] = ..., order_by: _Optional[str] = ..., decoded_jwt: _Optional[str] = ..., mo_ids: _Optional[_Iterable[int]] = ..., p_ids: _Optional[_Iterable[int]] = ..., only_ids: bool = ..., tprm_ids: _Optional[_Iterable[int]] = ..., mo_attrs: _Optional[_Iterable[str]] = ...) -> None: ...
 
+class RequestForFilteredObjSpecialV2(_message.Message):
+    __slots__ = ["decoded_jwt", "mo_attrs", "mo_ids", "object_type_id", "only_ids", "order_by", "p_ids", "query_params", "tprm_ids"]
+    DECODED_JWT_FIELD_NUMBER: _ClassVar[int]
+    MO_ATTRS_FIELD_NUMBER: _ClassVar[int]
+    MO_IDS_FIELD_NUMBER: _ClassVar[int]
+    OBJECT_TYPE_ID_FIELD_NUMBER: _ClassVar[int]
+    ONLY_IDS_FIELD_NUMBER: _ClassVar[int]
+    ORDER_BY_FIELD_NUMBER: _ClassVar[int]
+    P_IDS_FIELD_NUMBER: _ClassVar[int]
+    QUERY_PARAMS_FIELD_NUMBER: _ClassVar[int]
+    TPRM_IDS_FIELD_NUMBER: _ClassVar[int]
+    decoded_jwt: _struct_pb2.Struct
+    mo_attrs: _containers.RepeatedScalarFieldContainer[str]
+    mo_ids: _containers.RepeatedScalarFieldContainer[int]
+    object_type_id: int
+    only_ids: bool
+    order_by: _containers.RepeatedCompositeFieldContainer[OrderByTPRM]
+    p_ids: _containers.RepeatedScalarFieldContainer[int]
+    query_params: _containers.RepeatedCompositeFieldContainer[QueryParam]
+    tprm_ids: _containers.RepeatedScalarFieldContainer[int]
+    def __init__(self, object_type_id: _Optional[int] = ..., query_params: _Optional[_Iterable[_Union[QueryParam, _Mapping]]] = ..., order_by: _Optional[_Iterable[_Union[OrderByTPRM, _Mapping]]] = ..., decoded_jwt: _Optional[_Union[_struct_pb2.Struct, _Mapping]] = ..., mo_ids: _Optional[_Iterable[int]] = ..., p_ids: _Optional[_Iterable[int]] = ..., only_ids: bool = ..., tprm_ids: _Optional[_Iterable[int]] = ..., mo_attrs: _Optional[_Iterable[str]] = ...) -> None: ...
+
 class RequestForObjInfoByTMO(_message.Message):
     __slots__ = ["mo_p_id", "object_type_id", "tprm_ids"]
     MO_P_ID_FIELD_NUMBER: _ClassVar[int]
@@ -400,6 +520,20 @@ class ResponseMOdataSpecial(_message.Message):
     pickle_mo_dataset: _containers.RepeatedScalarFieldContainer[str]
     def __init__(self, mo_ids: _Optional[_Iterable[int]] = ..., pickle_mo_dataset: _Optional[_Iterable[str]] = ...) -> None: ...
 
+class ResponseMOdataSpecialV2(_message.Message):
+    __slots__ = ["mo_ids", "objects"]
+    MO_IDS_FIELD_NUMBER: _ClassVar[int]
+    OBJECTS_FIELD_NUMBER: _ClassVar[int]
+    mo_ids: _containers.RepeatedScalarFieldContainer[int]
+    objects: _containers.RepeatedCompositeFieldContainer[MO]
+    def __init__(self, mo_ids: _Optional[_Iterable[int]] = ..., objects: _Optional[_Iterable[_Union[MO, _Mapping]]] = ...) -> None: ...
+
+class ResponseMOs(_message.Message):
+    __slots__ = ["objects"]
+    OBJECTS_FIELD_NUMBER: _ClassVar[int]
+    objects: _containers.RepeatedCompositeFieldContainer[MO]
+    def __init__(self, objects: _Optional[_Iterable[_Union[MO, _Mapping]]] = ...) -> None: ...
+
 class ResponseNode(_message.Message):
     __slots__ = ["children_mo_ids", "node_id"]
     CHILDREN_MO_IDS_FIELD_NUMBER: _ClassVar[int]
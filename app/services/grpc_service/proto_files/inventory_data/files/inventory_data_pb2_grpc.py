@@ -160,6 +160,26 @@ class InformerStub(object):
                 request_serializer=inventory__data__pb2.RequestGetMOsNamesByIds.SerializeToString,
                 response_deserializer=inventory__data__pb2.ResponseGetMOsNamesByIds.FromString,
                 )
+        self.GetFilteredObjWithParamsV2 = channel.unary_unary(
+                '/mo_info.Informer/GetFilteredObjWithParamsV2',
+                request_serializer=inventory__data__pb2.RequestForFilteredObjInfoByTMOV2.SerializeToString,
+                response_deserializer=inventory__data__pb2.ResponseMOs.FromString,
+                )
+        self.GetFilteredObjWithParamsStreamV2 = channel.unary_stream(
+                '/mo_info.Informer/GetFilteredObjWithParamsStreamV2',
+                request_serializer=inventory__data__pb2.RequestForFilteredObjInfoByTMOV2.SerializeToString,
+                response_deserializer=inventory__data__pb2.ResponseMOs.FromString,
+                )
+        self.GetFilteredObjSpecialV2 = channel.unary_stream(
+                '/mo_info.Informer/GetFilteredObjSpecialV2',
+                request_serializer=inventory__data__pb2.RequestForFilteredObjSpecialV2.SerializeToString,
+                response_deserializer=inventory__data__pb2.ResponseMOdataSpecialV2.FromString,
+                )
+        self.GetAllMOWithParamsByTMOIdV2 = channel.unary_stream(
+                '/mo_info.Informer/GetAllMOWithParamsByTMOIdV2',
+                request_serializer=inventory__data__pb2.GetAllMOWithParamsByTMOIdRequest.SerializeToString,
+                response_deserializer=inventory__data__pb2.ResponseMOs.FromString,
+                )
 
 
 class InformerServicer(object):
@@ -342,6 +362,31 @@ class InformerServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GetFilteredObjWithParamsV2(self, request, context):
+        """/ Typed variants of the methods above which send objects as pickle
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetFilteredObjWithParamsStreamV2(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetFilteredObjSpecialV2(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetAllMOWithParamsByTMOIdV2(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_InformerServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -490,6 +535,26 @@ def add_InformerServicer_to_server(servicer, server):
                     request_deserializer=inventory__data__pb2.RequestGetMOsNamesByIds.FromString,
                     response_serializer=inventory__data__pb2.ResponseGetMOsNamesByIds.SerializeToString,
             ),
+            'GetFilteredObjWithParamsV2': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetFilteredObjWithParamsV2,
+                    request_deserializer=inventory__data__pb2.RequestForFilteredObjInfoByTMOV2.FromString,
+                    response_serializer=inventory__data__pb2.ResponseMOs.SerializeToString,
+            ),
+            'GetFilteredObjWithParamsStreamV2': grpc.unary_stream_rpc_method_handler(
+                    servicer.GetFilteredObjWithParamsStreamV2,
+                    request_deserializer=inventory__data__pb2.RequestForFilteredObjInfoByTMOV2.FromString,
+                    response_serializer=inventory__data__pb2.ResponseMOs.SerializeToString,
+            ),
+            'GetFilteredObjSpecialV2': grpc.unary_stream_rpc_method_handler(
+                    servicer.GetFilteredObjSpecialV2,
+                    request_deserializer=inventory__data__pb2.RequestForFilteredObjSpecialV2.FromString,
+                    response_serializer=inventory__data__pb2.ResponseMOdataSpecialV2.SerializeToString,
+            ),
+            'GetAllMOWithParamsByTMOIdV2': grpc.unary_stream_rpc_method_handler(
+                    servicer.GetAllMOWithParamsByTMOIdV2,
+                    request_deserializer=inventory__data__pb2.GetAllMOWithParamsByTMOIdRequest.FromString,
+                    response_serializer=inventory__data__pb2.ResponseMOs.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'mo_info.Informer', rpc_method_handlers)
@@ -993,3 +1058,71 @@ class Informer(object):
             inventory__data__pb2.ResponseGetMOsNamesByIds.FromString,
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def GetFilteredObjWithParamsV2(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/mo_info.Informer/GetFilteredObjWithParamsV2',
+            inventory__data__pb2.RequestForFilteredObjInfoByTMOV2.SerializeToString,
+            inventory__data__pb2.ResponseMOs.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def GetFilteredObjWithParamsStreamV2(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/mo_info.Informer/GetFilteredObjWithParamsStreamV2',
+            inventory__data__pb2.RequestForFilteredObjInfoByTMOV2.SerializeToString,
+            inventory__data__pb2.ResponseMOs.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def GetFilteredObjSpecialV2(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/mo_info.Informer/GetFilteredObjSpecialV2',
+            inventory__data__pb2.RequestForFilteredObjSpecialV2.SerializeToString,
+            inventory__data__pb2.ResponseMOdataSpecialV2.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def GetAllMOWithParamsByTMOIdV2(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/mo_info.Informer/GetAllMOWithParamsByTMOIdV2',
+            inventory__data__pb2.GetAllMOWithParamsByTMOIdRequest.SerializeToString,
+            inventory__data__pb2.ResponseMOs.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
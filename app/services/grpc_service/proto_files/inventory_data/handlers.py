@@ -3,120 +3,280 @@
 import pickle
 
 from logging import getLogger
-from typing import AsyncGenerator, Any
+from typing import AsyncGenerator, Any, Callable, Iterator
 
 from sqlmodel import Session
+from starlette.datastructures import QueryParams
 
 from database import engine
 from functions.db_functions.db_read import get_objects_with_parameters
 from routers.object_router.utils import TPRMFilterCleaner
+from services.grpc_service.db_executor import db_executor
+from services.grpc_service.message_chunker import MessageChunker
 from services.grpc_service.proto_files.inventory_data.files import (
     inventory_data_pb2,
 )
+from services.grpc_service.typed_payloads import (
+    jwt_from_message,
+    order_by_from_message,
+    query_params_from_message,
+    to_mo_message,
+)
 from services.security_service.security_data_models import UserData
 
 
 class FilteredObjWithParamsHandler(object):
     """Handler for Filter Object with parameters gRPC request. Return single object and divided by chunks"""
 
-    def __init__(self, max_chunk_size: int = 1_000_000) -> None:
+    def __init__(
+        self, max_chunk_size: int = 1_000_000, page_size: int = 5_000
+    ) -> None:
         self.logger = getLogger("Filtered Obj With Params")
         self.max_chunk_size = max_chunk_size
+        self.page_size = page_size
         self.engine = engine
 
     async def get_stream_response_chunked(
         self, request: inventory_data_pb2.RequestForFilteredObjInfoByTMO
     ) -> AsyncGenerator[inventory_data_pb2.ResponseMOdata, None]:
-        objects = await self.process(request)
-        current_chunk = []
+        async for message in self._iterate(self._iter_messages, request):
+            yield message
 
-        for obj in objects:
-            current_chunk.append(obj)
-            proto_msg = inventory_data_pb2.ResponseMOdata(
-                objects_with_parameters=current_chunk
-            )
-            if proto_msg.ByteSize() > self.max_chunk_size:
-                # remove last element
-                current_chunk.pop()
-                if current_chunk:
-                    yield inventory_data_pb2.ResponseMOdata(
-                        objects_with_parameters=current_chunk
-                    )
-                else:
-                    # if obj more than max_chunk size
-                    yield inventory_data_pb2.ResponseMOdata(
-                        objects_with_parameters=[obj]
-                    )
-                    current_chunk = []
-                    continue
-                current_chunk = [obj]
-        if current_chunk:
-            yield inventory_data_pb2.ResponseMOdata(
-                objects_with_parameters=current_chunk
-            )
+    async def get_stream_response_chunked_v2(
+        self, request: inventory_data_pb2.RequestForFilteredObjInfoByTMOV2
+    ) -> AsyncGenerator[inventory_data_pb2.ResponseMOs, None]:
+        async for message in self._iterate(self._iter_messages_v2, request):
+            yield message
 
     async def process(
         self, request: inventory_data_pb2.RequestForFilteredObjInfoByTMO
     ) -> list[str]:
         try:
-            elements: list[dict[str, str]] = await self._fetch_elements(request)
-            validated: list[str] = self._prepare_results(elements)
-            return validated
+            return await db_executor.run(self._get_results, request, heavy=True)
+        except Exception as ex:
+            self.logger.error(f"Processing failed: {str(ex)}")
+            raise
+
+    async def process_v2(
+        self, request: inventory_data_pb2.RequestForFilteredObjInfoByTMOV2
+    ) -> list[inventory_data_pb2.MO]:
+        try:
+            return await db_executor.run(
+                self._get_results_v2, request, heavy=True
+            )
+        except Exception as ex:
+            self.logger.error(f"Processing failed: {str(ex)}")
+            raise
+
+    async def _iterate(
+        self, func: Callable[..., Iterator], request
+    ) -> AsyncGenerator:
+        try:
+            async for message in db_executor.iterate(func, request, heavy=True):
+                yield message
         except Exception as ex:
             self.logger.error(f"Processing failed: {str(ex)}")
             raise
 
-    async def _fetch_elements(
+    def _get_results(
         self, request: inventory_data_pb2.RequestForFilteredObjInfoByTMO
-    ) -> list[dict[str, str]]:
-        tprm_cleaner_data = dict()
-        if request.object_type_id:
-            tprm_cleaner_data["object_type_id"] = request.object_type_id
+    ) -> list[str]:
+        elements: list[dict[str, str]] = self._fetch_elements(
+            **self._get_filter_data(request)
+        )
+        return self._prepare_results(elements)
+
+    def _get_results_v2(
+        self, request: inventory_data_pb2.RequestForFilteredObjInfoByTMOV2
+    ) -> list[inventory_data_pb2.MO]:
+        elements: list[dict[str, str]] = self._fetch_elements(
+            **self._get_filter_data_v2(request)
+        )
+        return [to_mo_message(item, inventory_data_pb2.MO) for item in elements]
+
+    def _iter_messages(
+        self, request: inventory_data_pb2.RequestForFilteredObjInfoByTMO
+    ) -> Iterator[inventory_data_pb2.ResponseMOdata]:
+        chunker = MessageChunker(
+            message_class=inventory_data_pb2.ResponseMOdata,
+            field_name="objects_with_parameters",
+            max_size=self.max_chunk_size,
+        )
+        pages = self._iter_element_pages(**self._get_filter_data(request))
+        for elements in pages:
+            yield from chunker.iter_messages(self._prepare_results(elements))
 
-        if request.query_params:
-            tprm_cleaner_data["query_params"] = pickle.loads(
-                bytes.fromhex(request.query_params)
+    def _iter_messages_v2(
+        self, request: inventory_data_pb2.RequestForFilteredObjInfoByTMOV2
+    ) -> Iterator[inventory_data_pb2.ResponseMOs]:
+        chunker = MessageChunker(
+            message_class=inventory_data_pb2.ResponseMOs,
+            field_name="objects",
+            max_size=self.max_chunk_size,
+        )
+        pages = self._iter_element_pages(**self._get_filter_data_v2(request))
+        for elements in pages:
+            yield from chunker.iter_messages(
+                to_mo_message(item, inventory_data_pb2.MO) for item in elements
             )
 
-        order_by = None
-        if request.order_by:
-            order_by = pickle.loads(bytes.fromhex(request.order_by))
-        additional_filter_data = {}
-        if request.mo_ids:
-            additional_filter_data["obj_ids"] = request.mo_ids
+    @staticmethod
+    def _get_filter_data(
+        request: inventory_data_pb2.RequestForFilteredObjInfoByTMO,
+    ) -> dict[str, Any]:
+        return {
+            "object_type_id": request.object_type_id,
+            "query_params": (
+                pickle.loads(bytes.fromhex(request.query_params))
+                if request.query_params
+                else None
+            ),
+            "order_by": (
+                pickle.loads(bytes.fromhex(request.order_by))
+                if request.order_by
+                else None
+            ),
+            "decoded_jwt": (
+                pickle.loads(bytes.fromhex(request.decoded_jwt))
+                if request.decoded_jwt
+                else None
+            ),
+            "mo_ids": request.mo_ids,
+        }
+
+    @staticmethod
+    def _get_filter_data_v2(
+        request: inventory_data_pb2.RequestForFilteredObjInfoByTMOV2,
+    ) -> dict[str, Any]:
+        return {
+            "object_type_id": request.object_type_id,
+            "query_params": (
+                query_params_from_message(request.query_params)
+                if request.query_params
+                else None
+            ),
+            "order_by": (
+                order_by_from_message(request.order_by)
+                if request.order_by
+                else None
+            ),
+            "decoded_jwt": (
+                jwt_from_message(request.decoded_jwt)
+                if request.HasField("decoded_jwt")
+                else None
+            ),
+            "mo_ids": request.mo_ids,
+        }
 
+    def _fetch_elements(
+        self,
+        object_type_id: int,
+        query_params: QueryParams | None,
+        order_by: dict | None,
+        decoded_jwt: dict | None,
+        mo_ids: list[int],
+    ) -> list[dict[str, str]]:
         with Session(self.engine) as session:
-            if request.decoded_jwt:
-                session.info["jwt"] = UserData.from_jwt(
-                    pickle.loads(bytes.fromhex(request.decoded_jwt))
+            tprm_cleaner = self._get_tprm_cleaner(
+                session=session,
+                object_type_id=object_type_id,
+                query_params=query_params,
+                order_by=order_by,
+                decoded_jwt=decoded_jwt,
+            )
+            if tprm_cleaner is None:
+                return []
+
+            mos_ids = (
+                tprm_cleaner.get_mo_ids_which_match_clean_filter_conditions(
+                    order_by=order_by, active=True, obj_ids=list(mo_ids) or None
                 )
-                session.info["action"] = "read"
+            )
+            objects_to_read = get_objects_with_parameters(
+                session,
+                limit=None,
+                offset=None,
+                mos_ids=mos_ids,
+                returnable=True,
+                active=True,
+            )
+
+        return objects_to_read
 
-            tprm_cleaner = TPRMFilterCleaner(
-                session=session, **tprm_cleaner_data
+    def _iter_element_pages(
+        self,
+        object_type_id: int,
+        query_params: QueryParams | None,
+        order_by: dict | None,
+        decoded_jwt: dict | None,
+        mo_ids: list[int],
+    ) -> Iterator[list[dict[str, str]]]:
+        """Yields objects with parameters by pages of page_size in the
+        requested order. Filtered ids are read by server-side cursor and
+        parameters are loaded for one page at once"""
+        with Session(self.engine) as session:
+            tprm_cleaner = self._get_tprm_cleaner(
+                session=session,
+                object_type_id=object_type_id,
+                query_params=query_params,
+                order_by=order_by,
+                decoded_jwt=decoded_jwt,
             )
-            if any(
-                [
-                    tprm_cleaner.check_filter_data_in_query_params(),
-                    order_by,
-                    tprm_cleaner_data,
-                ]
-            ):
-                mos_ids = (
-                    tprm_cleaner.get_mo_ids_which_match_clean_filter_conditions(
-                        order_by=order_by, active=True, **additional_filter_data
-                    )
-                )
-                objects_to_read = get_objects_with_parameters(
+            if tprm_cleaner is None:
+                return
+
+            pages = tprm_cleaner.iter_pages_of_mo_ids_which_match_clean_filter_conditions(
+                page_size=self.page_size,
+                order_by=order_by,
+                active=True,
+                obj_ids=list(mo_ids) or None,
+            )
+            for page_mo_ids in pages:
+                objects = get_objects_with_parameters(
                     session,
                     limit=None,
                     offset=None,
-                    mos_ids=mos_ids,
+                    mos_ids=page_mo_ids,
                     returnable=True,
                     active=True,
                 )
+                position = {
+                    mo_id: index for index, mo_id in enumerate(page_mo_ids)
+                }
+                objects.sort(key=lambda item: position[item["id"]])
+                yield objects
 
-        return objects_to_read
+    @staticmethod
+    def _get_tprm_cleaner(
+        session: Session,
+        object_type_id: int,
+        query_params: QueryParams | None,
+        order_by: dict | None,
+        decoded_jwt: dict | None,
+    ) -> TPRMFilterCleaner | None:
+        """Returns TPRMFilterCleaner of the request or None if the request
+        has neither filters, nor order, nor object type"""
+        tprm_cleaner_data = dict()
+        if object_type_id:
+            tprm_cleaner_data["object_type_id"] = object_type_id
+
+        if query_params:
+            tprm_cleaner_data["query_params"] = query_params
+
+        if decoded_jwt:
+            session.info["jwt"] = UserData.from_jwt(decoded_jwt)
+            session.info["action"] = "read"
+
+        tprm_cleaner = TPRMFilterCleaner(session=session, **tprm_cleaner_data)
+        if any(
+            [
+                tprm_cleaner.check_filter_data_in_query_params(),
+                order_by,
+                tprm_cleaner_data,
+            ]
+        ):
+            return tprm_cleaner
+        return None
 
     def _prepare_results(self, data: list[dict[str, str]]) -> list[str]:
         result = []
@@ -0,0 +1,179 @@
+"""Conversion of objects and request data to typed protobuf messages, used
+by V2 methods instead of pickle hex strings"""
+
+import functools
+import inspect
+from collections import namedtuple
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Callable, Iterable
+
+import grpc
+from google.protobuf import (
+    json_format,
+    message_factory,
+    struct_pb2,
+    timestamp_pb2,
+)
+from google.protobuf.descriptor import FieldDescriptor
+from google.protobuf.message import Message
+from starlette.datastructures import QueryParams
+
+from config.grpc_config import GRPC_PICKLE_PAYLOADS
+
+OrderValue = namedtuple("OrderValue", "type ascending")
+
+_STRUCT_NAME = struct_pb2.Struct.DESCRIPTOR.full_name
+_TIMESTAMP_NAME = timestamp_pb2.Timestamp.DESCRIPTOR.full_name
+
+
+def to_proto_value(value: Any) -> struct_pb2.Value:
+    """Returns parameter value as google.protobuf.Value. Dates are sent in
+    ISO format, numbers as double"""
+    if value is None:
+        return struct_pb2.Value(null_value=struct_pb2.NULL_VALUE)
+    if isinstance(value, str):
+        return struct_pb2.Value(string_value=value)
+    if isinstance(value, bool):
+        return struct_pb2.Value(bool_value=value)
+    if isinstance(value, (int, float, Decimal)):
+        return struct_pb2.Value(number_value=float(value))
+    if isinstance(value, (date, datetime)):
+        return struct_pb2.Value(string_value=value.isoformat())
+    if isinstance(value, dict):
+        return struct_pb2.Value(
+            struct_value=struct_pb2.Struct(
+                fields={
+                    str(key): to_proto_value(item)
+                    for key, item in value.items()
+                }
+            )
+        )
+    if isinstance(value, (list, tuple, set)):
+        return struct_pb2.Value(
+            list_value=struct_pb2.ListValue(
+                values=[to_proto_value(item) for item in value]
+            )
+        )
+    return struct_pb2.Value(string_value=str(value))
+
+
+def from_proto_value(value: struct_pb2.Value) -> Any:
+    """Returns python value of google.protobuf.Value"""
+    return json_format.MessageToDict(value)
+
+
+@functools.cache
+def _get_fields(
+    message_class: type[Message],
+) -> tuple[dict[str, str], type[Message]]:
+    """Returns kinds of fields by name and class of params elements"""
+    fields = message_class.DESCRIPTOR.fields_by_name
+    kinds = {}
+    for name, field in fields.items():
+        if field.type != FieldDescriptor.TYPE_MESSAGE:
+            kinds[name] = "scalar"
+        elif field.message_type.full_name == _STRUCT_NAME:
+            kinds[name] = "struct"
+        elif field.message_type.full_name == _TIMESTAMP_NAME:
+            kinds[name] = "timestamp"
+    prm_class = message_factory.GetMessageClass(fields["params"].message_type)
+    return kinds, prm_class
+
+
+def to_mo_message(
+    item: dict[str, Any], message_class: type[Message]
+) -> Message:
+    """Returns object dict (attributes of MO and "params" with dicts of PRM)
+    as message_class message. Int keys are TPRM ids with parameter values,
+    as in rows of GetFilteredObjSpecial. Keys without message field and None
+    values are skipped"""
+    kinds, prm_class = _get_fields(message_class)
+    attrs = {}
+    params = []
+    for key, value in item.items():
+        if value is None:
+            continue
+        if key == "params":
+            params.extend(_to_prm_message(param, prm_class) for param in value)
+        elif isinstance(key, int):
+            params.append(prm_class(tprm_id=key, value=to_proto_value(value)))
+        elif (kind := kinds.get(key)) == "scalar":
+            attrs[key] = value
+        elif kind == "struct":
+            attrs[key] = _to_struct(value)
+        elif kind == "timestamp":
+            timestamp = timestamp_pb2.Timestamp()
+            timestamp.FromDatetime(value)
+            attrs[key] = timestamp
+    return message_class(params=params, **attrs)
+
+
+def _to_struct(value: dict) -> struct_pb2.Struct:
+    struct = struct_pb2.Struct()
+    struct.update({str(key): item for key, item in value.items()})
+    return struct
+
+
+def _to_prm_message(param: Any, message_class: type[Message]) -> Message:
+    if not isinstance(param, dict):
+        param = dict(param)
+    return message_class(
+        value=to_proto_value(param.get("value")),
+        **{
+            key: int(param[key])
+            for key in ("id", "tprm_id", "mo_id", "version")
+            if param.get(key) is not None
+        },
+    )
+
+
+def query_params_from_message(query_params: Iterable[Message]) -> QueryParams:
+    """Returns QueryParams of repeated QueryParam"""
+    return QueryParams([(param.key, param.value) for param in query_params])
+
+
+def order_by_from_message(order_by: Iterable[Message]) -> dict[int, OrderValue]:
+    """Returns order_by of TPRMFilterCleaner of repeated OrderByTPRM"""
+    return {
+        item.tprm_id: OrderValue(type=item.val_type, ascending=item.ascending)
+        for item in order_by
+    }
+
+
+def jwt_from_message(decoded_jwt: struct_pb2.Struct) -> dict:
+    """Returns decoded jwt dict of Struct"""
+    return json_format.MessageToDict(decoded_jwt)
+
+
+def pickle_payload(replacement: str) -> Callable:
+    """Marks servicer method which sends pickle hex strings. If
+    GRPC_PICKLE_PAYLOADS is off, the method aborts with UNIMPLEMENTED and
+    name of the typed method to use"""
+
+    def decorator(method: Callable) -> Callable:
+        if GRPC_PICKLE_PAYLOADS:
+            return method
+
+        details = (
+            f"{method.__name__} is disabled by GRPC_PICKLE_PAYLOADS, "
+            f"use {replacement}"
+        )
+        if inspect.isasyncgenfunction(method) or inspect.isgeneratorfunction(
+            method
+        ):
+
+            @functools.wraps(method)
+            async def stream_wrapper(servicer, request, context):
+                await context.abort(grpc.StatusCode.UNIMPLEMENTED, details)
+                yield
+
+            return stream_wrapper
+
+        @functools.wraps(method)
+        async def unary_wrapper(servicer, request, context):
+            await context.abort(grpc.StatusCode.UNIMPLEMENTED, details)
+
+        return unary_wrapper
+
+    return decorator
@@ -0,0 +1,54 @@
+import logging
+
+from resistant_kafka_avataa import DataSend, ProducerConfig, ProducerInitializer
+
+
+class BatchProducerInitializer(ProducerInitializer):
+    """ProducerInitializer which does not flush after every message.
+    Messages are delivered in background by librdkafka, delivery results are
+    counted by the delivery callback and have to be awaited by flush()."""
+
+    def __init__(self, config: ProducerConfig):
+        super().__init__(config=config)
+        self.delivered_messages = 0
+        self.failed_messages = 0
+
+    def _delivery_report(self, error_message, message) -> None:
+        if error_message is not None:
+            self.failed_messages += 1
+            logging.error(
+                "Delivery to %s failed for %s: %s",
+                message.topic(),
+                message.key(),
+                error_message,
+            )
+            return
+
+        self.delivered_messages += 1
+
+    def send_message(
+        self,
+        data_to_send: DataSend,
+        partition_number: int = 0,
+    ) -> None:
+        while True:
+            try:
+                self._producer.produce(
+                    topic=self._producer_name,
+                    key=data_to_send.key,
+                    value=data_to_send.value,
+                    on_delivery=self._delivery_report,
+                    headers=data_to_send.headers,
+                    partition=partition_number,
+                )
+                break
+            except BufferError:
+                # local queue is full, wait for deliveries
+                self._producer.poll(1)
+
+        self._producer.poll(0)
+
+    def flush(self, timeout: float) -> int:
+        """Waits for delivery of produced messages.
+        Returns number of messages which are still not delivered."""
+        return self._producer.flush(timeout)
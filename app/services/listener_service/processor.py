@@ -1,91 +1,115 @@
-from resistant_kafka_avataa import ProducerInitializer, ProducerConfig
-from resistant_kafka_avataa.common_schemas import KafkaSecurityConfig
 from sqlmodel import Session
 
 from common.common_constant import MODEL_EQ_MESSAGE, ObjEventStatus
-from config.kafka_config import (
-    KAFKA_SECURITY_PROTOCOL,
-    KAFKA_SASL_MECHANISMS,
-    KAFKA_PRODUCER_TOPIC,
-    KAFKA_SECURED,
-    KAFKA_URL,
-    KAFKA_PRODUCER_PART_TOPIC_NAME,
-    KAFKA_TURN_ON,
-)
+from config import kafka_config
 from services.event_service.processor import (
+    EventHistoryWriter,
     EventProcessor,
 )
-from services.kafka_service.kafka_connection_utils import (
-    get_token_for_kafka_by_keycloak,
-)
-from services.kafka_service.producer.protobuf_producer import SendMessageToKafka
-from services.listener_service.constants import SessionDataKeys, AdditionalData
-from services.security_service.utils.get_user_data import (
-    get_user_id_from_session,
-    get_session_id_from_session,
-)
+from services.listener_service.constants import SessionDataKeys
+from services.outbox_service.processor import KafkaOutboxWriter
 from services.session_registry_service.processor import SessionRegistryService
 
-security_config = None
-
-if KAFKA_SECURED:
-    security_config = KafkaSecurityConfig(
-        oauth_cb=get_token_for_kafka_by_keycloak,
-        security_protocol=KAFKA_SECURITY_PROTOCOL,
-        sasl_mechanisms=KAFKA_SASL_MECHANISMS,
-    )
-
-if KAFKA_TURN_ON:
-    producer_task = ProducerInitializer(
-        config=ProducerConfig(
-            producer_name=KAFKA_PRODUCER_TOPIC,
-            bootstrap_servers=KAFKA_URL,
-            security_config=security_config,
-        )
-    )
-
-    producer_task_with_partitions = ProducerInitializer(
-        config=ProducerConfig(
-            producer_name=KAFKA_PRODUCER_PART_TOPIC_NAME,
-            bootstrap_servers=KAFKA_URL,
-            security_config=security_config,
-        )
-    )
+SESSION_DATA_KEY_EVENTS = {
+    SessionDataKeys.NEW: ObjEventStatus.CREATED,
+    SessionDataKeys.DIRTY: ObjEventStatus.UPDATED,
+    SessionDataKeys.DELETED: ObjEventStatus.DELETED,
+}
 
 
 class ListenerService:
     @staticmethod
-    def receive_after_flush(session: Session, flush_context):
-        def session_data_handler(
-            session_data, key_for_session_data: SessionDataKeys
-        ):
-            if not session.info.get(key_for_session_data.value, False):
-                session.info.setdefault(key_for_session_data.value, dict())
-
-            for item in session_data:
-                item_class_name = type(item).__name__
-                if item_class_name in MODEL_EQ_MESSAGE.keys():
-                    if not session.info[key_for_session_data.value].get(
-                        item_class_name, False
-                    ):
-                        session.info[key_for_session_data.value][
-                            item_class_name
-                        ] = list()
+    def _handle_session_data(
+        session: Session,
+        session_data,
+        key_for_session_data: SessionDataKeys,
+        outbox_writer: KafkaOutboxWriter | None,
+    ):
+        if not session.info.get(key_for_session_data.value, False):
+            session.info.setdefault(key_for_session_data.value, dict())
+
+        flushed_data = dict()
+        for item in session_data:
+            item_class_name = type(item).__name__
+            if item_class_name in MODEL_EQ_MESSAGE.keys():
+                if not session.info[key_for_session_data.value].get(
+                    item_class_name, False
+                ):
                     session.info[key_for_session_data.value][
                         item_class_name
-                    ].append(item.to_proto())
+                    ] = list()
+                item_data = item.to_proto()
+                session.info[key_for_session_data.value][
+                    item_class_name
+                ].append(item_data)
+                flushed_data.setdefault(item_class_name, []).append(item_data)
+
+        if outbox_writer is not None:
+            for item_class_name, data in flushed_data.items():
+                outbox_writer.add(
+                    key_class_name=item_class_name,
+                    key_event=SESSION_DATA_KEY_EVENTS[key_for_session_data],
+                    data=data,
+                )
+
+    @staticmethod
+    def receive_after_flush(session: Session, flush_context):
+        # Kafka messages are stored in the outbox within the same transaction
+        # and sent by the outbox relay process after commit
+        outbox_writer = None
+        if kafka_config.KAFKA_TURN_ON:
+            outbox_writer = KafkaOutboxWriter(session=session)
 
         if session.new:
-            session_data_handler(session.new, SessionDataKeys.NEW)
+            ListenerService._handle_session_data(
+                session, session.new, SessionDataKeys.NEW, outbox_writer
+            )
 
         if session.deleted:
-            session_data_handler(session.deleted, SessionDataKeys.DELETED)
+            ListenerService._handle_session_data(
+                session, session.deleted, SessionDataKeys.DELETED, outbox_writer
+            )
 
         if session.dirty:
-            session_data_handler(session.dirty, SessionDataKeys.DIRTY)
+            ListenerService._handle_session_data(
+                session, session.dirty, SessionDataKeys.DIRTY, outbox_writer
+            )
+
+        if outbox_writer is not None:
+            outbox_writer.write()
+
+    @staticmethod
+    def _receive_bulk(
+        session: Session, instances: list, key_for_session_data: SessionDataKeys
+    ):
+        outbox_writer = None
+        if kafka_config.KAFKA_TURN_ON:
+            outbox_writer = KafkaOutboxWriter(session=session)
+
+        ListenerService._handle_session_data(
+            session, instances, key_for_session_data, outbox_writer
+        )
+
+        if outbox_writer is not None:
+            outbox_writer.write()
+
+    @staticmethod
+    def receive_bulk_created(session: Session, instances: list):
+        """Handles instances, which are inserted without session flush
+        (for example by COPY), as flushed new instances of the session"""
+        ListenerService._receive_bulk(session, instances, SessionDataKeys.NEW)
+
+    @staticmethod
+    def receive_bulk_updated(session: Session, instances: list):
+        """Handles instances, which are updated without session flush
+        (for example by UPDATE ... RETURNING), as flushed dirty instances
+        of the session"""
+        ListenerService._receive_bulk(session, instances, SessionDataKeys.DIRTY)
 
     @staticmethod
     def receive_after_commit(session: Session):
+        event_writer = EventHistoryWriter()
+
         def after_commit_data_handler(
             key_for_session_data: SessionDataKeys,
             key_event: ObjEventStatus,
@@ -96,29 +120,14 @@ class ListenerService:
                 task = SessionRegistryService(session=session)
                 task.process_user_session()
 
-                if KAFKA_TURN_ON:
-                    task = SendMessageToKafka(
-                        additional_data=AdditionalData(
-                            user_id=get_user_id_from_session(session=session),
-                            session_id=get_session_id_from_session(
-                                session=session
-                            ),
-                        ),
+                event_writer.add(
+                    EventProcessor(
+                        session=session,
                         key_class_name=instance_type,
                         key_event=key_event.value,
                         data_to_send=data_to_send,
-                        producer_manager=producer_task,
-                        producer_manager_with_partitions=producer_task_with_partitions,
                     )
-                    task.send_message()
-
-                task = EventProcessor(
-                    session=session,
-                    key_class_name=instance_type,
-                    key_event=key_event.value,
-                    data_to_send=data_to_send,
                 )
-                task.execute()
 
         if session.info.get(SessionDataKeys.NEW.value, False):
             after_commit_data_handler(
@@ -137,3 +146,5 @@ class ListenerService:
                 key_for_session_data=SessionDataKeys.DELETED,
                 key_event=ObjEventStatus.DELETED,
             )
+
+        event_writer.write()
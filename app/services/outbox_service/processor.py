@@ -0,0 +1,349 @@
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import groupby
+from typing import Callable
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from common.common_constant import MODEL_EQ_MESSAGE, ObjEventStatus
+from config import kafka_config
+from models import KafkaOutbox, KafkaOutboxRelayMetrics
+from services.kafka_service.producer.batch_producer import (
+    BatchProducerInitializer,
+)
+from services.kafka_service.producer.protobuf_producer import SendMessageToKafka
+from services.listener_service.constants import AdditionalData
+from services.security_service.utils.get_user_data import (
+    get_user_id_from_session,
+    get_session_id_from_session,
+)
+
+# Only one relay sends messages at a time to keep their order
+OUTBOX_RELAY_LOCK_ID = 7_305_221
+OUTBOX_RELAY_METRICS_ID = 1
+
+
+class KafkaOutboxWriter:
+    """Stores changed instances of one flush into kafka_outbox.
+    Rows are inserted by the connection of the session, so they are
+    committed or rolled back together with the change itself."""
+
+    def __init__(self, session: Session):
+        self._session = session
+        self._rows = []
+
+    def add(
+        self, key_class_name: str, key_event: ObjEventStatus, data: list[dict]
+    ) -> None:
+        class_serializers = MODEL_EQ_MESSAGE[key_class_name]
+        try:
+            payload = class_serializers.proto_list_template(
+                objects=[
+                    class_serializers.proto_unit_template(**unit)
+                    for unit in data
+                ]
+            ).SerializeToString()
+        except (ValueError, TypeError) as ex:
+            logging.error("Serialize error, discarding record: %s %s", ex, data)
+            return
+
+        self._rows.append(
+            {
+                "class_name": key_class_name,
+                "event": key_event.value,
+                "user_id": get_user_id_from_session(session=self._session),
+                "session_id": get_session_id_from_session(
+                    session=self._session
+                ),
+                "payload": payload,
+                "created_at": datetime.utcnow(),
+            }
+        )
+
+    def write(self) -> None:
+        if self._rows:
+            self._session.connection().execute(
+                insert(KafkaOutbox.__table__), self._rows
+            )
+            self._rows = []
+
+
+@dataclass
+class OutboxRelayMetrics:
+    batches: int = 0
+    failed_batches: int = 0
+    sent_rows: int = 0
+    delivered_messages: int = 0
+    failed_messages: int = 0
+    # age of the oldest row and speed of the last sent batch
+    lag_seconds: float | None = None
+    rows_per_second: float | None = None
+
+
+class OutboxRelay:
+    """Sends kafka_outbox rows to Kafka and deletes them after delivery.
+    Consecutive rows of the same class, event and user are merged into one
+    list message, which is chunked and routed to partitions as before
+    by SendMessageToKafka. Rows of a failed batch stay in the table and
+    are sent again by the next batch (at-least-once delivery)."""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        producer: BatchProducerInitializer,
+        producer_with_partitions: BatchProducerInitializer,
+        batch_size: int = kafka_config.KAFKA_OUTBOX_BATCH_SIZE,
+        flush_timeout: float = kafka_config.KAFKA_OUTBOX_FLUSH_TIMEOUT,
+    ):
+        self._session_factory = session_factory
+        self._producer = producer
+        self._producer_with_partitions = producer_with_partitions
+        self._batch_size = batch_size
+        self._flush_timeout = flush_timeout
+        self.metrics = OutboxRelayMetrics()
+
+    @staticmethod
+    def _decode_payload(row: KafkaOutbox) -> list[dict]:
+        proto_list = MODEL_EQ_MESSAGE[row.class_name].proto_list_template
+        return [
+            {field.name: value for field, value in unit.ListFields()}
+            for unit in proto_list.FromString(row.payload).objects
+        ]
+
+    def _send_rows(self, rows: list[KafkaOutbox]) -> None:
+        def group_key(row: KafkaOutbox):
+            return row.class_name, row.event, row.user_id, row.session_id
+
+        for (class_name, event, user_id, session_id), group in groupby(
+            rows, key=group_key
+        ):
+            data_to_send = []
+            for row in group:
+                data_to_send.extend(self._decode_payload(row))
+
+            task = SendMessageToKafka(
+                additional_data=AdditionalData(
+                    user_id=user_id, session_id=session_id
+                ),
+                key_class_name=class_name,
+                key_event=event,
+                data_to_send=data_to_send,
+                producer_manager=self._producer,
+                producer_manager_with_partitions=self._producer_with_partitions,
+            )
+            task.send_message()
+
+    def _producers_failed_messages(self) -> int:
+        return (
+            self._producer.failed_messages
+            + self._producer_with_partitions.failed_messages
+        )
+
+    def _producers_delivered_messages(self) -> int:
+        return (
+            self._producer.delivered_messages
+            + self._producer_with_partitions.delivered_messages
+        )
+
+    def _save_metrics(
+        self, session: Session, batch_metrics: OutboxRelayMetrics
+    ) -> None:
+        """Adds counters of the batch to kafka_outbox_relay_metrics"""
+        table = KafkaOutboxRelayMetrics.__table__
+        counters = (
+            "batches",
+            "failed_batches",
+            "sent_rows",
+            "delivered_messages",
+            "failed_messages",
+        )
+        values = {
+            "id": OUTBOX_RELAY_METRICS_ID,
+            "updated_at": datetime.utcnow(),
+            **{name: getattr(batch_metrics, name) for name in counters},
+        }
+        set_values = {
+            name: table.c[name] + getattr(batch_metrics, name)
+            for name in counters
+        }
+        set_values["updated_at"] = values["updated_at"]
+        if batch_metrics.batches:
+            values["lag_seconds"] = set_values["lag_seconds"] = (
+                batch_metrics.lag_seconds
+            )
+            values["rows_per_second"] = set_values["rows_per_second"] = (
+                batch_metrics.rows_per_second
+            )
+        session.execute(
+            pg_insert(table)
+            .values(**values)
+            .on_conflict_do_update(index_elements=["id"], set_=set_values)
+        )
+
+    def _add_metrics(self, batch_metrics: OutboxRelayMetrics) -> None:
+        for name in (
+            "batches",
+            "failed_batches",
+            "sent_rows",
+            "delivered_messages",
+            "failed_messages",
+        ):
+            setattr(
+                self.metrics,
+                name,
+                getattr(self.metrics, name) + getattr(batch_metrics, name),
+            )
+        if batch_metrics.batches:
+            self.metrics.lag_seconds = batch_metrics.lag_seconds
+            self.metrics.rows_per_second = batch_metrics.rows_per_second
+
+    def acquire_lock(self) -> Session | None:
+        """Takes the session level advisory lock of the relay.
+        Returns the session holding the lock, it has to be kept open while
+        batches are processed. Returns None if another relay is running."""
+        session = self._session_factory()
+        connection = session.connection(
+            execution_options={"isolation_level": "AUTOCOMMIT"}
+        )
+        is_locked = connection.execute(
+            select(func.pg_try_advisory_lock(OUTBOX_RELAY_LOCK_ID))
+        ).scalar()
+        if not is_locked:
+            session.close()
+            return None
+        return session
+
+    @staticmethod
+    def release_lock(lock_session: Session) -> None:
+        """Releases the lock, it outlives the session when the connection
+        is returned to the pool"""
+        lock_session.connection().execute(
+            select(func.pg_advisory_unlock(OUTBOX_RELAY_LOCK_ID))
+        )
+        lock_session.close()
+
+    def process_batch(self) -> int:
+        """Sends one batch of outbox rows. Returns number of sent rows.
+        Has to be called while the relay lock is held (see acquire_lock).
+        Rows are read and deleted in short transactions, no transaction
+        stays open while messages are delivered."""
+        with self._session_factory() as session:
+            session.info["disable_security"] = True
+            rows = (
+                session.execute(
+                    select(KafkaOutbox)
+                    .order_by(KafkaOutbox.id)
+                    .limit(self._batch_size)
+                )
+                .scalars()
+                .all()
+            )
+            # rows are not expired by commit and read again while sending
+            session.expunge_all()
+            session.commit()
+            if not rows:
+                return 0
+
+            started = time.monotonic()
+            failed_before = self._producers_failed_messages()
+            delivered_before = self._producers_delivered_messages()
+            try:
+                self._send_rows(rows=rows)
+                not_delivered = self._producer.flush(
+                    self._flush_timeout
+                ) + self._producer_with_partitions.flush(self._flush_timeout)
+            except Exception as ex:
+                logging.exception("Outbox batch is not sent: %s", ex)
+                not_delivered = len(rows)
+
+            batch_metrics = OutboxRelayMetrics(
+                failed_messages=self._producers_failed_messages()
+                - failed_before,
+                delivered_messages=self._producers_delivered_messages()
+                - delivered_before,
+            )
+            if not_delivered or batch_metrics.failed_messages:
+                # rows stay in the outbox and are sent by the next batch
+                batch_metrics.failed_batches = 1
+                self._save_metrics(session=session, batch_metrics=batch_metrics)
+                session.commit()
+                self._add_metrics(batch_metrics=batch_metrics)
+                return 0
+
+            duration = time.monotonic() - started
+            batch_metrics.batches = 1
+            batch_metrics.sent_rows = len(rows)
+            batch_metrics.lag_seconds = (
+                datetime.utcnow() - rows[0].created_at
+            ).total_seconds()
+            if duration > 0:
+                batch_metrics.rows_per_second = len(rows) / duration
+
+            session.execute(
+                delete(KafkaOutbox).where(
+                    KafkaOutbox.id.in_([row.id for row in rows])
+                )
+            )
+            self._save_metrics(session=session, batch_metrics=batch_metrics)
+            session.commit()
+            self._add_metrics(batch_metrics=batch_metrics)
+            return len(rows)
+
+    def run(
+        self,
+        poll_interval: float = kafka_config.KAFKA_OUTBOX_POLL_INTERVAL,
+        metrics_interval: float = kafka_config.KAFKA_OUTBOX_METRICS_INTERVAL,
+    ) -> None:
+        lock_session = self.acquire_lock()
+        while lock_session is None:
+            time.sleep(poll_interval)
+            lock_session = self.acquire_lock()
+
+        metrics_logged_at = time.monotonic()
+        try:
+            while True:
+                try:
+                    sent_rows = self.process_batch()
+                except Exception as ex:
+                    logging.exception("Outbox relay error: %s", ex)
+                    sent_rows = 0
+
+                if time.monotonic() - metrics_logged_at >= metrics_interval:
+                    logging.info("Outbox relay metrics: %s", self.metrics)
+                    metrics_logged_at = time.monotonic()
+
+                if sent_rows < self._batch_size:
+                    time.sleep(poll_interval)
+        finally:
+            self.release_lock(lock_session=lock_session)
+
+
+def get_outbox_lag(session: Session) -> dict:
+    """Returns number of not sent outbox rows, age of the oldest one
+    and counters of the relay."""
+    pending_rows, oldest_created_at = session.execute(
+        select(func.count(KafkaOutbox.id), func.min(KafkaOutbox.created_at))
+    ).one()
+    lag_seconds = 0.0
+    if oldest_created_at is not None:
+        lag_seconds = (datetime.utcnow() - oldest_created_at).total_seconds()
+
+    relay_metrics = session.get(
+        KafkaOutboxRelayMetrics, OUTBOX_RELAY_METRICS_ID
+    )
+    relay = None
+    if relay_metrics is not None:
+        relay = {
+            column.name: getattr(relay_metrics, column.name)
+            for column in KafkaOutboxRelayMetrics.__table__.columns
+            if column.name != "id"
+        }
+    return {
+        "pending_rows": pending_rows,
+        "lag_seconds": lag_seconds,
+        "relay": relay,
+    }
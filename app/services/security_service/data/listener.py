@@ -1,10 +1,30 @@
 from fastapi import HTTPException
-from sqlalchemy import event, true, false, or_
+from sqlalchemy import (
+    ARRAY,
+    Integer,
+    and_,
+    any_,
+    event,
+    exists,
+    literal,
+    true,
+    false,
+    or_,
+)
 from sqlalchemy.orm import with_loader_criteria
 
 from sqlalchemy.orm import ORMExecuteState, Session
 
-from services.security_service.data.permission import db_permissions, db_admins
+from config.security_config import INHERIT_OBJECT_PERMISSIONS
+from services.security_service.data.permission import (
+    db_admins,
+    db_inherited_permissions,
+    db_permissions,
+)
+from services.security_service.data.permission_cache import (
+    CACHED_PERMISSION_TABLES,
+    get_available_parent_ids,
+)
 from services.security_service.data.utils import get_user_permissions
 
 
@@ -70,35 +90,88 @@ def select_listener(orm_execute_state):
     orm_execute_state.statement = statement
 
 
+def get_criteria(session, permission, user_permissions, actions):
+    column = getattr(permission.main, permission.column)
+    if permission.security in CACHED_PERMISSION_TABLES:
+        parent_ids = get_available_parent_ids(
+            session=session,
+            permission_table=permission.security,
+            user_permissions=user_permissions,
+            actions=actions,
+        )
+        return column == any_(literal(parent_ids, ARRAY(Integer)))
+
+    subquery = session.query(permission.security.parent_id).filter(
+        permission.security.permission.in_(user_permissions)
+    )
+
+    attrs = []
+    if actions:
+        for i in actions:
+            attr = getattr(permission.security, i)
+            attrs.append(attr == true())
+    else:
+        attr = false()
+        attrs.append(attr == true())
+
+    subquery = subquery.filter(or_(*attrs))
+    return column.in_(subquery)
+
+
+def get_inherited_criteria(session, permission, user_permissions, actions):
+    """Objects with own rules are filtered by them, other objects by rules
+    of object types"""
+    has_own_rules = exists().where(
+        permission.security.parent_id
+        == getattr(permission.main, permission.column)
+    )
+    return or_(
+        get_criteria(session, permission, user_permissions, actions),
+        and_(
+            ~has_own_rules,
+            get_criteria(
+                session, permission.inherited_from, user_permissions, actions
+            ),
+        ),
+    )
+
+
 def add_filter(statement, session, user_permissions, action):
+    if not action:
+        actions = ()
+    elif isinstance(action, list):
+        actions = tuple(action)
+    else:
+        actions = (action,)
     for from_ in statement.froms:
+        if (
+            INHERIT_OBJECT_PERMISSIONS
+            and from_.name in db_inherited_permissions
+        ):
+            permission = db_inherited_permissions[from_.name]
+            statement = statement.options(
+                with_loader_criteria(
+                    permission.main,
+                    get_inherited_criteria(
+                        session, permission, user_permissions, actions
+                    ),
+                    include_aliases=True,
+                )
+            )
+            continue
+
         permissions = db_permissions.get(from_.name, None)
         if not permissions:
             continue
         if not isinstance(permissions, list):
             permissions = [permissions]
         for permission in permissions:
-            subquery = session.query(permission.security.parent_id).filter(
-                permission.security.permission.in_(user_permissions)
-            )
-
-            attrs = []
-            if action:
-                if not isinstance(action, list):
-                    action = [action]
-                for i in action:
-                    attr = getattr(permission.security, i)
-                    attrs.append(attr == true())
-            else:
-                attr = false()
-                attrs.append(attr == true())
-
-            subquery = subquery.filter(or_(*attrs))
-
             statement = statement.options(
                 with_loader_criteria(
                     permission.main,
-                    getattr(permission.main, permission.column).in_(subquery),
+                    get_criteria(
+                        session, permission, user_permissions, actions
+                    ),
                     include_aliases=True,
                 )
             )
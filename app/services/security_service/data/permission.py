@@ -7,6 +7,9 @@ from services.security_service.data.permissions.inventory import (
 )
 
 Permission = namedtuple("Permission", ["main", "security", "column"])
+InheritedPermission = namedtuple(
+    "InheritedPermission", ["main", "security", "column", "inherited_from"]
+)
 
 db_permissions = {
     MO.__tablename__: [
@@ -18,4 +21,16 @@ db_permissions = {
     ),
 }
 
+# objects without own rules get rules of their object types
+db_inherited_permissions = {
+    MO.__tablename__: InheritedPermission(
+        main=MO,
+        security=MOPermission,
+        column="id",
+        inherited_from=Permission(
+            main=MO, security=TMOPermission, column="tmo_id"
+        ),
+    ),
+}
+
 db_admins = {"realm_access.__admin"}
@@ -0,0 +1,84 @@
+"""Ids of objects available to a set of roles, cached by the process.
+
+Rules of permission tables are already stored for every object they are
+inherited by (rows with root_permission_id), so ids available to roles are
+read by one query without recursion. TMO permissions are few, their ids are
+kept for PERMISSION_CACHE_TTL seconds and filters compare with them instead
+of running a subquery for every statement."""
+
+import threading
+
+from cachetools import TTLCache
+from sqlalchemy import event, or_, select, true
+from sqlalchemy.orm import Session
+
+from config.security_config import PERMISSION_CACHE_TTL
+from services.security_service.data.permissions.inventory import TMOPermission
+
+CACHED_PERMISSION_TABLES = {TMOPermission}
+SESSION_KEY_CHANGED_PERMISSIONS = "changed_cached_permissions"
+
+_available_ids = TTLCache(maxsize=1024, ttl=max(PERMISSION_CACHE_TTL, 1))
+_lock = threading.Lock()
+
+
+def get_available_parent_ids(
+    session: Session,
+    permission_table,
+    user_permissions: tuple[str, ...],
+    actions: tuple[str, ...],
+) -> list[int]:
+    """Returns sorted ids of objects with any of actions allowed for any of
+    user_permissions"""
+    if not actions:
+        return []
+    # the same roles are listed by tokens in any order
+    user_permissions = tuple(sorted(set(user_permissions)))
+    actions = tuple(sorted(set(actions)))
+    key = (permission_table.__tablename__, user_permissions, actions)
+    if PERMISSION_CACHE_TTL > 0:
+        with _lock:
+            parent_ids = _available_ids.get(key)
+        if parent_ids is not None:
+            return parent_ids
+
+    query = (
+        select(permission_table.parent_id)
+        .where(
+            permission_table.permission.in_(user_permissions),
+            or_(
+                *[
+                    getattr(permission_table, action) == true()
+                    for action in actions
+                ]
+            ),
+        )
+        .distinct()
+    )
+    # connection does not run ORM events, so the query is not filtered
+    parent_ids = sorted(session.connection().execute(query).scalars())
+    if PERMISSION_CACHE_TTL > 0:
+        with _lock:
+            _available_ids[key] = parent_ids
+    return parent_ids
+
+
+def clear_available_ids():
+    with _lock:
+        _available_ids.clear()
+
+
+@event.listens_for(Session, "after_flush")
+def mark_changed_permissions(session, flush_context):
+    if session.info.get(SESSION_KEY_CHANGED_PERMISSIONS):
+        return
+    for instances in (session.new, session.dirty, session.deleted):
+        if any(type(item) in CACHED_PERMISSION_TABLES for item in instances):
+            session.info[SESSION_KEY_CHANGED_PERMISSIONS] = True
+            return
+
+
+@event.listens_for(Session, "after_commit")
+def clear_changed_permissions(session):
+    if session.info.pop(SESSION_KEY_CHANGED_PERMISSIONS, False):
+        clear_available_ids()
@@ -1,12 +1,12 @@
 import ast
 import copy
-import pickle
 from dataclasses import dataclass
 from typing import List, Dict
 
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from functions.functions_utils.utils import encode_multiple_value
 from models import TPRM, PRM
 from routers.parameter_router.schemas import PRMCreateByMO
 from val_types.constants import enum_val_type_name
@@ -109,7 +109,7 @@ class EnumPRMCreator:
             for param in params:
                 tprm_instance = self.tprm_instances[param.tprm_id]
                 value = (
-                    pickle.dumps(param.value).hex()
+                    encode_multiple_value(param.value)
                     if tprm_instance.multiple
                     else param.value
                 )
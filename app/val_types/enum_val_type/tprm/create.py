@@ -1,11 +1,11 @@
 import ast
-import pickle
 from dataclasses import dataclass
 from typing import List, Union
 
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from functions.functions_utils.utils import encode_multiple_value
 from models import TPRM, TMO, MO, PRM
 from routers.parameter_type_router.schemas import TPRMCreate
 from val_types.enum_val_type.exceptions import (
@@ -156,7 +156,7 @@ class EnumTPRMCreator:
 
             if param_type.required:
                 if param_type.multiple:
-                    field_value = pickle.dumps(param_type.field_value).hex()
+                    field_value = encode_multiple_value(param_type.field_value)
                 else:
                     field_value = param_type.field_value
                 self._create_prms_for_all_mo(
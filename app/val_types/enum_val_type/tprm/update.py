@@ -1,5 +1,4 @@
 import ast
-import pickle
 from dataclasses import dataclass
 from datetime import datetime
 from typing import List, Dict, Any
@@ -7,6 +6,10 @@ from typing import List, Dict, Any
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from functions.functions_utils.utils import (
+    decode_multiple_value,
+    encode_multiple_value,
+)
 from models import TPRM, TMO, MO, PRM
 from routers.parameter_type_router.schemas import TPRMUpdate
 from val_types.enum_val_type.exceptions import (
@@ -111,7 +114,7 @@ class EnumTPRMUpdater:
 
             if all(value in param_type_constraint for value in field_value):
                 requested_param_type.field_value = (
-                    pickle.dumps(field_value).hex()
+                    encode_multiple_value(field_value)
                     if db_param_type.multiple
                     else field_value[0]
                 )
@@ -176,14 +179,14 @@ class EnumTPRMUpdater:
 
         for parameter in exists_parameters:
             if db_param_type.multiple:
-                parameter_value = pickle.loads(bytes.fromhex(parameter.value))
+                parameter_value = decode_multiple_value(parameter.value)
                 new_parameter_value = [
                     value
                     for value in parameter_value
                     if value in new_constraint
                 ]
                 if new_parameter_value:
-                    parameter.value = pickle.dumps(parameter_value).hex()
+                    parameter.value = encode_multiple_value(parameter_value)
                     self.session.add(parameter)
 
             else:
@@ -0,0 +1,101 @@
+"""Throughput of packing streamed elements into gRPC messages.
+
+Run from the repository root:
+    PYTHONPATH=app python tests/benchmarks/bench_message_chunker.py
+
+The previous approach appended elements one by one and serialized the
+whole message after every append, it is measured on a smaller stream
+since it is quadratic.
+"""
+
+import argparse
+import pickle
+import time
+
+from services.grpc_service.message_chunker import MessageChunker
+from services.grpc_service.proto_files.inventory_data.files.inventory_data_pb2 import (
+    GetMODataByIdsResponse,
+    MOData,
+    ResponseMOdata,
+)
+
+MAX_SIZE = 4_100_000
+
+
+def get_string_elements(count: int) -> list[str]:
+    return [
+        pickle.dumps({"id": index, "name": f"object {index}"}).hex()
+        for index in range(count)
+    ]
+
+
+def get_message_elements(count: int) -> list[MOData]:
+    return [
+        MOData(id=index, name=f"object {index}", tmo_id=1)
+        for index in range(count)
+    ]
+
+
+def pack_by_byte_size(message_class, field_name: str, elements: list):
+    """Previous packing: ByteSize of the message after every element"""
+    messages = []
+    current_chunk = []
+    for element in elements:
+        current_chunk.append(element)
+        message = message_class(**{field_name: current_chunk})
+        if message.ByteSize() > MAX_SIZE:
+            current_chunk.pop()
+            messages.append(message_class(**{field_name: current_chunk}))
+            current_chunk = [element]
+    if current_chunk:
+        messages.append(message_class(**{field_name: current_chunk}))
+    return messages
+
+
+def pack_by_chunker(message_class, field_name: str, elements: list):
+    chunker = MessageChunker(
+        message_class=message_class, field_name=field_name, max_size=MAX_SIZE
+    )
+    return list(chunker.iter_messages(elements))
+
+
+def measure(name: str, pack, message_class, field_name, elements) -> None:
+    started = time.perf_counter()
+    messages = pack(message_class, field_name, elements)
+    duration = time.perf_counter() - started
+    print(
+        f"{name:<45} {len(elements):>9} elements {len(messages):>5} messages "
+        f"{duration:>8.3f} s {len(elements) / duration:>12,.0f} elements/s"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--elements", type=int, default=1_000_000)
+    parser.add_argument("--previous-elements", type=int, default=5_000)
+    args = parser.parse_args()
+
+    for message_class, field_name, get_elements in (
+        (ResponseMOdata, "objects_with_parameters", get_string_elements),
+        (GetMODataByIdsResponse, "list_of_mo", get_message_elements),
+    ):
+        elements = get_elements(args.elements)
+        title = f"{message_class.__name__}.{field_name}"
+        measure(
+            f"previous {title}",
+            pack_by_byte_size,
+            message_class,
+            field_name,
+            elements[: args.previous_elements],
+        )
+        measure(
+            f"chunker {title}",
+            pack_by_chunker,
+            message_class,
+            field_name,
+            elements,
+        )
+
+
+if __name__ == "__main__":
+    main()
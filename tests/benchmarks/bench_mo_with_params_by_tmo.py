@@ -0,0 +1,140 @@
+"""Time and peak memory of GetAllMOWithParamsByTMOId.iter_results (MO and
+PRM cursors merged by mo_id) with and without replacing of links.
+
+Needs a database with the inventory schema (DB_* variables as for the
+application). The dataset (a TMO with --objects objects and --tprms TPRMs,
+every object has --fill share of parameters) is generated by SQL and removed
+after the run unless --keep is given.
+
+Run from the repository root:
+    PYTHONPATH=app python tests/benchmarks/bench_mo_with_params_by_tmo.py \
+        --objects 500000 --tprms 200
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from sqlalchemy import text
+from sqlmodel import Session
+
+from database import engine
+from models import TMO
+from services.grpc_service.grpc_utils import GetAllMOWithParamsByTMOId
+
+
+def create_dataset(session: Session, objects: int, tprms: int, fill: float):
+    tmo = TMO(
+        name=f"bench tmo {time.time_ns()}",
+        created_by="bench",
+        modified_by="bench",
+    )
+    session.add(tmo)
+    session.flush()
+    params = {"tmo_id": tmo.id, "objects": objects, "tprms": tprms}
+    session.execute(
+        text(
+            "INSERT INTO tprm (name, val_type, multiple, required, "
+            "returnable, tmo_id, version, created_by, modified_by, "
+            "creation_date, modification_date) "
+            "SELECT 'bench ' || n, (ARRAY['str', 'int', 'float', 'bool'])"
+            "[1 + n % 4], false, false, false, :tmo_id, 1, 'bench', "
+            "'bench', now(), now() FROM generate_series(1, :tprms) n"
+        ),
+        params,
+    )
+    session.execute(
+        text(
+            "INSERT INTO mo (name, tmo_id, active, version, document_count, "
+            "creation_date, modification_date) "
+            "SELECT 'bench ' || n, :tmo_id, true, 1, 0, now(), now() "
+            "FROM generate_series(1, :objects) n"
+        ),
+        params,
+    )
+    # points of objects are previous objects, parents are every 100th
+    session.execute(
+        text(
+            "UPDATE mo SET point_a_id = id - 1, "
+            "p_id = first_id + (id - first_id) / 100 * 100 "
+            "FROM (SELECT min(id) AS first_id FROM mo "
+            "WHERE tmo_id = :tmo_id) AS first "
+            "WHERE tmo_id = :tmo_id AND (id - first_id) % 100 <> 0"
+        ),
+        params,
+    )
+    session.execute(
+        text(
+            "INSERT INTO prm (tprm_id, mo_id, value, version) "
+            "SELECT tprm.id, mo.id, CASE tprm.val_type "
+            "WHEN 'str' THEN 'value ' || mo.id "
+            "WHEN 'int' THEN (mo.id % 1000)::text "
+            "WHEN 'float' THEN (mo.id / 7.0)::text "
+            "ELSE (mo.id % 2 = 0)::text END, 1 "
+            "FROM mo JOIN tprm ON tprm.tmo_id = mo.tmo_id "
+            "WHERE mo.tmo_id = :tmo_id AND random() < :fill"
+        ),
+        {**params, "fill": fill},
+    )
+    session.commit()
+    session.execute(text("ANALYZE mo; ANALYZE prm"))
+    return tmo.id
+
+
+def remove_dataset(session: Session, tmo_id: int):
+    session.execute(text("DELETE FROM tmo WHERE id = :id"), {"id": tmo_id})
+    session.commit()
+
+
+def measure(session: Session, tmo_id: int, replace_links: bool):
+    process = GetAllMOWithParamsByTMOId(session=session, tmo_id=tmo_id)
+    tracemalloc.start()
+    started = time.perf_counter()
+    objects = params = 0
+    for chunk in process.iter_results(replace_links=replace_links):
+        objects += len(chunk)
+        params += sum(len(item["params"]) for item in chunk)
+    duration = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    session.rollback()
+    return objects, params, duration, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--objects", type=int, default=500_000)
+    parser.add_argument("--tprms", type=int, default=200)
+    parser.add_argument("--fill", type=float, default=0.2)
+    parser.add_argument("--tmo-id", type=int, help="use existing TMO")
+    parser.add_argument("--keep", action="store_true")
+    args = parser.parse_args()
+
+    with Session(engine) as session:
+        tmo_id = args.tmo_id
+        if tmo_id is None:
+            started = time.perf_counter()
+            tmo_id = create_dataset(
+                session, objects=args.objects, tprms=args.tprms, fill=args.fill
+            )
+            print(
+                f"dataset TMO {tmo_id} created in "
+                f"{time.perf_counter() - started:.1f} s"
+            )
+        try:
+            for replace_links in (False, True):
+                objects, params, duration, peak = measure(
+                    session, tmo_id, replace_links
+                )
+                print(
+                    f"replace_links={replace_links!s:<5} {objects:>9,} objects "
+                    f"{params:>12,} params {duration:>8.1f} s "
+                    f"peak {peak / 2**20:>8.1f} MiB"
+                )
+        finally:
+            if args.tmo_id is None and not args.keep:
+                remove_dataset(session, tmo_id)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""Bytes on the wire and encode/decode time of objects sent as pickle hex
+strings (GetAllMOWithParamsByTMOId) and as typed MO messages
+(GetAllMOWithParamsByTMOIdV2).
+
+Run from the repository root:
+    PYTHONPATH=app python tests/benchmarks/bench_typed_payloads.py
+
+Decoding of typed messages is measured twice: parsing only, which is what
+clients reading fields need, and parsing with conversion back to dicts.
+"""
+
+import argparse
+import pickle
+import time
+from datetime import datetime, timedelta
+
+from google.protobuf import json_format
+
+from services.grpc_service.message_chunker import MessageChunker
+from services.grpc_service.proto_files.inventory_data.files.inventory_data_pb2 import (
+    MO,
+    GetAllMOWithParamsByTMOIdResponse,
+    ResponseMOs,
+)
+from services.grpc_service.typed_payloads import to_mo_message
+
+
+def get_objects(count: int, params_count: int) -> list[dict]:
+    creation_date = datetime(2024, 1, 1)
+    return [
+        {
+            "id": index,
+            "name": f"object {index}",
+            "label": None,
+            "tmo_id": 12,
+            "p_id": index // 10 or None,
+            "point_a_id": None,
+            "point_b_id": None,
+            "model": None,
+            "description": None,
+            "active": True,
+            "latitude": 50.0 + index / 1e6,
+            "longitude": 30.0 + index / 1e6,
+            "status": "in use",
+            "version": 1,
+            "document_count": 0,
+            "pov": None,
+            "geometry": {"type": "Point", "coordinates": [30.0, 50.0]},
+            "creation_date": creation_date,
+            "modification_date": creation_date + timedelta(days=index % 30),
+            "parent_name": f"object {index // 10}",
+            "point_a_name": None,
+            "point_b_name": None,
+            "params": [
+                {
+                    "tprm_id": str(100 + number),
+                    "value": (
+                        f"value {index} {number}"
+                        if number % 3 == 0
+                        else index * number
+                        if number % 3 == 1
+                        else [f"item {number}", f"item {index}"]
+                    ),
+                }
+                for number in range(params_count)
+            ],
+        }
+        for index in range(count)
+    ]
+
+
+def encode_pickle(objects: list[dict]) -> list[bytes]:
+    chunker = MessageChunker(
+        message_class=GetAllMOWithParamsByTMOIdResponse,
+        field_name="mos_with_params",
+    )
+    return [
+        message.SerializeToString()
+        for message in chunker.iter_messages(
+            pickle.dumps(item).hex() for item in objects
+        )
+    ]
+
+
+def decode_pickle(messages: list[bytes]) -> list[dict]:
+    return [
+        pickle.loads(bytes.fromhex(item))
+        for message in messages
+        for item in GetAllMOWithParamsByTMOIdResponse.FromString(
+            message
+        ).mos_with_params
+    ]
+
+
+def encode_typed(objects: list[dict]) -> list[bytes]:
+    chunker = MessageChunker(message_class=ResponseMOs, field_name="objects")
+    return [
+        message.SerializeToString()
+        for message in chunker.iter_messages(
+            to_mo_message(item, MO) for item in objects
+        )
+    ]
+
+
+def decode_typed(messages: list[bytes]) -> list[MO]:
+    return [
+        item
+        for message in messages
+        for item in ResponseMOs.FromString(message).objects
+    ]
+
+
+def decode_typed_to_dicts(messages: list[bytes]) -> list[dict]:
+    return [
+        json_format.MessageToDict(item, preserving_proto_field_name=True)
+        for item in decode_typed(messages)
+    ]
+
+
+def measure(func, data):
+    started = time.perf_counter()
+    result = func(data)
+    return result, time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--objects", type=int, default=100_000)
+    parser.add_argument("--params", type=int, default=10)
+    args = parser.parse_args()
+
+    objects = get_objects(count=args.objects, params_count=args.params)
+    print(f"{args.objects} objects with {args.params} parameters")
+    for name, encode, decoders in (
+        ("pickle hex", encode_pickle, (("decode", decode_pickle),)),
+        (
+            "typed",
+            encode_typed,
+            (("parse", decode_typed), ("to dicts", decode_typed_to_dicts)),
+        ),
+    ):
+        messages, encode_duration = measure(encode, objects)
+        wire_size = sum(len(message) for message in messages)
+        print(
+            f"{name:<12} {wire_size:>14,} bytes {len(messages):>5} messages "
+            f"encode {encode_duration:>7.3f} s"
+        )
+        for decoder_name, decode in decoders:
+            decoded, decode_duration = measure(decode, messages)
+            assert len(decoded) == len(objects)
+            print(f"{'':<12} {decoder_name:<10} {decode_duration:>7.3f} s")
+
+
+if __name__ == "__main__":
+    main()
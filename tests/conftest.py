@@ -3,7 +3,10 @@ import sys
 
 from fastapi.testclient import TestClient
 from pytest import fixture
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
 from sqlmodel import Session, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlmodel.pool import StaticPool
 from testcontainers.postgres import (
     PostgresContainer,
@@ -100,6 +103,17 @@ def client(session, engine, mocker):
     def get_session_override():
         return session
 
+    async_engine = create_async_engine(
+        engine.url.set(drivername="postgresql+asyncpg"),
+        poolclass=NullPool,
+    )
+
+    async def get_async_session_override():
+        async with AsyncSession(
+            async_engine, expire_on_commit=False
+        ) as async_session:
+            yield async_session
+
     mocker.patch("database.engine", new=engine)
     mocker.patch(
         "services.event_service.processor.get_not_auth_session",
@@ -107,11 +121,17 @@ def client(session, engine, mocker):
     )
     mocker.patch("config.database_config.DATABASE_URL", new=engine.url)
 
-    from database import get_session, get_not_auth_session
+    from database import (
+        get_session,
+        get_not_auth_session,
+        get_async_session,
+    )
     from main import app_v1, app
 
     app_v1.dependency_overrides[get_session] = get_session_override
     app.dependency_overrides[get_session] = get_session_override
+    app_v1.dependency_overrides[get_async_session] = get_async_session_override
+    app.dependency_overrides[get_async_session] = get_async_session_override
     app_v1.dependency_overrides[get_not_auth_session] = get_session_override
     app.dependency_overrides[get_not_auth_session] = get_session_override
 
@@ -0,0 +1,163 @@
+"""Tests GetAllMOWithParamsByTMOId reads objects with parameters in one pass"""
+
+import json
+
+import pytest
+from sqlmodel import select
+
+from models import MO, PRM, TMO, TPRM
+from services.grpc_service.grpc_utils import GetAllMOWithParamsByTMOId
+
+OBJECTS_COUNT = 7
+CHUNK_SIZE = 3
+
+
+@pytest.fixture(scope="function")
+def data(session):
+    tmo = TMO(name="TEST TMO", created_by="Admin", modified_by="Admin")
+    session.add(tmo)
+    session.flush()
+    tprms = {}
+    for name, val_type, multiple in (
+        ("int", "int", False),
+        ("str", "str", False),
+        ("mo link", "mo_link", False),
+        ("mo links", "mo_link", True),
+    ):
+        tprms[name] = TPRM(
+            name=name,
+            val_type=val_type,
+            multiple=multiple,
+            tmo_id=tmo.id,
+            created_by="Admin",
+            modified_by="Admin",
+        )
+    session.add_all(tprms.values())
+    session.flush()
+
+    mos = []
+    for index in range(OBJECTS_COUNT):
+        mo = MO(
+            name=f"TEST MO {index}",
+            tmo_id=tmo.id,
+            p_id=mos[0].id if mos else None,
+            point_a_id=mos[-1].id if mos else None,
+        )
+        session.add(mo)
+        session.flush()
+        mos.append(mo)
+        if index % 2:
+            continue
+        session.add_all(
+            [
+                PRM(tprm_id=tprms["int"].id, mo_id=mo.id, value=str(index)),
+                PRM(tprm_id=tprms["str"].id, mo_id=mo.id, value=""),
+            ]
+        )
+        if index:
+            session.add_all(
+                [
+                    PRM(
+                        tprm_id=tprms["mo link"].id,
+                        mo_id=mo.id,
+                        value=str(mos[0].id),
+                    ),
+                    PRM(
+                        tprm_id=tprms["mo links"].id,
+                        mo_id=mo.id,
+                        value=json.dumps([mos[0].id, mos[1].id]),
+                    ),
+                ]
+            )
+    session.commit()
+    return tmo, tprms, mos
+
+
+def get_objects(session, tmo, replace_links=False):
+    process = GetAllMOWithParamsByTMOId(session=session, tmo_id=tmo.id)
+    process.MO_COUNT_PER_QUERY = CHUNK_SIZE
+    return list(process.iter_results(replace_links=replace_links))
+
+
+def test_objects_are_read_by_chunks_in_id_order(session, data):
+    tmo, tprms, mos = data
+
+    chunks = get_objects(session, tmo)
+
+    assert [len(chunk) for chunk in chunks] == [3, 3, 1]
+    objects = [item for chunk in chunks for item in chunk]
+    assert [item["id"] for item in objects] == [mo.id for mo in mos]
+    assert objects[2]["parent_name"] == "TEST MO 0"
+    assert objects[2]["point_a_name"] == "TEST MO 1"
+    assert objects[2]["point_b_name"] is None
+    assert objects[1]["params"] == []
+    assert objects[2]["params"] == [
+        {"tprm_id": str(tprms["int"].id), "value": 2},
+        {"tprm_id": str(tprms["str"].id), "value": ""},
+        {"tprm_id": str(tprms["mo link"].id), "value": mos[0].id},
+        {"tprm_id": str(tprms["mo links"].id), "value": [mos[0].id, mos[1].id]},
+    ]
+
+
+def test_links_are_replaced(session, data):
+    tmo, tprms, mos = data
+
+    chunks = get_objects(session, tmo, replace_links=True)
+
+    params = {
+        int(param["tprm_id"]): param["value"]
+        for param in chunks[-1][0]["params"]
+    }
+    assert params[tprms["mo link"].id] == "TEST MO 0"
+    assert params[tprms["mo links"].id] == ["TEST MO 0", "TEST MO 1"]
+
+
+def get_expected_objects(session, tmo):
+    """Reads objects one by one as a reference for iter_results"""
+    process = GetAllMOWithParamsByTMOId(session=session, tmo_id=tmo.id)
+    tprms = process.get_all_tprms_cache()
+    objects = {}
+    for mo in session.exec(select(MO).where(MO.tmo_id == tmo.id)).all():
+        item = mo.dict()
+        for attr, name in (
+            ("p_id", "parent_name"),
+            ("point_a_id", "point_a_name"),
+            ("point_b_id", "point_b_name"),
+        ):
+            related = session.get(MO, item[attr]) if item[attr] else None
+            item[name] = related.name if related else None
+        item["params"] = []
+        for prm in session.exec(select(PRM).where(PRM.mo_id == mo.id)).all():
+            tprm = tprms[str(prm.tprm_id)]
+            if not prm.value and tprm["val_type"] != "str":
+                continue
+            item["params"].append(
+                {
+                    "tprm_id": str(prm.tprm_id),
+                    "value": process.get_tprm_value(
+                        prm.value, tprm["val_type"], tprm["multiple"]
+                    ),
+                }
+            )
+        objects[mo.id] = item
+    return objects
+
+
+def sort_params(objects):
+    for item in objects.values():
+        item["params"].sort(key=lambda param: int(param["tprm_id"]))
+    return objects
+
+
+def test_results_match_objects_read_one_by_one(session, data):
+    tmo, _, _ = data
+
+    objects = {
+        item["id"]: item
+        for chunk in get_objects(session, tmo)
+        for item in chunk
+    }
+
+    assert sort_params(objects) == sort_params(
+        get_expected_objects(session, tmo)
+    )
@@ -0,0 +1,99 @@
+"""Tests responses of streams and configured methods are compressed"""
+
+import inspect
+from unittest.mock import Mock
+
+import grpc
+import pytest
+
+from services.grpc_service.compression import (
+    CompressionInterceptor,
+    parse_method_compression,
+)
+
+
+def stream_objects(request, context):
+    yield from request
+
+
+async def stream_objects_async(request, context):
+    for item in request:
+        yield item
+
+
+def get_object(request, context):
+    return request[0]
+
+
+async def intercept(interceptor, handler, method="/Informer/Method"):
+    async def continuation(handler_call_details):
+        return handler
+
+    return await interceptor.intercept_service(
+        continuation, Mock(method=method)
+    )
+
+
+def test_method_compression_is_parsed():
+    assert parse_method_compression(
+        "GetTMOTree=gzip, /Informer/GetMOsByIds = none,"
+    ) == {
+        "GetTMOTree": grpc.Compression.Gzip,
+        "/Informer/GetMOsByIds": grpc.Compression.NoCompression,
+    }
+
+
+@pytest.mark.parametrize("value", ["GetTMOTree", "GetTMOTree=brotli"])
+def test_invalid_method_compression_is_rejected(value):
+    with pytest.raises(ValueError):
+        parse_method_compression(value)
+
+
+async def test_streamed_responses_are_compressed():
+    interceptor = CompressionInterceptor(
+        streaming_compression=grpc.Compression.Gzip
+    )
+    context = Mock()
+
+    handler = await intercept(
+        interceptor, grpc.unary_stream_rpc_method_handler(stream_objects_async)
+    )
+    responses = [
+        response async for response in handler.unary_stream([1, 2], context)
+    ]
+
+    assert responses == [1, 2]
+    context.set_compression.assert_called_once_with(grpc.Compression.Gzip)
+
+
+async def test_synchronous_behavior_stays_synchronous():
+    interceptor = CompressionInterceptor(
+        streaming_compression=grpc.Compression.Deflate
+    )
+    context = Mock()
+
+    handler = await intercept(
+        interceptor, grpc.unary_stream_rpc_method_handler(stream_objects)
+    )
+
+    assert not inspect.isasyncgenfunction(handler.unary_stream)
+    assert list(handler.unary_stream([1], context)) == [1]
+    context.set_compression.assert_called_once_with(grpc.Compression.Deflate)
+
+
+async def test_unary_responses_are_compressed_when_configured():
+    interceptor = CompressionInterceptor(
+        streaming_compression=grpc.Compression.Gzip,
+        method_compression={"GetTMOTree": grpc.Compression.Deflate},
+    )
+    handler = grpc.unary_unary_rpc_method_handler(get_object)
+
+    not_configured = await intercept(interceptor, handler)
+    configured = await intercept(
+        interceptor, handler, method="/GraphInformer/GetTMOTree"
+    )
+    context = Mock()
+
+    assert not_configured is handler
+    assert configured.unary_unary([5], context) == 5
+    context.set_compression.assert_called_once_with(grpc.Compression.Deflate)
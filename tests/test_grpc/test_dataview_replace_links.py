@@ -0,0 +1,121 @@
+"""Tests GrpcController pages objects by id and replaces links by pages"""
+
+import json
+
+import pytest
+
+from models import MO, PRM, TMO, TPRM
+from services.dataview_manager.controller import GrpcController
+
+OBJECTS_COUNT = 5
+PAGE_SIZE = 2
+
+
+@pytest.fixture(scope="function")
+def data(session):
+    tmo = TMO(name="TEST TMO", created_by="Admin", modified_by="Admin")
+    session.add(tmo)
+    session.flush()
+    tprms = {}
+    for name, val_type, multiple in (
+        ("text", "str", False),
+        ("mo link", "mo_link", False),
+        ("mo links", "mo_link", True),
+        ("prm link", "prm_link", False),
+    ):
+        tprms[name] = TPRM(
+            name=name,
+            val_type=val_type,
+            multiple=multiple,
+            tmo_id=tmo.id,
+            created_by="Admin",
+            modified_by="Admin",
+        )
+    session.add_all(tprms.values())
+    session.flush()
+
+    mos = []
+    for index in range(OBJECTS_COUNT):
+        mo = MO(name=f"TEST MO {index}", tmo_id=tmo.id)
+        session.add(mo)
+        session.flush()
+        mos.append(mo)
+        session.add(
+            PRM(tprm_id=tprms["text"].id, mo_id=mo.id, value=f"text {index}")
+        )
+    session.flush()
+    text_prm = session.query(PRM).filter(PRM.mo_id == mos[0].id).one()
+    for mo in mos[1:]:
+        session.add_all(
+            [
+                PRM(
+                    tprm_id=tprms["mo link"].id,
+                    mo_id=mo.id,
+                    value=str(mos[0].id),
+                ),
+                PRM(
+                    tprm_id=tprms["mo links"].id,
+                    mo_id=mo.id,
+                    value=json.dumps([mos[0].id, mo.id]),
+                ),
+                PRM(
+                    tprm_id=tprms["prm link"].id,
+                    mo_id=mo.id,
+                    value=str(text_prm.id),
+                ),
+            ]
+        )
+    session.commit()
+    return tmo, tprms
+
+
+def get_pages(session, tmo, tprms):
+    objects = GrpcController.get_objects(
+        session=session, tmo_id=tmo.id, page_size=PAGE_SIZE
+    )
+    objects = GrpcController.get_parameters(session=session, objects=objects)
+    return list(
+        GrpcController.replace_links(
+            session=session,
+            objects=objects,
+            mo_links=[tprms["mo link"].id, tprms["mo links"].id],
+            prm_links=[tprms["prm link"].id],
+            multiple_links={tprms["mo links"].id},
+        )
+    )
+
+
+def test_objects_are_paged_by_id(session, data):
+    pages = get_pages(session, *data)
+
+    assert [len(page) for page in pages] == [2, 2, 1]
+    ids = [mo_id for page in pages for mo_id in page]
+    assert ids == sorted(ids)
+
+
+def test_links_are_replaced(session, data):
+    _, tprms = data
+
+    pages = get_pages(session, *data)
+
+    item = pages[-1][max(pages[-1])]
+    values = {param["tprm_id"]: param["value"] for param in item["params"]}
+    assert values[tprms["mo link"].id] == "TEST MO 0"
+    assert values[tprms["mo links"].id] == ["TEST MO 0", "TEST MO 4"]
+    assert values[tprms["prm link"].id] == "text 0"
+
+
+def test_links_of_page_are_resolved_by_one_query(session, data, mocker):
+    tmo, tprms = data
+    # committed instances are expired, load ids before counting statements
+    tmo_id = tmo.id
+    tprm_ids = [tprm.id for tprm in tprms.values()]
+    assert tmo_id and all(tprm_ids)
+    execute = mocker.spy(session, "execute")
+
+    pages = get_pages(session, *data)
+
+    # objects and parameters of 3 pages, mo links of every page and the
+    # linked parameter once, later pages take it from the cache
+    assert len(pages) == 3
+    assert execute.call_count == 3 * 2 + 3 + 1
@@ -0,0 +1,115 @@
+"""Tests servicer methods are executed out of the event loop"""
+
+import asyncio
+import threading
+import time
+
+import grpc
+import pytest
+
+from models import TMO, MO
+from services.grpc_service.db_executor import GrpcDBExecutor
+from services.grpc_service.grpc_server import Informer
+from services.grpc_service.proto_files.inventory_data.files.inventory_data_pb2 import (
+    IntValue,
+)
+
+executor = GrpcDBExecutor(workers=2, heavy_workers=3, heavy_method_limit=2)
+
+
+class Servicer:
+    def __init__(self):
+        self.running = 0
+        self.max_running = 0
+        self.lock = threading.Lock()
+
+    @executor.stream(heavy=True)
+    def Export(self, request, context):
+        for item in range(request):
+            time.sleep(0.05)
+            yield item
+
+    @executor.unary(heavy=True)
+    def LimitedExport(self, request, context):
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(0.1)
+        with self.lock:
+            self.running -= 1
+        return request
+
+    @executor.unary()
+    def Lookup(self, request, context):
+        return request
+
+
+async def test_stream_does_not_block_lookups():
+    servicer = Servicer()
+    finished = []
+
+    async def export():
+        result = [item async for item in servicer.Export(10, None)]
+        finished.append("export")
+        return result
+
+    async def lookup():
+        await asyncio.sleep(0.05)
+        result = await servicer.Lookup(1, None)
+        finished.append("lookup")
+        return result
+
+    exported, looked_up = await asyncio.gather(export(), lookup())
+
+    assert exported == list(range(10))
+    assert looked_up == 1
+    assert finished == ["lookup", "export"]
+
+
+async def test_heavy_method_calls_are_limited():
+    servicer = Servicer()
+
+    results = await asyncio.gather(
+        *[servicer.LimitedExport(index, None) for index in range(5)]
+    )
+
+    assert results == list(range(5))
+    assert servicer.max_running == 2
+
+
+async def test_stream_is_closed_if_client_stops_reading():
+    closed = threading.Event()
+
+    class ClosingServicer:
+        @executor.stream()
+        def Export(self, request, context):
+            try:
+                yield from range(request)
+            finally:
+                closed.set()
+
+    stream = ClosingServicer().Export(10, None)
+    assert await stream.__anext__() == 0
+    await stream.aclose()
+
+    assert closed.is_set()
+
+
+@pytest.fixture(scope="function")
+def mo(session, engine, mocker):
+    mocker.patch("services.grpc_service.grpc_server.engine", new=engine)
+    tmo = TMO(name="TEST TMO", created_by="Admin", modified_by="Admin")
+    session.add(tmo)
+    session.flush()
+    mo = MO(name="TEST MO", tmo_id=tmo.id)
+    session.add(mo)
+    session.commit()
+    return mo
+
+
+async def test_informer_method_is_executed_by_executor(mo, mocker):
+    context = mocker.create_autospec(spec=grpc.aio.ServicerContext)
+
+    response = await Informer().GetTMOidForMo(IntValue(value=mo.id), context)
+
+    assert response.tmo_id == mo.tmo_id
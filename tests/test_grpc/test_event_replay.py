@@ -0,0 +1,133 @@
+"""Tests EventManagerManager replays events by id cursor"""
+
+import json
+from datetime import datetime, timedelta
+
+import grpc
+import pytest
+from sqlmodel import Session
+
+from models import Event
+from services.event_service.grpc_servicer import EventManagerManager
+from services.grpc_service.proto_files.event_manager_methods.files.event_manager_pb2 import (
+    ReplayEventsRequest,
+)
+
+BATCH_SIZE = 2
+
+
+@pytest.fixture(scope="function")
+def events(session, engine, mocker):
+    mocker.patch("services.event_service.grpc_servicer.engine", new=engine)
+    events = []
+    # events of one model are in different pages
+    for index, event_type in enumerate(
+        ["MOCreate", "MOUpdate", "PRMCreate", "MOUpdate", "MOUpdate"]
+    ):
+        instance_name = event_type.removesuffix("Create").removesuffix("Update")
+        event = Event(
+            event_type=event_type,
+            model_id=1,
+            user="Admin",
+            event_time=datetime.utcnow() - timedelta(hours=1),
+            event={instance_name: {"id": 1, "version": index}},
+        )
+        session.add(event)
+        events.append(event)
+    session.commit()
+    return events
+
+
+@pytest.fixture(scope="function")
+def context(mocker):
+    return mocker.create_autospec(spec=grpc.aio.ServicerContext)
+
+
+async def replay(context, **request_data):
+    request = ReplayEventsRequest(batch_size=BATCH_SIZE, **request_data)
+    return [
+        response
+        async for response in EventManagerManager().ReplayEvents(
+            request, context
+        )
+    ]
+
+
+async def test_replay_resumes_after_cursor(events, context):
+    first = await replay(context, event_types=["MOUpdate"])
+    assert [event.id for r in first for event in r.events] == [
+        events[1].id,
+        events[3].id,
+        events[4].id,
+    ]
+    assert first[-1].last_event_id == events[-1].id
+    event = first[0].events[0]
+    assert event.type == "UPDATED"
+    assert event.instance_name == "MO"
+    assert json.loads(event.data) == {"id": 1, "version": 1}
+
+    resumed = await replay(
+        context, after_event_id=events[2].id, event_types=["MOUpdate"]
+    )
+    assert [event.id for r in resumed for event in r.events] == [
+        events[3].id,
+        events[4].id,
+    ]
+
+
+async def test_cursor_moves_past_events_of_other_types(events, context):
+    responses = await replay(context, event_types=["PRMCreate"])
+
+    assert [event.id for r in responses for event in r.events] == [events[2].id]
+    assert responses[-1].last_event_id == events[-1].id
+
+
+async def test_unknown_event_type_is_rejected(events, context):
+    responses = await replay(context, event_types=["Unknown"])
+
+    assert responses == []
+    context.set_code.assert_called_once_with(grpc.StatusCode.INVALID_ARGUMENT)
+
+
+async def test_events_committed_after_higher_ids_are_not_skipped(
+    events, context, engine, mocker
+):
+    mocker.patch(
+        "services.event_service.grpc_servicer.EVENT_REPLAY_LAG", new=60
+    )
+
+    def new_event(version):
+        return Event(
+            event_type="MOUpdate",
+            model_id=1,
+            user="Admin",
+            event={"MO": {"id": 1, "version": version}},
+        )
+
+    with Session(engine) as pending_session, Session(engine) as session:
+        pending = new_event(version=5)
+        pending_session.add(pending)
+        pending_session.flush()
+        pending_id = pending.id
+        committed = new_event(version=6)
+        session.add(committed)
+        session.flush()
+        committed_id = committed.id
+        session.commit()
+        assert pending_id < committed_id
+
+        responses = await replay(context, event_types=["MOUpdate"])
+        assert responses[-1].last_event_id == events[-1].id
+
+        pending_session.commit()
+
+    mocker.patch("services.event_service.grpc_servicer.EVENT_REPLAY_LAG", new=0)
+    resumed = await replay(
+        context,
+        after_event_id=responses[-1].last_event_id,
+        event_types=["MOUpdate"],
+    )
+    assert [event.id for r in resumed for event in r.events] == [
+        pending_id,
+        committed_id,
+    ]
@@ -0,0 +1,89 @@
+"""Tests GetFilteredObjWithParamsStream pages through filtered objects"""
+
+import math
+import pickle
+
+import pytest
+
+from models import MO, PRM, TMO, TPRM
+from services.grpc_service.proto_files.inventory_data.files.inventory_data_pb2 import (
+    OrderByTPRM,
+    RequestForFilteredObjInfoByTMO,
+    RequestForFilteredObjInfoByTMOV2,
+)
+from services.grpc_service.proto_files.inventory_data.handlers import (
+    FilteredObjWithParamsHandler,
+)
+from services.grpc_service.typed_payloads import from_proto_value
+
+OBJECTS_COUNT = 5
+PAGE_SIZE = 2
+
+
+@pytest.fixture(scope="function")
+def handler(engine):
+    handler = FilteredObjWithParamsHandler(page_size=PAGE_SIZE)
+    handler.engine = engine
+    return handler
+
+
+@pytest.fixture(scope="function")
+def tprm(session):
+    tmo = TMO(name="TEST TMO", created_by="Admin", modified_by="Admin")
+    session.add(tmo)
+    session.flush()
+    tprm = TPRM(
+        name="TEST TPRM",
+        val_type="str",
+        returnable=True,
+        tmo_id=tmo.id,
+        created_by="Admin",
+        modified_by="Admin",
+    )
+    session.add(tprm)
+    session.flush()
+    for index in range(OBJECTS_COUNT):
+        mo = MO(name=f"TEST MO {index}", tmo_id=tmo.id)
+        session.add(mo)
+        session.flush()
+        session.add(PRM(tprm_id=tprm.id, mo_id=mo.id, value=f"value {index}"))
+    session.commit()
+    return tprm
+
+
+async def test_stream_yields_every_page(handler, tprm):
+    request = RequestForFilteredObjInfoByTMO(object_type_id=tprm.tmo_id)
+
+    messages = [
+        message
+        async for message in handler.get_stream_response_chunked(request)
+    ]
+
+    objects = [
+        pickle.loads(bytes.fromhex(item))
+        for message in messages
+        for item in message.objects_with_parameters
+    ]
+    expected_names = [f"TEST MO {index}" for index in range(OBJECTS_COUNT)]
+    assert [item["name"] for item in objects] == expected_names
+    assert all(len(item["params"]) == 1 for item in objects)
+    assert len(messages) == math.ceil(OBJECTS_COUNT / PAGE_SIZE)
+
+
+async def test_stream_keeps_requested_order(handler, tprm):
+    request = RequestForFilteredObjInfoByTMOV2(
+        object_type_id=tprm.tmo_id,
+        order_by=[
+            OrderByTPRM(tprm_id=tprm.id, val_type="str", ascending=False)
+        ],
+    )
+
+    objects = [
+        item
+        async for message in handler.get_stream_response_chunked_v2(request)
+        for item in message.objects
+    ]
+
+    assert [from_proto_value(item.params[0].value) for item in objects] == [
+        f"value {index}" for index in reversed(range(OBJECTS_COUNT))
+    ]
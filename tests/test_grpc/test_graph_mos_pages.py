@@ -0,0 +1,86 @@
+"""Tests GraphInformer.GetMOsByTMOidPages keyset pages"""
+
+import json
+
+import grpc
+import pytest
+
+from models import MO, PRM, TMO, TPRM
+from services.graph_service.graph import GraphInformer
+from services.grpc_service.proto_files.graph.files.graph_pb2 import (
+    InMOsByTMOid,
+)
+
+OBJECTS_COUNT = 7
+CHUNK_SIZE = 3
+
+
+@pytest.fixture(scope="function")
+def tmo(session):
+    tmo = TMO(name="TEST TMO", created_by="Admin", modified_by="Admin")
+    session.add(tmo)
+    session.flush()
+    tprm = TPRM(
+        name="TEST TPRM",
+        val_type="str",
+        tmo_id=tmo.id,
+        created_by="Admin",
+        modified_by="Admin",
+    )
+    session.add(tprm)
+    session.flush()
+    for index in range(OBJECTS_COUNT):
+        mo = MO(
+            name=f"TEST MO {index}",
+            tmo_id=tmo.id,
+            geometry={"path": [index]} if index == 0 else None,
+        )
+        session.add(mo)
+        session.flush()
+        if index % 2 == 0:
+            session.add(
+                PRM(tprm_id=tprm.id, mo_id=mo.id, value=f"value {index}")
+            )
+    session.commit()
+    return tmo
+
+
+@pytest.fixture(scope="function")
+def context(mocker):
+    return mocker.create_autospec(spec=grpc.aio.ServicerContext)
+
+
+async def get_all_pages(tmo_id, context, engine, **request_data):
+    informer = GraphInformer(engine=engine)
+    pages = []
+    request = InMOsByTMOid(tmo_id=tmo_id, chunk_size=CHUNK_SIZE, **request_data)
+    while True:
+        response = await informer.GetMOsByTMOidPages(request, context)
+        pages.append(response)
+        if not response.HasField("after_mo_id"):
+            return pages
+        request.after_mo_id = response.after_mo_id
+
+
+async def test_pages_are_read_after_cursor(tmo, context, engine):
+    pages = await get_all_pages(
+        tmo.id, context, engine, keep_mo_without_prm=True
+    )
+
+    mos = [mo for page in pages for mo in page.mo]
+    assert [mo.name for mo in mos] == [
+        f"TEST MO {index}" for index in range(OBJECTS_COUNT)
+    ]
+    assert len(pages) == 3
+    assert json.loads(mos[0].geometry) == {"path": [0]}
+    assert [prm.value for prm in mos[0].params] == ["value 0"]
+    assert mos[0].params[0].mo_id == mos[0].id
+
+
+async def test_cursor_skips_mos_without_parameters(tmo, context, engine):
+    pages = await get_all_pages(tmo.id, context, engine)
+
+    mos = [mo for page in pages for mo in page.mo]
+    assert [mo.name for mo in mos] == [
+        f"TEST MO {index}" for index in range(0, OBJECTS_COUNT, 2)
+    ]
@@ -0,0 +1,112 @@
+"""Tests GraphInformer.GetTMOTree point constraints and tree cache"""
+
+import grpc
+import pytest
+
+from models import MO, TMO, Event
+from services.graph_service.graph import GraphInformer
+from services.grpc_service.proto_files.graph.files.graph_pb2 import InTmoId
+
+
+@pytest.fixture(scope="function")
+def tmos(session):
+    root = TMO(name="ROOT", created_by="Admin", modified_by="Admin")
+    session.add(root)
+    session.flush()
+    point = TMO(
+        name="POINT", p_id=root.id, created_by="Admin", modified_by="Admin"
+    )
+    line = TMO(
+        name="LINE", p_id=root.id, created_by="Admin", modified_by="Admin"
+    )
+    session.add_all([point, line])
+    session.flush()
+    constrained = TMO(
+        name="CONSTRAINED",
+        p_id=line.id,
+        points_constraint_by_tmo=[point.id],
+        created_by="Admin",
+        modified_by="Admin",
+    )
+    session.add(constrained)
+    session.flush()
+
+    point_a = MO(name="A", tmo_id=point.id)
+    point_b = MO(name="B", tmo_id=root.id)
+    session.add_all([point_a, point_b])
+    session.flush()
+    session.add_all(
+        [
+            MO(
+                name="LINE 1",
+                tmo_id=line.id,
+                point_a_id=point_a.id,
+                point_b_id=point_b.id,
+            ),
+            MO(name="LINE 2", tmo_id=line.id, point_a_id=point_a.id),
+            MO(
+                name="INACTIVE",
+                tmo_id=point.id,
+                point_a_id=point_b.id,
+                active=False,
+            ),
+        ]
+    )
+    session.commit()
+    return {tmo.name: tmo for tmo in (root, point, line, constrained)}
+
+
+@pytest.fixture(scope="function")
+def context(mocker):
+    return mocker.create_autospec(spec=grpc.aio.ServicerContext)
+
+
+def get_nodes(nodes):
+    result = {}
+    for node in nodes:
+        result[node.name] = node
+        result.update(get_nodes(node.child))
+    return result
+
+
+async def test_tree_has_points_constraints(tmos, context, engine):
+    informer = GraphInformer(engine=engine)
+
+    response = await informer.GetTMOTree(InTmoId(), context)
+
+    assert [node.name for node in response.nodes] == ["ROOT"]
+    nodes = get_nodes(response.nodes)
+    assert sorted(nodes["LINE"].points_constraint_by_tmo) == sorted(
+        [tmos["POINT"].id, tmos["ROOT"].id]
+    )
+    assert list(nodes["POINT"].points_constraint_by_tmo) == []
+    assert list(nodes["CONSTRAINED"].points_constraint_by_tmo) == [
+        tmos["POINT"].id
+    ]
+
+
+async def test_tree_of_tmo_has_only_its_subtree(tmos, context, engine):
+    informer = GraphInformer(engine=engine)
+
+    response = await informer.GetTMOTree(
+        InTmoId(tmo_id=tmos["LINE"].id), context
+    )
+
+    assert [node.name for node in response.nodes] == ["LINE"]
+    assert [node.name for node in response.nodes[0].child] == ["CONSTRAINED"]
+
+
+async def test_tree_is_rebuilt_after_new_event(tmos, context, engine, session):
+    informer = GraphInformer(engine=engine)
+    await informer.GetTMOTree(InTmoId(), context)
+
+    tmo = session.get(TMO, tmos["POINT"].id)
+    tmo.name = "RENAMED POINT"
+    session.commit()
+    cached = await informer.GetTMOTree(InTmoId(), context)
+    session.add(Event(event_type="TMOUpdate", model_id=tmo.id))
+    session.commit()
+    rebuilt = await informer.GetTMOTree(InTmoId(), context)
+
+    assert "POINT" in get_nodes(cached.nodes)
+    assert "RENAMED POINT" in get_nodes(rebuilt.nodes)
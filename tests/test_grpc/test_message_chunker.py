@@ -0,0 +1,95 @@
+"""Tests streamed elements are packed into messages of limited size"""
+
+import pytest
+
+from services.grpc_service.message_chunker import MessageChunker
+from services.grpc_service.proto_files.inventory_data.files.inventory_data_pb2 import (
+    GetMODataByIdsRequest,
+    GetMODataByIdsResponse,
+    MOData,
+    ResponseMOdata,
+)
+
+STRING_ELEMENTS = ["a" * size for size in (1, 10, 100, 200, 1000)] + [
+    "объект" * 30
+]
+MESSAGE_ELEMENTS = [
+    MOData(id=index, name=f"mo_{index}" * index, tmo_id=1)
+    for index in range(1, 200)
+]
+
+
+@pytest.mark.parametrize(
+    "message_class, field_name, elements",
+    [
+        (ResponseMOdata, "objects_with_parameters", STRING_ELEMENTS),
+        (GetMODataByIdsResponse, "list_of_mo", MESSAGE_ELEMENTS),
+    ],
+)
+def test_element_size_is_size_in_message(message_class, field_name, elements):
+    chunker = MessageChunker(message_class=message_class, field_name=field_name)
+
+    message = message_class(**{field_name: elements})
+
+    assert message.ByteSize() == sum(
+        chunker.element_size(element) for element in elements
+    )
+
+
+@pytest.mark.parametrize("max_size", [50, 500, 5_000, 100_000])
+def test_messages_are_not_bigger_than_max_size(max_size):
+    chunker = MessageChunker(
+        message_class=GetMODataByIdsResponse,
+        field_name="list_of_mo",
+        max_size=max_size,
+    )
+
+    messages = list(chunker.iter_messages(MESSAGE_ELEMENTS))
+
+    assert [item for message in messages for item in message.list_of_mo] == (
+        MESSAGE_ELEMENTS
+    )
+    for message in messages:
+        assert message.ByteSize() <= max_size or len(message.list_of_mo) == 1
+    # next element did not fit into the message
+    for message, next_message in zip(messages, messages[1:]):
+        assert (
+            message.ByteSize()
+            + chunker.element_size(next_message.list_of_mo[0])
+            > max_size
+        )
+
+
+def test_element_bigger_than_max_size_is_sent_alone():
+    chunker = MessageChunker(
+        message_class=ResponseMOdata,
+        field_name="objects_with_parameters",
+        max_size=50,
+    )
+
+    messages = list(chunker.iter_messages(["a", "b" * 100, "c", "d"]))
+
+    assert [list(item.objects_with_parameters) for item in messages] == [
+        ["a"],
+        ["b" * 100],
+        ["c", "d"],
+    ]
+
+
+def test_empty_message_is_sent_on_demand():
+    chunker = MessageChunker(
+        message_class=ResponseMOdata, field_name="objects_with_parameters"
+    )
+
+    assert list(chunker.iter_messages([])) == []
+    assert list(chunker.iter_messages([], send_empty=True)) == [
+        ResponseMOdata()
+    ]
+    assert list(chunker.iter_messages(["a"], send_empty=True)) == [
+        ResponseMOdata(objects_with_parameters=["a"])
+    ]
+
+
+def test_scalar_field_is_not_supported():
+    with pytest.raises(ValueError):
+        MessageChunker(message_class=GetMODataByIdsRequest, field_name="mo_ids")
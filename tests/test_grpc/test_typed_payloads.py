@@ -0,0 +1,124 @@
+"""Tests objects and request data are converted to typed messages"""
+
+from datetime import datetime, timezone
+
+import pytest
+from google.protobuf import struct_pb2
+
+from services.grpc_service.proto_files.dataview.files import (
+    dataview_to_inventory_pb2,
+)
+from services.grpc_service.proto_files.inventory_data.files import (
+    inventory_data_pb2,
+)
+from services.grpc_service.typed_payloads import (
+    OrderValue,
+    from_proto_value,
+    jwt_from_message,
+    order_by_from_message,
+    query_params_from_message,
+    to_mo_message,
+    to_proto_value,
+)
+
+CREATION_DATE = datetime(2024, 5, 17, 10, 30, tzinfo=timezone.utc)
+MO_ITEM = {
+    "id": 10,
+    "name": "MO 10",
+    "label": None,
+    "tmo_id": 3,
+    "p_id": 7,
+    "active": True,
+    "latitude": 50.45,
+    "longitude": 30.52,
+    "version": 2,
+    "document_count": 0,
+    "pov": {"key": "value"},
+    "geometry": None,
+    "creation_date": CREATION_DATE,
+    "parent_name": "MO 7",
+    "not_a_field": "skipped",
+    "params": [
+        {"id": 1, "tprm_id": 5, "mo_id": 10, "value": "text", "version": 1},
+        {"tprm_id": "6", "value": [1, 2]},
+    ],
+}
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (None, None),
+        (True, True),
+        (15, 15),
+        (1.5, 1.5),
+        ("text", "text"),
+        (["a", "b"], ["a", "b"]),
+        ({"a": [1, None]}, {"a": [1, None]}),
+        (datetime(2024, 5, 17, 10, 30), "2024-05-17T10:30:00"),
+    ],
+)
+def test_value_is_kept(value, expected):
+    message = to_proto_value(value)
+    restored = struct_pb2.Value.FromString(message.SerializeToString())
+
+    assert from_proto_value(restored) == expected
+
+
+@pytest.mark.parametrize(
+    "message_class", [inventory_data_pb2.MO, dataview_to_inventory_pb2.MO]
+)
+def test_mo_message_has_attributes_and_params(message_class):
+    message = to_mo_message(MO_ITEM, message_class)
+
+    assert message.id == 10
+    assert message.name == "MO 10"
+    assert not message.HasField("label")
+    assert message.p_id == 7
+    assert message.latitude == pytest.approx(50.45)
+    assert dict(message.pov) == {"key": "value"}
+    assert not message.HasField("geometry")
+    assert message.creation_date.ToDatetime(timezone.utc) == CREATION_DATE
+    assert message.parent_name == "MO 7"
+    assert [
+        (prm.id, prm.tprm_id, prm.mo_id, from_proto_value(prm.value))
+        for prm in message.params
+    ] == [(1, 5, 10, "text"), (0, 6, 0, [1, 2])]
+
+
+def test_mo_message_of_special_row_has_params_by_int_keys():
+    row = {"id": 10, "p_id": None, 5: "text", 6: None}
+
+    message = to_mo_message(row, inventory_data_pb2.MO)
+
+    assert message.id == 10
+    assert not message.HasField("p_id")
+    assert [
+        (prm.tprm_id, from_proto_value(prm.value)) for prm in message.params
+    ] == [(5, "text")]
+
+
+def test_request_data_is_restored():
+    request = inventory_data_pb2.RequestForFilteredObjInfoByTMOV2(
+        query_params=[
+            inventory_data_pb2.QueryParam(key="tprm_id5|contains", value="a"),
+            inventory_data_pb2.QueryParam(key="tprm_id5|contains", value="b"),
+        ],
+        order_by=[
+            inventory_data_pb2.OrderByTPRM(
+                tprm_id=5, val_type="str", ascending=True
+            )
+        ],
+    )
+    request.decoded_jwt.update({"sub": "user", "realm_access": {"roles": []}})
+
+    query_params = query_params_from_message(request.query_params)
+
+    assert query_params.getlist("tprm_id5|contains") == ["a", "b"]
+    assert order_by_from_message(request.order_by) == {
+        5: OrderValue(type="str", ascending=True)
+    }
+    assert jwt_from_message(request.decoded_jwt) == {
+        "sub": "user",
+        "realm_access": {"roles": []},
+    }
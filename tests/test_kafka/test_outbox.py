@@ -0,0 +1,162 @@
+"""Tests kafka outbox is filled in transaction and sent by relay"""
+
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.event import listen
+from sqlmodel import Session
+
+from config import kafka_config
+from models import TMO, MO, KafkaOutbox, KafkaOutboxRelayMetrics
+from services.listener_service.processor import ListenerService
+from services.outbox_service.processor import OutboxRelay, get_outbox_lag
+
+
+class FakeProducer:
+    def __init__(
+        self, producer_name: str, not_delivered: int = 0, on_flush=None
+    ):
+        self._producer_name = producer_name
+        self._not_delivered = not_delivered
+        self._on_flush = on_flush
+        self.delivered_messages = 0
+        self.failed_messages = 0
+        self.messages = []
+
+    def send_message(self, data_to_send, partition_number: int = 0):
+        self.messages.append((partition_number, data_to_send))
+
+    def flush(self, timeout: float) -> int:
+        if self._on_flush is not None:
+            self._on_flush()
+        self.delivered_messages += len(self.messages) - self._not_delivered
+        return self._not_delivered
+
+
+@pytest.fixture(scope="function", autouse=True)
+def session_fixture(mocker, session, engine):
+    mocker.patch(
+        "services.event_service.processor.get_not_auth_session",
+        new=lambda: iter([Session(engine)]),
+    )
+    mocker.patch.object(kafka_config, "KAFKA_TURN_ON", new=True)
+    mocker.patch.object(kafka_config, "KAFKA_WITH_SCHEMA_REGISTRY", new=False)
+
+    listen(session, "after_flush", ListenerService.receive_after_flush)
+    listen(session, "after_commit", ListenerService.receive_after_commit)
+
+    tmo = TMO(name="tmo_1", created_by="Test", modified_by="Test")
+    session.add(tmo)
+    session.commit()
+    session.add(MO(tmo_id=tmo.id, name="mo_1"))
+    session.add(MO(tmo_id=tmo.id, name="mo_2"))
+    session.commit()
+    yield session
+
+
+def get_relay(engine, producer, producer_with_partitions) -> OutboxRelay:
+    return OutboxRelay(
+        session_factory=lambda: Session(engine),
+        producer=producer,
+        producer_with_partitions=producer_with_partitions,
+    )
+
+
+def test_changes_are_stored_in_outbox(session: Session):
+    rows = session.execute(select(KafkaOutbox).order_by(KafkaOutbox.id))
+    rows = rows.scalars().all()
+
+    assert [(row.class_name, row.event) for row in rows] == [
+        ("TMO", "created"),
+        ("MO", "created"),
+    ]
+    assert get_outbox_lag(session=session)["pending_rows"] == 2
+
+
+def test_rolled_back_changes_are_not_stored_in_outbox(session: Session):
+    session.add(MO(tmo_id=1, name="mo_3"))
+    session.flush()
+    session.rollback()
+
+    rows = session.execute(select(KafkaOutbox)).scalars().all()
+    assert len(rows) == 2
+
+
+def test_relay_sends_and_deletes_outbox_rows(session: Session, engine):
+    producer = FakeProducer(kafka_config.KAFKA_PRODUCER_TOPIC)
+    producer_with_partitions = FakeProducer(
+        kafka_config.KAFKA_PRODUCER_PART_TOPIC_NAME
+    )
+    relay = get_relay(engine, producer, producer_with_partitions)
+
+    assert relay.process_batch() == 2
+
+    keys = [message.key for _, message in producer.messages]
+    assert keys == ["TMO:created", "MO:created"]
+    assert producer_with_partitions.messages
+    assert relay.metrics.sent_rows == 2
+    assert session.execute(select(KafkaOutbox)).scalars().all() == []
+    relay_metrics = session.get(KafkaOutboxRelayMetrics, 1)
+    assert relay_metrics.batches == 1
+    assert relay_metrics.sent_rows == 2
+    assert get_outbox_lag(session=session)["relay"]["sent_rows"] == 2
+
+
+def test_relay_keeps_not_delivered_rows(session: Session, engine):
+    producer = FakeProducer(kafka_config.KAFKA_PRODUCER_TOPIC, not_delivered=1)
+    producer_with_partitions = FakeProducer(
+        kafka_config.KAFKA_PRODUCER_PART_TOPIC_NAME
+    )
+    relay = get_relay(engine, producer, producer_with_partitions)
+
+    assert relay.process_batch() == 0
+
+    assert relay.metrics.failed_batches == 1
+    assert len(session.execute(select(KafkaOutbox)).scalars().all()) == 2
+    assert session.get(KafkaOutboxRelayMetrics, 1).failed_batches == 1
+
+
+def test_relay_does_not_hold_transaction_while_flushing(
+    session: Session, engine
+):
+    transactions_on_flush = []
+
+    def count_transactions():
+        with engine.connect() as connection:
+            transactions_on_flush.append(
+                connection.execute(
+                    text(
+                        "SELECT count(*) FROM pg_stat_activity "
+                        "WHERE state LIKE 'idle in transaction%' "
+                        "AND pid <> pg_backend_pid()"
+                    )
+                ).scalar()
+            )
+
+    session.commit()
+    producer = FakeProducer(
+        kafka_config.KAFKA_PRODUCER_TOPIC, on_flush=count_transactions
+    )
+    producer_with_partitions = FakeProducer(
+        kafka_config.KAFKA_PRODUCER_PART_TOPIC_NAME
+    )
+    relay = get_relay(engine, producer, producer_with_partitions)
+
+    assert relay.process_batch() == 2
+    assert transactions_on_flush == [0]
+
+
+def test_relay_lock_is_taken_by_one_relay(engine):
+    producer = FakeProducer(kafka_config.KAFKA_PRODUCER_TOPIC)
+    first_relay = get_relay(engine, producer, producer)
+    second_relay = get_relay(engine, producer, producer)
+
+    lock_session = first_relay.acquire_lock()
+    assert lock_session is not None
+    try:
+        assert second_relay.acquire_lock() is None
+    finally:
+        first_relay.release_lock(lock_session=lock_session)
+
+    lock_session = second_relay.acquire_lock()
+    assert lock_session is not None
+    second_relay.release_lock(lock_session=lock_session)
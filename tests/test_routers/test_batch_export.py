@@ -1,9 +1,12 @@
 """Tests for batch router"""
 
+import io
 import re
 
+import pandas as pd
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import event
 from sqlmodel import Session, select
 
 from models import TMO, TPRM, MO, PRM
@@ -106,3 +109,222 @@ def test_get_request_with_xlsx_is_successful(
     filename = filename.findall(res.headers["content-disposition"])[0]
     file_ext = filename.split(".")[-1]
     assert file_ext == "xlsx"
+
+
+def get_csv_rows(response) -> list[list[str]]:
+    return [line.split(";") for line in response.text.splitlines()]
+
+
+@pytest.fixture(scope="function")
+def linked_objects(session: Session):
+    tmo = session.exec(select(TMO)).first()
+    mo_1, mo_2, mo_3 = session.exec(select(MO).order_by(MO.id)).all()
+    tprm_link = TPRM(
+        name="Test link TPRM",
+        val_type="mo_link",
+        tmo_id=tmo.id,
+        created_by="Test admin",
+        modified_by="Test admin",
+    )
+    tprm_multiple = TPRM(
+        name="Test multiple TPRM",
+        val_type="int",
+        multiple=True,
+        tmo_id=tmo.id,
+        created_by="Test admin",
+        modified_by="Test admin",
+    )
+    session.add(tprm_link)
+    session.add(tprm_multiple)
+    session.flush()
+    session.add(PRM(mo_id=mo_2.id, tprm_id=tprm_link.id, value=str(mo_1.id)))
+    session.add(PRM(mo_id=mo_1.id, tprm_id=tprm_multiple.id, value="[1, 2]"))
+    mo_2.p_id = mo_1.id
+    mo_3.point_a_id = mo_1.id
+    session.add(mo_2)
+    session.add(mo_3)
+    session.commit()
+    return tmo, mo_1
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 5000])
+def test_csv_contains_object_parameters_and_links(
+    mocker, session: Session, client: TestClient, linked_objects, chunk_size
+):
+    mocker.patch(
+        "routers.batch_router.processors.EXPORT_CHUNK_SIZE", new=chunk_size
+    )
+    tmo, mo_1 = linked_objects
+
+    res = client.get(
+        url=URL + str(tmo.id),
+        params={"file_type": "csv", "replace_ids_by_names": True},
+    )
+
+    assert res.status_code == 200
+    assert get_csv_rows(res) == [
+        [
+            "Test str TPRM",
+            "Test link TPRM",
+            "Test multiple TPRM",
+            "parent_name",
+            "point_a_name",
+            "point_b_name",
+        ],
+        ["mo 1 value", "", "[1, 2]", "", "", ""],
+        ["", "MO 1:Test TMO", "", "MO 1", "", ""],
+        ["mo 3 value", "", "", "", "MO 1:Test TMO", ""],
+    ]
+
+
+def test_csv_contains_linked_object_ids(
+    session: Session, client: TestClient, linked_objects
+):
+    tmo, mo_1 = linked_objects
+    tprm_link = session.exec(
+        select(TPRM).where(TPRM.name == "Test link TPRM")
+    ).first()
+
+    res = client.get(
+        url=URL + str(tmo.id),
+        params={"file_type": "csv", "prm_type_ids": [tprm_link.id]},
+    )
+
+    rows = get_csv_rows(res)
+    assert rows[0] == [
+        "Test link TPRM",
+        "parent_name",
+        "point_a_name",
+        "point_b_name",
+    ]
+    assert [row[0] for row in rows[1:]] == ["", str(mo_1.id), ""]
+
+
+def test_csv_contains_filtered_objects_with_full_attributes(
+    session: Session, client: TestClient
+):
+    tmo = session.exec(select(TMO)).first()
+    mo_3 = session.exec(select(MO).where(MO.name == "MO 3")).first()
+
+    res = client.get(
+        url=URL + str(tmo.id),
+        params={
+            "file_type": "csv",
+            "obj_ids": [mo_3.id],
+            "with_full_attributes": True,
+        },
+    )
+
+    header, *rows = get_csv_rows(res)
+    assert header[:4] == [
+        "Test str TPRM",
+        "parent_name",
+        "point_a_name",
+        "point_b_name",
+    ]
+    assert {"id", "name", "tmo_id", "active"} <= set(header)
+    assert "p_id" not in header
+    assert len(rows) == 1
+    row = dict(zip(header, rows[0]))
+    assert row["Test str TPRM"] == "mo 3 value"
+    assert row["name"] == "MO 3"
+    assert row["id"] == str(mo_3.id)
+
+
+def test_xlsx_contains_object_parameters(session: Session, client: TestClient):
+    tmo = session.exec(select(TMO)).first()
+
+    res = client.get(url=URL + str(tmo.id), params={"file_type": "xlsx"})
+
+    dataframe = pd.read_excel(io.BytesIO(res.content), dtype=str)
+    assert list(dataframe.columns) == [
+        "Test str TPRM",
+        "parent_name",
+        "point_a_name",
+        "point_b_name",
+    ]
+    assert dataframe["Test str TPRM"].fillna("").tolist() == [
+        "mo 1 value",
+        "",
+        "mo 3 value",
+    ]
+
+
+@pytest.mark.parametrize("file_type", ["csv", "xlsx"])
+def test_file_is_compressed_by_gzip(
+    session: Session, client: TestClient, file_type: str
+):
+    tmo = session.exec(select(TMO)).first()
+    tmo_url = URL + str(tmo.id)
+
+    not_compressed = client.get(url=tmo_url, params={"file_type": file_type})
+    compressed = client.get(
+        url=tmo_url, params={"file_type": file_type, "compression": "gzip"}
+    )
+
+    assert compressed.status_code == 200
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert "content-encoding" not in not_compressed.headers
+    if file_type == "csv":
+        assert compressed.content == not_compressed.content
+    else:
+        assert pd.read_excel(io.BytesIO(compressed.content)).equals(
+            pd.read_excel(io.BytesIO(not_compressed.content))
+        )
+
+
+def test_xlsx_is_sent_by_blocks_from_temporary_file(
+    mocker, session: Session, client: TestClient
+):
+    mocker.patch("routers.batch_router.processors.EXPORT_SPOOL_MAX_SIZE", new=1)
+    mocker.patch(
+        "routers.batch_router.processors.EXPORT_READ_BLOCK_SIZE", new=100
+    )
+    tmo = session.exec(select(TMO)).first()
+
+    res = client.get(url=URL + str(tmo.id), params={"file_type": "xlsx"})
+
+    dataframe = pd.read_excel(io.BytesIO(res.content), dtype=str)
+    assert dataframe["Test str TPRM"].fillna("").tolist() == [
+        "mo 1 value",
+        "",
+        "mo 3 value",
+    ]
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"file_type": "csv"},
+        {"file_type": "xlsx"},
+        {"file_type": "csv", "compression": "gzip"},
+    ],
+)
+def test_file_is_read_by_connection_returned_to_pool(
+    session: Session, client: TestClient, engine, params
+):
+    """Session of a request is closed before the file is streamed, so the
+    file is read by a connection of its own which is returned after it"""
+    tmo = session.exec(select(TMO)).first()
+    checkouts = []
+    checked_out = []
+
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        checkouts.append(connection_record)
+        checked_out.append(connection_record)
+
+    def on_checkin(dbapi_connection, connection_record):
+        if connection_record in checked_out:
+            checked_out.remove(connection_record)
+
+    event.listen(engine, "checkout", on_checkout)
+    event.listen(engine, "checkin", on_checkin)
+    try:
+        res = client.get(url=URL + str(tmo.id), params=params)
+    finally:
+        event.remove(engine, "checkout", on_checkout)
+        event.remove(engine, "checkin", on_checkin)
+
+    assert res.status_code == 200
+    assert checkouts
+    assert checked_out == []
@@ -2,15 +2,18 @@
 
 import csv
 import io
+import json
 import pickle
 from datetime import datetime
 from pprint import pprint
 
 import pytest
+import xlsxwriter
 from fastapi.testclient import TestClient
 from sqlmodel import Session, select
 
-from models import TMO, TPRM, MO, PRM
+from config import kafka_config
+from models import TMO, TPRM, MO, PRM, Event, KafkaOutbox
 
 URL = "/api/inventory/v1/batch/object_and_param_values/"
 
@@ -1885,14 +1888,14 @@ def test_mo_update_error_wrong_value_active(
     assert session.execute(
         select(PRM).where(
             PRM.tprm_id == 3,
-            PRM.value == pickle.dumps(["some_1", "some_2"]).hex(),
+            PRM.value == json.dumps(["some_1", "some_2"]),
             PRM.mo_id == updated_mo.id,
         )
     ).scalar()
     assert session.execute(
         select(PRM).where(
             PRM.tprm_id == 3,
-            PRM.value == PRM.value == pickle.dumps(["some_3", "some_4"]).hex(),
+            PRM.value == PRM.value == json.dumps(["some_3", "some_4"]),
             PRM.mo_id == created_mo.id,
         )
     ).scalar()
@@ -1901,9 +1904,9 @@ def test_mo_update_error_wrong_value_active(
         select(PRM).where(
             PRM.tprm_id == 4,
             PRM.value
-            == pickle.dumps(
+            == json.dumps(
                 ["2022-04-27T14:55:19.000000Z", "2022-04-27 14:55:19"]
-            ).hex(),
+            ),
             PRM.mo_id == updated_mo.id,
         )
     ).scalar()
@@ -1912,9 +1915,9 @@ def test_mo_update_error_wrong_value_active(
             PRM.tprm_id == 4,
             PRM.value
             == PRM.value
-            == pickle.dumps(
+            == json.dumps(
                 ["2002-02-04T14:55:19.000000Z", "2003-01-21 13:52:25"]
-            ).hex(),
+            ),
             PRM.mo_id == created_mo.id,
         )
     ).scalar()
@@ -3003,7 +3006,7 @@ def test_enum_tprm_multiple(session: Session, client: TestClient):
     created_enum_param = session.execute(
         select(PRM).where(
             PRM.id == 2,
-            PRM.value == pickle.dumps(["string_value", "123"]).hex(),
+            PRM.value == json.dumps(["string_value", "123"]),
         )
     ).first()
     assert created_str_param
@@ -4569,3 +4572,203 @@ def test_successful_post_with_check_true_with_data_for_new_mo_with_force(
         "will_be_updated_parameter_values": 0,
         "will_be_deleted_parameter_values": 0,
     }
+
+
+@pytest.fixture(scope="function")
+def streaming_tmo(mocker, session: Session):
+    mocker.patch("routers.batch_router.processors.IMPORT_CHUNK_SIZE", new=2)
+    tmo = TMO(**TMO_DEFAULT_DATA)
+    tmo.name = "Streaming TMO"
+    session.add(tmo)
+    session.flush()
+    tprm_name = TPRM(**TPRM_STR_DEFAULT_DATA)
+    tprm_name.name = "Streaming name TPRM"
+    tprm_name.val_type = "str"
+    tprm_name.required = True
+    tprm_name.tmo_id = tmo.id
+    tprm_value = TPRM(**TPRM_STR_DEFAULT_DATA)
+    tprm_value.name = "Streaming value TPRM"
+    tprm_value.tmo_id = tmo.id
+    session.add(tprm_name)
+    session.add(tprm_value)
+    session.flush()
+    tmo.primary = [tprm_name.id]
+    session.add(tmo)
+    session.commit()
+    return tmo
+
+
+STREAMING_FILE_DATA = [
+    ["Streaming name TPRM", "Streaming value TPRM"],
+    ["mo_1", "1"],
+    ["mo_2", "2"],
+    ["mo_3", ""],
+    ["mo_4", "4"],
+    ["mo_5", "5"],
+]
+
+
+def generate_xlsx_in_memory(default_data: list[list]):
+    file = io.BytesIO()
+    workbook = xlsxwriter.Workbook(file)
+    worksheet = workbook.add_worksheet()
+    for row_number, row in enumerate(default_data):
+        worksheet.write_row(row_number, 0, row)
+    workbook.close()
+    file.seek(0)
+    return file
+
+
+@pytest.mark.parametrize(
+    "file, content_type",
+    [
+        (lambda: generate_csv_in_memory(STREAMING_FILE_DATA), "text/csv"),
+        (
+            lambda: generate_xlsx_in_memory(STREAMING_FILE_DATA),
+            "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        ),
+    ],
+)
+def test_streaming_import_creates_objects_by_chunks(
+    session: Session, client: TestClient, streaming_tmo, file, content_type
+):
+    res = client.post(
+        URL + str(streaming_tmo.id),
+        data={"streaming": True},
+        files={"file": ("data", file(), content_type)},
+    )
+
+    assert res.status_code == 201, res.json()
+    assert res.json()["detail"] == "File is valid. 5 rows are processed"
+    objects = session.exec(
+        select(MO).where(MO.tmo_id == streaming_tmo.id).order_by(MO.id)
+    ).all()
+    assert [mo.name for mo in objects] == [
+        "mo_1",
+        "mo_2",
+        "mo_3",
+        "mo_4",
+        "mo_5",
+    ]
+    values = session.exec(
+        select(MO.name, PRM.value)
+        .join(PRM, PRM.mo_id == MO.id)
+        .join(TPRM, TPRM.id == PRM.tprm_id)
+        .where(TPRM.name == "Streaming value TPRM")
+        .order_by(MO.name)
+    ).all()
+    assert values == [
+        ("mo_1", "1"),
+        ("mo_2", "2"),
+        ("mo_4", "4"),
+        ("mo_5", "5"),
+    ]
+
+
+def test_streaming_import_statistic_is_summed_by_chunks(
+    session: Session, client: TestClient, streaming_tmo
+):
+    file_data = STREAMING_FILE_DATA
+
+    streaming_res = client.post(
+        URL + str(streaming_tmo.id),
+        data={"streaming": True, "check": True},
+        files={"file": generate_csv_in_memory(file_data)},
+    )
+    res = client.post(
+        URL + str(streaming_tmo.id),
+        data={"check": True},
+        files={"file": generate_csv_in_memory(file_data)},
+    )
+
+    assert streaming_res.json() == res.json()
+    assert streaming_res.json()["will_be_created_mo"] == 5
+    assert streaming_res.json()["will_be_created_parameter_values"] == 9
+    assert (
+        session.exec(select(MO).where(MO.tmo_id == streaming_tmo.id)).all()
+        == []
+    )
+
+
+def test_streaming_import_finds_duplicated_names_in_other_chunk(
+    session: Session, client: TestClient, streaming_tmo
+):
+    file_data = STREAMING_FILE_DATA + [["mo_1", "6"]]
+
+    res = client.post(
+        URL + str(streaming_tmo.id),
+        data={"streaming": True},
+        files={"file": generate_csv_in_memory(file_data)},
+    )
+
+    assert res.status_code == 422
+    assert res.json() == {
+        "detail": "Error in file rows from 4 to 5: "
+        "There are duplicated object name in file: mo_1"
+    }
+    # chunks before not valid one are committed
+    objects = session.exec(
+        select(MO.name).where(MO.tmo_id == streaming_tmo.id).order_by(MO.id)
+    ).all()
+    assert objects == ["mo_1", "mo_2", "mo_3", "mo_4"]
+
+
+def test_streaming_import_with_force_skips_duplicated_names(
+    session: Session, client: TestClient, streaming_tmo
+):
+    file_data = STREAMING_FILE_DATA + [["mo_1", "6"]]
+
+    res = client.post(
+        URL + str(streaming_tmo.id),
+        data={"streaming": True, "force": True},
+        files={"file": generate_csv_in_memory(file_data)},
+    )
+
+    assert res.status_code == 201
+    mo_1 = session.exec(
+        select(MO).where(MO.tmo_id == streaming_tmo.id, MO.name == "mo_1")
+    ).one()
+    assert sorted(prm.value for prm in mo_1.prms) == ["1", "mo_1"]
+
+
+def test_created_objects_are_notified(
+    mocker, session: Session, client: TestClient
+):
+    mocker.patch.object(kafka_config, "KAFKA_TURN_ON", new=True)
+    tmo = session.exec(select(TMO)).first()
+    tprm = session.exec(select(TPRM)).first()
+    file_data = [
+        ["pov", "geometry", tprm.name],
+        ['{"test": 1}', '{"test": 2}', "1"],
+        ['{"test": 3}', "", "2"],
+    ]
+
+    res = client.post(
+        URL + str(tmo.id),
+        files={"file": generate_csv_in_memory(file_data)},
+    )
+
+    assert res.status_code == 201, res.json()
+    objects = session.exec(
+        select(MO).where(MO.tmo_id == tmo.id).order_by(MO.id)
+    ).all()
+    # names of not primary objects are ids without following update
+    assert [mo.name for mo in objects] == [str(mo.id) for mo in objects]
+    assert [mo.pov for mo in objects] == [{"test": 1}, {"test": 3}]
+    assert [mo.geometry for mo in objects] == [{"test": 2}, None]
+    assert [mo.version for mo in objects] == [1, 1]
+    assert [[prm.value for prm in mo.prms] for mo in objects] == [["1"], ["2"]]
+
+    events = session.exec(
+        select(Event).where(Event.event_type.like("MO%")).order_by(Event.id)
+    ).all()
+    assert [item.event_type for item in events] == ["MOCreate", "MOCreate"]
+    assert [item.event["MO"]["name"] for item in events] == [
+        mo.name for mo in objects
+    ]
+    outbox = session.exec(
+        select(KafkaOutbox).where(KafkaOutbox.class_name == "MO")
+    ).all()
+    assert [(row.class_name, row.event) for row in outbox] == [
+        ("MO", "created")
+    ]
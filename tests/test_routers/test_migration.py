@@ -0,0 +1,117 @@
+import json
+import pickle
+
+import pytest
+from sqlalchemy import select, update
+from sqlmodel import Session
+
+from models import TMO, TPRM, MO, PRM, PRM_MULTIPLE_VALUE_COLUMN
+from routers.migration_router import processors
+from routers.migration_router.processors import ConvertMultipleParameterValues
+
+
+@pytest.fixture(scope="function", autouse=True)
+def session_fixture(mocker, session, engine):
+    mocker.patch(
+        "services.event_service.processor.get_not_auth_session",
+        new=lambda: iter([Session(engine)]),
+    )
+    yield session
+
+
+def fill_multiple_values(session: Session):
+    session.add(
+        TMO(name="tmo", created_by="Test creator", modified_by="Test modifier")
+    )
+    session.add(
+        TPRM(
+            name="multiple",
+            tmo_id=1,
+            val_type="str",
+            multiple=True,
+            required=True,
+            field_value=pickle.dumps(["default"]).hex(),
+            created_by="Test creator",
+            modified_by="Test modifier",
+        )
+    )
+    session.add(
+        TPRM(
+            name="single",
+            tmo_id=1,
+            val_type="str",
+            created_by="Test creator",
+            modified_by="Test modifier",
+        )
+    )
+    for _ in range(3):
+        session.add(MO(tmo_id=1))
+    session.flush()
+    session.add(PRM(tprm_id=1, mo_id=1, value=pickle.dumps(["a", "b"]).hex()))
+    session.add(PRM(tprm_id=1, mo_id=2, value=json.dumps(["c"])))
+    session.add(PRM(tprm_id=1, mo_id=3, value=pickle.dumps(["d"]).hex()))
+    session.add(PRM(tprm_id=2, mo_id=1, value="80"))
+    session.commit()
+
+
+def test_convert_multiple_parameter_values(session: Session, engine):
+    fill_multiple_values(session=session)
+
+    with Session(engine) as task_session:
+        result = ConvertMultipleParameterValues(
+            session=task_session, batch_size=1
+        ).execute()
+    assert result.converted_parameters == 2
+    assert result.converted_parameter_types == 1
+
+    session.expire_all()
+    params = session.execute(
+        select(PRM.value, PRM.version, PRM_MULTIPLE_VALUE_COLUMN).order_by(
+            PRM.id
+        )
+    ).all()
+    assert [tuple(param) for param in params] == [
+        ('["a", "b"]', 1, ["a", "b"]),
+        ('["c"]', 1, ["c"]),
+        ('["d"]', 1, ["d"]),
+        ("80", 1, None),
+    ]
+    assert session.get(TPRM, 1).field_value == '["default"]'
+
+    with Session(engine) as task_session:
+        result = ConvertMultipleParameterValues(session=task_session).execute()
+    assert result.converted_parameters == 0
+    assert result.converted_parameter_types == 0
+
+
+def test_convert_multiple_parameter_values_keeps_concurrent_writes(
+    mocker, session: Session, engine
+):
+    fill_multiple_values(session=session)
+    encode_multiple_value = processors.encode_multiple_value
+
+    concurrent_writes = [
+        update(TPRM).where(TPRM.id == 1).values(field_value='["new"]'),
+        update(PRM).where(PRM.id == 1).values(value='["new"]'),
+    ]
+
+    def encode_with_concurrent_write(value):
+        # user changes the value after it was read by conversion
+        if concurrent_writes:
+            with Session(engine) as user_session:
+                user_session.execute(concurrent_writes.pop(0))
+                user_session.commit()
+        return encode_multiple_value(value)
+
+    mocker.patch.object(
+        processors,
+        "encode_multiple_value",
+        side_effect=encode_with_concurrent_write,
+    )
+    with Session(engine) as task_session:
+        ConvertMultipleParameterValues(session=task_session).execute()
+
+    session.expire_all()
+    assert session.get(PRM, 1).value == '["new"]'
+    assert session.get(PRM, 3).value == '["d"]'
+    assert session.get(TPRM, 1).field_value == '["new"]'
@@ -1,6 +1,7 @@
 """Tests for object (MO) router"""
 
 import datetime
+import json
 import pickle
 from pprint import pprint
 
@@ -1770,6 +1771,50 @@ def test_massive_objects_delete_6(session: Session, client: TestClient):
     )
 
 
+def test_massive_objects_delete_with_sequence(
+    session: Session, client: TestClient
+):
+    tprm_type = TPRM(
+        **{**TPRM_DEFAULT_DATA_1, "name": "type", "val_type": "str"}
+    )
+    session.add(tprm_type)
+    session.flush()
+    tprm_sequence = TPRM(
+        **{
+            **TPRM_DEFAULT_DATA_1,
+            "name": "sequence",
+            "val_type": "sequence",
+            "constraint": str(tprm_type.id),
+        }
+    )
+    session.add(tprm_sequence)
+    session.flush()
+    positions = {"a": 0, "b": 0}
+    for mo_id, sequence_type in enumerate("abaaba", start=1):
+        if mo_id > 1:
+            session.add(MO(tmo_id=1))
+            session.flush()
+        positions[sequence_type] += 1
+        session.add_all(
+            [
+                PRM(tprm_id=tprm_type.id, mo_id=mo_id, value=sequence_type),
+                PRM(
+                    tprm_id=tprm_sequence.id,
+                    mo_id=mo_id,
+                    value=str(positions[sequence_type]),
+                ),
+            ]
+        )
+    session.commit()
+
+    data = {"mo_ids": [1, 4, 5], "erase": True}
+    res = client.post("/api/inventory/v1/massive_objects_delete/", json=data)
+
+    assert res.status_code == 200
+    stmt = select(PRM.mo_id, PRM.value).where(PRM.tprm_id == tprm_sequence.id)
+    assert dict(session.execute(stmt).all()) == {2: "1", 3: "1", 6: "2"}
+
+
 def test_massive_objects_update(session: Session, client: TestClient):
     assert session.execute(select(MO.pov).where(MO.id == 1)).scalar() is None
 
@@ -2382,3 +2427,335 @@ def test_change_child_mo_point_a_id(session: Session, client: TestClient):
     # We got updated child mo
     target_child_mo_from_db: MO = session.exec(stmt_child).first()
     assert target_child_mo_from_db.geometry == a2_b_geometry
+
+
+def test_read_objects_returns_result_length(
+    session: Session, client: TestClient
+):
+    session.add(MO(tmo_id=1, name="mo_2"))
+    session.add(MO(tmo_id=1, name="mo_3"))
+    session.commit()
+
+    res = client.get(
+        "/api/inventory/v1/objects/",
+        params={"object_type_id": 1, "limit": 2, "offset": 1},
+    )
+    assert res.status_code == 200
+    assert res.headers["Result-Length"] == "3"
+    assert [mo["id"] for mo in res.json()] == [2, 3]
+
+
+def test_read_objects_with_filter_and_order(
+    session: Session, client: TestClient
+):
+    session.add(MO(tmo_id=1, name="mo_2"))
+    session.add(MO(tmo_id=1, name="mo_3"))
+    session.flush()
+    for mo_id, value in [(1, "30"), (2, "10"), (3, "20")]:
+        session.add(PRM(tprm_id=1, mo_id=mo_id, value=value))
+    session.commit()
+
+    res = client.get(
+        "/api/inventory/v1/objects/",
+        params={
+            "object_type_id": 1,
+            "with_parameters": True,
+            "tprm_id1|more": "15",
+            "order_by_tprms_id": [1],
+            "order_by_asc": [True],
+        },
+    )
+    assert res.status_code == 200
+    assert res.headers["Result-Length"] == "2"
+    assert [mo["id"] for mo in res.json()] == [3, 1]
+    assert res.json()[0]["params"][0]["value"] == 20
+
+
+def test_read_objects_with_not_exists_object_type(client: TestClient):
+    res = client.get(
+        "/api/inventory/v1/objects/", params={"object_type_id": 100500}
+    )
+    assert res.status_code == 404
+
+
+@pytest.fixture(scope="function")
+def objects_with_int_values(session: Session):
+    """Objects 2..6 with values of tprm 1, object 1 without value"""
+    values = {2: "30", 3: "10", 4: "20", 5: "10", 6: "40"}
+    for _ in values:
+        session.add(MO(tmo_id=1))
+    session.flush()
+    for mo_id, value in values.items():
+        session.add(PRM(tprm_id=1, mo_id=mo_id, value=value))
+    session.commit()
+
+
+@pytest.mark.parametrize(
+    "ascending, expected_order",
+    [(True, [3, 5, 4, 2, 6, 1]), (False, [1, 6, 2, 4, 3, 5])],
+)
+def test_read_objects_ordered_pages_by_offset_and_after_id(
+    objects_with_int_values, client: TestClient, ascending, expected_order
+):
+    params = {
+        "object_type_id": 1,
+        "order_by_tprms_id": [1],
+        "order_by_asc": [ascending],
+        "limit": 2,
+    }
+    by_offset = []
+    by_cursor = []
+    after_id = None
+    for offset in range(0, 6, 2):
+        res = client.get(
+            "/api/inventory/v1/objects/", params={**params, "offset": offset}
+        )
+        assert res.status_code == 200
+        assert res.headers["Result-Length"] == "6"
+        by_offset.extend(mo["id"] for mo in res.json())
+
+        cursor_params = dict(params)
+        if after_id is not None:
+            cursor_params["after_id"] = after_id
+        res = client.get("/api/inventory/v1/objects/", params=cursor_params)
+        assert res.status_code == 200
+        assert res.headers["Result-Length"] == "6"
+        by_cursor.extend(mo["id"] for mo in res.json())
+        after_id = by_cursor[-1]
+
+    assert by_offset == expected_order
+    assert by_cursor == expected_order
+
+
+def test_read_objects_filtered_page_out_of_range(
+    objects_with_int_values, client: TestClient
+):
+    res = client.get(
+        "/api/inventory/v1/objects/",
+        params={"object_type_id": 1, "tprm_id1|more": "15", "offset": 10},
+    )
+    assert res.status_code == 200
+    assert res.json() == []
+    assert res.headers["Result-Length"] == "3"
+
+
+def test_read_objects_without_filter_after_id(
+    objects_with_int_values, client: TestClient
+):
+    res = client.get(
+        "/api/inventory/v1/objects/",
+        params={"object_type_id": 1, "after_id": 4, "limit": 10},
+    )
+    assert res.status_code == 200
+    assert [mo["id"] for mo in res.json()] == [5, 6]
+    assert res.headers["Result-Length"] == "6"
+
+
+@pytest.mark.parametrize(
+    "val_type, values, query_params, expected_ids",
+    [
+        ("bool", ["True", "False", "True"], {"|is_true": ""}, [2, 4]),
+        ("bool", ["True", "False", "True"], {"|equals": "false"}, [3]),
+        (
+            "date",
+            ["2024-01-31", "2024-02-01", "2023-12-31"],
+            {"|more_or_eq": "2024-01-31"},
+            [2, 3],
+        ),
+        (
+            "date",
+            ["2024-1-5", "2024-01-04", "2024-2-1"],
+            {"|more": "2024-01-04"},
+            [2, 4],
+        ),
+        (
+            "datetime",
+            ["2024-1-5 9:05:00", "2024-01-05 08:00:00"],
+            {"|more": "2024-01-05T08:30"},
+            [2],
+        ),
+        (
+            "datetime",
+            [
+                "2024-01-31T10:00:00.000000Z",
+                "2024-01-31T09:59:00.000000Z",
+                "2024-02-01T00:00:00.000000Z",
+            ],
+            {"|less": "2024-01-31T10:00"},
+            [3],
+        ),
+        ("float", ["1.5", "-2", "1e3"], {"|more": "1"}, [2, 4]),
+    ],
+)
+def test_read_objects_filter_by_typed_values(
+    session: Session,
+    client: TestClient,
+    val_type,
+    values,
+    query_params,
+    expected_ids,
+):
+    tprm = TPRM(
+        name=f"tprm_{val_type}",
+        tmo_id=1,
+        val_type=val_type,
+        created_by="Test creator",
+        modified_by="Test modifier",
+    )
+    session.add(tprm)
+    for _ in values:
+        session.add(MO(tmo_id=1))
+    session.flush()
+    for mo_id, value in enumerate(values, start=2):
+        session.add(PRM(tprm_id=tprm.id, mo_id=mo_id, value=value))
+    session.commit()
+
+    params = {
+        f"tprm_id{tprm.id}{flag}": value for flag, value in query_params.items()
+    }
+    res = client.get(
+        "/api/inventory/v1/objects/", params={"object_type_id": 1, **params}
+    )
+    assert res.status_code == 200
+    assert [mo["id"] for mo in res.json()] == expected_ids
+
+
+@pytest.mark.parametrize(
+    "val_type, query_params, expected_ids",
+    [
+        ("mo_link", {"|contains": "2"}, [2, 3]),
+        ("mo_link", {"|contains": "1;2"}, [2]),
+        ("mo_link", {"|contains_any_of": "1;4"}, [2, 4]),
+        ("mo_link", {"|equals": "4"}, [1, 2, 3, 4]),
+        ("str", {"|contains": "2"}, []),
+    ],
+)
+def test_read_objects_filter_by_multiple_values(
+    session: Session,
+    client: TestClient,
+    val_type,
+    query_params,
+    expected_ids,
+):
+    tprm = TPRM(
+        name=f"tprm_{val_type}",
+        tmo_id=1,
+        val_type=val_type,
+        multiple=True,
+        created_by="Test creator",
+        modified_by="Test modifier",
+    )
+    session.add(tprm)
+    values = [[1, 2], [2, 3], [4]]
+    for _ in values:
+        session.add(MO(tmo_id=1))
+    session.flush()
+    for mo_id, value in enumerate(values, start=2):
+        session.add(PRM(tprm_id=tprm.id, mo_id=mo_id, value=json.dumps(value)))
+    session.commit()
+
+    params = {
+        f"tprm_id{tprm.id}{flag}": value for flag, value in query_params.items()
+    }
+    res = client.get(
+        "/api/inventory/v1/objects/", params={"object_type_id": 1, **params}
+    )
+    assert res.status_code == 200
+    assert [mo["id"] for mo in res.json()] == expected_ids
+
+
+def test_erase_object_removes_it_from_multiple_links(
+    session: Session, client: TestClient
+):
+    tprm = TPRM(
+        name="tprm_mo_link",
+        tmo_id=1,
+        val_type="mo_link",
+        multiple=True,
+        created_by="Test creator",
+        modified_by="Test modifier",
+    )
+    session.add(tprm)
+    for _ in range(3):
+        session.add(MO(tmo_id=1))
+    session.flush()
+    session.add(PRM(tprm_id=tprm.id, mo_id=2, value=json.dumps([1, 3])))
+    session.add(PRM(tprm_id=tprm.id, mo_id=3, value=pickle.dumps([1]).hex()))
+    session.add(PRM(tprm_id=tprm.id, mo_id=4, value=json.dumps([2, 3])))
+    session.commit()
+
+    res = client.delete(f"{URL}1", params={"erase": True})
+    assert res.status_code == 200
+
+    session.expire_all()
+    params = session.execute(select(PRM).order_by(PRM.id)).scalars().all()
+    assert [(prm.mo_id, prm.value) for prm in params] == [
+        (2, "[3]"),
+        (4, "[2, 3]"),
+    ]
+
+
+def test_erase_object_without_legacy_multiple_values(
+    mocker, session: Session, client: TestClient
+):
+    mocker.patch(
+        "functions.functions_utils.utils.app_config.MULTIPLE_VALUES_LEGACY_ROWS",
+        new=False,
+    )
+    tprm = TPRM(
+        name="tprm_mo_link",
+        tmo_id=1,
+        val_type="mo_link",
+        multiple=True,
+        created_by="Test creator",
+        modified_by="Test modifier",
+    )
+    session.add(tprm)
+    for _ in range(2):
+        session.add(MO(tmo_id=1))
+    session.flush()
+    session.add(PRM(tprm_id=tprm.id, mo_id=2, value=json.dumps([1, 3])))
+    session.add(PRM(tprm_id=tprm.id, mo_id=3, value=json.dumps([2])))
+    session.commit()
+
+    res = client.delete(f"{URL}1", params={"erase": True})
+    assert res.status_code == 200
+
+    session.expire_all()
+    params = session.execute(select(PRM).order_by(PRM.id)).scalars().all()
+    assert [(prm.mo_id, prm.value) for prm in params] == [
+        (2, "[3]"),
+        (3, "[2]"),
+    ]
+
+
+@pytest.mark.parametrize(
+    "flag, expected_ids",
+    [("|is_empty", [1]), ("|is_not_empty", [2, 3])],
+)
+def test_read_objects_filter_multiple_values_by_emptiness(
+    session: Session, client: TestClient, flag, expected_ids
+):
+    tprm = TPRM(
+        name="tprm_multiple",
+        tmo_id=1,
+        val_type="str",
+        multiple=True,
+        created_by="Test creator",
+        modified_by="Test modifier",
+    )
+    session.add(tprm)
+    for _ in range(2):
+        session.add(MO(tmo_id=1))
+    session.flush()
+    session.add(PRM(tprm_id=tprm.id, mo_id=2, value=json.dumps(["a"])))
+    # not converted pickled value has no value_multiple
+    session.add(PRM(tprm_id=tprm.id, mo_id=3, value=pickle.dumps(["b"]).hex()))
+    session.commit()
+
+    res = client.get(
+        "/api/inventory/v1/objects/",
+        params={"object_type_id": 1, f"tprm_id{tprm.id}{flag}": ""},
+    )
+    assert res.status_code == 200
+    assert [mo["id"] for mo in res.json()] == expected_ids
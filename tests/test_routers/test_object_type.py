@@ -1,5 +1,6 @@
 """Tests for object type router"""
 
+import json
 import pickle
 
 import pytest
@@ -262,7 +263,7 @@ def test_delete_object_type_linked_mos_multiple(
     assert not tmo
 
     linked_param = session.execute(select(PRM).where(PRM.id == 1)).scalar()
-    assert pickle.loads(bytes.fromhex(linked_param.value)) == [3]
+    assert json.loads(linked_param.value) == [3]
 
 
 def test_delete_object_type_linked_mos_multiple_with_prm(
@@ -2254,7 +2254,7 @@ def test_multiple_parameter_update_multiple_values(
                 "tprm_id": 3,
                 "id": 1,
                 "mo_id": 2,
-                "value": "8004950c000000000000005d94284b6f4bde4d4d01652e",
+                "value": "[111, 222, 333]",
                 "version": 2,
             },
             {
@@ -2774,7 +2774,7 @@ def test_multiple_parameter_create_multiple_params(
     assert res.json() == {
         "created_params": [
             {
-                "value": "8004950c000000000000005d94284b6f4bde4d4d01652e",
+                "value": "[111, 222, 333]",
                 "id": 1,
                 "version": 1,
                 "tprm_id": 3,
@@ -2823,3 +2823,66 @@ def test_multiple_parameter_create_incorrect_value_type(
     assert res.json() == {
         "detail": "Parameter True for parameter type with id 3 does not valid"
     }
+
+
+def test_read_parameters_by_list_of_param_types(
+    session: Session, client: TestClient
+):
+    session.add(PRM(tprm_id=1, mo_id=1, value="42"))
+    session.add(PRM(tprm_id=2, mo_id=1, value="true"))
+    session.commit()
+
+    res = client.post(
+        f"{URL}1/list_of_param_types/1/parameter/", json=[1, 2, 3]
+    )
+    assert res.status_code == 200
+    assert sorted((prm["tprm_id"], prm["value"]) for prm in res.json()) == [
+        (1, 42),
+        (2, True),
+    ]
+
+
+def test_read_parameters_by_list_of_param_types_not_exists_object(
+    client: TestClient,
+):
+    res = client.post(f"{URL}100500/list_of_param_types/1/parameter/", json=[1])
+    assert res.status_code == 404
+
+
+def test_get_parameter_data_for_multiple_parameters(
+    session: Session, client: TestClient
+):
+    session.add(
+        TPRM(
+            name="tprm_multiple_str",
+            tmo_id=1,
+            val_type="str",
+            multiple=True,
+            created_by="Test creator",
+            modified_by="Test modifier",
+        )
+    )
+    session.add(
+        TPRM(
+            name="tprm_multiple_mo_link",
+            tmo_id=1,
+            val_type="mo_link",
+            multiple=True,
+            created_by="Test creator",
+            modified_by="Test modifier",
+        )
+    )
+    session.add(PRM(tprm_id=3, mo_id=1, value='["a", "b"]'))
+    session.add(PRM(tprm_id=4, mo_id=1, value="[1]"))
+    # value stored before conversion of multiple values into JSON
+    session.add(MO(tmo_id=1, name="2"))
+    session.add(PRM(tprm_id=3, mo_id=2, value=pickle.dumps(["c"]).hex()))
+    session.commit()
+
+    res = client.post("/api/inventory/v1/get_parameter_data", json=[1, 2, 3])
+    assert res.status_code == 200
+    assert sorted(res.json(), key=lambda item: item["prm_id"]) == [
+        {"mo_id": 1, "prm_id": 1, "mo_name": "1", "value": "['a', 'b']"},
+        {"mo_id": 1, "prm_id": 2, "mo_name": "1", "value": "['1']"},
+        {"mo_id": 2, "prm_id": 3, "mo_name": "2", "value": "['c']"},
+    ]
@@ -1,7 +1,7 @@
 """Tests for object type router"""
 
 import datetime
-import pickle
+import json
 from pprint import pprint
 
 import pytest
@@ -10,6 +10,7 @@ from sqlalchemy import select, func, and_
 from sqlmodel import Session
 
 from models import TMO, TPRM, MO, Event, PRM
+from services.listener_service.processor import ListenerService
 
 URL = "/api/inventory/v1/param_type/"
 
@@ -540,8 +541,8 @@ def test_create_param_type_enum_with_creating_default_values_for_multiple(
     prm_2: PRM = session.execute(
         select(PRM).where(PRM.tprm_id == tprm.id, PRM.mo_id == 2)
     ).scalar()
-    assert pickle.loads(bytes.fromhex(prm_1.value)) == ["1", "2"]
-    assert pickle.loads(bytes.fromhex(prm_2.value)) == ["1", "2"]
+    assert json.loads(prm_1.value) == ["1", "2"]
+    assert json.loads(prm_2.value) == ["1", "2"]
 
 
 def test_update_param_type_enum(session: Session, client: TestClient):
@@ -9009,6 +9010,54 @@ def test_sequence_with_insert(session: Session, client: TestClient):
     assert prm_for_mo_3.value == "4"
 
 
+def test_sequence_update_shifts_positions_with_events(
+    session: Session, client: TestClient, mocker
+):
+    """Move the last of 3 MO's of a sequence to the first position. Other
+    positions are shifted by one statement and their events are sent"""
+    tmo_id = 1
+    res = client.post(
+        URL,
+        json={
+            "name": "tprm_seq",
+            "val_type": "sequence",
+            "returnable": True,
+            "tmo_id": tmo_id,
+        },
+    )
+    assert res.status_code == 200
+    tprm: TPRM = TPRM(**res.json())
+    mo_ids = []
+    for _ in range(3):
+        res = client.post(
+            "/api/inventory/v1/object_with_parameters/",
+            json={"tmo_id": tmo_id, "params": []},
+        )
+        assert res.status_code == 200
+        mo_ids.append(res.json()["id"])
+    receive_bulk_updated = mocker.spy(ListenerService, "receive_bulk_updated")
+
+    res = client.patch(
+        f"/api/inventory/v1/object/{mo_ids[2]}/param_types/{tprm.id}"
+        f"/parameter/",
+        json={"value": 1, "version": 1},
+    )
+
+    assert res.status_code == 200
+    stmt = select(PRM.mo_id, PRM.value).where(PRM.tprm_id == tprm.id)
+    assert dict(session.execute(stmt).all()) == {
+        mo_ids[0]: "2",
+        mo_ids[1]: "3",
+        mo_ids[2]: "1",
+    }
+    receive_bulk_updated.assert_called_once()
+    shifted = receive_bulk_updated.call_args.kwargs["instances"]
+    assert sorted((prm.mo_id, prm.value) for prm in shifted) == [
+        (mo_ids[0], "2"),
+        (mo_ids[1], "3"),
+    ]
+
+
 def test_sequence_insert_with_constraint(session: Session, client: TestClient):
     """Create two sequence TPRM and insert mo inside sequence"""
     # Arrange
@@ -0,0 +1,131 @@
+"""Tests filters of the security listener and rules of new objects"""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session, select
+
+from models import MO, TMO
+from services.security_service.data import listener
+from services.security_service.data.permission_cache import (
+    clear_available_ids,
+)
+from services.security_service.data.permissions.inventory import (
+    MOPermission,
+    TMOPermission,
+)
+from services.security_service.security_data_models import (
+    ClientRoles,
+    UserData,
+)
+from services.session_registry_service.processor import SessionRegistryService
+
+READER = "realm_access.__reader"
+
+
+@pytest.fixture(scope="function", autouse=True)
+def session_fixture(mocker, session, engine):
+    mocker.patch(
+        "services.event_service.processor.get_not_auth_session",
+        new=lambda: iter([Session(engine)]),
+    )
+    mocker.patch(
+        "services.kafka_service.producer.protobuf_producer.kafka_config.KAFKA_TURN_ON",
+        new=False,
+    )
+    clear_available_ids()
+    yield session
+    clear_available_ids()
+
+
+@pytest.fixture(scope="function")
+def mo_ids(session):
+    tmos = [
+        TMO(name=f"tmo_{index}", created_by="Admin", modified_by="Admin")
+        for index in range(2)
+    ]
+    session.add_all(tmos)
+    session.flush()
+    mos = [
+        MO(name=f"mo_{index}", tmo_id=tmos[tmo_index].id)
+        for index, tmo_index in enumerate((0, 0, 0, 1, 1))
+    ]
+    session.add_all(mos)
+    session.flush()
+
+    def rule(table, parent_id, permission):
+        return table(
+            parent_id=parent_id,
+            permission=permission,
+            permission_name=permission,
+            read=True,
+        )
+
+    # the third and the last objects have no own rules
+    session.add_all(
+        [
+            rule(TMOPermission, tmos[0].id, "default"),
+            rule(TMOPermission, tmos[0].id, READER),
+            rule(TMOPermission, tmos[1].id, READER),
+            rule(MOPermission, mos[0].id, "default"),
+            rule(MOPermission, mos[1].id, READER),
+            rule(MOPermission, mos[3].id, "default"),
+            rule(MOPermission, mos[3].id, READER),
+        ]
+    )
+    session.flush()
+    return [mo.id for mo in mos]
+
+
+def get_available_object_ids(session, user_permissions):
+    statement = listener.add_filter(
+        select(MO.id).order_by(MO.id), session, user_permissions, "read"
+    )
+    return session.execute(statement).scalars().all()
+
+
+@pytest.mark.parametrize(
+    "inherit, user_permissions, expected",
+    [
+        (False, ("default",), [0]),
+        (False, (READER, "default"), [0, 1, 3]),
+        (True, ("default",), [0, 2, 3]),
+        (True, (READER, "default"), [0, 1, 2, 3, 4]),
+    ],
+)
+def test_objects_without_own_rules_inherit_object_type_rules(
+    mocker, session, mo_ids, inherit, user_permissions, expected
+):
+    mocker.patch.object(listener, "INHERIT_OBJECT_PERMISSIONS", new=inherit)
+
+    assert get_available_object_ids(session, user_permissions) == [
+        mo_ids[index] for index in expected
+    ]
+
+
+@pytest.mark.parametrize("inherit", [False, True])
+def test_objects_are_created_by_user_with_roles(
+    mocker, session: Session, client: TestClient, inherit
+):
+    mocker.patch.object(listener, "INHERIT_OBJECT_PERMISSIONS", new=inherit)
+    # sessions of users are registered by a session which is not closed
+    mocker.patch.object(SessionRegistryService, "process_user_session")
+    session.info["jwt"] = UserData(
+        id="test_id",
+        audience="test_aud",
+        name="Test User",
+        preferred_name="test_user",
+        realm_access=ClientRoles(
+            "realm_access", roles=["__admin", "other", "__reader"]
+        ),
+        resource_access=None,
+        groups=None,
+        session_id="test_session_id",
+    )
+
+    res = client.post("/api/inventory/v1/object_type/", json={"name": "tmo"})
+    assert res.status_code == 200
+    res = client.post(
+        "/api/inventory/v1/object_with_parameters/",
+        json={"tmo_id": res.json()["id"], "params": []},
+    )
+    assert res.status_code == 200
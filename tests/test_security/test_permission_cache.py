@@ -0,0 +1,118 @@
+"""Tests ids of TMOs available to roles are cached until permissions change"""
+
+import pytest
+from sqlmodel import Session
+
+from models import TMO
+from services.security_service.data.permission_cache import (
+    clear_available_ids,
+    get_available_parent_ids,
+)
+from services.security_service.data.permissions.inventory import TMOPermission
+
+READER = "realm_access.__reader"
+
+
+@pytest.fixture(scope="function", autouse=True)
+def session_fixture(mocker, session, engine):
+    mocker.patch(
+        "services.event_service.processor.get_not_auth_session",
+        new=lambda: iter([Session(engine)]),
+    )
+    mocker.patch(
+        "services.kafka_service.producer.protobuf_producer.kafka_config.KAFKA_TURN_ON",
+        new=False,
+    )
+    clear_available_ids()
+    yield session
+    clear_available_ids()
+
+
+@pytest.fixture(scope="function")
+def tmo_ids(session):
+    tmos = [
+        TMO(name=f"tmo_{index}", created_by="Admin", modified_by="Admin")
+        for index in range(3)
+    ]
+    session.add_all(tmos)
+    session.flush()
+    # default role reads the first TMO only, reader reads all of them
+    session.add_all(
+        [
+            TMOPermission(
+                parent_id=tmos[0].id,
+                permission="default",
+                permission_name="default",
+                read=True,
+            ),
+            TMOPermission(
+                parent_id=tmos[2].id,
+                permission="default",
+                permission_name="default",
+                update=True,
+            ),
+            *[
+                TMOPermission(
+                    parent_id=tmo.id,
+                    permission=READER,
+                    permission_name="reader",
+                    read=True,
+                )
+                for tmo in tmos
+            ],
+        ]
+    )
+    session.commit()
+    return [tmo.id for tmo in tmos]
+
+
+def get_tmo_ids(session, user_permissions, actions=("read",)):
+    return get_available_parent_ids(
+        session=session,
+        permission_table=TMOPermission,
+        user_permissions=user_permissions,
+        actions=actions,
+    )
+
+
+def test_available_tmo_ids_by_roles_and_actions(session, tmo_ids):
+    assert get_tmo_ids(session, (READER, "default")) == tmo_ids
+    assert get_tmo_ids(session, ("default",)) == tmo_ids[:1]
+    assert get_tmo_ids(session, ("default",), actions=("update",)) == [
+        tmo_ids[2]
+    ]
+    assert get_tmo_ids(session, ("default",), actions=("delete",)) == []
+    assert get_tmo_ids(session, ("default",), actions=()) == []
+
+
+def test_available_tmo_ids_are_cleared_by_committed_changes(session, tmo_ids):
+    assert get_tmo_ids(session, ("default",)) == tmo_ids[:1]
+
+    session.add(
+        TMOPermission(
+            parent_id=tmo_ids[1],
+            permission="default",
+            permission_name="default",
+            read=True,
+        )
+    )
+    session.flush()
+    assert get_tmo_ids(session, ("default",)) == tmo_ids[:1]
+
+    session.commit()
+    assert get_tmo_ids(session, ("default",)) == tmo_ids[:2]
+
+
+def test_available_tmo_ids_are_cached_for_roles_in_any_order(
+    mocker, session, tmo_ids
+):
+    connection = mocker.spy(session, "connection")
+
+    assert get_tmo_ids(session, (READER, "default")) == tmo_ids
+    assert get_tmo_ids(session, ("default", READER, "default")) == tmo_ids
+    assert (
+        get_tmo_ids(session, ("default", READER), actions=("read", "read"))
+        == tmo_ids
+    )
+
+    assert connection.call_count == 1
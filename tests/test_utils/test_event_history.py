@@ -0,0 +1,172 @@
+"""Tests events of one commit are stored by one session and one INSERT"""
+
+import pytest
+from sqlalchemy import delete, event, orm, select
+from sqlmodel import Session
+
+from models import TMO, TPRM, MO, PRM, Event
+from services.event_service.processor import EventProcessor
+from services.listener_service.constants import PARAMETER_TYPE_INSTANCES_CACHE
+from services.listener_service.processor import ListenerService
+
+TMO_DEFAULT_DATA = {
+    "name": "tmo_1",
+    "created_by": "Test creator",
+    "modified_by": "Test modifier",
+}
+
+TPRM_DEFAULT_DATA = {
+    "name": "tprm_1",
+    "val_type": "int",
+    "created_by": "Test creator",
+    "modified_by": "Test modifier",
+}
+
+
+@pytest.fixture(scope="function")
+def opened_sessions(mocker, engine):
+    sessions = []
+
+    def get_not_auth_session():
+        new_session = Session(engine)
+        sessions.append(new_session)
+        yield new_session
+        new_session.close()
+
+    mocker.patch(
+        "services.event_service.processor.get_not_auth_session",
+        new=get_not_auth_session,
+    )
+    return sessions
+
+
+@pytest.fixture(scope="function")
+def executed_statements(engine):
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.fixture(scope="function", autouse=True)
+def session_fixture(mocker, session, opened_sessions):
+    mocker.patch(
+        "services.kafka_service.producer.protobuf_producer.kafka_config.KAFKA_TURN_ON",
+        new=False,
+    )
+    tmo = TMO(**TMO_DEFAULT_DATA)
+    session.add(tmo)
+    session.flush()
+    session.add(TPRM(**TPRM_DEFAULT_DATA, tmo_id=tmo.id))
+    session.commit()
+
+    # listeners are registered for all sessions once the app is imported
+    if not event.contains(
+        orm.Session, "after_commit", ListenerService.receive_after_commit
+    ):
+        event.listen(
+            session, "after_flush", ListenerService.receive_after_flush
+        )
+        event.listen(
+            session, "after_commit", ListenerService.receive_after_commit
+        )
+
+    cached_parameter_types = PARAMETER_TYPE_INSTANCES_CACHE.copy()
+    PARAMETER_TYPE_INSTANCES_CACHE.clear()
+    yield session
+    PARAMETER_TYPE_INSTANCES_CACHE.clear()
+    PARAMETER_TYPE_INSTANCES_CACHE.update(cached_parameter_types)
+
+
+def test_events_of_one_commit_are_written_by_one_insert(
+    session: Session, opened_sessions: list, executed_statements: list
+):
+    tprm = session.execute(select(TPRM)).scalar()
+    # events of the object type created by the fixture
+    session.execute(delete(Event))
+    session.commit()
+    opened_sessions.clear()
+    executed_statements.clear()
+
+    for index in range(3):
+        mo = MO(tmo_id=tprm.tmo_id, name=f"mo_{index}")
+        session.add(mo)
+        session.flush()
+        session.add(PRM(tprm_id=tprm.id, mo_id=mo.id, value=str(index)))
+    session.commit()
+
+    events = session.execute(select(Event)).scalars().all()
+    assert sorted(item.event_type for item in events) == [
+        "MOCreate",
+        "MOCreate",
+        "MOCreate",
+        "PRMCreate",
+        "PRMCreate",
+        "PRMCreate",
+    ]
+    assert len(opened_sessions) == 1
+    event_inserts = [
+        statement
+        for statement in executed_statements
+        if statement.startswith("INSERT INTO events")
+    ]
+    assert len(event_inserts) == 1
+    tprm_selects = [
+        statement
+        for statement in executed_statements
+        if "FROM tprm" in statement and "tprm.id IN" in statement
+    ]
+    assert len(tprm_selects) == 1
+
+
+def test_parameter_types_are_selected_by_one_query_and_cache(
+    session: Session, executed_statements: list
+):
+    tprm = session.execute(select(TPRM)).scalar()
+    deleted_tprm_id = tprm.id + 100
+    PARAMETER_TYPE_INSTANCES_CACHE[deleted_tprm_id] = {
+        "id": deleted_tprm_id,
+        "val_type": "str",
+        "multiple": True,
+    }
+    data_to_send = [
+        {"id": 1, "tprm_id": tprm.id, "mo_id": 1, "value": "1", "version": 1},
+        {
+            "id": 2,
+            "tprm_id": str(tprm.id),
+            "mo_id": 2,
+            "value": "2",
+            "version": 1,
+        },
+        {
+            "id": 3,
+            "tprm_id": deleted_tprm_id,
+            "mo_id": 3,
+            "value": '["a", "b"]',
+            "version": 1,
+        },
+    ]
+    processor = EventProcessor(
+        session=session,
+        key_class_name="PRM",
+        key_event="deleted",
+        data_to_send=data_to_send,
+    )
+    events = processor.get_events(session=session)
+
+    assert [item["event"]["PRM"]["value"] for item in events] == [
+        1,
+        2,
+        ["a", "b"],
+    ]
+    assert {item["event_type"] for item in events} == {"PRMDelete"}
+    tprm_selects = [
+        statement
+        for statement in executed_statements
+        if "FROM tprm" in statement and "tprm.id IN" in statement
+    ]
+    assert len(tprm_selects) == 1
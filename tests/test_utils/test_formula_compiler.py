@@ -0,0 +1,245 @@
+"""Tests formula plans evaluate columns as formulas are calculated by rows"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from functions.formula_compiler import compile_formula, get_formula_plan
+from functions.functions_utils.utils import (
+    ParameterAggregate,
+    calculate_by_formula_batch,
+    calculate_by_formula_batch_frame,
+    calculate_by_formula_for_objects,
+    calculate_by_formula_new,
+    get_parameter_aggregates,
+)
+from models import MO, PRM, TMO, TPRM
+
+CONSTRAINTS = [
+    "parameter['int'] * 2 + parameter['float']",
+    "parameter['int'] / parameter['float'] - 1",
+    "-parameter['float'] * 3",
+    "parameter['str'] + '-' + parameter['str']",
+    "if parameter['int'] > 2 then parameter['int'] - 2; "
+    "elif parameter['str'] == 'abc' then 'ABC'; else parameter['float']",
+    "if parameter['int'] > 1 and parameter['float'] == 0 or "
+    "parameter['int'] == 7 then 1; else 2",
+    "if parameter['int'] == 100 then 1;",
+    "if INNER_MAX['int'] > 5 then INNER_MAX['int'] + 1; else 0",
+    "math.sqrt(parameter['int'])",
+]
+
+
+@pytest.fixture(scope="function")
+def tprms_by_name():
+    return {
+        name: TPRM(
+            id=index,
+            name=name,
+            val_type=val_type,
+            tmo_id=1,
+            multiple=False,
+            version=1,
+        )
+        for index, (name, val_type) in enumerate(
+            (("int", "int"), ("float", "float"), ("str", "str")), start=1
+        )
+    }
+
+
+@pytest.fixture(scope="function")
+def frame():
+    return pd.DataFrame(
+        {
+            "1": [1, 3, 7, 2**60, 0, 5],
+            "2": [0.0, 1.5, 2.0, 1.0, np.nan, -0.0],
+            "3": ["abc", "x", None, "it's", 5, "2024-03-01T17:23:14.907907Z"],
+        }
+    )
+
+
+def test_plan_is_cached_by_tprm_version():
+    tprm = TPRM(
+        id=10,
+        name="formula",
+        val_type="formula",
+        constraint=CONSTRAINTS[0],
+        version=1,
+    )
+
+    plan = get_formula_plan(tprm)
+
+    assert get_formula_plan(tprm) is plan
+    assert plan.vectorizable
+    assert plan.parameter_names == {"int", "float"}
+    tprm.version = 2
+    assert get_formula_plan(tprm) is not plan
+
+
+@pytest.mark.parametrize(
+    "constraint",
+    [
+        "math.sqrt(parameter['int'])",
+        "parameter['str'][0:2]",
+        'parameter["int"] + 1',
+        "parameter['int'] + x",
+        "if parameter['int'] > 1 then 2; elsewhere 3",
+    ],
+)
+def test_not_supported_formula_is_not_vectorizable(constraint):
+    assert not compile_formula(constraint).vectorizable
+
+
+@pytest.mark.parametrize("constraint", CONSTRAINTS)
+def test_batch_values_match_calculation_by_rows(
+    constraint, frame, tprms_by_name
+):
+    parameter_aggregates = {1: ParameterAggregate(count=2, max=9, min=3)}
+    formula_tprm = TPRM(
+        id=10,
+        name="formula",
+        val_type="formula",
+        tmo_id=1,
+        constraint=constraint,
+        version=1,
+    )
+    expected = {}
+    for index, row in frame.iterrows():
+        try:
+            expected[index] = calculate_by_formula_batch(
+                session=None,
+                formula_tprm=formula_tprm,
+                prm_data=dict(row.items()),
+                tprms_from_formula_by_name=tprms_by_name,
+                parameter_aggregates=parameter_aggregates,
+            )
+        except ValueError:
+            continue
+
+    values, not_valid_indexes = calculate_by_formula_batch_frame(
+        session=None,
+        formula_tprm=formula_tprm,
+        frame=frame,
+        tprms_from_formula_by_name=tprms_by_name,
+        parameter_aggregates=parameter_aggregates,
+    )
+
+    assert sorted(not_valid_indexes) == sorted(set(frame.index) - set(expected))
+    assert {
+        index: (type(value), str(value))
+        for index, value in values.drop(not_valid_indexes).items()
+    } == {index: (type(value), str(value)) for index, value in expected.items()}
+
+
+def test_rows_with_not_matching_values_are_left_for_rows(frame):
+    plan = compile_formula("parameter['int'] / parameter['float']")
+
+    values, evaluated = plan.evaluate(
+        columns={"int": frame["1"], "float": frame["2"]}, index=frame.index
+    )
+
+    # division by zero, big integer and missing value
+    assert evaluated.tolist() == [False, True, True, False, False, False]
+    assert values[evaluated].tolist() == [2.0, 3.5]
+
+
+def test_objects_values_match_calculation_by_objects(session):
+    tmo = TMO(name="TEST TMO", created_by="Admin", modified_by="Admin")
+    session.add(tmo)
+    session.flush()
+    tprms = {}
+    for name, val_type in (
+        ("int value", "int"),
+        ("flag", "bool"),
+        ("link", "mo_link"),
+    ):
+        tprms[name] = TPRM(
+            name=name,
+            val_type=val_type,
+            tmo_id=tmo.id,
+            created_by="Admin",
+            modified_by="Admin",
+        )
+    tprms["formula"] = TPRM(
+        name="formula",
+        val_type="formula",
+        tmo_id=tmo.id,
+        constraint="if parameter['flag'] == 1 then parameter['int_value'] * 2; "
+        "elif parameter['link'] == 'TEST MO 0' then 'linked'; else 0",
+        created_by="Admin",
+        modified_by="Admin",
+    )
+    session.add_all(tprms.values())
+    session.flush()
+    mos = []
+    for index in range(4):
+        mo = MO(name=f"TEST MO {index}", tmo_id=tmo.id)
+        session.add(mo)
+        session.flush()
+        mos.append(mo)
+        if index == 3:
+            continue
+        session.add_all(
+            [
+                PRM(
+                    tprm_id=tprms["int value"].id, mo_id=mo.id, value=str(index)
+                ),
+                PRM(
+                    tprm_id=tprms["flag"].id,
+                    mo_id=mo.id,
+                    value=str(index == 1),
+                ),
+                PRM(
+                    tprm_id=tprms["link"].id, mo_id=mo.id, value=str(mos[0].id)
+                ),
+            ]
+        )
+    session.flush()
+
+    values = calculate_by_formula_for_objects(
+        session=session, param_type=tprms["formula"], objects=mos
+    )
+
+    assert values == {
+        mo.id: calculate_by_formula_new(
+            session=session, param_type=tprms["formula"], object_instance=mo
+        )
+        for mo in mos
+    }
+    assert values[mos[1].id] == 2
+    assert values[mos[2].id] == "linked"
+
+
+def test_parameter_aggregates_skip_not_integer_values(session):
+    tmo = TMO(name="TEST TMO", created_by="Admin", modified_by="Admin")
+    session.add(tmo)
+    session.flush()
+    tprms = [
+        TPRM(
+            name=f"int {index}",
+            val_type="int",
+            tmo_id=tmo.id,
+            created_by="Admin",
+            modified_by="Admin",
+        )
+        for index in range(2)
+    ]
+    session.add_all(tprms)
+    session.flush()
+    for value in ("3", "10", "x", "2.5", " -7 "):
+        mo = MO(tmo_id=tmo.id)
+        session.add(mo)
+        session.flush()
+        session.add(PRM(tprm_id=tprms[0].id, mo_id=mo.id, value=value))
+    session.flush()
+
+    aggregates = get_parameter_aggregates(
+        session=session, tprm_ids=[tprm.id for tprm in tprms]
+    )
+
+    assert aggregates == {
+        tprms[0].id: ParameterAggregate(
+            count=5, not_int_count=2, max=10, min=-7
+        ),
+        tprms[1].id: ParameterAggregate(),
+    }